@@ -44,6 +44,7 @@ docopt_ignore = [
     'kiwi.tasks.system_prepare',
     'kiwi.tasks.system_update',
     'kiwi.tasks.system_create',
+    'kiwi.tasks.system_capabilities',
     'kiwi.tasks.result_list',
     'kiwi.tasks.result_bundle',
     'kiwi.tasks.image_resize',
@@ -239,6 +240,7 @@ system_prepare_doc = 'commands/system_prepare'
 system_update_doc = 'commands/system_update'
 system_build_doc = 'commands/system_build'
 system_create_doc = 'commands/system_create'
+system_capabilities_doc = 'commands/system_capabilities'
 image_resize_doc = 'commands/image_resize'
 image_info_doc = 'commands/image_info'
 
@@ -293,6 +295,13 @@ man_pages = [
         [author],
         8
     ),
+    (
+        system_capabilities_doc,
+        'kiwi::system::capabilities',
+        'Show capabilities of the host tools',
+        [author],
+        8
+    ),
     (
         image_resize_doc,
         'kiwi::image::resize',
@@ -0,0 +1,533 @@
+# Copyright (c) 2026 SUSE LLC.  All rights reserved.
+#
+# This file is part of kiwi.
+#
+# kiwi is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# kiwi is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kiwi.  If not, see <http://www.gnu.org/licenses/>
+#
+import io
+import os
+import errno
+import stat
+import shutil
+import tarfile
+import threading
+import subprocess
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    IO, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+)
+
+from kiwi.exceptions import KiwiArchiveDebError
+
+
+class PathClaims:
+    """
+    **Decide which package provides a path shared by packages**
+
+    Packages extracted in parallel can ship the same path. Like
+    for an extraction one after another the package with the
+    highest order wins, independent of which one writes last
+    """
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.owners: Dict[str, int] = {}
+
+    def claim(self, path: str, order: int) -> bool:
+        """
+        Register the package of the given order for the path
+
+        :param str path: target path name
+        :param int order: order of the package
+
+        :return: False if a package of a higher order claimed it
+
+        :rtype: bool
+        """
+        with self.lock:
+            if self.owners.get(path, order) > order:
+                return False
+            self.owners[path] = order
+            return True
+
+    def make_directory(self, path: str) -> None:
+        """
+        Create a directory, replacing a file at the path
+
+        :param str path: target path name
+        """
+        with self.lock:
+            if os.path.lexists(path) and not os.path.isdir(path):
+                os.unlink(path)
+            os.makedirs(path, exist_ok=True)
+
+    def commit(self, path: str, order: int, temporary: str) -> bool:
+        """
+        Move the temporary file of a package to the path if the
+        package still owns it
+
+        :param str path: target path name
+        :param int order: order of the package
+        :param str temporary: temporary path name
+
+        :return: False if a package of a higher order claimed it
+
+        :rtype: bool
+        """
+        with self.lock:
+            if self.owners.get(path) != order:
+                return False
+            os.replace(temporary, path)
+            return True
+
+
+class ArMember(io.RawIOBase):
+    """
+    **Read a member of an ar container as a stream**
+
+    :param file archive: ar container positioned at the member data
+    :param int size: size of the member data
+    """
+    def __init__(self, archive: IO[bytes], size: int) -> None:
+        self.archive = archive
+        self.remaining = size
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:  # type: ignore[override]
+        view = memoryview(buffer)[:self.remaining]
+        count = self.archive.readinto(view)  # type: ignore[attr-defined]
+        self.remaining -= count
+        return count
+
+
+class ArchiveDeb:
+    """
+    **Extraction of Debian binary packages**
+
+    The ar container and the control and data tar archives of the
+    package are read in-process, no dpkg-deb is needed. Paths are
+    resolved inside the target directory like in a chroot, such
+    that symlinks in the tree, e.g. of a merged /usr, are followed
+    without leaving it
+
+    :param str filename: Debian package file path
+    """
+    # compressions of the tar members, tarfile detects all but
+    # zstd which is decompressed by the zstd tool
+    tar_suffixes = ('', '.gz', '.xz', '.bz2', '.zst')
+    max_workers = 8
+    block_size = 1048576
+
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+
+    @classmethod
+    def extract_all(
+        cls, filenames: List[str], dest_dir: str,
+        control_dir: Optional[str] = None
+    ) -> None:
+        """
+        Extract the given packages in parallel. If packages share
+        a path the result is the same as for extracting them one
+        after another in the given order.
+
+        The directories and symlinks of all packages decide where
+        the members of every package are placed. Therefore they are
+        read in parallel first and created one package after another,
+        before the regular files are extracted in parallel. Members
+        at a path another package places members below replace the
+        directory or symlink there only after all other members are
+        extracted, again one package after another
+
+        :param list filenames: Debian package file paths
+        :param str dest_dir: target root directory
+        :param str control_dir:
+            directory to store the control files of each package
+            in a subdirectory named after the package file
+
+        :raises KiwiArchiveDebError: if a package failed to extract
+        """
+        claims = PathClaims()
+        debs = [cls(filename) for filename in filenames]
+        parents: Set[str] = set()
+
+        def is_deferred(member: tarfile.TarInfo) -> bool:
+            if member.isdir() or member.issym():
+                return False
+            return cls._get_name(member.name) in parents or (
+                member.islnk() and cls._get_name(member.linkname) in parents
+            )
+
+        def scan(deb: ArchiveDeb) -> Tuple[List[tarfile.TarInfo], Set[str]]:
+            if control_dir:
+                deb.extract_control(
+                    os.sep.join([control_dir, os.path.basename(deb.filename)])
+                )
+            return deb.get_layout()
+
+        def extract(job: Tuple[int, ArchiveDeb]) -> bool:
+            order, deb = job
+            deferred: List[tarfile.TarInfo] = []
+
+            def select(member: tarfile.TarInfo) -> bool:
+                if is_deferred(member):
+                    deferred.append(member)
+                    return False
+                return not (member.isdir() or member.issym())
+
+            deb.extract(dest_dir, claims, order, select)
+            return bool(deferred)
+
+        with ThreadPoolExecutor(max_workers=cls.max_workers) as executor:
+            # consume the results to raise a failed extraction here
+            layouts = list(executor.map(scan, debs))
+            for order, (deb, (skeleton, deb_parents)) in enumerate(
+                zip(debs, layouts)
+            ):
+                deb.extract_members(dest_dir, skeleton, claims, order)
+                parents.update(deb_parents)
+            has_deferred = list(executor.map(extract, enumerate(debs)))
+        for order, deb in enumerate(debs):
+            if has_deferred[order]:
+                deb.extract(dest_dir, claims, order, is_deferred)
+
+    def extract(
+        self, dest_dir: str, claims: Optional[PathClaims] = None,
+        order: int = 0,
+        select: Optional[Callable[[tarfile.TarInfo], bool]] = None
+    ) -> None:
+        """
+        Extract the data archive of the package
+
+        :param str dest_dir: target root directory
+        :param PathClaims claims: path claims shared with other packages
+        :param int order: order of the package for the path claims
+        :param callable select:
+            extract only the members for which this returns True
+
+        :raises KiwiArchiveDebError: if the extraction failed
+        """
+        try:
+            with self._open_tar('data.tar') as tar:
+                self._extract_members(
+                    tar, (
+                        member for member in tar
+                        if select is None or select(member)
+                    ), dest_dir, claims or PathClaims(), order
+                )
+        except (OSError, tarfile.TarError) as issue:
+            raise KiwiArchiveDebError(
+                f'Extraction of {self.filename} failed: {issue}'
+            )
+
+    def extract_members(
+        self, dest_dir: str, members: List[tarfile.TarInfo],
+        claims: Optional[PathClaims] = None, order: int = 0
+    ) -> None:
+        """
+        Create the given directories and symlinks of the data
+        archive, as read by get_layout
+
+        :param str dest_dir: target root directory
+        :param list members: directory and symlink members
+        :param PathClaims claims: path claims shared with other packages
+        :param int order: order of the package for the path claims
+
+        :raises KiwiArchiveDebError: if the extraction failed
+        """
+        try:
+            self._extract_members(
+                None, members, dest_dir, claims or PathClaims(), order
+            )
+        except OSError as issue:
+            raise KiwiArchiveDebError(
+                f'Extraction of {self.filename} failed: {issue}'
+            )
+
+    def get_layout(self) -> Tuple[List[tarfile.TarInfo], Set[str]]:
+        """
+        Read the directories and symlinks of the data archive and
+        the paths the members of the package are placed below
+
+        :return: directory and symlink members, parent paths
+
+        :rtype: tuple
+
+        :raises KiwiArchiveDebError: if reading the archive failed
+        """
+        skeleton = []
+        parents: Set[str] = set()
+        try:
+            with self._open_tar('data.tar') as tar:
+                for member in tar:
+                    if member.isdir() or member.issym():
+                        skeleton.append(member)
+                    parent = os.path.dirname(self._get_name(member.name))
+                    while parent and parent not in parents:
+                        parents.add(parent)
+                        parent = os.path.dirname(parent)
+        except (OSError, tarfile.TarError) as issue:
+            raise KiwiArchiveDebError(
+                f'Reading of {self.filename} failed: {issue}'
+            )
+        return skeleton, parents
+
+    def extract_control(self, dest_dir: str) -> None:
+        """
+        Extract the control files, e.g. the maintainer scripts,
+        of the package like dpkg -e does
+
+        :param str dest_dir: target directory
+
+        :raises KiwiArchiveDebError: if the extraction failed
+        """
+        try:
+            os.makedirs(dest_dir, exist_ok=True)
+            with self._open_tar('control.tar') as tar:
+                for member in tar:
+                    name = os.path.normpath(member.name)
+                    if not member.isfile() or os.sep in name:
+                        continue
+                    target = os.sep.join([dest_dir, name])
+                    with open(target, 'wb') as control_file:
+                        self._copy_member(tar, member, control_file)
+                    os.chmod(target, member.mode & 0o7777)
+        except (OSError, tarfile.TarError) as issue:
+            raise KiwiArchiveDebError(
+                f'Extraction of control files of {self.filename} failed: {issue}'
+            )
+
+    def get_members(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Read the member table of the ar container
+
+        :return: offset and size of each member by name
+
+        :rtype: dict
+        """
+        members = {}
+        with open(self.filename, 'rb') as deb:
+            if deb.read(8) != b'!<arch>\n':
+                raise KiwiArchiveDebError(
+                    f'{self.filename} is not a Debian package'
+                )
+            while True:
+                header = deb.read(60)
+                if len(header) < 60:
+                    break
+                if header[58:60] != b'`\n':
+                    raise KiwiArchiveDebError(
+                        f'{self.filename} has a corrupt ar header'
+                    )
+                name = header[0:16].decode().strip().rstrip('/')
+                size = int(header[48:58].decode().strip())
+                members[name] = (deb.tell(), size)
+                # members are aligned to an even offset
+                deb.seek(size + size % 2, os.SEEK_CUR)
+        return members
+
+    @contextmanager
+    def _open_tar(self, name: str) -> Iterator[tarfile.TarFile]:
+        for member, (offset, size) in self.get_members().items():
+            suffix = member[len(name):]
+            if member.startswith(name) and suffix in self.tar_suffixes:
+                break
+        else:
+            raise KiwiArchiveDebError(f'{self.filename} has no {name}')
+        with open(self.filename, 'rb') as deb:
+            deb.seek(offset)
+            data = ArMember(deb, size)
+            if suffix != '.zst':
+                with tarfile.open(fileobj=data, mode='r|*') as tar:
+                    yield tar
+                return
+            with self._decompress_zstd(data, member) as stream:
+                with tarfile.open(fileobj=stream, mode='r|') as tar:
+                    yield tar
+
+    @contextmanager
+    def _decompress_zstd(
+        self, source: io.RawIOBase, name: str
+    ) -> Iterator[IO[bytes]]:
+        zstd = subprocess.Popen(
+            ['zstd', '-d', '-c'], stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        assert zstd.stdin and zstd.stdout and zstd.stderr
+        feeder = threading.Thread(
+            target=self._feed, args=(source, zstd.stdin)
+        )
+        feeder.start()
+        try:
+            yield zstd.stdout
+            # the end of archive marker can be followed by padding
+            while zstd.stdout.read(self.block_size):
+                pass
+        finally:
+            # zstd stops on a broken pipe if the reader stopped early
+            zstd.stdout.close()
+            feeder.join()
+            error = zstd.stderr.read().decode()
+            zstd.stderr.close()
+            if zstd.wait() > 0:
+                raise KiwiArchiveDebError(
+                    f'Decompression of {name} failed: {error}'
+                )
+
+    @staticmethod
+    def _feed(source: io.RawIOBase, target: IO[bytes]) -> None:
+        try:
+            shutil.copyfileobj(source, target)
+            target.close()
+        except OSError:
+            # the decompressor exited early and reports the cause
+            pass
+
+    def _extract_members(
+        self, tar: Optional[tarfile.TarFile],
+        members: Iterable[tarfile.TarInfo], dest_dir: str,
+        claims: PathClaims, order: int
+    ) -> None:
+        # files of this package replaced by a package of a higher
+        # order are kept until the end for hard links to them
+        superseded: Dict[str, str] = {}
+        try:
+            for member in members:
+                self._extract_member(
+                    tar, member, dest_dir, claims, order, superseded
+                )
+        finally:
+            for temporary in superseded.values():
+                if os.path.lexists(temporary):
+                    os.unlink(temporary)
+
+    def _extract_member(
+        self, tar: Optional[tarfile.TarFile], member: tarfile.TarInfo,
+        dest_dir: str, claims: PathClaims, order: int,
+        superseded: Dict[str, str]
+    ) -> None:
+        if os.path.normpath(member.name) in (os.curdir, os.sep):
+            # the root directory itself
+            return
+        target = self._resolve(dest_dir, member.name)
+        if member.isdir():
+            if not claims.claim(target, order):
+                return
+            # an existing symlink to a directory is kept as dpkg does
+            if not os.path.isdir(target):
+                claims.make_directory(target)
+                os.chown(target, member.uid, member.gid)
+                os.chmod(target, member.mode & 0o7777)
+            return
+        if member.issym() and os.path.isdir(target) and \
+           not os.path.islink(target):
+            # an existing directory is not replaced by a symlink
+            # as dpkg does
+            return
+        owned = claims.claim(target, order)
+        if not owned and not (member.isfile() or member.islnk()):
+            return
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        temporary = os.sep.join(
+            [
+                os.path.dirname(target),
+                f'.{os.path.basename(target)}.kiwi-deb{order}'
+            ]
+        )
+        if os.path.lexists(temporary):
+            os.unlink(temporary)
+        if member.islnk():
+            link_target = self._resolve(dest_dir, member.linkname)
+            os.link(superseded.get(link_target, link_target), temporary)
+        elif member.isfile():
+            descriptor = os.open(
+                temporary,
+                os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_NOFOLLOW,
+                0o600
+            )
+            with os.fdopen(descriptor, 'wb') as target_file:
+                self._copy_member(tar, member, target_file)
+        elif member.issym():
+            os.symlink(member.linkname, temporary)
+        elif member.ischr() or member.isblk():
+            os.mknod(
+                temporary, member.mode & 0o7777 | (
+                    stat.S_IFCHR if member.ischr() else stat.S_IFBLK
+                ), os.makedev(member.devmajor, member.devminor)
+            )
+        elif member.isfifo():
+            os.mkfifo(temporary)
+        else:
+            return
+        if not member.islnk():
+            os.chown(temporary, member.uid, member.gid, follow_symlinks=False)
+            if not member.issym():
+                # after chown, which drops the setuid and setgid bits
+                os.chmod(temporary, member.mode & 0o7777)
+            os.utime(
+                temporary, (member.mtime, member.mtime), follow_symlinks=False
+            )
+        if owned and claims.commit(target, order, temporary):
+            superseded.pop(target, None)
+        elif member.isfile() or member.islnk():
+            superseded[target] = temporary
+        else:
+            os.unlink(temporary)
+
+    @staticmethod
+    def _copy_member(
+        tar: Optional[tarfile.TarFile], member: tarfile.TarInfo,
+        target_file: IO[bytes]
+    ) -> None:
+        source = tar.extractfile(member) if tar else None
+        if source:
+            shutil.copyfileobj(source, target_file)
+
+    @staticmethod
+    def _get_name(path: str) -> str:
+        return os.path.normpath(path).lstrip(os.sep)
+
+    @staticmethod
+    def _resolve(root_dir: str, path: str) -> str:
+        # resolve all but the last path component like inside
+        # a chroot of root_dir
+        names = [name for name in path.split('/') if name not in ('', '.')]
+        resolved: List[str] = []
+        links = 0
+        while names:
+            name = names.pop(0)
+            if name == '..':
+                if resolved:
+                    resolved.pop()
+                continue
+            if not names:
+                resolved.append(name)
+                break
+            current = os.sep.join([root_dir] + resolved + [name])
+            if not os.path.islink(current):
+                resolved.append(name)
+                continue
+            links += 1
+            if links > 40:
+                raise OSError(errno.ELOOP, os.strerror(errno.ELOOP), path)
+            link_target = os.readlink(current)
+            if link_target.startswith('/'):
+                resolved = []
+            names = [
+                name for name in link_target.split('/')
+                if name not in ('', '.')
+            ] + names
+        return os.sep.join([root_dir] + resolved)
@@ -116,6 +116,33 @@ class ArchiveTar:
         Command.run(['bash', '-c', ' '.join(bash_command)])
         return self.filename + '.xz'
 
+    def create_zstd_compressed(
+        self, source_dir, exclude=None, options=None, zstd_options=None
+    ):
+        """
+        Create zstd compressed tar archive
+
+        :param string source_dir: data source directory
+        :param list exclude: list of excluded items
+        :param list options: custom tar creation options
+        :param list zstd_options: custom zstd compression options
+        """
+        if not options:
+            options = []
+        if not zstd_options:
+            zstd_options = Defaults.get_zstd_compression_options()
+        bash_command = [
+            'tar', '-C', source_dir
+        ] + options + self.xattrs_options + [
+            '-c', '--to-stdout'
+        ] + self._get_archive_items(source_dir, exclude) + [
+            '|', 'zstd', '-f', '-q'
+        ] + zstd_options + [
+            '-o', self.filename + '.zst'
+        ]
+        Command.run(['bash', '-c', ' '.join(bash_command)])
+        return self.filename + '.zst'
+
     def create_gnu_gzip_compressed(self, source_dir, exclude=None):
         """
         Create gzip compressed tar archive
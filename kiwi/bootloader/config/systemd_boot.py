@@ -32,6 +32,7 @@ from kiwi.storage.loop_device import LoopDevice
 from kiwi.storage.disk import Disk
 from kiwi.command import Command
 from kiwi.utils.os_release import OsRelease
+from kiwi.utils.block_copy import BlockCopy
 
 from kiwi.exceptions import (
     KiwiTemplateError,
@@ -176,9 +177,7 @@ class BootLoaderSystemdBoot(BootLoaderSpecBase):
                     sys_mount.bind_mount()
                     self._run_bootctl(self.root_dir)
                     self.set_loader_entry(self.root_dir, self.target.live)
-                Command.run(
-                    ['dd', f'if={disk.partition_map["efi"]}', f'of={path}.img']
-                )
+                BlockCopy(disk.partition_map['efi'], f'{path}.img').copy()
 
         Command.run(
             ['mv', f'{path}.img', path]
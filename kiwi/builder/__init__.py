@@ -17,15 +17,19 @@
 #
 # project
 import importlib
-from typing import Dict
+from typing import (
+    TYPE_CHECKING, Dict
+)
 from abc import (
     ABCMeta, abstractmethod
 )
 from kiwi.defaults import Defaults
-from kiwi.xml_state import XMLState
 
 from kiwi.exceptions import KiwiRequestedTypeError
 
+if TYPE_CHECKING:  # pragma: nocover
+    from kiwi.xml_state import XMLState
+
 
 class ImageBuilder(metaclass=ABCMeta):
     """
@@ -37,7 +41,7 @@ class ImageBuilder(metaclass=ABCMeta):
 
     @staticmethod
     def new(
-        xml_state: XMLState, target_dir: str,
+        xml_state: 'XMLState', target_dir: str,
         root_dir: str, custom_args: Dict = None
     ):
         image_type = xml_state.get_build_type_name()
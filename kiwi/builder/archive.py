@@ -22,6 +22,7 @@ from typing import Dict
 from kiwi.defaults import Defaults
 from kiwi.archive.tar import ArchiveTar
 from kiwi.archive.cpio import ArchiveCpio
+from kiwi.command_trace import CommandTrace
 from kiwi.system.setup import SystemSetup
 from kiwi.system.result import Result
 from kiwi.runtime_config import RuntimeConfig
@@ -63,6 +64,7 @@ class ArchiveBuilder:
 
         self.runtime_config = RuntimeConfig()
 
+    @CommandTrace.traced
     def create(self) -> Result:
         """
         Create a root archive tarball
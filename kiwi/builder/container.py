@@ -22,6 +22,7 @@ from typing import Dict
 # project
 from kiwi.container import ContainerImage
 from kiwi.container.setup import ContainerSetup
+from kiwi.command_trace import CommandTrace
 from kiwi.system.setup import SystemSetup
 from kiwi.system.result import Result
 from kiwi.utils.checksum import Checksum
@@ -108,6 +109,7 @@ class ContainerBuilder:
         )
         self.result = Result(xml_state)
 
+    @CommandTrace.traced
     def create(self) -> Result:
         """
         Builds a container image which is usually a data archive
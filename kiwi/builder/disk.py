@@ -45,6 +45,7 @@ from kiwi.system.identifier import SystemIdentifier
 from kiwi.boot.image import BootImage
 from kiwi.boot.image.base import BootImageBase
 from kiwi.storage.setup import DiskSetup
+from kiwi.system.size import SystemSize
 from kiwi.storage.loop_device import LoopDevice
 from kiwi.storage.clone_device import CloneDevice
 from kiwi.firmware import FirmWare
@@ -60,12 +61,15 @@ from kiwi.filesystem import FileSystem
 from kiwi.volume_manager import VolumeManager
 from kiwi.volume_manager.base import VolumeManagerBase
 from kiwi.command import Command
+from kiwi.command_trace import CommandTrace
 from kiwi.system.setup import SystemSetup
 from kiwi.builder.install import InstallImageBuilder
 from kiwi.system.kernel import Kernel
 from kiwi.storage.subformat import DiskFormat
 from kiwi.system.result import Result
 from kiwi.utils.block import BlockID
+from kiwi.utils.block_copy import BlockCopy
+from kiwi.utils.sync_manifest import SyncManifest
 from kiwi.utils.fstab import Fstab
 from kiwi.runtime_config import RuntimeConfig
 from kiwi.partitioner import Partitioner
@@ -271,6 +275,7 @@ class DiskBuilder:
         if not self.boot_image.has_initrd_support():
             log.warning('Building without initrd support !')
 
+    @CommandTrace.traced
     def create(self) -> Result:
         """
         Build a bootable disk image and optional installation image
@@ -290,6 +295,7 @@ class DiskBuilder:
         self.append_unpartitioned_space()
         return self.create_disk_format(result)
 
+    @CommandTrace.traced
     def create_disk(self) -> Result:
         """
         Build a bootable raw disk image
@@ -335,7 +341,9 @@ class DiskBuilder:
             log.info('Preparing boot system')
             self.boot_image.prepare()
 
-        # precalculate needed disk size
+        # precalculate needed disk size, the root tree has changed
+        # since any previous size calculation
+        SystemSize.invalidate_index(self.root_dir)
         disksize_mbytes = self.disk_setup.get_disksize_mbytes(
             root_clone=self.root_clone_count, boot_clone=self.boot_clone_count
         )
@@ -508,6 +516,7 @@ class DiskBuilder:
         )
         return self.result
 
+    @CommandTrace.traced
     def create_disk_format(self, result_instance: Result) -> Result:
         """
         Create a bootable disk format from a previously
@@ -553,6 +562,7 @@ class DiskBuilder:
                     )
                     partitioner.resize_table()
 
+    @CommandTrace.traced
     def create_install_media(self, result_instance: Result) -> Result:
         """
         Build an installation image. The installation image is a
@@ -916,17 +926,19 @@ class DiskBuilder:
                 )
                 disk_system.call_pre_disk_script()
 
-            # syncing system data to disk image
-            system = self._sync_system_to_image(
-                stack,
-                device_map,
-                system,
-                system_boot,
-                system_efi,
-                system_spare,
-                system_custom_parts,
-                integrity_root
-            )
+            # syncing system data to disk image, all partitions
+            # are synced from the same unchanged root tree
+            with SyncManifest.share():
+                system = self._sync_system_to_image(
+                    stack,
+                    device_map,
+                    system,
+                    system_boot,
+                    system_efi,
+                    system_spare,
+                    system_custom_parts,
+                    integrity_root
+                )
 
             # run post sync actions...
             if self.veritysetup:
@@ -1086,12 +1098,14 @@ class DiskBuilder:
                                     'bytes'
                                 )
                             )
-                            Command.run(
-                                [
-                                    'dd',
-                                    f'if={squashed_root_file.name}',
-                                    f'of={readonly_target}'
-                                ]
+                            # the target can be a mapped device which
+                            # does not read as zeros, thus holes of the
+                            # image must be written
+                            BlockCopy(
+                                squashed_root_file.name, readonly_target
+                            ).copy(
+                                sparse=False,
+                                progress_prefix=f'Dumping {map_name}'
                             )
                         else:
                             filesystem.create_on_device(
@@ -1697,6 +1711,7 @@ class DiskBuilder:
                 '{0}{1}'.format(kexec_boot_options, os.linesep)
             )
 
+    @CommandTrace.traced
     def _sync_system_to_image(
         self,
         stack: ExitStack,
@@ -1810,13 +1825,12 @@ class DiskBuilder:
                         readonly_target, readonly_target_bytesize
                     )
                 )
-                Command.run(
-                    [
-                        'dd',
-                        f'if={squashed_root_file.name}',
-                        f'of={readonly_target}'
-                    ]
-                )
+                # the target can be a luks, integrity or raid mapped
+                # device which does not read as zeros, thus holes of
+                # the image must be written
+                BlockCopy(
+                    squashed_root_file.name, readonly_target
+                ).copy(sparse=False, progress_prefix='Dumping rootfs')
                 if self.root_filesystem_embed_verity_metadata:
                     squashed_root.create_verification_metadata(
                         readonly_target
@@ -1860,7 +1874,8 @@ class DiskBuilder:
                     )
                     self.storage_map['system'] = filesystem
                     filesystem.sync_data(
-                        self._get_exclude_list_for_root_data_sync(device_map)
+                        self._get_exclude_list_for_root_data_sync(device_map),
+                        offline=True
                     )
                 filesystem.create_verity_layer(
                     self.root_filesystem_verity_blocks if
@@ -1875,13 +1890,12 @@ class DiskBuilder:
                     root_target, root_target_bytesize
                 )
             )
-            Command.run(
-                [
-                    'dd',
-                    f'if={verity_root_file.name}',
-                    f'of={root_target}'
-                ]
-            )
+            # the target can be a luks, integrity or raid mapped
+            # device which does not read as zeros, thus holes of
+            # the image must be written
+            BlockCopy(
+                verity_root_file.name, root_target
+            ).copy(sparse=False, progress_prefix='Dumping rootfs')
             if self.root_filesystem_embed_verity_metadata:
                 filesystem.create_verification_metadata(
                     root_target
@@ -1894,8 +1908,11 @@ class DiskBuilder:
                     self._get_clone_devices('rootclone', device_map)
                 )
         elif system:
+            # the root filesystem is still empty, if supported its
+            # mkfs tool creates it again populated with the data
             system_mount = system.sync_data(
-                self._get_exclude_list_for_root_data_sync(device_map)
+                self._get_exclude_list_for_root_data_sync(device_map),
+                offline=True
             )
             if system_mount:
                 stack.push(system_mount)
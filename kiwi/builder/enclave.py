@@ -22,6 +22,7 @@ from typing import Dict
 # project
 from kiwi.defaults import Defaults
 from kiwi.boot.image import BootImage
+from kiwi.command_trace import CommandTrace
 from kiwi.system.setup import SystemSetup
 from kiwi.system.kernel import Kernel
 from kiwi.system.result import Result
@@ -93,6 +94,7 @@ class EnclaveBuilder:
         self.result = Result(xml_state)
         self.runtime_config = RuntimeConfig()
 
+    @CommandTrace.traced
     def create(self) -> Result:
         """
         Build an eif image using the eif-cli
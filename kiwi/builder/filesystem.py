@@ -22,9 +22,11 @@ from typing import Dict
 # project
 from kiwi.filesystem import FileSystem
 from kiwi.filesystem.setup import FileSystemSetup
+from kiwi.command_trace import CommandTrace
 from kiwi.storage.loop_device import LoopDevice
 from kiwi.storage.device_provider import DeviceProvider
 from kiwi.system.setup import SystemSetup
+from kiwi.system.size import SystemSize
 from kiwi.defaults import Defaults
 from kiwi.system.result import Result
 from kiwi.runtime_config import RuntimeConfig
@@ -97,6 +99,7 @@ class FileSystemBuilder:
         self.result = Result(xml_state)
         self.runtime_config = RuntimeConfig()
 
+    @CommandTrace.traced
     def create(self) -> Result:
         """
         Build a mountable filesystem image
@@ -116,6 +119,7 @@ class FileSystemBuilder:
         log.info(
             'Creating %s filesystem', self.requested_filesystem
         )
+        SystemSize.invalidate_index(self.root_dir)
         supported_filesystems = Defaults.get_filesystem_image_types()
         if self.requested_filesystem not in supported_filesystems:
             raise KiwiFileSystemSetupError(
@@ -22,6 +22,7 @@ from typing import Dict
 # project
 from kiwi.defaults import Defaults
 from kiwi.boot.image import BootImage
+from kiwi.command_trace import CommandTrace
 from kiwi.builder.filesystem import FileSystemBuilder
 from kiwi.utils.compress import Compress
 from kiwi.system.setup import SystemSetup
@@ -97,6 +98,7 @@ class KisBuilder:
         if not self.boot_image_task.has_initrd_support():
             log.warning('Building without initrd support !')
 
+    @CommandTrace.traced
     def create(self) -> Result:
         """
         Build a component image consisting out of a boot image(initrd)
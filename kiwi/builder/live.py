@@ -28,6 +28,7 @@ import kiwi.defaults as defaults
 
 from kiwi.utils.veritysetup import VeritySetup
 from kiwi.utils.block import BlockID
+from kiwi.utils.block_copy import BlockCopy
 from kiwi.utils.temporary import Temporary
 from kiwi.bootloader.config import create_boot_loader_config
 from kiwi.bootloader.config.grub2 import BootLoaderConfigGrub2
@@ -53,6 +54,7 @@ from kiwi.runtime_config import RuntimeConfig
 from kiwi.iso_tools.base import IsoToolsBase
 from kiwi.xml_state import XMLState
 from kiwi.command import Command
+from kiwi.command_trace import CommandTrace
 
 from kiwi.exceptions import KiwiLiveBootImageError
 
@@ -139,6 +141,7 @@ class LiveImageBuilder:
             }
         }
 
+    @CommandTrace.traced
     def create(self) -> Result:
         """
         Build a bootable hybrid live ISO image
@@ -380,13 +383,11 @@ class LiveImageBuilder:
                         root_dir=self.root_dir
                     )
                     luks_device = luks_provider.get_device() or DeviceProvider()
-                    Command.run(
-                        [
-                            'dd',
-                            f'if={container_image.name}',
-                            f'of={luks_device.get_device()}'
-                        ]
-                    )
+                    # the mapped luks device does not read as zeros,
+                    # thus holes of the image must be written
+                    BlockCopy(
+                        container_image.name, luks_device.get_device()
+                    ).copy(sparse=False)
                 Path.create(self.media_dir.name + '/LiveOS')
                 os.chmod(container_image.name, 0o644)
                 # Note: we keep the filename of the read-only image as it is
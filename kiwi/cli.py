@@ -27,6 +27,7 @@ usage: kiwi-ng -h | --help
                [--loglevel=<number>]
                [--debug]
                [--debug-run-scripts-in-screen]
+               [--trace]
                [--color-output]
                [--config=<configfile>]
                [--kiwi-file=<kiwifile>]
@@ -36,6 +37,7 @@ usage: kiwi-ng -h | --help
                [--loglevel=<number>]
                [--debug]
                [--debug-run-scripts-in-screen]
+               [--trace]
                [--color-output]
                [--config=<configfile>]
            result <command> [<args>...]
@@ -50,6 +52,7 @@ usage: kiwi-ng -h | --help
                [--loglevel=<number>]
                [--debug]
                [--debug-run-scripts-in-screen]
+               [--trace]
                [--color-output]
                [--config=<configfile>]
                [--kiwi-file=<kiwifile>]
@@ -82,6 +85,11 @@ global options:
         print debug information, same as: '--loglevel 10'
     --debug-run-scripts-in-screen
         run scripts called by kiwi in a screen session
+    --trace
+        record wall time, CPU time, exit code and output size of
+        all called commands together with the build phase. The
+        trace is written as kiwi.trace.json next to kiwi.result
+        and a summary of the most expensive commands is logged
     -v --version
         show program version
     help
@@ -251,7 +259,8 @@ class Cli:
 
     def load_command(self):
         """
-        Loads task class plugin according to service and command name
+        Loads task class plugin according to service and command name.
+        Only the task module of the selected command is imported
 
         :return: loaded task module
 
@@ -261,11 +270,11 @@ class Cli:
         if sys.version_info >= (3, 12):
             for entry in list(entry_points()):  # pragma: no cover
                 if entry.group == 'kiwi.tasks':
-                    discovered_tasks[entry.name] = entry.load()
+                    discovered_tasks[entry.name] = entry
         else:  # pragma: no cover
             module_entries = dict.get(entry_points(), 'kiwi.tasks')
             for entry in module_entries:
-                discovered_tasks[entry.name] = entry.load()
+                discovered_tasks[entry.name] = entry
 
         service = self.get_servicename()
         command = self.get_command()
@@ -275,10 +284,10 @@ class Cli:
                 'No command specified for {0} service'.format(service)
             )
 
-        self.command_loaded = discovered_tasks.get(
+        task_entry = discovered_tasks.get(
             service + '_' + command
         )
-        if not self.command_loaded:
+        if not task_entry:
             prefix = 'usage:'
             discovered_tasks_for_service = ''
             for task in discovered_tasks:
@@ -292,6 +301,7 @@ class Cli:
                     command, discovered_tasks_for_service
                 )
             )
+        self.command_loaded = task_entry.load()
         return self.command_loaded
 
     def _load_command_args(self):
@@ -29,6 +29,10 @@ else:  # pragma: no cover
 
 # project
 from kiwi.utils.codec import Codec
+from kiwi.command_trace import (
+    CommandTrace,
+    TracedPopen
+)
 
 from kiwi.exceptions import (
     KiwiCommandError,
@@ -134,19 +138,34 @@ class Command:
             return None
         stderr = subprocess.STDOUT if stderr_to_stdout else subprocess.PIPE
         log.debug('EXEC: [%s]', ' '.join(command))
+        trace_record = CommandTrace.start_command(command)
+        process: subprocess.Popen
         try:
-            process = subprocess.Popen(
-                [cmd_abspath] + command[1:],
-                stdout=subprocess.PIPE,
-                stderr=stderr,
-                env=environment
-            )
+            if trace_record:
+                process = TracedPopen(
+                    trace_record,
+                    [cmd_abspath] + command[1:],
+                    stdout=subprocess.PIPE,
+                    stderr=stderr,
+                    env=environment
+                )
+            else:
+                process = subprocess.Popen(
+                    [cmd_abspath] + command[1:],
+                    stdout=subprocess.PIPE,
+                    stderr=stderr,
+                    env=environment
+                )
         except (OSError, subprocess.SubprocessError) as e:
             raise KiwiCommandError(
                 f'{command[0]}: {type(e).__name__}: {format(e)}'
             ) from e
 
         output, error = process.communicate()
+        if trace_record:
+            CommandTrace.add_output(
+                trace_record, len(output or b'') + len(error or b'')
+            )
         if process.returncode != 0 and raise_on_error:
             if not error:
                 error = bytes(b'(no output on stderr)')
@@ -211,13 +230,24 @@ class Command:
             raise KiwiCommandNotFound(
                 f'Command "{command[0]}" not found in the environment'
             )
+        trace_record = CommandTrace.start_command(command)
+        process: subprocess.Popen
         try:
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                env=environment
-            )
+            if trace_record:
+                process = TracedPopen(
+                    trace_record,
+                    command,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    env=environment
+                )
+            else:
+                process = subprocess.Popen(
+                    command,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    env=environment
+                )
         except Exception as e:
             raise KiwiCommandError(
                 f'{type(e).__name__}: {format(e)}'
@@ -17,10 +17,17 @@
 #
 import os
 import logging
-from collections import namedtuple
+import selectors
+from collections import (
+    namedtuple, deque
+)
 from kiwi.command import CommandCallT
+from kiwi.command_trace import (
+    CommandTrace,
+    TracedPopen
+)
 from typing import (
-    NamedTuple, List, Callable
+    NamedTuple, List, Callable, Deque, Optional
 )
 
 # project
@@ -67,15 +74,24 @@ class CommandProcess:
 
     def poll_show_progress(
         self, items_to_complete: List[str], match_method: Callable,
-        with_stderr: bool = False
+        with_stderr: bool = False,
+        extract_method: Optional[Callable[[str], Optional[str]]] = None
     ):
         """
         Iterate over process and show progress in percent
         raise on error and log output
 
+        If an extract_method is given, it is called once per
+        output line and the returned item name is looked up in
+        an index of the items to complete. Otherwise the
+        match_method is called for each item on every line
+
         :param list items_to_complete: all items
         :param function match_method: method matching item
+        :param bool with_stderr: also process stderr lines
+        :param function extract_method: method extracting item from line
         """
+        items_index = set(items_to_complete)
         self._init_progress()
         for lineT in self.command:
             lines = [lineT.stdout_line]
@@ -84,9 +100,15 @@ class CommandProcess:
             for line in lines:
                 if line:
                     log.debug('%s: %s', self.log_topic, line)
-                    self._update_progress(
-                        match_method, items_to_complete, line
-                    )
+                    if extract_method:
+                        self._update_progress_from_index(
+                            extract_method, items_index,
+                            len(items_to_complete), line
+                        )
+                    else:
+                        self._update_progress(
+                            match_method, items_to_complete, line
+                        )
         self._stop_progress()
         if self.command.get_error_code() != 0:
             raise KiwiCommandError(
@@ -160,53 +182,59 @@ class CommandProcess:
                         '[ INFO    ]: Processing'
                     )
 
+    def _update_progress_from_index(
+        self, extract_method, items_index, items_count, command_output
+    ):
+        if extract_method(command_output) in items_index:
+            self.items_processed += 1
+            if self.items_processed <= items_count:
+                Logger.progress(
+                    self.items_processed, items_count,
+                    '[ INFO    ]: Processing'
+                )
+
 
 class CommandIterator:
     """
     **Implements an Iterator for Instances of Command**
 
+    The stdout and stderr channels of the command are drained
+    in chunks through a selector. Complete lines are buffered
+    and handed out one stdout/stderr pair per iteration
+
     :param subprocess command: instance of subprocess
+    :param int chunk_size: max number of bytes per read
     """
-    def __init__(self, command: CommandCallT) -> None:
+    def __init__(
+        self, command: CommandCallT, chunk_size: int = 65536
+    ) -> None:
         self.command = command
-        self.command_error_output = bytes(b'')
-        self.command_output_line = bytes(b'')
-        self.command_error_line = bytes(b'')
+        self.chunk_size = chunk_size
+        self.command_error_output: List[bytes] = []
+        self.command_output_line = bytearray()
+        self.command_error_line = bytearray()
+        self.command_output_lines: Deque[str] = deque()
+        self.command_error_lines: Deque[str] = deque()
         self.output_eof_reached = False
         self.errors_eof_reached = False
+        self.selector: Optional[selectors.BaseSelector] = None
 
     def __next__(self) -> PollT:
-        line_stdout = ''
-        line_stderr = ''
-        if self.command.process.poll() is not None:
+        while not self.command_output_lines and \
+                not self.command_error_lines:
             if self.output_eof_reached and self.errors_eof_reached:
+                if self.selector:
+                    self.selector.close()
+                    self.selector = None
+                self.command.process.wait()
                 raise StopIteration()
-
-        if self.command.output_available():
-            byte_read = self.command.output.read(1)
-            if not byte_read:
-                self.output_eof_reached = True
-            elif byte_read == bytes(b'\n'):
-                line_stdout = Codec.decode(self.command_output_line)
-                self.command_output_line = bytes(b'')
-            else:
-                self.command_output_line += byte_read
-
-        if self.command.error_available():
-            byte_read = self.command.error.read(1)
-            if not byte_read:
-                self.errors_eof_reached = True
-            elif byte_read == bytes(b'\n'):
-                line_stderr = Codec.decode(self.command_error_line)
-                self.command_error_line = bytes(b'')
-                self.command_error_output += byte_read
-            else:
-                self.command_error_line += byte_read
-                self.command_error_output += byte_read
+            self._read_available()
 
         return PollT(
-            stdout_line=line_stdout,
-            stderr_line=line_stderr
+            stdout_line=self.command_output_lines.popleft()
+            if self.command_output_lines else '',
+            stderr_line=self.command_error_lines.popleft()
+            if self.command_error_lines else ''
         )
 
     def get_error_output(self):
@@ -217,7 +245,7 @@ class CommandIterator:
 
         :rtype: str
         """
-        return Codec.decode(self.command_error_output)
+        return Codec.decode(b''.join(self.command_error_output))
 
     def get_error_code(self) -> int:
         """
@@ -247,3 +275,50 @@ class CommandIterator:
 
     def __iter__(self):
         return self
+
+    def _read_available(self) -> None:
+        if not self.selector:
+            self.selector = selectors.DefaultSelector()
+            self.selector.register(self.command.output, selectors.EVENT_READ)
+            self.selector.register(self.command.error, selectors.EVENT_READ)
+        for key, _ in self.selector.select():
+            data = os.read(key.fd, self.chunk_size)
+            if isinstance(self.command.process, TracedPopen):
+                CommandTrace.add_output(
+                    self.command.process.trace_record, len(data)
+                )
+            if not data:
+                self.selector.unregister(key.fileobj)
+            if key.fileobj is self.command.output:
+                if not data:
+                    self.output_eof_reached = True
+                self._add_lines(
+                    data, self.command_output_line,
+                    self.command_output_lines
+                )
+            else:
+                if not data:
+                    self.errors_eof_reached = True
+                else:
+                    self.command_error_output.append(data)
+                self._add_lines(
+                    data, self.command_error_line,
+                    self.command_error_lines
+                )
+
+    def _add_lines(
+        self, data: bytes, pending: bytearray, lines: Deque[str]
+    ) -> None:
+        if not data:
+            # end of stream, flush a trailing line without newline
+            if pending:
+                lines.append(Codec.decode(bytes(pending)))
+                pending.clear()
+            return
+        pending.extend(data)
+        if b'\n' in data:
+            complete_lines = bytes(pending).split(b'\n')
+            pending[:] = complete_lines.pop()
+            lines.extend(
+                Codec.decode(line) for line in complete_lines
+            )
@@ -0,0 +1,271 @@
+# Copyright (c) 2026 SUSE LLC.  All rights reserved.
+#
+# This file is part of kiwi.
+#
+# kiwi is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# kiwi is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kiwi.  If not, see <http://www.gnu.org/licenses/>
+#
+import os
+import json
+import time
+import logging
+import threading
+import subprocess
+from contextlib import contextmanager
+from functools import wraps
+from typing import (
+    Any, Callable, Dict, Iterator, List, Optional
+)
+
+log = logging.getLogger('kiwi')
+
+
+class CommandTrace:
+    """
+    **Record the external commands called during a build**
+
+    If enabled, every command started through Command.run or
+    Command.call is recorded with its start time, wall time,
+    CPU time of the child process, exit code, number of output
+    bytes and the build phase it was called from. Build phases
+    are marked with the phase context manager or the traced
+    decorator. The trace is written in the Chrome trace event
+    format which can be loaded into chrome://tracing or Perfetto
+    """
+    enabled = False
+    lock = threading.Lock()
+    events: List[Dict[str, Any]] = []
+    phases: List[str] = []
+
+    @classmethod
+    def enable(cls) -> None:
+        """
+        Enable tracing and drop previously recorded events
+        """
+        with cls.lock:
+            cls.enabled = True
+            cls.events = []
+            cls.phases = []
+
+    @classmethod
+    def disable(cls) -> None:
+        """
+        Disable tracing
+        """
+        cls.enabled = False
+
+    @classmethod
+    def start_command(cls, command: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Create a trace record for the given command
+
+        :param list command: command and arguments
+
+        :return: trace record or None if tracing is disabled
+
+        :rtype: dict
+        """
+        if not cls.enabled:
+            return None
+        return {
+            'name': os.path.basename(command[0]),
+            'cat': 'command',
+            'ph': 'X',
+            'ts': time.time() * 1e6,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'start': time.monotonic(),
+            'args': {
+                'command': ' '.join(command),
+                'phase': cls.phases[-1] if cls.phases else '',
+                'output_bytes': 0
+            }
+        }
+
+    @classmethod
+    def finish_command(
+        cls, record: Dict[str, Any], returncode: Optional[int],
+        cpu_time: float = 0.0
+    ) -> None:
+        """
+        Complete the trace record of a finished command
+
+        :param dict record: trace record from start_command
+        :param int returncode: exit code or None if not started
+        :param float cpu_time: user and system time of the command
+        """
+        record['dur'] = (time.monotonic() - record.pop('start')) * 1e6
+        record['args']['returncode'] = returncode
+        record['args']['cpu_time'] = cpu_time
+        with cls.lock:
+            cls.events.append(record)
+
+    @staticmethod
+    def add_output(record: Dict[str, Any], byte_count: int) -> None:
+        """
+        Account output bytes read from a traced command
+
+        :param dict record: trace record from start_command
+        :param int byte_count: number of bytes
+        """
+        record['args']['output_bytes'] += byte_count
+
+    @classmethod
+    @contextmanager
+    def phase(cls, name: str) -> Iterator[None]:
+        """
+        Context manager marking a build phase. Commands called
+        within the context are recorded with the given phase name
+
+        :param str name: phase name
+        """
+        if not cls.enabled:
+            yield
+            return
+        start = time.monotonic()
+        record = {
+            'name': name,
+            'cat': 'phase',
+            'ph': 'X',
+            'ts': time.time() * 1e6,
+            'pid': os.getpid(),
+            'tid': threading.get_ident()
+        }
+        cls.phases.append(name)
+        try:
+            yield
+        finally:
+            cls.phases.pop()
+            record['dur'] = (time.monotonic() - start) * 1e6
+            with cls.lock:
+                cls.events.append(record)
+
+    @classmethod
+    def traced(cls, method: Callable) -> Callable:
+        """
+        Decorator marking the decorated method as build phase
+        named by the qualified method name
+
+        :param callable method: method to decorate
+
+        :return: decorated method
+
+        :rtype: callable
+        """
+        @wraps(method)
+        def traced_method(*args, **kwargs):
+            with cls.phase(method.__qualname__):
+                return method(*args, **kwargs)
+        return traced_method
+
+    @classmethod
+    def write(cls, filename: str, count: int = 10) -> None:
+        """
+        Write recorded events as Chrome trace event file and
+        log a summary of the most expensive commands and phases
+
+        :param str filename: trace file name
+        :param int count: number of commands in the summary
+        """
+        if not cls.enabled:
+            return
+        with cls.lock:
+            events = list(cls.events)
+        with open(filename, 'w') as trace:
+            json.dump(
+                {'traceEvents': events, 'displayTimeUnit': 'ms'}, trace
+            )
+        log.info(f'Command trace written to {filename}')
+        for line in cls.get_summary(events, count):
+            log.info(line)
+
+    @staticmethod
+    def get_summary(events: List[Dict[str, Any]], count: int) -> List[str]:
+        """
+        Summarize the given trace events
+
+        :param list events: trace events
+        :param int count: number of commands to list
+
+        :return: summary lines
+
+        :rtype: list
+        """
+        commands = [event for event in events if event['cat'] == 'command']
+        phase_times: Dict[str, List[float]] = {}
+        for event in commands:
+            phase_time = phase_times.setdefault(
+                event['args']['phase'] or '(no phase)', [0, 0.0, 0.0]
+            )
+            phase_time[0] += 1
+            phase_time[1] += event['dur'] / 1e6
+            phase_time[2] += event['args']['cpu_time']
+        summary = [
+            'Command trace: {0} commands, {1:.3f}s wall time'.format(
+                len(commands), sum(event['dur'] for event in commands) / 1e6
+            ),
+            f'--> Top {count} commands by wall time:'
+        ]
+        for event in sorted(
+            commands, key=lambda event: event['dur'], reverse=True
+        )[:count]:
+            summary.append(
+                '    {0:9.3f}s wall {1:9.3f}s cpu [{2}] {3}'.format(
+                    event['dur'] / 1e6, event['args']['cpu_time'],
+                    event['args']['phase'], event['args']['command'][:120]
+                )
+            )
+        summary.append('--> Command time per phase:')
+        for phase, (calls, wall_time, cpu_time) in sorted(
+            phase_times.items(), key=lambda item: item[1][1], reverse=True
+        ):
+            summary.append(
+                '    {0:9.3f}s wall {1:9.3f}s cpu {2:5d} calls {3}'.format(
+                    wall_time, cpu_time, int(calls), phase
+                )
+            )
+        return summary
+
+
+class TracedPopen(subprocess.Popen):
+    """
+    **subprocess.Popen recording the command in a trace record**
+
+    The child is reaped via os.wait4 to obtain the resource
+    usage of exactly this process
+
+    :param dict trace_record: trace record from CommandTrace.start_command
+    """
+    def __init__(self, trace_record: Dict[str, Any], *args, **kwargs) -> None:
+        self.trace_record = trace_record
+        try:
+            super().__init__(*args, **kwargs)
+        except Exception:
+            CommandTrace.finish_command(trace_record, None)
+            raise
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        if self.returncode is None and timeout is None:
+            try:
+                pid, status, rusage = os.wait4(self.pid, 0)
+            except ChildProcessError:
+                # reaped elsewhere, no resource usage available
+                returncode = super().wait()
+                CommandTrace.finish_command(self.trace_record, returncode)
+                return returncode
+            self.returncode = os.waitstatus_to_exitcode(status)
+            CommandTrace.finish_command(
+                self.trace_record, self.returncode,
+                rusage.ru_utime + rusage.ru_stime
+            )
+        return super().wait(timeout)
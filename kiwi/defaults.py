@@ -24,7 +24,6 @@ from importlib.util import find_spec
 from importlib.machinery import ModuleSpec
 from collections import namedtuple
 import platform
-import yaml
 from typing import (
     List, NamedTuple, Optional, Dict
 )
@@ -190,6 +189,24 @@ class Defaults:
             '--threads=0'
         ]
 
+    @staticmethod
+    def get_zstd_compression_options():
+        """
+        Provides compression options for the zstd compressor
+
+        :return:
+            Contains list of options
+
+            .. code:: python
+
+                ['--option=value']
+
+        :rtype: list
+        """
+        return [
+            '--threads=0', '-19'
+        ]
+
     @staticmethod
     def get_platform_name():
         """
@@ -319,6 +336,118 @@ class Defaults:
         """
         return '/var/tmp/kiwi/satsolver'
 
+    @staticmethod
+    def get_download_cache_location():
+        """
+        Provides the directory to store repository metadata files
+        which are revalidated via If-None-Match/If-Modified-Since
+        on the next download
+
+        :return: directory path
+
+        :rtype: str
+        """
+        return '/var/tmp/kiwi/download_cache'
+
+    @staticmethod
+    def get_capabilities_cache_file():
+        """
+        Provides the file to store memoized tool capability probes
+        below the cache directory of the calling user
+
+        :return: file path
+
+        :rtype: str
+        """
+        return os.sep.join(
+            [Defaults.get_user_cache_location(), 'capabilities.json']
+        )
+
+    @staticmethod
+    def get_runtime_checks_cache_file():
+        """
+        Provides the file to store succeeded runtime checks of
+        the build host below the cache directory of the calling
+        user
+
+        :return: file path
+
+        :rtype: str
+        """
+        return os.sep.join(
+            [Defaults.get_user_cache_location(), 'runtime_checks.json']
+        )
+
+    @staticmethod
+    def get_description_cache_location():
+        """
+        Provides the directory to store validated and XSLT upgraded
+        image descriptions below the cache directory of the calling
+        user
+
+        :return: directory path
+
+        :rtype: str
+        """
+        return os.sep.join(
+            [Defaults.get_user_cache_location(), 'descriptions']
+        )
+
+    @staticmethod
+    def get_bootstrap_cache_location():
+        """
+        Provides the directory to store root trees after the
+        bootstrap phase below the cache directory of the calling
+        user
+
+        :return: directory path
+
+        :rtype: str
+        """
+        return os.sep.join(
+            [Defaults.get_user_cache_location(), 'bootstrap']
+        )
+
+    @staticmethod
+    def get_bootstrap_cache_max_size():
+        """
+        Provides the default maximum size of all cached bootstrap
+        root trees
+
+        :return: byte value
+
+        :rtype: int
+        """
+        return 20 * 1024 ** 3
+
+    @staticmethod
+    def get_user_cache_location():
+        """
+        Provides the kiwi cache directory of the calling user
+        according to the XDG base directory specification
+
+        :return: directory path
+
+        :rtype: str
+        """
+        cache_home = os.environ.get('XDG_CACHE_HOME') or os.sep.join(
+            [os.environ.get('HOME') or '', '.cache']
+        )
+        return os.sep.join([cache_home, 'kiwi'])
+
+    @staticmethod
+    def get_solvable_cache_size():
+        """
+        Provides the maximum number of bytes all cached SAT
+        solvables below the solvable location are allowed to
+        consume before the least recently used ones gets deleted
+
+        :return: size in bytes
+
+        :rtype: int
+        """
+        return 2 * 1024 * 1024 * 1024
+
     @staticmethod
     def set_runtime_checker_metadata(filename):
         """
@@ -464,6 +593,7 @@ class Defaults:
 
     @staticmethod
     def get_runtime_checker_metadata() -> Dict:
+        import yaml
         with open(RUNTIME_CHECKER_METADATA) as meta:
             return yaml.safe_load(meta)
 
@@ -495,6 +625,7 @@ class Defaults:
         )
         exclude_list = []
         if os.path.isfile(exclude_file):
+            import yaml
             with open(exclude_file) as exclude:
                 exclude_dict = yaml.safe_load(exclude)
                 exclude_data = exclude_dict.get('exclude')
@@ -2085,6 +2216,29 @@ class Defaults:
         """
         return 'umoci'
 
+    @staticmethod
+    def get_oci_layer_compression():
+        """
+        Provides the default compression of layers written by
+        the native OCI archive tool
+
+        :return: name
+
+        :rtype: str
+        """
+        return 'gzip'
+
+    @staticmethod
+    def get_sync_engine():
+        """
+        Provides the default engine to sync directory trees
+
+        :return: name
+
+        :rtype: str
+        """
+        return 'rsync'
+
     @staticmethod
     def get_part_mapper_tool():
         """
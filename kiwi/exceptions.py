@@ -47,6 +47,13 @@ class KiwiArchiveTarError(KiwiError):
     """
 
 
+class KiwiBlockCopyError(KiwiError):
+    """
+    Exception raised if copying data from a source file or
+    device to a target file or device has failed.
+    """
+
+
 class KiwiBootImageSetupError(KiwiError):
     """
     Exception raised if an unsupported initrd system type is used.
@@ -889,3 +896,16 @@ class KiwiCATargetDistributionError(KiwiError):
     Exception raised if no CA target distribution can be found
     but the request to import custom CA certificates was issued
     """
+
+
+class KiwiDataSyncError(KiwiError):
+    """
+    Exception raised if the in-process sync of a directory
+    tree to its target has failed
+    """
+
+
+class KiwiArchiveDebError(KiwiError):
+    """
+    Exception raised if the extraction of a Debian package failed
+    """
@@ -30,13 +30,16 @@ import kiwi.defaults as defaults
 
 from kiwi.defaults import Defaults
 from kiwi.utils.sync import DataSync
+from kiwi.utils.sync_manifest import SyncManifest
+from kiwi.utils.temporary import Temporary
 from kiwi.mount_manager import MountManager
 from kiwi.command import Command
 from kiwi.storage.device_provider import DeviceProvider
 from kiwi.utils.veritysetup import VeritySetup
 
 from kiwi.exceptions import (
-    KiwiFileSystemSyncError
+    KiwiFileSystemSyncError,
+    KiwiDataSyncError
 )
 
 log = logging.getLogger('kiwi')
@@ -73,6 +76,13 @@ class FileSystemBase:
         # filesystem file name here
         self.filename = ''
 
+        # filesystems which can be populated from a directory by
+        # their mkfs tool store the arguments of create_on_device
+        # here and the mkfs options to populate from a directory
+        # while sync_data creates them again with data
+        self.device_create_args: Optional[Dict] = None
+        self.populate_args: List[str] = []
+
         self.custom_args: Dict = {}
         self.post_init(custom_args)
         self.veritysetup: Optional[VeritySetup] = None
@@ -176,11 +186,17 @@ class FileSystemBase:
             return self.filesystem_mount.mountpoint
         return None
 
-    def sync_data(self, exclude: List[str] = []) -> MountManager:
+    def sync_data(
+        self, exclude: List[str] = [], offline: bool = False
+    ) -> MountManager:
         """
         Copy data tree into filesystem
 
         :param list exclude: list of exclude dirs/files
+        :param bool offline:
+            create the filesystem on the device again and populate
+            it from the data tree by the mkfs tool if supported,
+            instead of copying the data into the mounted filesystem
         :return: The mount created for syncing data. It should be used to
             un-mount the filesystem again.
         """
@@ -195,6 +211,11 @@ class FileSystemBase:
         self.filesystem_mount = MountManager(
             device=self.device_provider.get_device()
         )
+        if offline and self._sync_data_offline(exclude):
+            self.filesystem_mount.mount(
+                self.custom_args['mount_options']
+            )
+            return self.filesystem_mount
         self.filesystem_mount.mount(
             self.custom_args['mount_options']
         )
@@ -402,6 +423,69 @@ class FileSystemBase:
             )
         return format(int(result_size))
 
+    def _get_populate_args(self, data_dir: str) -> List[str]:
+        """
+        Provides the mkfs options to populate the filesystem from
+        the given directory
+
+        Implement in specialized filesystem class for filesystems
+        whose mkfs tool can populate the filesystem from a directory
+
+        :param str data_dir: directory path name
+
+        :return: list of mkfs options, empty if not supported
+
+        :rtype: list
+        """
+        return []
+
+    def _sync_data_offline(self, exclude: List[str]) -> bool:
+        """
+        Create the filesystem on the device again, populated from
+        a tree of hard links to the data tree without the excluded
+        entries. The UUID, label and size of the first creation
+        are kept. Filesystem attributes can only be applied to a
+        mounted filesystem, they require the online sync
+
+        :param list exclude: list of exclude dirs/files
+
+        :return: True if populated, False if not supported
+
+        :rtype: bool
+        """
+        if not self.device_create_args or \
+                not self.device_create_args.get('uuid') or \
+                self.custom_args['fs_attributes']:
+            return False
+        data_dir = Temporary(
+            path=os.path.dirname(os.path.normpath(self.root_dir))
+        ).new_dir()
+        populate_args = self._get_populate_args(data_dir.name)
+        if not populate_args:
+            return False
+        options = Defaults.get_sync_options()
+        flags = SyncManifest.get_flags(options)
+        if not flags:
+            return False
+        try:
+            SyncManifest.get(
+                self.root_dir, '--one-file-system' in options
+            ).link(data_dir.name, flags, exclude)
+        except KiwiDataSyncError as issue:
+            log.debug(f'Offline sync not possible: {issue}')
+            return False
+        log.info(
+            '--> populating {0} from {1}'.format(
+                type(self).__name__, self.root_dir
+            )
+        )
+        self.populate_args = populate_args
+        try:
+            self.create_on_device(**self.device_create_args)
+        finally:
+            self.populate_args = []
+        return True
+
     def _apply_attributes(self):
         """
         Apply filesystem attributes
@@ -16,10 +16,14 @@
 # along with kiwi.  If not, see <http://www.gnu.org/licenses/>
 #
 # project
+from typing import List
+
 import kiwi.defaults as defaults
 
 from kiwi.command import Command
 from kiwi.filesystem.base import FileSystemBase
+from kiwi.utils.block import BlockID
+from kiwi.utils.command_capabilities import CommandCapabilities
 
 
 class FileSystemBtrfs(FileSystemBase):
@@ -45,6 +49,9 @@ class FileSystemBtrfs(FileSystemBase):
         call_args = self.custom_args['create_options'].copy()
         if not uuid and label:
             uuid = self._generate_seed_uuid(label)
+        self.device_create_args = {
+            'label': label, 'size': size, 'unit': unit, 'uuid': uuid
+        }
         if label:
             call_args.append('-L')
             call_args.append(label)
@@ -61,8 +68,9 @@ class FileSystemBtrfs(FileSystemBase):
                 )
             )
         Command.run(
-            ['mkfs.btrfs'] + call_args + [device]
+            ['mkfs.btrfs'] + call_args + self.populate_args + [device]
         )
+        BlockID.invalidate(device)
 
     def set_uuid(self):
         """
@@ -72,3 +80,21 @@ class FileSystemBtrfs(FileSystemBase):
         Command.run(
             ['btrfstune', '-f', '-u', device]
         )
+        BlockID.invalidate(device)
+
+    def _get_populate_args(self, data_dir: str) -> List[str]:
+        """
+        Provides the mkfs options to populate the filesystem
+        from the given directory
+
+        :param str data_dir: directory path name
+
+        :return: list of mkfs options, empty if not supported
+
+        :rtype: list
+        """
+        if CommandCapabilities.has_option_in_help(
+            'mkfs.btrfs', '--rootdir', raise_on_error=False, silent=True
+        ):
+            return ['--rootdir', data_dir]
+        return []
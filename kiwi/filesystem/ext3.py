@@ -16,9 +16,13 @@
 # along with kiwi.  If not, see <http://www.gnu.org/licenses/>
 
 # project
+from typing import List
+
 import kiwi.defaults as defaults
 
 from kiwi.filesystem.base import FileSystemBase
+from kiwi.utils.block import BlockID
+from kiwi.utils.command_capabilities import CommandCapabilities
 from kiwi.command import Command
 
 
@@ -45,6 +49,9 @@ class FileSystemExt3(FileSystemBase):
         call_args = self.custom_args['create_options'].copy()
         if not uuid and label:
             uuid = self._generate_seed_uuid(label)
+        self.device_create_args = {
+            'label': label, 'size': size, 'unit': unit, 'uuid': uuid
+        }
         if label:
             call_args.append('-L')
             call_args.append(label)
@@ -60,8 +67,9 @@ class FileSystemExt3(FileSystemBase):
                 )
             )
         Command.run(
-            ['mkfs.ext3'] + call_args + device_args
+            ['mkfs.ext3'] + call_args + self.populate_args + device_args
         )
+        BlockID.invalidate(device_args[0])
 
     def set_uuid(self):
         """
@@ -74,3 +82,22 @@ class FileSystemExt3(FileSystemBase):
         Command.run(
             ['tune2fs', '-f', '-U', 'random', device]
         )
+        BlockID.invalidate(device)
+
+    def _get_populate_args(self, data_dir: str) -> List[str]:
+        """
+        Provides the mkfs options to populate the filesystem
+        from the given directory, supported since e2fsprogs 1.43
+
+        :param str data_dir: directory path name
+
+        :return: list of mkfs options, empty if not supported
+
+        :rtype: list
+        """
+        if CommandCapabilities.has_option_in_help(
+            'mkfs.ext3', '-d root-directory',
+            raise_on_error=False, silent=True
+        ):
+            return ['-d', data_dir]
+        return []
@@ -20,6 +20,7 @@ from uuid import UUID
 import kiwi.defaults as defaults
 
 from kiwi.filesystem.base import FileSystemBase
+from kiwi.utils.block import BlockID
 from kiwi.command import Command
 
 
@@ -65,6 +66,7 @@ class FileSystemFat32(FileSystemBase):
                 'mkdosfs', '-F32', '-I'
             ] + call_args + device_args
         )
+        BlockID.invalidate(device_args[0])
 
     def set_uuid(self):
         """
@@ -74,3 +76,4 @@ class FileSystemFat32(FileSystemBase):
         Command.run(
             ['mlabel', '-n', '-i', device, '::']
         )
+        BlockID.invalidate(device)
@@ -19,6 +19,7 @@
 import kiwi.defaults as defaults
 
 from kiwi.filesystem.base import FileSystemBase
+from kiwi.utils.block import BlockID
 from kiwi.command import Command
 
 
@@ -46,3 +47,4 @@ class FileSystemSwap(FileSystemBase):
         Command.run(
             ['mkswap'] + call_args + [device]
         )
+        BlockID.invalidate(device)
@@ -16,9 +16,13 @@
 # along with kiwi.  If not, see <http://www.gnu.org/licenses/>
 #
 # project
+from typing import List
+
 import kiwi.defaults as defaults
 
 from kiwi.filesystem.base import FileSystemBase
+from kiwi.utils.block import BlockID
+from kiwi.utils.command_capabilities import CommandCapabilities
 from kiwi.command import Command
 
 
@@ -45,6 +49,9 @@ class FileSystemXfs(FileSystemBase):
         call_args = self.custom_args['create_options'].copy()
         if not uuid and label:
             uuid = self._generate_seed_uuid(label)
+        self.device_create_args = {
+            'label': label, 'size': size, 'unit': unit, 'uuid': uuid
+        }
         if label:
             call_args.append('-L')
             call_args.append(label)
@@ -63,8 +70,9 @@ class FileSystemXfs(FileSystemBase):
                 )
             )
         Command.run(
-            ['mkfs.xfs', '-f'] + call_args + [device]
+            ['mkfs.xfs', '-f'] + call_args + self.populate_args + [device]
         )
+        BlockID.invalidate(device)
 
     def set_uuid(self):
         """
@@ -77,3 +85,24 @@ class FileSystemXfs(FileSystemBase):
         Command.run(
             ['xfs_admin', '-U', 'generate', device]
         )
+        BlockID.invalidate(device)
+
+    def _get_populate_args(self, data_dir: str) -> List[str]:
+        """
+        Provides the mkfs options to populate the filesystem
+        from the given directory. A classic protofile can't
+        express hard links, extended attributes and timestamps,
+        thus only mkfs.xfs versions which accept a directory as
+        prototype and keep the timestamps are used
+
+        :param str data_dir: directory path name
+
+        :return: list of mkfs options, empty if not supported
+
+        :rtype: list
+        """
+        if CommandCapabilities.has_option_in_help(
+            'mkfs.xfs', 'atime=', raise_on_error=False, silent=True
+        ):
+            return ['-p', f'file={data_dir},atime=1']
+        return []
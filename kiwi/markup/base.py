@@ -16,11 +16,17 @@
 # along with kiwi.  If not, see <http://www.gnu.org/licenses/>
 #
 import os
+import shutil
+import threading
 from lxml import etree
+from typing import (
+    Any, Dict, Tuple
+)
 from urllib.parse import urlparse
 
 # project
 from kiwi.utils.temporary import Temporary
+from kiwi.utils.description_cache import DescriptionCache
 from kiwi.defaults import Defaults
 from kiwi.exceptions import (
     KiwiConfigFileFormatNotSupported,
@@ -33,12 +39,20 @@ class MarkupBase:
     """
     **Implements base class for Markup interface**
 
+    The compiled XSLT style sheets are shared by all instances
+    of the process
+
     Attributes
 
     :param str description: description path
     """
+    xslt_lock = threading.Lock()
+    xslt_transforms: Dict[str, Tuple[Any, 'FileResolver']] = {}
+
     def __init__(self, description: str):
         self.description = description
+        self.description_cache_key = ''
+        self.description_validated = False
         self.post_init()
 
     def post_init(self) -> None:
@@ -68,23 +82,30 @@ class MarkupBase:
                 'Python anymarkup module is required.'
             )
 
-        xslt_transform_parser = etree.XMLParser()
-        xslt_transform_parser.resolvers.add(
-            FileResolver(os.path.dirname(self.description))
-        )
-        xslt_transform = etree.XSLT(
-            etree.parse(
-                Defaults.get_xsl_stylesheet_file(), xslt_transform_parser
-            )
-        )
         self.description_xslt_processed = Temporary(
             prefix='kiwi_xslt-'
         ).new_file()
+
+        # Use the validated result of a former kiwi call if the
+        # description and its include files are unchanged
+        self.description_cache_key = self._get_description_cache_key(
+            description, parsed_description
+        )
+        cached_description = DescriptionCache.lookup(
+            self.description_cache_key
+        )
+        self.description_validated = bool(cached_description)
+        if cached_description:
+            shutil.copyfile(
+                cached_description, self.description_xslt_processed.name
+            )
+            return self.description_xslt_processed.name
+
         try:
             with open(self.description_xslt_processed.name, "wb") as xsltout:
                 xsltout.write(
                     etree.tostring(
-                        xslt_transform(parsed_description), pretty_print=True
+                        self._transform(parsed_description), pretty_print=True
                     )
                 )
         except etree.XMLSyntaxError as issue:
@@ -110,12 +131,70 @@ class MarkupBase:
         """
         raise NotImplementedError
 
+    def _transform(self, parsed_description: Any) -> Any:
+        """
+        Apply the XSLT style sheets compiled once per process. The
+        include references of the description are resolved relative
+        to the description directory
+        """
+        stylesheet = Defaults.get_xsl_stylesheet_file()
+        with MarkupBase.xslt_lock:
+            if stylesheet not in MarkupBase.xslt_transforms:
+                resolver = FileResolver('')
+                xslt_transform_parser = etree.XMLParser()
+                xslt_transform_parser.resolvers.add(resolver)
+                MarkupBase.xslt_transforms[stylesheet] = (
+                    etree.XSLT(
+                        etree.parse(stylesheet, xslt_transform_parser)
+                    ),
+                    resolver
+                )
+            xslt_transform, resolver = MarkupBase.xslt_transforms[stylesheet]
+            resolver.description_dir = os.path.dirname(self.description)
+            return xslt_transform(parsed_description)
+
+    def _get_description_cache_key(
+        self, description: str, parsed_description: Any
+    ) -> str:
+        if not DescriptionCache.cache_dir:
+            return ''
+        description_files = [description]
+        resolver = FileResolver(os.path.dirname(self.description))
+        for include_reference in parsed_description.xpath('/image/include/@from'):
+            include_file = resolver.get_filename(str(include_reference))
+            if not os.path.isabs(include_file):
+                include_file = os.path.join(
+                    os.path.dirname(description), include_file
+                )
+            if not os.path.isfile(include_file):
+                return ''
+            description_files.append(include_file)
+        return DescriptionCache.get_key(description_files)
+
 
 class FileResolver(etree.Resolver):
     def __init__(self, description_dir):
         self.description_dir = description_dir
 
     def resolve(self, url, pubid, context):
+        url = self.get_filename(url)
+        if os.path.exists(url):
+            return self.resolve_filename(url, context)
+        else:
+            raise KiwiIncludFileNotFoundError(
+                f'include reference {url!r} does not exist'
+            )
+
+    def get_filename(self, url: str) -> str:
+        """
+        Provides the file name referenced by the given include url
+
+        :param str url: include reference
+
+        :return: file path
+
+        :rtype: str
+        """
         if url.startswith('this://'):
             url = url.replace('this://', '')
             url = 'dir://{0}'.format(
@@ -126,9 +205,4 @@ class FileResolver(etree.Resolver):
             url = ''.join([uri.netloc, uri.path])
         elif uri.path:
             url = uri.path
-        if os.path.exists(url):
-            return self.resolve_filename(url, context)
-        else:
-            raise KiwiIncludFileNotFoundError(
-                f'include reference {url!r} does not exist'
-            )
+        return url
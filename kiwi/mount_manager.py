@@ -27,6 +27,7 @@ from typing import (
 from kiwi.path import Path
 from kiwi.utils.temporary import Temporary
 from kiwi.command import Command
+from kiwi.utils.mount_table import MountTable
 from kiwi.exceptions import KiwiCommandError, KiwiUmountBusyError
 
 log = logging.getLogger('kiwi')
@@ -81,6 +82,7 @@ class MountManager:
             Command.run(
                 ['mount', '-n', '--bind', self.device, self.mountpoint]
             )
+            MountTable.invalidate()
 
     def overlay_mount(self, lower: str) -> None:
         self.device = 'overlay'
@@ -99,6 +101,7 @@ class MountManager:
                     )
                 ]
             )
+            MountTable.invalidate()
 
     def tmpfs_mount(self) -> None:
         """
@@ -108,6 +111,7 @@ class MountManager:
             Command.run(
                 ['mount', '-t', 'tmpfs', 'tmpfs', self.mountpoint]
             )
+            MountTable.invalidate()
 
     def mount(self, options: List[str] = []) -> None:
         """
@@ -122,6 +126,7 @@ class MountManager:
             Command.run(
                 ['mount'] + option_list + [self.device, self.mountpoint]
             )
+            MountTable.invalidate()
 
     def umount_lazy(self) -> None:
         """
@@ -133,6 +138,7 @@ class MountManager:
         """
         if self.is_mounted():
             Command.run(['umount', '-l', self.mountpoint])
+            MountTable.invalidate()
 
     def umount(self, raise_on_busy: bool = True) -> bool:
         """
@@ -168,45 +174,42 @@ class MountManager:
                     log.error(
                         f'umount of {self.mountpoint} failed with: {err}'
                     )
+            MountTable.invalidate()
             if not umounted_successfully:
-                if raise_on_busy:
-                    lsof = Path.which('lsof', access_mode=os.X_OK)
-                    if lsof:
-                        open_files = Command.run(
-                            [lsof, '+c', '0', self.mountpoint],
-                            raise_on_error=False
-                        )
-                        open_files_info = 'Open files status:{0}{1}'.format(
-                            os.linesep, open_files.output
-                        )
-                    else:
-                        open_files_info = 'For further details install: lsof'
-                    message = dedent('''\n
-                        Failed to umount: {0}.
-
-                        Your build host system is in an inconsistent state.
-                        The cleanup of the created resource was not possible
-                        because it is still busy. This resource and all nested
-                        resources stays active on your host and needs a manual
-                        cleanup.
-
-                        Please do not use the intermediate state of the image
-                        files created so far. There is no guarantee that the
-                        produced results are valid.
-
-                        {1}
-                    ''')
-                    raise KiwiUmountBusyError(
-                        message.format(self.mountpoint, open_files_info)
-                    )
-                else:
-                    log.warning(
-                        '{0} still busy at {1}'.format(
-                            self.mountpoint, type(self).__name__
-                        )
-                    )
-                    # skip removing the mountpoint directory
-                    return False
+                return self._umount_busy(self.mountpoint, raise_on_busy)
+        return True
+
+    def umount_tree(self, raise_on_busy: bool = True) -> bool:
+        """
+        Umount the mountpoint directory and all mounts below it
+
+        All mounts are umounted in one pass, deepest first. A busy
+        mount is released in lazy mode right away instead of waiting
+        for it. If the mount table is not available this is the same
+        as umount
+
+        :return: True or False
+
+        :rtype: bool
+        """
+        mountpoints = MountTable.get_mountpoints(self.mountpoint)
+        if mountpoints is None:
+            return self.umount(raise_on_busy)
+        busy_mountpoint = ''
+        for mountpoint in mountpoints:
+            try:
+                Command.run(['umount', mountpoint])
+            except KiwiCommandError as err:
+                log.warning(f'umount of {mountpoint} failed with: {err}')
+                try:
+                    Command.run(['umount', '--lazy', mountpoint])
+                except KiwiCommandError as err:
+                    log.error(f'umount of {mountpoint} failed with: {err}')
+                    busy_mountpoint = busy_mountpoint or mountpoint
+        if mountpoints:
+            MountTable.invalidate()
+        if busy_mountpoint:
+            return self._umount_busy(busy_mountpoint, raise_on_busy)
         return True
 
     def is_mounted(self) -> bool:
@@ -217,8 +220,50 @@ class MountManager:
 
         :rtype: bool
         """
-        mountpoint_call = Command.run(
-            command=['mountpoint', '-q', self.mountpoint],
-            raise_on_error=False
+        mounted = MountTable.is_mountpoint(self.mountpoint)
+        if mounted is None:
+            mountpoint_call = Command.run(
+                command=['mountpoint', '-q', self.mountpoint],
+                raise_on_error=False
+            )
+            mounted = mountpoint_call.returncode == 0
+        return mounted
+
+    def _umount_busy(self, mountpoint: str, raise_on_busy: bool) -> bool:
+        if raise_on_busy:
+            lsof = Path.which('lsof', access_mode=os.X_OK)
+            if lsof:
+                open_files = Command.run(
+                    [lsof, '+c', '0', mountpoint],
+                    raise_on_error=False
+                )
+                open_files_info = 'Open files status:{0}{1}'.format(
+                    os.linesep, open_files.output
+                )
+            else:
+                open_files_info = 'For further details install: lsof'
+            message = dedent('''\n
+                Failed to umount: {0}.
+
+                Your build host system is in an inconsistent state.
+                The cleanup of the created resource was not possible
+                because it is still busy. This resource and all nested
+                resources stays active on your host and needs a manual
+                cleanup.
+
+                Please do not use the intermediate state of the image
+                files created so far. There is no guarantee that the
+                produced results are valid.
+
+                {1}
+            ''')
+            raise KiwiUmountBusyError(
+                message.format(mountpoint, open_files_info)
+            )
+        log.warning(
+            '{0} still busy at {1}'.format(
+                mountpoint, type(self).__name__
+            )
         )
-        return mountpoint_call.returncode == 0
+        # skip removing the mountpoint directory
+        return False
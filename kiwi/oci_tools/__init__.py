@@ -45,6 +45,9 @@ class OCI(metaclass=ABCMeta):
         elif tool_name == "buildah":
             from kiwi.oci_tools.buildah import OCIBuildah
             return OCIBuildah()
+        elif tool_name == "native":
+            from kiwi.oci_tools.native import OCINative
+            return OCINative()
         else:
             raise KiwiOCIArchiveToolError(
                 'No support for {0} tool available'.format(tool_name)
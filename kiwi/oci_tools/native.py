@@ -0,0 +1,819 @@
+# Copyright (c) 2026 SUSE LLC.  All rights reserved.
+#
+# This file is part of kiwi.
+#
+# kiwi is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# kiwi is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kiwi.  If not, see <http://www.gnu.org/licenses/>
+#
+import io
+import os
+import json
+import stat
+import shutil
+import hashlib
+import logging
+import tarfile
+import threading
+import subprocess
+from contextlib import contextmanager
+from typing import (
+    IO, Callable, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+)
+
+# project
+import kiwi.defaults as defaults
+
+from kiwi.oci_tools.base import OCIBase
+from kiwi.command import Command
+from kiwi.defaults import Defaults
+from kiwi.path import Path
+from kiwi.runtime_config import RuntimeConfig
+from kiwi.utils.sync_manifest import (
+    SyncManifest, ManifestEntryT
+)
+from kiwi.utils.temporary import Temporary
+
+from kiwi.exceptions import KiwiOCIArchiveToolError
+
+log = logging.getLogger('kiwi')
+
+
+class LayerFileT(NamedTuple):
+    kind: bytes
+    mode: int
+    uid: int
+    gid: int
+    size: int
+    mtime: int
+    link: str
+    rdev: int
+    xattrs: Tuple[Tuple[str, bytes], ...]
+
+
+class DigestWriter:
+    """
+    **Pass written data on to a file object and hash it**
+
+    :param object target: file object to write to
+    """
+    def __init__(self, target: IO[bytes]) -> None:
+        self.target = target
+        self.digest = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        """
+        Hash the data and write it to the target
+
+        :param bytes data: data to write
+
+        :return: number of bytes written
+
+        :rtype: int
+        """
+        self.digest.update(data)
+        self.size += len(data)
+        return self.target.write(data)
+
+    def get_digest(self) -> str:
+        """
+        Provides the OCI digest of all written data
+
+        :return: sha256:hexdigest
+
+        :rtype: str
+        """
+        return f'sha256:{self.digest.hexdigest()}'
+
+
+class OCINative(OCIBase):
+    """
+    **Open Container Operations without an external OCI tool**
+
+    The layer is written as a tar stream directly from the root
+    tree of the image. Only the paths which differ from the file
+    manifest of the base image layers are added, paths removed
+    from the base image are added as whiteout files. The stream
+    is compressed by a parallel gzip or zstd and hashed on the
+    fly. The blobs, the manifest and the config of the image are
+    written to an OCI layout by this class. skopeo is only used
+    to import and export transports other than oci-archive
+    """
+    media_type_index = 'application/vnd.oci.image.index.v1+json'
+    media_type_manifest = 'application/vnd.oci.image.manifest.v1+json'
+    media_type_config = 'application/vnd.oci.image.config.v1+json'
+    media_type_layer = 'application/vnd.oci.image.layer.v1.tar'
+    ref_name = 'org.opencontainers.image.ref.name'
+    whiteout_prefix = '.wh.'
+    opaque_whiteout = '.wh..wh..opq'
+    architectures = {
+        'x86_64': 'amd64',
+        'i586': '386',
+        'i686': '386',
+        'aarch64': 'arm64',
+        'armv7l': 'arm',
+        'ppc64le': 'ppc64le',
+        's390x': 's390x',
+        'riscv64': 'riscv64'
+    }
+    # extended attributes which are not stored in a layer
+    # like umoci does, they are specific to the build host
+    ignored_xattrs = ('security.selinux',)
+    zstd_magic = b'\x28\xb5\x2f\xfd'
+    chunk_size = 1 << 20
+
+    def post_init(self):
+        """
+        Initializes the OCI layout location and the layer compression
+        """
+        self.oci_dir_tempfile = Temporary(prefix='kiwi_oci_dir.').new_dir()
+        self.oci_dir = self.oci_dir_tempfile.name
+        self.container_dir = os.sep.join(
+            [self.oci_dir, 'oci_layout']
+        )
+        self.container_tag = Defaults.get_container_base_image_tag()
+        self.layer_compression = \
+            RuntimeConfig().get_oci_layer_compression()
+        self.manifest: Dict = {}
+        self.config: Dict = {}
+        self.base_files: Dict[str, LayerFileT] = {}
+        self.layer_whiteouts: Dict[str, List[str]] = {}
+        self.root_dir = ''
+        self.exclude_list: List[str] = []
+
+    def import_container_image(self, container_image_ref):
+        """
+        Imports container image reference to an OCI layout.
+        An oci-archive is extracted as it is, other transports
+        are copied by skopeo
+
+        :param str container_image_ref: container image reference
+        """
+        transport, _, location = container_image_ref.partition(':')
+        tag = Defaults.get_container_base_image_tag()
+        if transport == 'oci-archive':
+            filename, _, archive_tag = location.partition(':')
+            self._init_layout()
+            self._extract_layout(filename)
+            descriptor = self._find_manifest(archive_tag)
+            self._set_tag(descriptor, tag)
+        else:
+            Command.run(
+                [
+                    'skopeo', 'copy', container_image_ref,
+                    'oci:{0}:{1}'.format(self.container_dir, tag)
+                ] + self._get_skopeo_tmpdir_option()
+            )
+            descriptor = self._find_manifest(tag)
+        self.container_tag = tag
+        self.manifest = self._read_blob(descriptor['digest'])
+        self.config = self._read_blob(self.manifest['config']['digest'])
+
+    def export_container_image(
+        self, filename, transport, image_ref, additional_names=None
+    ):
+        """
+        Exports the working container to a container image archive.
+        An oci-archive is written as a tar archive of the layout
+        with only the working image in it, other transports are
+        written by skopeo
+
+        :param str filename: The resulting filename
+        :param str transport: The archive format
+        :param str image_ref: Image reference of the exported image
+        :param list additional_names: List of additional references
+        """
+        Path.wipe(filename)
+        if transport == 'oci-archive':
+            self._write_archive(filename, image_ref)
+            return
+        extra_tags_opt = []
+        for ref in additional_names or []:
+            extra_tags_opt.extend(['--additional-tag', ref])
+        Command.run(
+            [
+                'skopeo', 'copy', 'oci:{0}:{1}'.format(
+                    self.container_dir, self.container_tag
+                ),
+                '{0}:{1}:{2}'.format(transport, filename, image_ref)
+            ] + extra_tags_opt + self._get_skopeo_tmpdir_option()
+        )
+
+    def init_container(self):
+        """
+        Initialize a new container layout with an image
+        without layers
+        """
+        self._init_layout()
+        self.manifest = {
+            'schemaVersion': 2,
+            'mediaType': self.media_type_manifest,
+            'config': {},
+            'layers': []
+        }
+        self.config = {
+            'created': self.creation_date,
+            'architecture': self.architectures.get(
+                defaults.PLATFORM_MACHINE, defaults.PLATFORM_MACHINE
+            ),
+            'os': 'linux',
+            'config': {},
+            'rootfs': {
+                'type': 'layers',
+                'diff_ids': []
+            },
+            'history': []
+        }
+
+    def unpack(self):
+        """
+        Read the file manifest of the container layers with the
+        whiteouts of each layer applied. The layers are not
+        extracted
+        """
+        self.base_files = {}
+        self.layer_whiteouts = {}
+        for layer in self.manifest['layers']:
+            whiteouts = []
+            with self._open_layer(layer['digest']) as tar:
+                for member in tar:
+                    path = self._normalize(member.name)
+                    directory, name = os.path.split(path)
+                    if name.startswith(self.whiteout_prefix):
+                        whiteouts.append(path)
+                        if name == self.opaque_whiteout:
+                            self._remove_base_files(directory, False)
+                        else:
+                            self._remove_base_files(
+                                os.path.join(
+                                    directory,
+                                    name[len(self.whiteout_prefix):]
+                                ), True
+                            )
+                    else:
+                        self._add_base_file(path, member)
+            self.layer_whiteouts[layer['digest']] = whiteouts
+
+    def sync_rootfs(self, root_dir, exclude_list=None):
+        """
+        Use the image root as the rootfs of the container. Nothing
+        is copied, the layer is written from root_dir on repack
+
+        :param string root_dir: root directory of the prepare step
+        :param list exclude_list: list of paths to exclude
+        """
+        self.root_dir = root_dir
+        self.exclude_list = exclude_list or []
+
+    def import_rootfs(self, root_dir, exclude_list=None):
+        """
+        Extract the container layers into the root tree of the
+        build, the whiteouts of a layer are applied before it
+        is extracted
+
+        :param string root_dir: root directory used in prepare step
+        :param list exclude_list: list of paths to exclude
+        """
+        exclude_options = ['--exclude', f'{self.whiteout_prefix}*']
+        for item in exclude_list or []:
+            exclude_options.extend(['--exclude', item])
+        for layer in self.manifest['layers']:
+            for path in self.layer_whiteouts.get(layer['digest'], []):
+                self._apply_whiteout(root_dir, path)
+            Command.run(
+                [
+                    'tar', '-C', root_dir, '--numeric-owner', '--xattrs',
+                    '--xattrs-include=*', '-x', '-f',
+                    self._get_blob_path(layer['digest'])
+                ] + exclude_options
+            )
+
+    def repack(self, oci_config):
+        """
+        Write the difference of the image root to the file manifest
+        of the container layers as new layer
+
+        :param list oci_config: meta data list
+        """
+        flags = SyncManifest.get_flags(Defaults.get_sync_options())
+        assert flags
+        manifest = SyncManifest.get(self.root_dir, one_file_system=True)
+        kinds = {
+            entry.path: stat.S_IFMT(entry.mode) for entry in manifest.entries
+        }
+        whiteouts = self._get_whiteouts(
+            kinds, SyncManifest.get_exclude_filter(self.exclude_list)
+        )
+        log.info('--> Writing container layer from {0}'.format(self.root_dir))
+        layer, diff_id = self._write_layer(
+            lambda tar: self._add_layer_entries(
+                tar, manifest.select(flags, self.exclude_list), whiteouts
+            )
+        )
+        self.manifest['layers'].append(layer)
+        self.layer_whiteouts[layer['digest']] = [
+            self._get_whiteout_name(path) for path in whiteouts
+        ]
+        self.config['rootfs']['diff_ids'].append(diff_id)
+        history = {'created': self.creation_date}
+        for key in ('created_by', 'author', 'comment'):
+            if key in oci_config.get('history', {}):
+                history[key] = oci_config['history'][key]
+        self.config.setdefault('history', []).append(history)
+
+    def set_config(self, oci_config):
+        """
+        Set list of meta data information such as entry_point,
+        maintainer, etc... to the container and write the config
+        and manifest of the image under the container tag
+
+        :param list oci_config: meta data list
+        """
+        # images written by docker store unset settings as null
+        config = {
+            name: value for name, value in (
+                self.config.get('config') or {}
+            ).items() if value is not None
+        }
+        self.config['config'] = config
+        if 'maintainer' in oci_config:
+            self.config['author'] = oci_config['maintainer']
+        if 'user' in oci_config:
+            config['User'] = oci_config['user']
+        if 'workingdir' in oci_config:
+            config['WorkingDir'] = oci_config['workingdir']
+        for key, name in (
+            ('entry_command', 'Entrypoint'), ('entry_subcommand', 'Cmd')
+        ):
+            if key in oci_config:
+                if len(oci_config[key]) == 0:
+                    config.pop(name, None)
+                else:
+                    config[name] = list(oci_config[key])
+        for vol in oci_config.get('volumes', []):
+            config.setdefault('Volumes', {})[vol] = {}
+        if 'stopsignal' in oci_config:
+            config['StopSignal'] = oci_config['stopsignal']
+        for port in oci_config.get('expose_ports', []):
+            config.setdefault('ExposedPorts', {})[port] = {}
+        environment = oci_config.get('environment', {})
+        for name in sorted(environment):
+            config['Env'] = [
+                variable for variable in config.get('Env', [])
+                if variable.partition('=')[0] != name
+            ] + ['{0}={1}'.format(name, environment[name])]
+        for name in sorted(oci_config.get('labels', {})):
+            config.setdefault('Labels', {})[name] = \
+                oci_config['labels'][name]
+        self.config['created'] = self.creation_date
+        self.manifest['config'] = self._write_blob(
+            json.dumps(self.config).encode(), self.media_type_config
+        )
+        self.container_tag = oci_config['container_tag']
+        self._set_tag(
+            self._write_blob(
+                json.dumps(self.manifest).encode(), self.media_type_manifest
+            ), self.container_tag
+        )
+
+    def post_process(self):
+        """
+        Delete the blobs no image in the layout refers to
+        """
+        referenced: Set[str] = set()
+        for descriptor in self._read_index()['manifests']:
+            referenced.update(self._get_references(descriptor))
+        blob_dir = os.sep.join([self.container_dir, 'blobs', 'sha256'])
+        for name in os.listdir(blob_dir):
+            if f'sha256:{name}' not in referenced:
+                os.unlink(os.sep.join([blob_dir, name]))
+
+    def _init_layout(self) -> None:
+        os.makedirs(
+            os.sep.join([self.container_dir, 'blobs', 'sha256']),
+            exist_ok=True
+        )
+        with open(os.sep.join([self.container_dir, 'oci-layout']), 'w') as layout:
+            json.dump({'imageLayoutVersion': '1.0.0'}, layout)
+        self._write_index({'schemaVersion': 2, 'manifests': []})
+
+    def _extract_layout(self, filename: str) -> None:
+        try:
+            with tarfile.open(filename) as archive:
+                for member in archive:
+                    path = self._normalize(member.name)
+                    if not member.isfile() or path.startswith('..'):
+                        continue
+                    target = os.sep.join([self.container_dir, path])
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    source = archive.extractfile(member)
+                    if source:
+                        with open(target, 'wb') as target_file:
+                            shutil.copyfileobj(
+                                source, target_file, self.chunk_size
+                            )
+        except (OSError, tarfile.TarError) as issue:
+            raise KiwiOCIArchiveToolError(
+                f'Failed to read container archive {filename}: {issue}'
+            )
+
+    def _find_manifest(self, tag: str) -> Dict:
+        manifests = self._read_index()['manifests']
+        for descriptor in manifests:
+            if tag and descriptor.get('annotations', {}).get(
+                self.ref_name
+            ) == tag:
+                break
+        else:
+            if tag or len(manifests) != 1:
+                raise KiwiOCIArchiveToolError(
+                    f'No image {tag!r} found in container layout'
+                )
+            descriptor = manifests[0]
+        while descriptor['mediaType'] == self.media_type_index:
+            # an image index for more than one platform
+            architecture = self.architectures.get(
+                defaults.PLATFORM_MACHINE, defaults.PLATFORM_MACHINE
+            )
+            for platform_descriptor in self._read_blob(
+                descriptor['digest']
+            )['manifests']:
+                if platform_descriptor.get('platform', {}).get(
+                    'architecture'
+                ) == architecture:
+                    descriptor = platform_descriptor
+                    break
+            else:
+                raise KiwiOCIArchiveToolError(
+                    f'No image for {architecture} found in container layout'
+                )
+        return descriptor
+
+    def _set_tag(self, descriptor: Dict, tag: str) -> None:
+        index = self._read_index()
+        index['manifests'] = [
+            manifest for manifest in index['manifests']
+            if manifest.get('annotations', {}).get(self.ref_name) != tag
+        ] + [dict(descriptor, annotations={self.ref_name: tag})]
+        self._write_index(index)
+
+    def _get_references(self, descriptor: Dict) -> Set[str]:
+        references = {descriptor['digest']}
+        if descriptor['mediaType'] == self.media_type_index:
+            for manifest in self._read_blob(descriptor['digest'])['manifests']:
+                references.update(self._get_references(manifest))
+        elif descriptor['mediaType'] == self.media_type_manifest:
+            manifest = self._read_blob(descriptor['digest'])
+            references.add(manifest['config']['digest'])
+            for layer in manifest['layers']:
+                references.add(layer['digest'])
+        return references
+
+    def _read_index(self) -> Dict:
+        with open(os.sep.join([self.container_dir, 'index.json'])) as index:
+            return json.load(index)
+
+    def _write_index(self, index: Dict) -> None:
+        with open(
+            os.sep.join([self.container_dir, 'index.json']), 'w'
+        ) as index_file:
+            json.dump(index, index_file)
+
+    def _get_blob_path(self, digest: str) -> str:
+        algorithm, _, hexdigest = digest.partition(':')
+        return os.sep.join([self.container_dir, 'blobs', algorithm, hexdigest])
+
+    def _read_blob(self, digest: str) -> Dict:
+        with open(self._get_blob_path(digest)) as blob:
+            return json.load(blob)
+
+    def _write_blob(self, data: bytes, media_type: str) -> Dict:
+        digest = f'sha256:{hashlib.sha256(data).hexdigest()}'
+        with open(self._get_blob_path(digest), 'wb') as blob:
+            blob.write(data)
+        return {'mediaType': media_type, 'digest': digest, 'size': len(data)}
+
+    @contextmanager
+    def _open_layer(self, digest: str) -> Iterator[tarfile.TarFile]:
+        blob_path = self._get_blob_path(digest)
+        try:
+            with open(blob_path, 'rb') as blob:
+                if blob.read(4) != self.zstd_magic:
+                    blob.seek(0)
+                    with tarfile.open(fileobj=blob, mode='r|*') as tar:
+                        yield tar
+                    return
+            zstd = subprocess.Popen(
+                ['zstd', '-d', '-c', '-q', blob_path],
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+            try:
+                with tarfile.open(fileobj=zstd.stdout, mode='r|') as tar:
+                    yield tar
+            finally:
+                error = zstd.communicate()[1]
+            if zstd.returncode != 0:
+                raise KiwiOCIArchiveToolError(
+                    f'Decompression of {digest} failed: {error.decode()}'
+                )
+        except (OSError, tarfile.TarError) as issue:
+            raise KiwiOCIArchiveToolError(
+                f'Failed to read layer {digest}: {issue}'
+            )
+
+    def _add_base_file(self, path: str, member: tarfile.TarInfo) -> None:
+        previous = self.base_files.get(path)
+        if previous and previous.kind == tarfile.DIRTYPE and \
+                not member.isdir():
+            self._remove_base_files(path, False)
+        if member.islnk():
+            link_target = self.base_files.get(self._normalize(member.linkname))
+            if link_target:
+                self.base_files[path] = link_target
+            return
+        self.base_files[path] = LayerFileT(
+            kind=tarfile.REGTYPE if member.isfile() else member.type,
+            mode=member.mode & 0o7777,
+            uid=member.uid,
+            gid=member.gid,
+            size=member.size if member.isfile() else 0,
+            mtime=int(member.mtime),
+            link=member.linkname if member.issym() else '',
+            rdev=os.makedev(member.devmajor, member.devminor)
+            if member.ischr() or member.isblk() else 0,
+            xattrs=tuple(
+                sorted(
+                    (
+                        name[len('SCHILY.xattr.'):],
+                        value.encode('utf-8', 'surrogateescape')
+                    ) for name, value in member.pax_headers.items()
+                    if name.startswith('SCHILY.xattr.') and name[
+                        len('SCHILY.xattr.'):
+                    ] not in self.ignored_xattrs
+                )
+            )
+        )
+
+    def _remove_base_files(self, path: str, remove_path: bool) -> None:
+        prefix = path + '/' if path else ''
+        for base_path in [
+            base_path for base_path in self.base_files
+            if base_path.startswith(prefix) and base_path != path
+        ]:
+            del self.base_files[base_path]
+        if remove_path:
+            self.base_files.pop(path, None)
+
+    def _get_layer_file(self, entry: ManifestEntryT) -> LayerFileT:
+        kind = stat.S_IFMT(entry.mode)
+        return LayerFileT(
+            kind={
+                stat.S_IFDIR: tarfile.DIRTYPE,
+                stat.S_IFREG: tarfile.REGTYPE,
+                stat.S_IFLNK: tarfile.SYMTYPE,
+                stat.S_IFCHR: tarfile.CHRTYPE,
+                stat.S_IFBLK: tarfile.BLKTYPE,
+                stat.S_IFIFO: tarfile.FIFOTYPE
+            }.get(kind, b''),
+            mode=stat.S_IMODE(entry.mode),
+            uid=entry.uid,
+            gid=entry.gid,
+            size=entry.size if kind == stat.S_IFREG else 0,
+            mtime=entry.mtime_ns // 1000000000,
+            link=entry.link,
+            rdev=entry.rdev if kind in (stat.S_IFCHR, stat.S_IFBLK) else 0,
+            xattrs=tuple(
+                sorted(
+                    (name, value) for name, value in entry.xattrs
+                    if name not in self.ignored_xattrs
+                )
+            )
+        )
+
+    def _get_whiteouts(
+        self, kinds: Dict[str, int], is_excluded: Callable[[str, bool], bool]
+    ) -> List[str]:
+        # base paths missing in the root tree are removed, unless
+        # they are excluded, like rsync --delete does. A directory
+        # replaced by another type is removed with its content
+        whiteouts = []
+        skipped: Set[str] = set()
+        for path in sorted(self.base_files):
+            parent = os.path.dirname(path)
+            while parent and parent not in skipped:
+                parent = os.path.dirname(parent)
+            if not path or parent:
+                continue
+            base_file = self.base_files[path]
+            kind = kinds.get(path)
+            if kind is None:
+                skipped.add(path)
+                if not is_excluded(path, base_file.kind == tarfile.DIRTYPE):
+                    whiteouts.append(path)
+            elif base_file.kind == tarfile.DIRTYPE and kind != stat.S_IFDIR:
+                skipped.add(path)
+                whiteouts.append(path)
+        return whiteouts
+
+    def _add_layer_entries(
+        self, tar: tarfile.TarFile, entries: Iterator[ManifestEntryT],
+        whiteouts: List[str]
+    ) -> None:
+        for path in whiteouts:
+            whiteout = tarfile.TarInfo(self._get_whiteout_name(path))
+            whiteout.mode = 0o644
+            tar.addfile(whiteout)
+        link_targets: Dict[Tuple[int, int], str] = {}
+        for entry in entries:
+            layer_file = self._get_layer_file(entry)
+            if not entry.path or not layer_file.kind or \
+                    layer_file == self.base_files.get(entry.path):
+                continue
+            info = tarfile.TarInfo(entry.path)
+            info.type = layer_file.kind
+            info.mode = layer_file.mode
+            info.uid = entry.uid
+            info.gid = entry.gid
+            info.mtime = layer_file.mtime
+            info.linkname = entry.link
+            info.pax_headers = {
+                f'SCHILY.xattr.{name}': value.decode('utf-8', 'surrogateescape')
+                for name, value in layer_file.xattrs
+            }
+            if layer_file.kind == tarfile.REGTYPE:
+                inode = (entry.dev, entry.ino)
+                if entry.nlink > 1 and inode in link_targets:
+                    info.type = tarfile.LNKTYPE
+                    info.linkname = link_targets[inode]
+                    tar.addfile(info)
+                    continue
+                if entry.nlink > 1:
+                    link_targets[inode] = entry.path
+                info.size = entry.size
+                with open(
+                    os.sep.join([self.root_dir, entry.path]), 'rb'
+                ) as data:
+                    tar.addfile(info, data)
+            else:
+                if layer_file.rdev:
+                    info.devmajor = os.major(layer_file.rdev)
+                    info.devminor = os.minor(layer_file.rdev)
+                tar.addfile(info)
+
+    def _write_layer(
+        self, add_entries: Callable[[tarfile.TarFile], None]
+    ) -> Tuple[Dict, str]:
+        if self.layer_compression == 'zstd':
+            compressor = ['zstd', '-T0', '-q', '-c']
+            media_type = f'{self.media_type_layer}+zstd'
+        else:
+            compressor = [
+                'pigz' if Path.which('pigz') else 'gzip', '-n', '-c'
+            ]
+            media_type = f'{self.media_type_layer}+gzip'
+        blob_dir = os.sep.join([self.container_dir, 'blobs', 'sha256'])
+        temporary = os.sep.join([blob_dir, f'.layer.{os.getpid()}'])
+        failures: List[Exception] = []
+        try:
+            with open(temporary, 'wb') as blob:
+                compressed = DigestWriter(blob)
+                process = subprocess.Popen(
+                    compressor, stdin=subprocess.PIPE, stdout=subprocess.PIPE
+                )
+                assert process.stdin and process.stdout
+                output = process.stdout
+
+                def store() -> None:
+                    try:
+                        shutil.copyfileobj(output, compressed, self.chunk_size)
+                    except Exception as issue:
+                        failures.append(issue)
+
+                reader = threading.Thread(target=store)
+                reader.start()
+                uncompressed = DigestWriter(process.stdin)
+                try:
+                    with tarfile.open(  # type: ignore
+                        fileobj=uncompressed, mode='w|',
+                        format=tarfile.PAX_FORMAT
+                    ) as tar:
+                        add_entries(tar)
+                finally:
+                    try:
+                        process.stdin.close()
+                    except BrokenPipeError:
+                        pass
+                    reader.join()
+                    process.wait()
+            if failures:
+                raise failures[0]
+            if process.returncode != 0:
+                raise KiwiOCIArchiveToolError(
+                    '{0} failed with exit code {1}'.format(
+                        compressor[0], process.returncode
+                    )
+                )
+            digest = compressed.get_digest()
+            os.rename(temporary, self._get_blob_path(digest))
+        except (OSError, tarfile.TarError) as issue:
+            raise KiwiOCIArchiveToolError(
+                f'Failed to write container layer: {issue}'
+            )
+        finally:
+            if os.path.lexists(temporary):
+                os.unlink(temporary)
+        return {
+            'mediaType': media_type,
+            'digest': digest,
+            'size': compressed.size
+        }, uncompressed.get_digest()
+
+    def _write_archive(self, filename: str, image_ref: str) -> None:
+        descriptor = self._find_manifest(self.container_tag)
+        index = {
+            'schemaVersion': 2,
+            'manifests': [
+                dict(descriptor, annotations={self.ref_name: image_ref})
+            ]
+        }
+        with tarfile.open(filename, 'w', format=tarfile.PAX_FORMAT) as archive:
+            self._add_archive_file(archive, 'blobs', None)
+            self._add_archive_file(archive, 'blobs/sha256', None)
+            for digest in sorted(self._get_references(descriptor)):
+                self._add_archive_file(
+                    archive, 'blobs/sha256/{0}'.format(digest.partition(':')[2]),
+                    self._get_blob_path(digest)
+                )
+            for name, data in (
+                ('oci-layout', {'imageLayoutVersion': '1.0.0'}),
+                ('index.json', index)
+            ):
+                self._add_archive_file(
+                    archive, name, None, json.dumps(data).encode()
+                )
+
+    @staticmethod
+    def _add_archive_file(
+        archive: tarfile.TarFile, name: str, filename: Optional[str],
+        data: Optional[bytes] = None
+    ) -> None:
+        info = tarfile.TarInfo(name)
+        if filename:
+            info.size = os.path.getsize(filename)
+            info.mode = 0o644
+            with open(filename, 'rb') as source:
+                archive.addfile(info, source)
+        elif data is not None:
+            info.size = len(data)
+            info.mode = 0o644
+            archive.addfile(info, io.BytesIO(data))
+        else:
+            info.type = tarfile.DIRTYPE
+            info.mode = 0o755
+            archive.addfile(info)
+
+    def _apply_whiteout(self, root_dir: str, path: str) -> None:
+        directory, name = os.path.split(path)
+        real_root = os.path.realpath(root_dir)
+        real_directory = os.path.realpath(os.sep.join([root_dir, directory]))
+        if real_directory != real_root and not real_directory.startswith(
+            real_root + os.sep
+        ):
+            # never follow a symlink out of the root tree
+            return
+        if not os.path.isdir(real_directory):
+            return
+        if name == self.opaque_whiteout:
+            targets = os.listdir(real_directory)
+        else:
+            targets = [name[len(self.whiteout_prefix):]]
+        for target in targets:
+            target_path = os.sep.join([real_directory, target])
+            if os.path.isdir(target_path) and not os.path.islink(target_path):
+                shutil.rmtree(target_path)
+            elif os.path.lexists(target_path):
+                os.unlink(target_path)
+
+    def _get_whiteout_name(self, path: str) -> str:
+        directory, name = os.path.split(path)
+        return os.path.join(directory, self.whiteout_prefix + name)
+
+    @staticmethod
+    def _normalize(name: str) -> str:
+        path = os.path.normpath(name).lstrip('/')
+        return '' if path == os.curdir else path
+
+    def _get_skopeo_tmpdir_option(self) -> List[str]:
+        return [
+            '--tmpdir', Defaults.get_temp_location()
+        ] if self._skopeo_provides_tmpdir_option() else []
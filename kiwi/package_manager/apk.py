@@ -246,6 +246,24 @@ class PackageManagerApk(PackageManagerBase):
             )
         )
 
+    def get_installed_package_name(
+        self, package_manager_output: str
+    ) -> Optional[str]:
+        """
+        Extract the name of the package the given apk output
+        line reports as being installed
+
+        :param str package_manager_output: apk status line
+
+        :return: package name or None
+
+        :rtype: str
+        """
+        match = re.search(
+            r' Installing (\S+)', package_manager_output
+        )
+        return match.group(1) if match else None
+
     def match_package_deleted(
         self, package_name: str, package_manager_output: str
     ) -> bool:
@@ -21,10 +21,11 @@ import glob
 import logging
 import pathlib
 from typing import (
-    List, Dict
+    List, Dict, Optional
 )
 
 # project
+from kiwi.archive.deb import ArchiveDeb
 from kiwi.command import CommandCallT
 from kiwi.command import Command
 from kiwi.path import Path
@@ -271,15 +272,13 @@ class PackageManagerApt(PackageManagerBase):
             with open(package_names.name) as packages:
                 solved_debootstrap_packages = [p.rstrip() for p in packages]
             self.command_env['PATH'] = '$PATH:/usr/bin:/bin:/usr/sbin:/sbin'
-            for package in solved_debootstrap_packages:
-                Command.run(
-                    [
-                        'bash', '-c',
-                        'dpkg-deb --fsys-tarfile {0} | tar -C {1} -x'.format(
-                            package, self.root_dir
-                        )
-                    ], self.command_env
-                )
+            post_script_dir = Temporary(
+                prefix='kiwi_debpost.', path=self.root_dir
+            ).new_dir()
+            ArchiveDeb.extract_all(
+                solved_debootstrap_packages, self.root_dir,
+                post_script_dir.name
+            )
             # Run package scripts. Unfortuantely Debian based systems
             # requires special sauce for bootstrap. See the exceptions
             # we have to apply below:
@@ -290,12 +289,13 @@ class PackageManagerApt(PackageManagerBase):
             # 1. Pass: Run package scripts, manual order
             self._run_bootstrap_scripts(
                 solved_debootstrap_packages,
-                only_for=['base-passwd'], skip=['usrmerge']
+                only_for=['base-passwd'], skip=['usrmerge'],
+                metadata_dir=post_script_dir.name
             )
             # 2. Pass: Run package scripts in apt order
             self._run_bootstrap_scripts(
                 solved_debootstrap_packages,
-                skip=['usrmerge']
+                skip=['usrmerge'], metadata_dir=post_script_dir.name
             )
             self.cleanup_requests()
             return Command.call(
@@ -509,6 +509,24 @@ class PackageManagerApt(PackageManagerBase):
             )
         )
 
+    def get_installed_package_name(
+        self, package_manager_output: str
+    ) -> Optional[str]:
+        """
+        Extract the name of the package the given apt-get output
+        line reports as being installed
+
+        :param str package_manager_output: apt-get status line
+
+        :return: package name or None
+
+        :rtype: str
+        """
+        match = re.search(
+            r'Unpacking ([^\s:]+)', package_manager_output
+        )
+        return match.group(1) if match else None
+
     def match_package_deleted(
         self, package_name: str, package_manager_output: str
     ) -> bool:
@@ -536,7 +554,8 @@ class PackageManagerApt(PackageManagerBase):
 
     def _run_bootstrap_scripts(
         self, solved_debootstrap_packages: List[str],
-        only_for: List[str] = [], skip: List[str] = []
+        only_for: List[str] = [], skip: List[str] = [],
+        metadata_dir: str = ''
     ):
         # TODO: this should not be needed but without setting
         # the following environment variables no package pre/post
@@ -545,9 +564,11 @@ class PackageManagerApt(PackageManagerBase):
         self.command_env['DPKG_MAINTSCRIPT_NAME'] = 'true'
         self.command_env['DPKG_MAINTSCRIPT_PACKAGE'] = 'libc6'
 
-        post_script_dir = Temporary(
-            prefix='kiwi_debpost.', path=self.root_dir
-        ).new_dir()
+        if not metadata_dir:
+            post_script_dir = Temporary(
+                prefix='kiwi_debpost.', path=self.root_dir
+            ).new_dir()
+            metadata_dir = post_script_dir.name
         for package in solved_debootstrap_packages:
             package_base_name = os.path.basename(package)
             go_ahead = False if only_for else True
@@ -565,10 +586,11 @@ class PackageManagerApt(PackageManagerBase):
                 f'Running pre/post scripts for: {package_base_name}'
             )
             package_metadata_dir = \
-                f'{post_script_dir.name}/{os.path.basename(package)}'
-            Command.run(
-                ['dpkg', '-e', package, package_metadata_dir]
-            )
+                f'{metadata_dir}/{os.path.basename(package)}'
+            if not os.path.isdir(package_metadata_dir):
+                Command.run(
+                    ['dpkg', '-e', package, package_metadata_dir]
+                )
             script_pre = f'{package_metadata_dir}/preinst'
             script_post = f'{package_metadata_dir}/postinst'
             # 1. preinst
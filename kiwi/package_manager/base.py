@@ -16,7 +16,7 @@
 # along with kiwi.  If not, see <http://www.gnu.org/licenses/>
 #
 from typing import (
-    List, Dict
+    List, Dict, Optional
 )
 
 from kiwi.api_helper import decommissioned
@@ -187,6 +187,23 @@ class PackageManagerBase:
         """
         raise NotImplementedError
 
+    def get_installed_package_name(
+        self, package_manager_output: str
+    ) -> Optional[str]:
+        """
+        Extract the name of the package the given package manager
+        output line reports as being installed
+
+        Implementation in specialized package manager class
+
+        :param str package_manager_output: unused
+
+        :return: package name or None
+
+        :rtype: str
+        """
+        raise NotImplementedError
+
     def match_package_deleted(
         self, package_name: str, package_manager_output: str
     ) -> bool:
@@ -280,6 +297,11 @@ class PackageManagerBase:
         del self.product_requests[:]
         del self.exclude_requests[:]
 
+    @staticmethod
+    def _get_rpm_package_name(nevra: str) -> str:
+        # name-[epoch:]version-release.arch
+        return nevra.rsplit('-', 2)[0]
+
     def __exit__(self, exc_type, exc_value, traceback):
         if self.repository:
             self.repository.cleanup()
@@ -18,7 +18,7 @@
 import os
 import re
 from typing import (
-    List, Dict
+    List, Dict, Optional
 )
 
 # project
@@ -342,6 +342,26 @@ class PackageManagerDnf4(PackageManagerBase):
             )
         )
 
+    def get_installed_package_name(
+        self, package_manager_output: str
+    ) -> Optional[str]:
+        """
+        Extract the name of the package the given dnf output
+        line reports as being installed
+
+        :param str package_manager_output: dnf status line
+
+        :return: package name or None
+
+        :rtype: str
+        """
+        match = re.search(
+            r'Installing\s*: (\S+)', package_manager_output
+        )
+        if match:
+            return self._get_rpm_package_name(match.group(1))
+        return None
+
     def match_package_deleted(
         self, package_name: str, package_manager_output: str
     ) -> bool:
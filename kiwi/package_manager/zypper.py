@@ -18,7 +18,7 @@
 import re
 import os
 from typing import (
-    List, Dict
+    List, Dict, Optional
 )
 
 
@@ -266,6 +266,26 @@ class PackageManagerZypper(PackageManagerBase):
             )
         )
 
+    def get_installed_package_name(
+        self, package_manager_output: str
+    ) -> Optional[str]:
+        """
+        Extract the name of the package the given zypper output
+        line reports as being installed
+
+        :param str package_manager_output: zypper status line
+
+        :return: package name or None
+
+        :rtype: str
+        """
+        match = re.search(
+            r'Installing: (\S+)', package_manager_output
+        )
+        if match:
+            return self._get_rpm_package_name(match.group(1))
+        return None
+
     def match_package_deleted(
         self, package_name: str, package_manager_output: str
     ) -> bool:
@@ -22,6 +22,7 @@ from typing import (
 
 # project
 from kiwi.command import Command
+from kiwi.utils.block import BlockID
 from kiwi.partitioner.base import PartitionerBase
 
 from kiwi.exceptions import (
@@ -138,6 +139,8 @@ class PartitionerGpt(PartitionerBase):
                 self.disk_device
             ]
         )
+        # the cached tags of the partition devices are outdated
+        BlockID.invalidate()
 
     def set_hybrid_mbr(self) -> None:
         """
@@ -16,6 +16,7 @@
 # along with kiwi.  If not, see <http://www.gnu.org/licenses/>
 #
 import os
+import fcntl
 import logging
 import collections
 import pathlib
@@ -28,6 +29,9 @@ from kiwi.exceptions import KiwiFileAccessError
 
 log = logging.getLogger('kiwi')
 
+# ioctl request to share the data blocks of a file, see ioctl_ficlone(2)
+FICLONE = 0x40049409
+
 
 class Path:
     """
@@ -243,3 +247,44 @@ class Path:
             return path
         else:
             return Path.first_exists(format(p.parent))
+
+    @staticmethod
+    def clone(source: str, target: str, allow_hardlink: bool = False) -> str:
+        """
+        Create target as copy of source without copying the data
+        if possible. A reflink sharing the data blocks of source is
+        tried first. If allow_hardlink is set, a hard link to source
+        is created next. Callers allowing hard links must only
+        replace target but never modify it in place. If neither
+        works the data is copied
+
+        :param str source: source file path
+        :param str target: target file path
+        :param bool allow_hardlink: allow target to be a hard link
+
+        :return: method used, one of reflink, hardlink or copy
+
+        :rtype: str
+        """
+        if os.path.lexists(target):
+            os.unlink(target)
+        with open(source, 'rb') as source_file:
+            with open(target, 'wb') as target_file:
+                try:
+                    fcntl.ioctl(
+                        target_file.fileno(), FICLONE, source_file.fileno()
+                    )
+                    shutil.copymode(source, target)
+                    return 'reflink'
+                except OSError:
+                    pass
+        if allow_hardlink:
+            try:
+                os.unlink(target)
+                os.link(source, target)
+                return 'hardlink'
+            except OSError:
+                pass
+        shutil.copyfile(source, target)
+        shutil.copymode(source, target)
+        return 'copy'
@@ -0,0 +1,201 @@
+# Copyright (c) 2026 SUSE LLC.  All rights reserved.
+#
+# This file is part of kiwi.
+#
+# kiwi is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# kiwi is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kiwi.  If not, see <http://www.gnu.org/licenses/>
+#
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any, Dict, List, Optional
+)
+
+log = logging.getLogger('kiwi')
+
+
+class RuntimeCheckScheduler:
+    """
+    **Run independent RuntimeChecker checks concurrently**
+
+    All given checks are started in a thread pool. Once all of
+    them are done, the duration of each check is logged and the
+    error of the first failed check in the given order is raised,
+    such that the result is the same as for running the checks one
+    after another. Checks listed in the host_checks attribute of
+    the runtime checker only depend on the build host and the
+    image description. Their success is memoized by a digest of
+    the description and the check arguments. If a cache file is
+    set, the memoized results are shared between kiwi invocations
+
+    :param object runtime_checker: Instance of RuntimeChecker
+    :param str description_digest: digest from get_description_digest
+    """
+    max_workers = 8
+    cache: Dict[str, str] = {}
+    cache_file: Optional[str] = None
+    cache_lock = threading.Lock()
+
+    def __init__(
+        self, runtime_checker: Any, description_digest: str = ''
+    ) -> None:
+        self.runtime_checker = runtime_checker
+        self.description_digest = description_digest
+        self.host_checks = getattr(type(runtime_checker), 'host_checks', ())
+
+    @classmethod
+    def set_cache_file(cls, filename: str) -> None:
+        """
+        Store succeeded host checks in the given file and load
+        the results stored there by a former kiwi invocation
+
+        :param str filename: cache file path
+        """
+        with cls.cache_lock:
+            cls.cache_file = filename
+            try:
+                with open(filename) as cache:
+                    cls.cache.update(json.load(cache))
+            except (OSError, ValueError):
+                pass
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """
+        Drop all memoized check results from memory and disk
+        """
+        with cls.cache_lock:
+            cls.cache = {}
+            if cls.cache_file and os.path.exists(cls.cache_file):
+                os.unlink(cls.cache_file)
+
+    @staticmethod
+    def get_description_digest(
+        config_file: str, profiles: List[str], build_type: str
+    ) -> str:
+        """
+        Provides a digest of the loaded image description, the
+        selected profiles and build type and the runtime config
+
+        :param str config_file: image description file path
+        :param list profiles: selected profiles
+        :param str build_type: selected build type name
+
+        :return: sha256 hex digest
+
+        :rtype: str
+        """
+        # the runtime config module reads yaml, import it on demand
+        import kiwi.runtime_config as runtime_config
+        digest = hashlib.sha256()
+        with open(config_file, 'rb') as description:
+            digest.update(description.read())
+        digest.update(
+            json.dumps(
+                [profiles, build_type, runtime_config.RUNTIME_CONFIG],
+                sort_keys=True, default=str
+            ).encode()
+        )
+        return digest.hexdigest()
+
+    def run(self, checks: Dict[str, List[str]]) -> Dict[str, float]:
+        """
+        Run the given checks and raise the error of the first
+        failed check in the order of the given dictionary
+
+        :param dict checks: A dictionary with the runtime method names
+            as keys and their arguments list as the values.
+
+        :return: check durations in seconds by method name
+
+        :rtype: dict
+        """
+        durations: Dict[str, float] = {}
+        errors: Dict[str, Optional[Exception]] = {}
+        scheduled = {}
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_workers, len(checks)))
+        ) as executor:
+            for method, args in checks.items():
+                if self._is_cached(method, args):
+                    continue
+                scheduled[method] = executor.submit(
+                    self._run_check, method, args
+                )
+            for method, future in scheduled.items():
+                durations[method], errors[method] = future.result()
+        first_error = None
+        stored = False
+        for method, args in checks.items():
+            if method not in scheduled:
+                log.debug(f'Runtime check: {method}: passed before, skipped')
+            else:
+                log.debug(
+                    'Runtime check: {0}: {1} in {2:.3f}s'.format(
+                        method, 'failed' if errors[method] else 'passed',
+                        durations[method]
+                    )
+                )
+                if not errors[method] and method in self.host_checks:
+                    stored |= self._store(method, args)
+                if errors[method] and not first_error:
+                    first_error = errors[method]
+        if stored:
+            self._write_cache()
+        if first_error:
+            raise first_error
+        return durations
+
+    def _run_check(self, method: str, args: List[str]) -> tuple:
+        start = time.monotonic()
+        error = None
+        try:
+            attrgetter(method)(self.runtime_checker)(*args)
+        except Exception as issue:
+            error = issue
+        return time.monotonic() - start, error
+
+    def _get_cache_key(self, method: str, args: List[str]) -> str:
+        return hashlib.sha256(
+            json.dumps([self.description_digest, method, args]).encode()
+        ).hexdigest()
+
+    def _is_cached(self, method: str, args: List[str]) -> bool:
+        if method not in self.host_checks or not self.description_digest:
+            return False
+        with self.cache_lock:
+            return self._get_cache_key(method, args) in self.cache
+
+    def _store(self, method: str, args: List[str]) -> bool:
+        if not self.description_digest:
+            return False
+        with self.cache_lock:
+            self.cache[self._get_cache_key(method, args)] = method
+        return True
+
+    def _write_cache(self) -> None:
+        with self.cache_lock:
+            if not self.cache_file:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+                with open(self.cache_file, 'w') as cache:
+                    json.dump(self.cache, cache, indent=4, sort_keys=True)
+            except OSError as issue:
+                log.debug(f'Failed to write runtime check cache: {issue}')
@@ -56,6 +56,14 @@ class RuntimeChecker:
     """
     **Implements build consistency checks at runtime**
     """
+    # checks which only depend on the build host and the image
+    # description, their success can be reused for the same
+    # description
+    host_checks = (
+        'check_container_tool_chain_installed',
+        'check_target_dir_on_unsupported_filesystem'
+    )
+
     def __init__(self, xml_state: XMLState) -> None:
         """
         The schema of an image description covers structure and syntax of
@@ -388,11 +396,12 @@ class RuntimeChecker:
         message_unknown_tool = dedent('''\n
             Unknown tool: {0}.
 
-            Please configure KIWI with an appropriate value (umoci or buildah).
+            Please configure KIWI with an appropriate value (umoci, buildah
+            or native).
             Consider this runtime configuration file syntax (/etc/kiwi.yml):
 
             oci:
-                - archive_tool: umoci | buildah
+                - archive_tool: umoci | buildah | native
         ''')
 
         expected_version = (0, 1, 0)
@@ -404,6 +413,10 @@ class RuntimeChecker:
                 oci_tools = ['buildah', 'skopeo']
             elif tool_name == 'umoci':
                 oci_tools = ['umoci', 'skopeo']
+            elif tool_name == 'native':
+                # skopeo writes all archives but oci-archive
+                oci_tools = ['skopeo'] \
+                    if self.xml_state.get_build_type_name() == 'docker' else []
             else:
                 raise KiwiRuntimeError(message_unknown_tool.format(tool_name))
             for tool in oci_tools:
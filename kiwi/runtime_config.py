@@ -256,6 +256,37 @@ class RuntimeConfig:
             bundle_compress = default
         return bool(bundle_compress)
 
+    def get_bundle_compression_format(self, default: str = 'xz') -> str:
+        """
+        Return the compression format used for image results
+        in the bundle
+
+        bundle:
+          - compress_format: xz|zstd
+
+        if no or invalid configuration data is provided, the
+        default format applies
+
+        :param str default: Default format
+
+        :return: xz or zstd
+
+        :rtype: str
+        """
+        compress_format = self._get_attribute(
+            element='bundle', attribute='compress_format'
+        )
+        if compress_format is None:
+            return default
+        elif compress_format in ('xz', 'zstd'):
+            return compress_format
+        log.warning(
+            'Skipping invalid bundle compression format: {0}'.format(
+                compress_format
+            )
+        )
+        return default
+
     def get_checksum_handler(
         self,
         source_filename: str,
@@ -337,6 +368,27 @@ class RuntimeConfig:
         xz_options = self._get_attribute(element='xz', attribute='options')
         return xz_options.split() if xz_options else None
 
+    def get_zstd_options(self) -> Optional[List[str]]:
+        """
+        Return list of zstd compression options in:
+
+        zstd:
+          - options: ...
+
+        if no configuration exists None is returned
+
+        :return:
+            Contains list of options
+
+            .. code:: python
+
+                ['--option=value']
+
+        :rtype: list
+        """
+        zstd_options = self._get_attribute(element='zstd', attribute='options')
+        return zstd_options.split() if zstd_options else None
+
     def get_container_compression(self) -> bool:
         """
         Return compression for container images
@@ -368,6 +420,103 @@ class RuntimeConfig:
             )
             return Defaults.get_container_compression()
 
+    def get_capabilities_cache(self, default: bool = False) -> bool:
+        """
+        Return boolean value to express if memoized tool capability
+        probes should be stored on disk and reused by the next kiwi
+        invocation
+
+        capabilities:
+          - cache: true|false
+
+        If no cache setting is configured, the provided default
+        value applies
+
+        :param bool default: Default value
+
+        :return: True or False
+
+        :rtype: bool
+        """
+        capabilities_cache = self._get_attribute(
+            element='capabilities', attribute='cache'
+        )
+        if capabilities_cache is None:
+            capabilities_cache = default
+        return bool(capabilities_cache)
+
+    def get_description_cache(self, default: bool = False) -> bool:
+        """
+        Return boolean value to express if validated and XSLT
+        upgraded image descriptions should be stored on disk and
+        reused by the next kiwi invocation
+
+        description:
+          - cache: true|false
+
+        If no cache setting is configured, the provided default
+        value applies
+
+        :param bool default: Default value
+
+        :return: True or False
+
+        :rtype: bool
+        """
+        description_cache = self._get_attribute(
+            element='description', attribute='cache'
+        )
+        if description_cache is None:
+            description_cache = default
+        return bool(description_cache)
+
+    def get_bootstrap_cache(self, default: bool = False) -> bool:
+        """
+        Return boolean value to express if the root tree after the
+        bootstrap phase should be stored on disk and restored by
+        builds with the same bootstrap package set
+
+        bootstrap:
+          - cache: true|false
+
+        If no cache setting is configured, the provided default
+        value applies
+
+        :param bool default: Default value
+
+        :return: True or False
+
+        :rtype: bool
+        """
+        bootstrap_cache = self._get_attribute(
+            element='bootstrap', attribute='cache'
+        )
+        if bootstrap_cache is None:
+            bootstrap_cache = default
+        return bool(bootstrap_cache)
+
+    def get_bootstrap_cache_max_size(self) -> int:
+        """
+        Return the maximum size of all cached bootstrap root trees
+        in bytes. The value can be specified in bytes or with
+        m=MB or g=GB
+
+        bootstrap:
+          - cache_max_size: 20g
+
+        if no configuration exists the default size from the
+        Defaults class is returned
+
+        :return: byte value
+
+        :rtype: int
+        """
+        max_size = self._get_attribute(
+            element='bootstrap', attribute='cache_max_size'
+        )
+        return StringToSize.to_bytes(str(max_size)) if max_size \
+            else Defaults.get_bootstrap_cache_max_size()
+
     def get_iso_tool_category(self) -> str:
         """
         Return tool category which should be used to build iso images
@@ -448,6 +597,60 @@ class RuntimeConfig:
         )
         return oci_archive_tool or Defaults.get_oci_archive_tool()
 
+    def get_oci_layer_compression(self) -> str:
+        """
+        Return compression of the layers written by the native
+        OCI archive tool
+
+        oci:
+          - layer_compression: gzip
+
+        if no or invalid configuration exists the default compression
+        from the Defaults class is returned
+
+        :return: A name
+
+        :rtype: str
+        """
+        layer_compression = self._get_attribute(
+            element='oci', attribute='layer_compression'
+        )
+        if not layer_compression:
+            return Defaults.get_oci_layer_compression()
+        elif layer_compression in ('gzip', 'zstd'):
+            return layer_compression
+        else:
+            log.warning(
+                f'Skipping invalid OCI layer compression: {layer_compression}'
+            )
+            return Defaults.get_oci_layer_compression()
+
+    def get_sync_engine(self) -> str:
+        """
+        Return engine to sync directory trees, rsync or the
+        in-process manifest engine
+
+        sync:
+          - engine: manifest
+
+        if no or invalid configuration exists the default engine
+        from the Defaults class is returned
+
+        :return: A name
+
+        :rtype: str
+        """
+        sync_engine = self._get_attribute(
+            element='sync', attribute='engine'
+        )
+        if not sync_engine:
+            return Defaults.get_sync_engine()
+        elif sync_engine in ('rsync', 'manifest'):
+            return sync_engine
+        else:
+            log.warning(f'Skipping invalid sync engine: {sync_engine}')
+            return Defaults.get_sync_engine()
+
     def get_mapper_tool(self) -> str:
         """
         Return partition mapper tool
@@ -488,6 +691,31 @@ class RuntimeConfig:
         )
         return StringToSize.to_bytes(max_size) if max_size else None
 
+    def get_runtime_checks_cache(self, default: bool = False) -> bool:
+        """
+        Return boolean value to express if succeeded runtime checks
+        of the build host should be stored on disk and skipped by
+        the next kiwi invocation for the same image description
+
+        runtime_checks:
+          - cache: true|false
+
+        If no cache setting is configured, the provided default
+        value applies
+
+        :param bool default: Default value
+
+        :return: True or False
+
+        :rtype: bool
+        """
+        runtime_checks_cache = self._get_attribute(
+            element='runtime_checks', attribute='cache'
+        )
+        if runtime_checks_cache is None:
+            runtime_checks_cache = default
+        return bool(runtime_checks_cache)
+
     def get_disabled_runtime_checks(self) -> List[str]:
         """
         Returns disabled runtime checks. Checks can be disabled with:
@@ -16,11 +16,16 @@
 # along with kiwi.  If not, see <http://www.gnu.org/licenses/>
 #
 from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
 from urllib.request import urlopen
 from urllib.request import Request
 from kiwi.utils.temporary import Temporary
 from lxml import etree
+import hashlib
+import logging
 import random
+import shutil
+import tempfile
 import glob
 import os
 import re
@@ -32,6 +37,9 @@ from kiwi.exceptions import KiwiUriOpenError
 from kiwi.path import Path
 from kiwi.command import Command
 from kiwi.defaults import Defaults
+from kiwi.utils.download import Download
+
+log = logging.getLogger('kiwi')
 
 
 class SolverRepositoryBase:
@@ -75,6 +83,11 @@ class SolverRepositoryBase:
         :rtype: str
         """
         Path.create(target_dir)
+        metadata_checksum = self.get_metadata_checksum()
+        if metadata_checksum:
+            return self._create_cached_repository_solvable(
+                target_dir, metadata_checksum
+            )
         solvable = os.sep.join(
             [target_dir, self.uri.alias()]
         )
@@ -84,6 +97,24 @@ class SolverRepositoryBase:
 
         return solvable
 
+    def get_metadata_checksum(self):
+        """
+        Return checksum identifying the solver relevant repository
+        metadata
+
+        The checksum is used to share one solvable between all
+        repositories providing the same metadata, e.g mirrors or
+        the same repository used under a different alias. The
+        retrieval of the checksum depends on the type of the
+        repository and is therefore supposed to be implemented in
+        the specialized Solver Repository classes. If no such
+        implementation exists the method returns None and the
+        solvable is stored by the repository alias
+
+        :rtype: str
+        """
+        return None
+
     def timestamp(self):
         """
         Return repository timestamp
@@ -117,7 +148,7 @@ class SolverRepositoryBase:
 
         return False
 
-    def download_from_repository(self, repo_source, target):
+    def download_from_repository(self, repo_source, target, use_cache=False):
         """
         Download given source file from the repository and store
         it as target file
@@ -126,19 +157,31 @@ class SolverRepositoryBase:
         location and will be part of a mime type source like:
         `file://repo_path/repo_source`
 
+        http(s) locations are downloaded through the pooled
+        :class:`Download` client. If use_cache is set, the file is
+        revalidated against a previous download of the same location
+
         :param str repo_source: source file in the repo
         :param str target: file path
+        :param bool use_cache: revalidate against the download cache
 
         :raises KiwiUriOpenError: if the download fails
         """
-        download_link = None
-        try:
-            download_link = os.sep.join(
-                [
-                    self._get_mime_typed_uri(),
-                    repo_source
-                ]
+        download_link = os.sep.join(
+            [
+                self._get_mime_typed_uri(),
+                repo_source
+            ]
+        )
+        if download_link.startswith(('http://', 'https://')):
+            Download(
+                Defaults.get_download_cache_location() if use_cache else None
+            ).get(
+                download_link, target,
+                (self.user, self.secret) if self.user and self.secret else None
             )
+            return
+        try:
             request = Request(download_link)
             if self.user and self.secret:
                 credentials = b64encode(
@@ -153,7 +196,28 @@ class SolverRepositoryBase:
                 f'{type(e).__name__}: {e} {download_link}'
             )
         with open(target, 'wb') as target_file:
-            target_file.write(location.read())
+            shutil.copyfileobj(location, target_file, 1048576)
+
+    def download_files_from_repository(self, downloads):
+        """
+        Download the given list of source files from the repository
+        concurrently
+
+        :param list downloads: list of (repo_source, target) tuples
+
+        :raises KiwiUriOpenError: if one of the downloads fails
+        """
+        if not downloads:
+            return
+        with ThreadPoolExecutor(
+            max_workers=min(len(downloads), 8)
+        ) as executor:
+            for result in [
+                executor.submit(
+                    self.download_from_repository, repo_source, target
+                ) for repo_source, target in downloads
+            ]:
+                result.result()
 
     def get_repo_type(self):
         try:
@@ -205,7 +269,9 @@ class SolverRepositoryBase:
         repo_source = 'Packages.gz'
         if not download_dir:
             packages_download = Temporary().new_file()
-            self.download_from_repository(repo_source, packages_download.name)
+            self.download_from_repository(
+                repo_source, packages_download.name, use_cache=True
+            )
             if os.path.isfile(packages_download.name):
                 with open(packages_download.name) as packages:
                     return packages.read()
@@ -213,7 +279,9 @@ class SolverRepositoryBase:
             packages_download = os.sep.join(
                 [download_dir, repo_source.replace(os.sep, '_')]
             )
-            self.download_from_repository(repo_source, packages_download)
+            self.download_from_repository(
+                repo_source, packages_download, use_cache=True
+            )
             return packages_download
 
     def _get_repomd_xml(self, lookup_path='repodata'):
@@ -229,7 +297,9 @@ class SolverRepositoryBase:
         """
         xml_download = Temporary().new_file()
         xml_setup_file = os.sep.join([lookup_path, 'repomd.xml'])
-        self.download_from_repository(xml_setup_file, xml_download.name)
+        self.download_from_repository(
+            xml_setup_file, xml_download.name, use_cache=True
+        )
         return etree.parse(xml_download.name)
 
     def _get_repomd_xpath(self, xml_data, expression):
@@ -306,10 +376,12 @@ class SolverRepositoryBase:
             Command.run(['bash', '-c', ' '.join(bash_command)])
         else:
             # each file in the metadata_dir is considered a valid
-            # solvable for the selected solv tool
+            # solvable for the selected solv tool. The files are
+            # independent of each other and converted in parallel
             tool_options = []
             if tool == 'deb2solv':
                 tool_options.append('-r')
+            solv_commands = []
             for source in glob.iglob('/'.join([metadata_dir, '*'])):
                 bash_command = ['gzip', '-cd', '--force']
                 if source.endswith('.zst'):
@@ -317,31 +389,137 @@ class SolverRepositoryBase:
                 bash_command += [source, '|', tool] + tool_options + [
                     '>', self._get_random_solvable_name()
                 ]
-                Command.run(['bash', '-c', ' '.join(bash_command)])
+                solv_commands.append(['bash', '-c', ' '.join(bash_command)])
+            if solv_commands:
+                with ThreadPoolExecutor(
+                    max_workers=min(len(solv_commands), os.cpu_count() or 1)
+                ) as pool:
+                    for _ in pool.map(Command.run, solv_commands):
+                        pass
+
+    def _create_cached_repository_solvable(
+        self, target_dir, metadata_checksum
+    ):
+        """
+        Lookup the solvable for the given metadata checksum in
+        the solvable cache below target_dir. If not present
+        create it and evict the least recently used solvables
+        if the cache exceeds its size limit
+
+        :param str target_dir: path name
+        :param str metadata_checksum: metadata checksum
 
-    def _merge_solvables(self, target_dir):
+        :return: file path to solvable
+
+        :rtype: str
+        """
+        cache_dir = os.sep.join([target_dir, 'cache'])
+        solvable = os.sep.join([cache_dir, metadata_checksum])
+        # the solvable is moved into place after its info files,
+        # a solvable without them is about to be evicted
+        if all(
+            os.path.exists(cache_file) for cache_file in (
+                solvable, solvable + '.info', solvable + '.timestamp'
+            )
+        ):
+            log.debug(
+                'Using cached solvable %s for %s', solvable, self.uri.uri
+            )
+            # update mtime to track the least recently used solvables
+            os.utime(solvable)
+            return solvable
+        Path.create(cache_dir)
+        self._setup_repository_metadata()
+        solvable = self._merge_solvables(cache_dir, metadata_checksum)
+        self._cleanup_solvable_cache(cache_dir)
+        return solvable
+
+    def _cleanup_solvable_cache(self, cache_dir):
+        """
+        Delete least recently used solvables until the total size
+        of the solvable cache is below the configured limit. The
+        most recently used solvable is always kept
+
+        :param str cache_dir: path name
+        """
+        solvables = []
+        for solvable in glob.iglob(os.sep.join([cache_dir, '*'])):
+            if not solvable.endswith(('.info', '.timestamp')):
+                solvable_stat = os.stat(solvable)
+                solvables.append(
+                    (solvable_stat.st_mtime, solvable_stat.st_size, solvable)
+                )
+        solvables.sort()
+        cache_bytes = sum(size for _, size, _ in solvables)
+        cache_bytes_limit = Defaults.get_solvable_cache_size()
+        for _, size, solvable in solvables[:-1]:
+            if cache_bytes <= cache_bytes_limit:
+                break
+            log.debug('Evicting cached solvable %s', solvable)
+            for cache_file in (solvable, solvable + '.info', solvable + '.timestamp'):
+                if os.path.exists(cache_file):
+                    os.unlink(cache_file)
+            cache_bytes -= size
+
+    def _merge_solvables(self, target_dir, solvable_name=None):
         """
         Merge all intermediate SAT solvables into one and store
         the result in the given target_dir. In addition an
         info file containing the repo url and a timestamp file
-        is created
+        is created. The solvable is merged into a temporary file
+        and moved into place at last, such that a failed merge
+        or a concurrent build never sees an incomplete solvable
 
         :param str target_dir: path name
+        :param str solvable_name:
+            solvable file name, defaults to the repository alias
         """
         if self.repository_solvable_dir:
-            solvable = os.sep.join([target_dir, self.uri.alias()])
-            bash_command = [
-                'mergesolv',
-                '/'.join([self.repository_solvable_dir.name, '*']),
-                '>', solvable
-            ]
-            Command.run(['bash', '-c', ' '.join(bash_command)])
-            with open('.'.join([solvable, 'info']), 'w') as solvable_info:
-                solvable_info.write(''.join([self.uri.uri, os.linesep]))
-            with open('.'.join([solvable, 'timestamp']), 'w') as solvable_time:
-                solvable_time.write(self.timestamp())
+            solvable = os.sep.join(
+                [target_dir, solvable_name or self.uri.alias()]
+            )
+            # a hidden name is not taken as solvable by the cache cleanup
+            descriptor, merged_solvable = tempfile.mkstemp(
+                dir=target_dir, prefix='.{0}.'.format(
+                    os.path.basename(solvable)
+                )
+            )
+            os.close(descriptor)
+            try:
+                bash_command = [
+                    'mergesolv',
+                    '/'.join([self.repository_solvable_dir.name, '*']),
+                    '>', merged_solvable
+                ]
+                Command.run(['bash', '-c', ' '.join(bash_command)])
+                os.chmod(merged_solvable, 0o644)
+                with open('.'.join([solvable, 'info']), 'w') as solvable_info:
+                    solvable_info.write(''.join([self.uri.uri, os.linesep]))
+                with open(
+                    '.'.join([solvable, 'timestamp']), 'w'
+                ) as solvable_time:
+                    solvable_time.write(self.timestamp())
+                os.replace(merged_solvable, solvable)
+            finally:
+                if os.path.exists(merged_solvable):
+                    os.unlink(merged_solvable)
             return solvable
 
+    def _get_metadata_checksum_from(self, checksums):
+        """
+        Create one checksum from the given list of metadata
+        checksums
+
+        :param list checksums: list of checksum strings
+
+        :return: sha256 hex digest
+
+        :rtype: str
+        """
+        return hashlib.sha256(
+            os.linesep.join(checksums).encode()
+        ).hexdigest()
+
     def _get_mime_typed_uri(self):
         """
         Adds `file` scheme for local URIs
@@ -15,8 +15,13 @@
 # You should have received a copy of the GNU General Public License
 # along with kiwi.  If not, see <http://www.gnu.org/licenses/>
 #
+import os
+
 # project
 from kiwi.solver.repository.base import SolverRepositoryBase
+from kiwi.utils.temporary import Temporary
+
+from kiwi.exceptions import KiwiUriOpenError
 
 
 class SolverRepositoryDeb(SolverRepositoryBase):
@@ -36,3 +41,40 @@ class SolverRepositoryDeb(SolverRepositoryBase):
         self._create_solvables(
             deb_dir, 'deb2solv'
         )
+
+    def get_metadata_checksum(self):
+        """
+        Get checksum from the SHA256 entry of the Packages.gz file
+        in the Release file. For repositories below dists/ the
+        Release file of the distribution is used
+
+        :return: sha256 hex digest or None
+
+        :rtype: str
+        """
+        release_file = 'Release'
+        packages_file = 'Packages.gz'
+        uri_path = self.uri.uri.rstrip(os.sep).split(os.sep)
+        if len(uri_path) > 4 and uri_path[-4] == 'dists':
+            release_file = '../../Release'
+            packages_file = '/'.join(uri_path[-2:] + [packages_file])
+        release_download = Temporary().new_file()
+        try:
+            self.download_from_repository(
+                release_file, release_download.name, use_cache=True
+            )
+        except KiwiUriOpenError:
+            return None
+        sha256_section = False
+        with open(release_download.name) as release:
+            for line in release:
+                if not line.startswith(' '):
+                    sha256_section = line.startswith('SHA256:')
+                    continue
+                checksum_entry = line.split()
+                if sha256_section and len(checksum_entry) == 3 and \
+                   checksum_entry[2] == packages_file:
+                    return self._get_metadata_checksum_from(
+                        [f'Packages:{checksum_entry[0]}']
+                    )
+        return None
@@ -38,11 +38,13 @@ class SolverRepositoryRpmDir(SolverRepositoryBase):
             )
 
         package_dir = self._create_temporary_metadata_dir()
+        downloads = []
         for package in glob.iglob('/'.join([self.uri.translate(), '*.rpm'])):
             package_name = os.path.basename(package)
-            self.download_from_repository(
-                package_name, os.sep.join([package_dir, package_name])
+            downloads.append(
+                (package_name, os.sep.join([package_dir, package_name]))
             )
+        self.download_files_from_repository(downloads)
         self._create_solvables(
             package_dir, 'rpms2solv'
         )
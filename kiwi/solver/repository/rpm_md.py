@@ -38,11 +38,14 @@ class SolverRepositoryRpmMd(SolverRepositoryBase):
         rpm_md_data = self._find_repomd_files(
             ['primary', 'patterns'], 'rpmmd2solv'
         )
-        for rpm_md_file in rpm_md_data.metadata_files:
-            self.download_from_repository(
-                rpm_md_file,
-                os.sep.join([rpm_md_dir, os.path.basename(rpm_md_file)])
-            )
+        self.download_files_from_repository(
+            [
+                (
+                    rpm_md_file,
+                    os.sep.join([rpm_md_dir, os.path.basename(rpm_md_file)])
+                ) for rpm_md_file in rpm_md_data.metadata_files
+            ]
+        )
         self._create_solvables(
             rpm_md_dir, rpm_md_data.solv_tool
         )
@@ -56,11 +59,16 @@ class SolverRepositoryRpmMd(SolverRepositoryBase):
         rpm_comps_data = self._find_repomd_files(
             ['group_gz'], 'comps2solv'
         )
-        for rpm_comps_file in rpm_comps_data.metadata_files:
-            self.download_from_repository(
-                rpm_comps_file,
-                os.sep.join([rpm_comps_dir, os.path.basename(rpm_comps_file)])
-            )
+        self.download_files_from_repository(
+            [
+                (
+                    rpm_comps_file,
+                    os.sep.join(
+                        [rpm_comps_dir, os.path.basename(rpm_comps_file)]
+                    )
+                ) for rpm_comps_file in rpm_comps_data.metadata_files
+            ]
+        )
         self._create_solvables(
             rpm_comps_dir, rpm_comps_data.solv_tool
         )
@@ -78,6 +86,27 @@ class SolverRepositoryRpmMd(SolverRepositoryBase):
             'repo:data[@type="primary"]/repo:timestamp'
         )[0].text
 
+    def get_metadata_checksum(self):
+        """
+        Get checksum from the primary, patterns and group_gz
+        metadata checksums listed in repomd.xml
+
+        :return: sha256 hex digest
+
+        :rtype: str
+        """
+        repomd_xml = self._get_repomd_xml()
+        checksums = []
+        for metadata_type in ['primary', 'patterns', 'group_gz']:
+            for checksum in self._get_repomd_xpath(
+                repomd_xml,
+                'repo:data[@type="{0}"]/repo:checksum'.format(metadata_type)
+            ):
+                checksums.append(f'{metadata_type}:{checksum.text}')
+        if checksums:
+            return self._get_metadata_checksum_from(checksums)
+        return None
+
     def _find_repomd_files(self, type_list, tool):
         """
         Lookup repodata/repomd.xml and the metadata files for the
@@ -33,15 +33,41 @@ class SolverRepositorySUSE(SolverRepositoryBase):
         """
         metadata_dir = self._create_temporary_metadata_dir()
         repo_data = self._find_primary_repository_files()
-        for primary_file in repo_data.primary_files:
-            self.download_from_repository(
-                primary_file,
-                os.sep.join([metadata_dir, os.path.basename(primary_file)])
-            )
+        self.download_files_from_repository(
+            [
+                (
+                    primary_file,
+                    os.sep.join([metadata_dir, os.path.basename(primary_file)])
+                ) for primary_file in repo_data.primary_files
+            ]
+        )
         self._create_solvables(
             metadata_dir, repo_data.solv_tool
         )
 
+    def get_metadata_checksum(self):
+        """
+        Get checksum from the primary metadata checksums listed
+        in suse/repodata/repomd.xml. Media repositories providing
+        only the suse/setup/descr metadata has no checksum
+
+        :return: sha256 hex digest or None
+
+        :rtype: str
+        """
+        try:
+            checksums = []
+            for checksum in self._get_repomd_xpath(
+                self._get_repomd_xml('suse/repodata'),
+                'repo:data[@type="primary"]/repo:checksum'
+            ):
+                checksums.append(f'primary:{checksum.text}')
+            if checksums:
+                return self._get_metadata_checksum_from(checksums)
+        except Exception:
+            pass
+        return None
+
     def _find_primary_repository_files(self):
         """
         Lookup repodata/repomd.xml or alternative the packages.gz
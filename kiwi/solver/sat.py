@@ -17,7 +17,9 @@
 #
 import importlib
 import logging
+import time
 from collections import namedtuple
+from typing import Dict
 from xml.etree import ElementTree
 from xml.dom import minidom
 
@@ -57,6 +59,13 @@ class Sat:
 
         self.pool = self.solv.Pool()
         self.pool.setarch()
+        self.whatprovides_outdated = False
+        self.phase_timing: Dict[str, float] = {
+            'load': 0.0,
+            'index': 0.0,
+            'solve': 0.0,
+            'transaction': 0.0
+        }
 
     def set_dist_type(self, dist, arch=None):
         if not arch:
@@ -86,15 +95,39 @@ class Sat:
         """
         Add a repository solvable to the pool. This basically add the
         required repository metadata which is needed to run a solver
-        operation later.
+        operation later. The whatprovides index of the pool is only
+        marked as outdated and gets created once on the next solve
 
         :param object solver_repository: Instance of :class:`SolverRepository`
         """
+        start = time.monotonic()
         solvable = solver_repository.create_repository_solvable()
         pool_repository = self.pool.add_repo(solver_repository.uri.uri)
         pool_repository.add_solv(solvable)
-        self.pool.addfileprovides()
-        self.pool.createwhatprovides()
+        self.whatprovides_outdated = True
+        self._add_phase_timing('load', start)
+
+    def add_repositories(self, solver_repositories):
+        """
+        Add a list of repository solvables to the pool
+
+        :param list solver_repositories:
+            list of :class:`SolverRepository` instances
+        """
+        for solver_repository in solver_repositories:
+            self.add_repository(solver_repository)
+
+    def get_phase_timing(self) -> Dict[str, float]:
+        """
+        Time spent in seconds per solver phase: load of the repository
+        solvables, creation of the whatprovides index, solving the jobs
+        and evaluation of the solver transaction
+
+        :return: dict of phase names and accumulated seconds
+
+        :rtype: dict
+        """
+        return dict(self.phase_timing)
 
     def solve(self, job_names, skip_missing=False, ignore_recommended=True):
         """
@@ -123,6 +156,9 @@ class Sat:
 
         :rtype: dict
         """
+        self._create_whatprovides()
+
+        start = time.monotonic()
         solver = self.pool.Solver()
         if ignore_recommended:
             solver.set_flag(self.solv.Solver.SOLVER_FLAG_IGNORE_RECOMMENDED, 1)
@@ -133,13 +169,46 @@ class Sat:
         solver_problem_info = self._evaluate_solver_problems(
             solver_problems
         )
+        self._add_phase_timing('solve', start)
         if solver_problem_info:
             raise KiwiSatSolverJobProblems(solver_problem_info)
 
+        start = time.monotonic()
         solver_transaction = solver.transaction()
-        return self._evaluate_solver_result(
+        result = self._evaluate_solver_result(
             solver_transaction
         )
+        self._add_phase_timing('transaction', start)
+        log.debug(
+            'Solver phase timing: {0}'.format(
+                ', '.join(
+                    '{0}: {1:.3f}s'.format(phase, seconds)
+                    for phase, seconds in self.phase_timing.items()
+                )
+            )
+        )
+        return result
+
+    def _create_whatprovides(self):
+        """
+        Create the whatprovides index of the pool if repositories
+        were added since it was created last
+        """
+        if self.whatprovides_outdated:
+            start = time.monotonic()
+            self.pool.addfileprovides()
+            self.pool.createwhatprovides()
+            self.whatprovides_outdated = False
+            self._add_phase_timing('index', start)
+
+    def _add_phase_timing(self, phase, start):
+        """
+        Add the time elapsed since start to the given phase
+
+        :param str phase: phase name
+        :param float start: start time from time.monotonic()
+        """
+        self.phase_timing[phase] += time.monotonic() - start
 
     def _evaluate_solver_problems(self, solver_problems):
         """
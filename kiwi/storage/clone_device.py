@@ -15,6 +15,7 @@
 # You should have received a copy of the GNU General Public License
 # along with kiwi.  If not, see <http://www.gnu.org/licenses/>
 #
+import os
 import uuid
 from typing import List
 
@@ -23,6 +24,7 @@ from kiwi.storage.mapped_device import MappedDevice
 from kiwi.filesystem import FileSystem
 from kiwi.command import Command
 from kiwi.utils.block import BlockID
+from kiwi.utils.block_copy import BlockCopy
 from kiwi.defaults import Defaults
 
 from kiwi.exceptions import KiwiRaidSetupError
@@ -46,19 +48,21 @@ class CloneDevice(DeviceProvider):
 
     def clone(self, target_devices: List[DeviceProvider]):
         """
-        Clone source device to target device(s)
+        Clone source device to target device(s). Holes and zero
+        blocks of the source are skipped if the target reads as
+        zeros, otherwise all blocks of the source are written
 
         :param list target_devices:
             List of target DeviceProvider instances
         """
         for target_device in target_devices:
-            Command.run(
-                [
-                    'dd',
-                    'if={0}'.format(self.source_provider.get_device()),
-                    'of={0}'.format(target_device.get_device()),
-                    'bs=1M'
-                ]
+            BlockCopy(
+                self.source_provider.get_device(), target_device.get_device()
+            ).copy(
+                sparse=self._reads_zeros(target_device.get_device()),
+                progress_prefix='Cloning {0}'.format(
+                    target_device.get_device()
+                )
             )
             clone_id = BlockID(target_device.get_device())
             target_filesystem = clone_id.get_filesystem()
@@ -74,6 +78,7 @@ class CloneDevice(DeviceProvider):
                 Command.run(
                     ['vgimportclone', target_device.get_device()]
                 )
+                BlockID.invalidate(target_device.get_device())
             elif target_filesystem == 'crypto_LUKS':
                 # Device mapper clones based on the LUKS header needs to be
                 # unique in the LUKS UUID to avoid conflicts on the running
@@ -85,6 +90,7 @@ class CloneDevice(DeviceProvider):
                         format(uuid.uuid4())
                     ]
                 )
+                BlockID.invalidate(target_device.get_device())
             elif target_filesystem == 'linux_raid_member':
                 # Device mapper clones based on the RAID superblock needs
                 # to be unique in the UUID stored in the raid superblock
@@ -122,3 +128,50 @@ class CloneDevice(DeviceProvider):
                     raise KiwiRaidSetupError(
                         f'Failed to update mdraid UUID: {issue}'
                     )
+
+    def _reads_zeros(
+        self, device: str, sys_block: str = '/sys/class/block'
+    ) -> bool:
+        """
+        Check if unwritten blocks of the given device read as zeros.
+        This is the case for a partition of a new disk image file
+        but not for a device stacked on dm-crypt, dm-integrity or
+        raid which transforms the data or stores metadata in it
+
+        :param str device: device node or file name
+        :param str sys_block: sysfs block class directory
+
+        :return: True if a sparse copy to device is valid
+
+        :rtype: bool
+        """
+        if os.path.isfile(device):
+            # regular files are truncated by BlockCopy
+            return True
+        return self._block_reads_zeros(
+            os.sep.join([sys_block, os.path.basename(os.path.realpath(device))])
+        )
+
+    def _block_reads_zeros(self, block: str) -> bool:
+        block = os.path.realpath(block)
+        if not os.path.isdir(block):
+            return False
+        if os.path.exists(os.sep.join([block, 'partition'])):
+            block = os.path.dirname(block)
+        if os.path.exists(os.sep.join([block, 'md'])):
+            return False
+        if os.path.exists(os.sep.join([block, 'dm'])):
+            table = Command.run(
+                ['dmsetup', 'table', '/dev/' + os.path.basename(block)]
+            ).output
+            for target in table.splitlines():
+                if target.split()[2:3] not in (
+                    ['linear'], ['striped'], ['zero']
+                ):
+                    return False
+        slaves = os.sep.join([block, 'slaves'])
+        if os.path.isdir(slaves):
+            for slave in os.listdir(slaves):
+                if not self._block_reads_zeros(os.sep.join([slaves, slave])):
+                    return False
+        return True
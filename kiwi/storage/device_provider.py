@@ -17,6 +17,7 @@
 #
 # project
 from kiwi.command import Command
+from kiwi.utils.block import BlockID
 from kiwi.exceptions import (
     KiwiDeviceProviderError
 )
@@ -47,10 +48,7 @@ class DeviceProvider:
 
         :rtype: str
         """
-        uuid_call = Command.run(
-            ['blkid', device, '-s', 'UUID', '-o', 'value']
-        )
-        return uuid_call.output.rstrip('\n')
+        return BlockID(device).get_uuid()
 
     def get_byte_size(self, device: str) -> int:
         """
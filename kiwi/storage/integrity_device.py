@@ -130,6 +130,7 @@ class IntegrityDevice(DeviceProvider):
                 storage_device
             ]
         )
+        BlockID.invalidate(storage_device)
         Command.run(
             [
                 'integritysetup', '-v', '--batch-mode', 'open'
@@ -247,6 +248,7 @@ class IntegrityDevice(DeviceProvider):
                     # warned.
                     target.seek(-defaults.DM_METADATA_OFFSET, 2)
                     target.write(meta.read())
+            BlockID.invalidate(self.storage_provider.get_device())
 
     def create_integritytab(self, filename: str) -> None:
         """
@@ -25,6 +25,7 @@ from kiwi.runtime_config import RuntimeConfig
 from kiwi.utils.temporary import Temporary
 from kiwi.path import Path
 from kiwi.command import Command
+from kiwi.utils.block import BlockID
 from kiwi.defaults import Defaults
 from kiwi.storage.device_provider import DeviceProvider
 from kiwi.storage.mapped_device import MappedDevice
@@ -170,6 +171,7 @@ class LuksDevice(DeviceProvider):
                 'luksFormat', storage_device
             ]
         )
+        BlockID.invalidate(storage_device)
 
         if keyfile:
             Command.run(
@@ -21,6 +21,7 @@ from typing import Optional
 
 # project
 from kiwi.command import Command
+from kiwi.utils.block import BlockID
 from kiwi.storage.device_provider import DeviceProvider
 from kiwi.storage.mapped_device import MappedDevice
 
@@ -98,6 +99,7 @@ class RaidDevice(DeviceProvider):
                 self.storage_provider.get_device(), 'missing'
             ]
         )
+        BlockID.invalidate(self.storage_provider.get_device())
         self.raid_device = raid_device
 
     def create_raid_config(self, filename: str) -> None:
@@ -164,11 +164,13 @@ class ImageSystem:
 
     def umount(self) -> None:
         """
-        Umount all elements of mount_list in reverse order
+        Umount all elements of mount_list in reverse order. Mounts
+        created below them, e.g by scripts called in the image
+        system, are umounted deepest first along with them
         """
         for mount in reversed(self.mount_list):
             if mount.is_mounted():
-                mount.umount()
+                mount.umount_tree()
         if self.volume_manager:
             self.volume_manager.umount_volumes()
 
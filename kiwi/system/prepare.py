@@ -25,6 +25,7 @@ from textwrap import dedent
 
 # project
 from kiwi.command import Command
+from kiwi.command_trace import CommandTrace
 from kiwi.xml_parse import repository
 from kiwi.xml_state import XMLState
 from kiwi.system.root_init import RootInit
@@ -37,6 +38,9 @@ from kiwi.command_process import CommandProcess
 from kiwi.system.uri import Uri
 from kiwi.archive.tar import ArchiveTar
 from kiwi.utils.sync import DataSync
+from kiwi.utils.bootstrap_cache import (
+    BootstrapCache, RepositorySourceT
+)
 from kiwi.path import Path
 from kiwi.defaults import Defaults
 
@@ -113,9 +117,15 @@ class SystemPrepare:
         #: A list of Uri references
         self.uri_list: List[Uri] = []
 
+        #: Repositories and options used for the package installation
+        self.repository_sources: List[RepositorySourceT] = []
+        self.repository_options: List[str] = []
+        self.signing_keys: List[str] = []
+
     def __enter__(self):
         return self
 
+    @CommandTrace.traced
     def setup_repositories(
         self, clear_cache: bool = False,
         signing_keys: List[str] = None, target_arch: Optional[str] = None
@@ -153,6 +163,8 @@ class SystemPrepare:
             repository_options.append(
                 f'_target_arch%{target_arch}'
             )
+        self.repository_options = repository_options
+        self.signing_keys = signing_keys or []
         with Repository.new(
             self.root_bind, package_manager, repository_options
         ) as repo:
@@ -220,6 +232,18 @@ class SystemPrepare:
                 if clear_cache:
                     repo.delete_repo_cache(repo_alias)
                 self.uri_list.append(uri)
+                self.repository_sources.append(
+                    RepositorySourceT(
+                        source=repo_source_translated,
+                        repo_type=repo_type,
+                        distribution=repo_dist or '',
+                        remote=uri.is_remote(),
+                        alias=repo_alias,
+                        priority=repo_priority,
+                        components=repo_components or '',
+                        customization_script=repo_customization_script or ''
+                    )
+                )
             repo.cleanup_unused_repos()
             return PackageManager.new(
                 repository=repo,
@@ -227,6 +251,7 @@ class SystemPrepare:
                 release_version=release_version
             )
 
+    @CommandTrace.traced
     def install_bootstrap(
         self, manager: PackageManagerBase, plus_packages: List = None
     ) -> None:
@@ -274,30 +299,44 @@ class SystemPrepare:
         manager.setup_repository_modules(
             self.xml_state.get_collection_modules()
         )
-        process = CommandProcess(
-            command=manager.process_install_requests_bootstrap(
-                self.root_bind, self.xml_state.get_bootstrap_package_name()
-            ), log_topic='bootstrap'
+        bootstrap_cache_key = self._get_bootstrap_cache_key(
+            package_manager, collection_type, all_install_items
         )
-        try:
-            process.poll_show_progress(
-                items_to_complete=all_install_items,
-                match_method=process.create_match_method(
-                    manager.match_package_installed
-                ),
-                with_stderr=True if package_manager == 'dnf5' else False
+        if BootstrapCache.restore(
+            bootstrap_cache_key, self.root_dir,
+            self._get_bootstrap_cache_exclude()
+        ):
+            manager.cleanup_requests()
+        else:
+            process = CommandProcess(
+                command=manager.process_install_requests_bootstrap(
+                    self.root_bind, self.xml_state.get_bootstrap_package_name()
+                ), log_topic='bootstrap'
             )
-        except Exception as issue:
-            if manager.has_failed(process.returncode()):
-                raise KiwiBootStrapPhaseFailed(
-                    self.issue_message.format(
-                        headline='Bootstrap package installation failed',
-                        reason=f'{issue}: {manager.get_error_details()}'
-                    )
+            try:
+                process.poll_show_progress(
+                    items_to_complete=all_install_items,
+                    match_method=process.create_match_method(
+                        manager.match_package_installed
+                    ),
+                    with_stderr=True if package_manager == 'dnf5' else False,
+                    extract_method=manager.get_installed_package_name
                 )
-        manager.post_process_install_requests_bootstrap(
-            self.root_bind, self.delta_root
-        )
+            except Exception as issue:
+                if manager.has_failed(process.returncode()):
+                    raise KiwiBootStrapPhaseFailed(
+                        self.issue_message.format(
+                            headline='Bootstrap package installation failed',
+                            reason=f'{issue}: {manager.get_error_details()}'
+                        )
+                    )
+            manager.post_process_install_requests_bootstrap(
+                self.root_bind, self.delta_root
+            )
+            BootstrapCache.store(
+                bootstrap_cache_key, self.root_dir,
+                self._get_bootstrap_cache_exclude()
+            )
         # process archive installations
         if bootstrap_archives:
             try:
@@ -312,6 +351,7 @@ class SystemPrepare:
                     )
                 )
 
+    @CommandTrace.traced
     def install_system(self, manager: PackageManagerBase) -> None:
         """
         Install system software using the package manager inside
@@ -360,7 +400,8 @@ class SystemPrepare:
                     match_method=process.create_match_method(
                         manager.match_package_installed
                     ),
-                    with_stderr=True if package_manager == 'dnf5' else False
+                    with_stderr=True if package_manager == 'dnf5' else False,
+                    extract_method=manager.get_installed_package_name
                 )
             except Exception as issue:
                 if manager.has_failed(process.returncode()):
@@ -442,6 +483,7 @@ class SystemPrepare:
                     )
                 )
 
+    @CommandTrace.traced
     def install_packages(
         self, manager: PackageManagerBase, packages: List
     ) -> None:
@@ -469,7 +511,8 @@ class SystemPrepare:
                     match_method=process.create_match_method(
                         manager.match_package_installed
                     ),
-                    with_stderr=True if package_manager == 'dnf5' else False
+                    with_stderr=True if package_manager == 'dnf5' else False,
+                    extract_method=manager.get_installed_package_name
                 )
             except Exception as issue:
                 raise KiwiSystemInstallPackagesFailed(
@@ -479,6 +522,7 @@ class SystemPrepare:
                     )
                 )
 
+    @CommandTrace.traced
     def delete_packages(
         self, manager: PackageManagerBase, packages: List, force: bool = False
     ) -> None:
@@ -525,6 +569,7 @@ class SystemPrepare:
                     )
                 )
 
+    @CommandTrace.traced
     def update_system(self, manager: PackageManagerBase) -> None:
         """
         Install package updates from the used repositories.
@@ -684,6 +729,37 @@ class SystemPrepare:
             manager.product_requests + \
             manager.exclude_requests
 
+    def _get_bootstrap_cache_key(
+        self, package_manager: str, collection_type: str,
+        install_items: List[str]
+    ) -> str:
+        if self.root_import or self.delta_root:
+            # the bootstrap root is based on data from outside
+            return ''
+        return BootstrapCache.get_key(
+            package_manager, [
+                collection_type,
+                self.xml_state.get_bootstrap_package_name(),
+                self.xml_state.get_release_version(),
+                self.xml_state.get_collection_modules(),
+                self.repository_options
+            ] + sorted(install_items), self.repository_sources,
+            self.signing_keys
+        )
+
+    def _get_bootstrap_cache_exclude(self) -> List[str]:
+        # the bind mounts and intermediate config files of this build
+        exclude = []
+        for mount in self.root_bind.mount_stack:
+            mountpoint = os.path.relpath(mount.mountpoint, self.root_dir)
+            if mountpoint != os.curdir and \
+                    not mountpoint.startswith(os.pardir):
+                exclude.append(mountpoint)
+        for config in self.root_bind.config_files:
+            for suffix in ('', '.kiwi', '.sha'):
+                exclude.append(config.lstrip(os.sep) + suffix)
+        return exclude
+
     def _get_repo_customization_script(self, xml_repo: repository) -> str:
         script_path = xml_repo.get_customize()
         if script_path and not os.path.isabs(script_path):
@@ -43,8 +43,10 @@ from kiwi.repository import Repository
 from kiwi.system.root_bind import RootBind
 from kiwi.system.root_init import RootInit
 from kiwi.command import Command
+from kiwi.command_trace import CommandTrace
 from kiwi.command_process import CommandProcess
 from kiwi.utils.sync import DataSync
+from kiwi.utils.file_install import FileInstall
 from kiwi.defaults import Defaults
 from kiwi.system.users import Users
 from kiwi.system.shell import Shell
@@ -767,6 +769,7 @@ class SystemSetup:
             return filename
         return ''
 
+    @CommandTrace.traced
     def call_disk_script(self) -> None:
         """
         Call disk.sh script chrooted
@@ -776,6 +779,7 @@ class SystemSetup:
             root_is_mountpoint=True
         )
 
+    @CommandTrace.traced
     def call_pre_disk_script(self) -> None:
         """
         Call pre_disk_sync.sh script chrooted
@@ -792,6 +796,7 @@ class SystemSetup:
             defaults.POST_BOOTSTRAP_SCRIPT
         )
 
+    @CommandTrace.traced
     def call_config_script(self) -> None:
         """
         Call config.sh script chrooted
@@ -818,6 +823,7 @@ class SystemSetup:
             working_directory=working_directory
         )
 
+    @CommandTrace.traced
     def call_image_script(self) -> None:
         """
         Call images.sh script chrooted
@@ -1558,6 +1564,7 @@ class SystemSetup:
 
     def _sync_files(self, file_list: Dict[str, FileT]) -> None:
         log.info("Installing files")
+        file_install = FileInstall(self.root_dir)
         ordered_files = OrderedDict(sorted(file_list.items()))
         for filename, file_t in list(ordered_files.items()):
             target = file_t.target
@@ -1572,7 +1579,12 @@ class SystemSetup:
                     os.sep.join([target_name, target])
                 )
             log.info(f'--> file: {file_file} -> {target_name}')
-            if target_owner:
+            # regular files are installed in-process, anything
+            # the in-process path can't handle uses the tools
+            in_process = file_install.is_supported(file_file)
+            if target_owner and not (
+                in_process and file_install.set_owner(file_file, target_owner)
+            ):
                 Command.run(
                     [
                         'chroot', self.root_dir,
@@ -1580,7 +1592,11 @@ class SystemSetup:
                         file_file.replace(self.root_dir, '')
                     ]
                 )
-            if target_permissions:
+            if target_permissions and not (
+                in_process and file_install.set_mode(
+                    file_file, target_permissions
+                )
+            ):
                 Command.run(
                     [
                         'chroot', self.root_dir,
@@ -1590,10 +1606,11 @@ class SystemSetup:
                 )
             if os.path.dirname(target_name):
                 Path.create(os.path.dirname(target_name))
-            data = DataSync(file_file, target_name)
-            data.sync_data(
-                options=Defaults.get_sync_options()
-            )
+            if not (in_process and file_install.copy(file_file, target_name)):
+                data = DataSync(file_file, target_name)
+                data.sync_data(
+                    options=Defaults.get_sync_options()
+                )
 
     def _sync_overlay_files(
         self, overlay_directory, follow_links=False,
@@ -16,21 +16,195 @@
 # along with kiwi.  If not, see <http://www.gnu.org/licenses/>
 #
 import os
-from typing import List
+import stat
+import logging
+from bisect import (
+    bisect_left, bisect_right
+)
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    List, Dict, Tuple, NamedTuple
+)
 
 # project
-from kiwi.command import Command
 from kiwi.defaults import Defaults
 
+log = logging.getLogger('kiwi')
+
+
+class DirectorySizeT(NamedTuple):
+    # size of the directory itself and of all non directory
+    # entries which are not hardlinked
+    apparent_bytes: int
+    # the directory itself and all non directory entries
+    file_count: int
+    # (st_dev, st_ino): size of all hardlinked entries
+    hardlinks: Dict[Tuple[int, int], int]
+
+
+class SystemSizeIndex:
+    """
+    **Provide an in-memory size index of a directory tree**
+
+    The tree is walked once, in parallel per top level directory,
+    and the apparent size, the number of files and the hardlinked
+    inodes are recorded per directory. Size queries for the tree
+    or any directory below it are answered from the index
+
+    :param str source_dir: source directory path name
+    """
+    def __init__(self, source_dir: str):
+        self.source_dir = os.path.normpath(source_dir)
+        self.directories: Dict[str, DirectorySizeT] = {}
+        top_level_directories = self._index_directory(
+            self.source_dir, os.lstat(self.source_dir).st_size,
+            self.directories
+        )
+        with ThreadPoolExecutor() as pool:
+            for directories in pool.map(
+                self._index_tree, top_level_directories
+            ):
+                self.directories.update(directories)
+        self.sorted_directories = sorted(self.directories)
+
+    def get_byte_size(
+        self, source_dir: str, exclude: List[str] = None
+    ) -> int:
+        """
+        Calculate the apparent size of all data below source_dir.
+        Hardlinked files are counted once, like du does
+
+        :param str source_dir: directory path name inside of the index
+        :param list exclude: list of directory paths to exclude
+
+        :return: bytes
+
+        :rtype: int
+        """
+        exclude_dirs = set(
+            os.path.normpath(item) for item in exclude or []
+        )
+        exclude_prefixes = tuple(
+            os.path.join(item, '') for item in exclude_dirs
+        )
+        apparent_bytes = 0
+        hardlinks: Dict[Tuple[int, int], int] = {}
+        for directory in self._get_subtree(source_dir):
+            if directory in exclude_dirs or \
+               directory.startswith(exclude_prefixes):
+                continue
+            directory_size = self.directories[directory]
+            apparent_bytes += directory_size.apparent_bytes
+            hardlinks.update(directory_size.hardlinks)
+        return apparent_bytes + sum(hardlinks.values())
+
+    def get_file_count(self, source_dir: str) -> int:
+        """
+        Calculate the number of files and directories below
+        source_dir including source_dir itself, like find does
+
+        :param str source_dir: directory path name inside of the index
+
+        :return: number of files
+
+        :rtype: int
+        """
+        return sum(
+            self.directories[directory].file_count
+            for directory in self._get_subtree(source_dir)
+        )
+
+    def contains(self, source_dir: str) -> bool:
+        """
+        Check if the given directory is covered by the index
+
+        :param str source_dir: directory path name
+
+        :return: True|False
+
+        :rtype: bool
+        """
+        return os.path.normpath(source_dir) in self.directories
+
+    def _get_subtree(self, source_dir: str) -> List[str]:
+        source_dir = os.path.normpath(source_dir)
+        if source_dir not in self.directories:
+            return []
+        # all paths below source_dir start with source_dir/ and
+        # are sorted in before the first path starting with source_dir0
+        prefix = os.path.join(source_dir, '')
+        lower = bisect_right(self.sorted_directories, prefix)
+        upper = bisect_left(
+            self.sorted_directories, prefix[:-1] + chr(ord(os.sep) + 1)
+        )
+        return [source_dir] + self.sorted_directories[lower:upper]
+
+    def _index_tree(
+        self, top_level_directory: Tuple[str, int]
+    ) -> Dict[str, DirectorySizeT]:
+        directories: Dict[str, DirectorySizeT] = {}
+        pending = [top_level_directory]
+        while pending:
+            directory, directory_bytes = pending.pop()
+            pending.extend(
+                self._index_directory(
+                    directory, directory_bytes, directories
+                )
+            )
+        return directories
+
+    def _index_directory(
+        self, directory: str, directory_bytes: int,
+        directories: Dict[str, DirectorySizeT]
+    ) -> List[Tuple[str, int]]:
+        sub_directories = []
+        apparent_bytes = directory_bytes
+        file_count = 1
+        hardlinks = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        entry_stat = entry.stat(follow_symlinks=False)
+                    except FileNotFoundError:
+                        continue
+                    if stat.S_ISDIR(entry_stat.st_mode):
+                        sub_directories.append(
+                            (entry.path, entry_stat.st_size)
+                        )
+                        continue
+                    file_count += 1
+                    if entry_stat.st_nlink > 1:
+                        hardlinks[
+                            (entry_stat.st_dev, entry_stat.st_ino)
+                        ] = entry_stat.st_size
+                    else:
+                        apparent_bytes += entry_stat.st_size
+        except FileNotFoundError:
+            return []
+        directories[directory] = DirectorySizeT(
+            apparent_bytes=apparent_bytes,
+            file_count=file_count,
+            hardlinks=hardlinks
+        )
+        return sub_directories
+
 
 class SystemSize:
     """
     **Provide source tree size information**
 
+    Size information is taken from a :class:`SystemSizeIndex`.
+    An index created for a directory is shared by all SystemSize
+    instances for this directory or any directory below it,
+    until it gets invalidated via invalidate_index()
+
     :param str source_dir: source directory path name
     """
+    size_index: Dict[str, SystemSizeIndex] = {}
+
     def __init__(self, source_dir: str):
-        self.source_dir = source_dir
+        self.source_dir = os.path.normpath(source_dir)
 
     def customize(self, size: float, requested_filesystem: str) -> int:
         """
@@ -74,24 +248,18 @@ class SystemSize:
 
         :rtype: int
         """
-        exclude_options: List[str] = []
+        exclude_paths: List[str] = []
         for nodev in Defaults.get_exclude_list_for_non_physical_devices():
-            exclude_options.append('--exclude')
-            exclude_options.append(
+            exclude_paths.append(
                 os.sep.join([self.source_dir, nodev])
             )
         if exclude:
-            for item in exclude:
-                exclude_options.append('--exclude')
-                exclude_options.append(item)
-        du_call = Command.run(
-            [
-                'du', '-s', '--apparent-size', '--block-size', '1'
-            ] + exclude_options + [
-                self.source_dir
-            ]
+            exclude_paths += exclude
+        return int(
+            self.get_index().get_byte_size(
+                self.source_dir, exclude_paths
+            ) / 1048576
         )
-        return int(int(du_call.output.split('\t')[0]) / 1048576)
 
     def accumulate_files(self) -> int:
         """
@@ -101,12 +269,38 @@ class SystemSize:
 
         :rtype: int
         """
-        bash_comand = [
-            'find', self.source_dir, '|', 'wc', '-l'
-        ]
-        wc_call = Command.run(
-            [
-                'bash', '-c', ' '.join(bash_comand)
-            ]
-        )
-        return int(wc_call.output.rstrip('\n'))
+        return self.get_index().get_file_count(self.source_dir)
+
+    def get_index(self) -> SystemSizeIndex:
+        """
+        Provide size index covering the source tree. An existing
+        index for the source tree or one of its parent directories
+        is reused, otherwise a new index is created
+
+        :return: instance of :class:`SystemSizeIndex`
+
+        :rtype: SystemSizeIndex
+        """
+        for size_index in SystemSize.size_index.values():
+            if size_index.contains(self.source_dir):
+                return size_index
+        log.debug('Creating size index for %s', self.source_dir)
+        size_index = SystemSizeIndex(self.source_dir)
+        SystemSize.size_index[self.source_dir] = size_index
+        return size_index
+
+    @staticmethod
+    def invalidate_index(source_dir: str = '') -> None:
+        """
+        Drop size index information such that the next size
+        request walks the tree again. This is required whenever
+        the build moves into a phase that modifies the tree
+
+        :param str source_dir:
+            directory path name of the tree to forget,
+            all trees if not specified
+        """
+        if source_dir:
+            SystemSize.size_index.pop(os.path.normpath(source_dir), None)
+        else:
+            SystemSize.size_index.clear()
@@ -19,20 +19,26 @@ import os
 import logging
 import glob
 from typing import (
-    List, Dict, Optional, Union, Any
+    TYPE_CHECKING, List, Dict, Optional, Union, Any
 )
-from operator import attrgetter
 
 # project
 from kiwi.cli import Cli
-from kiwi.xml_state import XMLState
-from kiwi.xml_description import XMLDescription
-from kiwi.runtime_checker import RuntimeChecker
+from kiwi.command_trace import CommandTrace
+from kiwi.defaults import Defaults
+from kiwi.runtime_check_scheduler import RuntimeCheckScheduler
+from kiwi.utils.bootstrap_cache import BootstrapCache
+from kiwi.utils.command_capabilities import CommandCapabilities
+from kiwi.utils.description_cache import DescriptionCache
+from kiwi.utils.sync import DataSync
 
 from kiwi.exceptions import (
     KiwiConfigFileNotFound
 )
 
+if TYPE_CHECKING:  # pragma: nocover
+    from kiwi.runtime_checker import RuntimeChecker
+
 log: Any = logging.getLogger('kiwi')
 
 
@@ -54,7 +60,8 @@ class CliTask:
         self.cli = Cli()
 
         # initialize runtime checker
-        self.runtime_checker: Optional[RuntimeChecker] = None
+        self.runtime_checker: Optional['RuntimeChecker'] = None
+        self.description_digest = ''
 
         # help requested
         self.cli.show_and_exit_on_help_request()
@@ -138,6 +145,10 @@ class CliTask:
             if self.global_args['--debug-run-scripts-in-screen']:
                 log.setLogFlag('run-scripts-in-screen')
 
+            # enable command tracing
+            if self.global_args['--trace']:
+                CommandTrace.enable()
+
             if self.global_args['--color-output']:
                 log.set_color_format()
 
@@ -152,6 +163,35 @@ class CliTask:
         from kiwi.runtime_config import RuntimeConfig
         self.runtime_config = RuntimeConfig()
 
+        # share memoized tool capability probes between invocations
+        if self.runtime_config.get_capabilities_cache():
+            CommandCapabilities.set_cache_file(
+                Defaults.get_capabilities_cache_file()
+            )
+
+        # sync directory trees in-process if requested
+        if self.runtime_config.get_sync_engine() == 'manifest':
+            DataSync.set_engine('manifest')
+
+        # skip host checks which passed for the same description before
+        if self.runtime_config.get_runtime_checks_cache():
+            RuntimeCheckScheduler.set_cache_file(
+                Defaults.get_runtime_checks_cache_file()
+            )
+
+        # skip validation of descriptions unchanged since the last run
+        if self.runtime_config.get_description_cache():
+            DescriptionCache.set_cache_dir(
+                Defaults.get_description_cache_location()
+            )
+
+        # reuse bootstrapped root trees of former builds
+        if self.runtime_config.get_bootstrap_cache():
+            BootstrapCache.set_cache_dir(
+                Defaults.get_bootstrap_cache_location(),
+                self.runtime_config.get_bootstrap_cache_max_size()
+            )
+
     def load_xml_description(
         self, description_directory: str, kiwi_file: str = ''
     ) -> None:
@@ -186,6 +226,11 @@ class CliTask:
                 f'no XML description found in {description_directory}'
             )
 
+        # import the description parser late, commands which do not
+        # load a description should not pay for it at startup
+        from kiwi.xml_state import XMLState
+        from kiwi.xml_description import XMLDescription
+        from kiwi.runtime_checker import RuntimeChecker
         self.description = XMLDescription(
             config_file
         )
@@ -209,6 +254,10 @@ class CliTask:
                 ','.join(self.xml_state.profiles)
             )
 
+        self.description_digest = RuntimeCheckScheduler.get_description_digest(
+            self.config_file, self.xml_state.profiles,
+            self.xml_state.get_build_type_name()
+        )
         self.runtime_checker = RuntimeChecker(self.xml_state)
 
     def eleventuple_token(
@@ -247,18 +296,23 @@ class CliTask:
     def run_checks(self, checks: Dict[str, List[str]]) -> None:
         """
         This method runs the given runtime checks excluding the ones disabled
-        in the runtime configuration file.
+        in the runtime configuration file. Independent checks run
+        concurrently, the error of the first failed check in the
+        given order is raised.
 
         :param dict checks: A dictionary with the runtime method names as keys
             and their arguments list as the values.
         """
         exclude_list = self.runtime_config.get_disabled_runtime_checks()
         if self.runtime_checker is not None:
-            for method, args in {
-                key: value for key, value in checks.items()
+            RuntimeCheckScheduler(
+                self.runtime_checker, self.description_digest
+            ).run(
+                {
+                    key: value for key, value in checks.items()
                     if key not in exclude_list
-            }.items():
-                attrgetter(method)(self.runtime_checker)(*args)
+                }
+            )
 
     def _pop_token(self, tokens: List[str]) -> Union[bool, str, List[str]]:
         token = tokens.pop(0)
@@ -185,6 +185,7 @@ class ImageInfoTask(CliTask):
 
     def _setup_solver(self):
         solver = Sat()
+        solver_repositories = []
         for xml_repo in self.xml_state.get_repository_sections_used_for_build():
             repo_source = xml_repo.get_source().get_path()
             repo_sourcetype = xml_repo.get_sourcetype() or ''
@@ -214,7 +215,7 @@ class ImageInfoTask(CliTask):
                                 component, f'binary-{dist_type.get("arch")}'
                             ]
                         )
-                        solver.add_repository(
+                        solver_repositories.append(
                             SolverRepository.new(
                                 Uri(
                                     repo_source_for_component,
@@ -224,12 +225,13 @@ class ImageInfoTask(CliTask):
                             )
                         )
                     continue
-            solver.add_repository(
+            solver_repositories.append(
                 SolverRepository.new(
                     Uri(repo_source, repo_type, repo_sourcetype),
                     repo_user, repo_secret
                 )
             )
+        solver.add_repositories(solver_repositories)
         return solver
 
     def _get_repo_parameters(self, tokens, credentials):
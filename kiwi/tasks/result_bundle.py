@@ -22,6 +22,7 @@ usage: kiwi-ng result bundle -h | --help
            [--zsync-source=<download_location>]
            [--package-as-rpm]
            [--no-compress]
+           [--jobs=<number>]
        kiwi-ng result bundle help
 
 commands:
@@ -29,7 +30,7 @@ commands:
         create result bundle from the image build results in the
         specified target directory. Each result image will contain
         the specified bundle identifier as part of its filename.
-        Uncompressed image files will also become xz compressed
+        Uncompressed image files will also become xz or zstd compressed
         and a sha sum will be created from every result image.
 
 options:
@@ -57,13 +58,22 @@ options:
         image description
     --no-compress
         Do not compress the result image file(s)
+    --jobs=<number>
+        number of bundle files to zsync and checksum in parallel.
+        Defaults to the number of CPUs. Compression runs for one
+        file at a time as the compressor uses all CPUs itself
 """
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from textwrap import dedent
-from typing import List
+from typing import (
+    List, Tuple
+)
 import logging
+import shutil
 import glob
 import os
+import threading
 
 # project
 from kiwi.tasks.base import CliTask
@@ -75,6 +85,7 @@ from kiwi.path import Path
 from kiwi.utils.compress import Compress
 from kiwi.privileges import Privileges
 from kiwi.command import Command
+from kiwi.command_trace import CommandTrace
 
 from kiwi.exceptions import (
     KiwiBundleError
@@ -97,7 +108,7 @@ class ResultBundleTask(CliTask):
         Create result bundle from the image build results in the
         specified target directory. Each result image will contain
         the specified bundle identifier as part of its filename.
-        Uncompressed image files will also become xz compressed
+        Uncompressed image files will also become xz or zstd compressed
         and a sha sum will be created from every result image
         """
         self.manual = Help()
@@ -179,101 +190,53 @@ class ResultBundleTask(CliTask):
             )
             del ordered_results['bundle_format']
 
-        # copy result files
-        origin_files = []
-        copied_files = []
+        compress_results = not self.command_args['--no-compress']
+        bundle_jobs = int(self.command_args['--jobs'] or os.cpu_count() or 1)
+
+        # clone result files, files which gets compressed are replaced
+        # by their compressed variant and are allowed to be hard linked
+        bundle_files: List[Tuple[result_file_type, str]] = []
+        renames: List[Tuple[str, str]] = []
         for result_file in list(ordered_results.values()):
             if result_file.use_for_bundle:
                 bundle_file_basename = self._get_bundle_file_basename(
                     result, result_file, bundle_file_format_name
                 )
-                log.info('Creating %s', bundle_file_basename)
                 bundle_file = ''.join(
                     [bundle_directory, '/', bundle_file_basename]
                 )
-                Command.run(
-                    [
-                        'cp', result_file.filename, bundle_file
-                    ]
+                log.info(
+                    'Creating %s (%s)', bundle_file_basename, Path.clone(
+                        result_file.filename, bundle_file,
+                        allow_hardlink=bool(
+                            result_file.compress and compress_results
+                        )
+                    )
                 )
-                copied_files.append(bundle_file)
+                bundle_files.append((result_file, bundle_file))
                 result_file_basename = os.path.basename(result_file.filename)
                 if result_file_basename != bundle_file_basename:
-                    symlink_orignal_name = f'{bundle_directory}/{result_file_basename}'
-                    if os.path.islink(symlink_orignal_name):
-                        os.unlink(symlink_orignal_name)
-                    os.symlink(bundle_file, symlink_orignal_name)
-                    origin_files.append(symlink_orignal_name)
-
-        # check and fix file references due to possible bundle_format renames
-        for origin_file in origin_files:
-            origin_file_basename = os.path.basename(origin_file)
-            bundle_file_basename = os.path.basename(os.readlink(origin_file))
-            log.info(f'Checking file references for {origin_file_basename}')
-            for result_file in copied_files:
-                if 'text' in Command.run(['file', result_file]).output:
-                    log.info(f'--> {result_file}')
-                    Command.run(
-                        [
-                            'sed', '-ie',
-                            f's/{origin_file_basename}/{bundle_file_basename}/g',
-                            result_file
-                        ]
+                    renames.append(
+                        (result_file_basename, bundle_file_basename)
                     )
-                    os.unlink(f'{result_file}e')
-            os.unlink(origin_file)
-
-        # finalize result data, checksums, compressions
-        for result_file in list(ordered_results.values()):
-            if result_file.use_for_bundle:
-                bundle_file_basename = self._get_bundle_file_basename(
-                    result, result_file, bundle_file_format_name
-                )
-                log.info(f'Finalizing {bundle_file_basename}')
-                bundle_file = ''.join(
-                    [bundle_directory, '/', bundle_file_basename]
-                )
-                if result_file.compress and not self.command_args['--no-compress']:
-                    log.info('--> Compressing')
-                    compress = Compress(bundle_file)
-                    bundle_file = compress.xz(self.runtime_config.get_xz_options())
-
-                if self.command_args['--zsync-source'] and result_file.shasum:
-                    # Files with a checksum are considered to be image files
-                    # and are therefore eligible to be provided via the
-                    # requested Partial/differential file download based on
-                    # zsync
-                    zsyncmake = Path.which('zsyncmake', access_mode=os.X_OK)
-                    if zsyncmake:
-                        log.info('--> Creating zsync control file')
-                        Command.run(
-                            [
-                                zsyncmake, '-e', '-u', os.sep.join(
-                                    [
-                                        self.command_args['--zsync-source'],
-                                        os.path.basename(bundle_file)
-                                    ]
-                                ), '-o', bundle_file + '.zsync', bundle_file
-                            ]
-                        )
-                    else:
-                        log.warning(
-                            '--> zsyncmake missing, zsync setup skipped'
-                        )
 
-                if result_file.shasum:
-                    checksum = self.runtime_config.get_checksum_handler(
-                        source_filename=bundle_file, bundle_lookup=True
-                    )
-                    log.info(f'--> Creating {checksum.suffix} sum')
-                    with open(f'{bundle_file}{checksum.suffix}', 'w') as shasum:
-                        shasum.write(
-                            '{0}  {1}{2}'.format(
-                                checksum.digest(),
-                                os.path.basename(bundle_file),
-                                os.linesep
-                            )
-                        )
+        # fix file references due to possible bundle_format renames
+        if renames:
+            for result_file, bundle_file in bundle_files:
+                self._rewrite_file_references(bundle_file, renames)
+
+        # finalize result data, compressions, zsync and checksums
+        # independent files are processed in parallel
+        self.compress_lock = threading.Lock()
+        with CommandTrace.phase('ResultBundleTask.finalize'):
+            with ThreadPoolExecutor(max_workers=bundle_jobs) as executor:
+                for finalized in [
+                    executor.submit(
+                        self._finalize_bundle_file, result_file,
+                        bundle_file, compress_results
+                    ) for result_file, bundle_file in bundle_files
+                ]:
+                    finalized.result()
 
         if self.command_args['--package-as-rpm']:
             ResultBundleTask._build_rpm_package(
@@ -283,6 +246,99 @@ class ResultBundleTask(CliTask):
                 image_description.specification,
                 list(glob.iglob(f'{bundle_directory}/*'))
             )
+        CommandTrace.write(
+            os.sep.join([bundle_directory, 'kiwi.trace.json'])
+        )
+
+    def _finalize_bundle_file(
+        self, result_file: result_file_type, bundle_file: str,
+        compress_results: bool
+    ) -> None:
+        bundle_file_basename = os.path.basename(bundle_file)
+        log.info(f'Finalizing {bundle_file_basename}')
+        if result_file.compress and compress_results:
+            # the compressor runs threaded on all CPUs, thus only
+            # one file is compressed at a time
+            with self.compress_lock:
+                log.info(f'--> Compressing {bundle_file_basename}')
+                compress = Compress(bundle_file)
+                if self.runtime_config.get_bundle_compression_format() == \
+                   'zstd':
+                    bundle_file = compress.zstd(
+                        self.runtime_config.get_zstd_options()
+                    )
+                else:
+                    bundle_file = compress.xz(
+                        self.runtime_config.get_xz_options()
+                    )
+
+        if self.command_args['--zsync-source'] and result_file.shasum:
+            # Files with a checksum are considered to be image files
+            # and are therefore eligible to be provided via the
+            # requested Partial/differential file download based on
+            # zsync
+            zsyncmake = Path.which('zsyncmake', access_mode=os.X_OK)
+            if zsyncmake:
+                log.info(
+                    f'--> Creating zsync control file for {bundle_file_basename}'
+                )
+                Command.run(
+                    [
+                        zsyncmake, '-e', '-u', os.sep.join(
+                            [
+                                self.command_args['--zsync-source'],
+                                os.path.basename(bundle_file)
+                            ]
+                        ), '-o', bundle_file + '.zsync', bundle_file
+                    ]
+                )
+            else:
+                log.warning(
+                    '--> zsyncmake missing, zsync setup skipped'
+                )
+
+        if result_file.shasum:
+            checksum = self.runtime_config.get_checksum_handler(
+                source_filename=bundle_file, bundle_lookup=True
+            )
+            log.info(
+                f'--> Creating {checksum.suffix} sum for {bundle_file_basename}'
+            )
+            digest = checksum.digest()
+            with open(f'{bundle_file}{checksum.suffix}', 'w') as shasum:
+                shasum.write(
+                    '{0}  {1}{2}'.format(
+                        digest, os.path.basename(bundle_file), os.linesep
+                    )
+                )
+
+    @staticmethod
+    def _rewrite_file_references(
+        bundle_file: str, renames: List[Tuple[str, str]]
+    ) -> None:
+        """
+        Replace the original result file names by their bundle
+        file names in text results. The file is replaced, never
+        modified in place, as it might be a hard link or reflink
+        to the original result file
+        """
+        with open(bundle_file, 'rb') as bundle:
+            if b'\0' in bundle.read(8192):
+                # not a text file
+                return
+            bundle.seek(0)
+            data = bundle.read()
+        new_data = data
+        for origin_file_basename, bundle_file_basename in renames:
+            new_data = new_data.replace(
+                origin_file_basename.encode(), bundle_file_basename.encode()
+            )
+        if new_data != data:
+            log.info(f'Fixing file references in {bundle_file}')
+            with open(bundle_file + '.tmp', 'wb') as bundle:
+                bundle.write(new_data)
+            shutil.copymode(bundle_file, bundle_file + '.tmp')
+            os.replace(bundle_file + '.tmp', bundle_file)
 
     def _get_bundle_file_basename(
         self, result: Result, result_file: result_file_type,
@@ -323,6 +379,7 @@ class ResultBundleTask(CliTask):
         return bundle_file_basename
 
     @staticmethod
+    @CommandTrace.traced
     def _build_rpm_package(
         bundle_directory: str, image_name: str, image_version: str,
         description_text, filenames: List[str]
@@ -142,6 +142,7 @@ from kiwi.builder import ImageBuilder
 from kiwi.system.profile import Profile
 from kiwi.defaults import Defaults
 from kiwi.privileges import Privileges
+from kiwi.command_trace import CommandTrace
 from kiwi.path import Path
 
 from kiwi.exceptions import (
@@ -399,6 +400,9 @@ class SystemBuildTask(CliTask):
         result.dump(
             os.sep.join([abs_target_dir_path, 'kiwi.result'])
         )
+        CommandTrace.write(
+            os.sep.join([abs_target_dir_path, 'kiwi.trace.json'])
+        )
 
     def _help(self):
         if self.command_args['help']:
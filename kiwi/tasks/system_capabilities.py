@@ -0,0 +1,134 @@
+# Copyright (c) 2026 SUSE LLC.  All rights reserved.
+#
+# This file is part of kiwi.
+#
+# kiwi is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# kiwi is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kiwi.  If not, see <http://www.gnu.org/licenses/>
+#
+"""
+usage: kiwi-ng system capabilities -h | --help
+       kiwi-ng system capabilities
+           [--clear-cache]
+       kiwi-ng system capabilities help
+
+commands:
+    capabilities
+        probe the capabilities of the tools on the host which are
+        checked by kiwi and show them together with the memoized
+        probes
+
+options:
+    --clear-cache
+        drop all memoized tool capability probes from memory and
+        from the capabilities cache file before probing
+"""
+import os
+import logging
+
+# project
+from kiwi.tasks.base import CliTask
+from kiwi.help import Help
+from kiwi.path import Path
+from kiwi.utils.command_capabilities import CommandCapabilities
+from kiwi.utils.output import DataOutput
+
+log = logging.getLogger('kiwi')
+
+
+class SystemCapabilitiesTask(CliTask):
+    """
+    Implements probing of host tool capabilities
+
+    Attributes
+
+    * :attr:`manual`
+        Instance of Help
+    """
+    def process(self):
+        """
+        Probe and show the capabilities of the host tools
+        """
+        self.manual = Help()
+        if self._help():
+            return
+
+        if self.command_args['--clear-cache']:
+            log.info('Clearing tool capabilities cache')
+            CommandCapabilities.invalidate_cache()
+
+        capabilities = {}
+        for tool, capability, probe in self._get_probes():
+            if not Path.which(filename=tool, access_mode=os.X_OK):
+                capabilities[capability] = 'not installed'
+            else:
+                capabilities[capability] = probe()
+
+        result = {
+            'capabilities': capabilities,
+            'cache_file': CommandCapabilities.cache_file,
+            'probes': CommandCapabilities.get_cached_probes()
+        }
+        if self.global_args['--color-output']:
+            DataOutput(result, style='color').display()
+        else:
+            DataOutput(result).display()
+
+    def _get_probes(self):
+        return [
+            (
+                'tar', 'tar version >= 1.27',
+                lambda: CommandCapabilities.check_version(
+                    'tar', (1, 27), raise_on_error=False, silent=True
+                )
+            ),
+            (
+                'losetup', 'losetup --sector-size',
+                lambda: CommandCapabilities.has_option_in_help(
+                    'losetup', '--sector-size',
+                    raise_on_error=False, silent=True
+                )
+            ),
+            (
+                'umoci', 'umoci config --no-history',
+                lambda: CommandCapabilities.has_option_in_help(
+                    'umoci', '--no-history', ['config', '--help'],
+                    raise_on_error=False, silent=True
+                )
+            ),
+            (
+                'skopeo', 'skopeo version >= 0.2.0',
+                lambda: CommandCapabilities.check_version(
+                    'skopeo', (0, 2, 0), raise_on_error=False, silent=True
+                )
+            ),
+            (
+                'skopeo', 'skopeo copy --additional-tag',
+                lambda: CommandCapabilities.has_option_in_help(
+                    'skopeo', '--additional-tag', ['copy', '--help'],
+                    raise_on_error=False, silent=True
+                )
+            ),
+            (
+                'checkmedia', 'checkmedia version >= 6.6',
+                lambda: CommandCapabilities.check_version(
+                    'checkmedia', (6, 6), raise_on_error=False, silent=True
+                )
+            )
+        ]
+
+    def _help(self):
+        if self.command_args['help']:
+            self.manual.show('kiwi::system::capabilities')
+        else:
+            return False
+        return self.manual
@@ -47,6 +47,7 @@ from kiwi.help import Help
 from kiwi.builder import ImageBuilder
 from kiwi.system.setup import SystemSetup
 from kiwi.privileges import Privileges
+from kiwi.command_trace import CommandTrace
 from kiwi.path import Path
 
 log = logging.getLogger('kiwi')
@@ -117,6 +118,9 @@ class SystemCreateTask(CliTask):
         result.dump(
             os.sep.join([abs_target_dir_path, 'kiwi.result'])
         )
+        CommandTrace.write(
+            os.sep.join([abs_target_dir_path, 'kiwi.trace.json'])
+        )
 
     def _help(self):
         if self.command_args['help']:
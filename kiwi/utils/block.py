@@ -17,6 +17,10 @@
 #
 import os
 import re
+import threading
+from typing import (
+    Dict, Optional
+)
 
 # project
 from kiwi.command import Command
@@ -26,11 +30,23 @@ class BlockID:
     """
     **Get information from a block device**
 
+    All tags of a device are read in one blkid call and cached
+    per device node. The cache is dropped if the kernel reported
+    a device event, e.g. a new loop or partition device, and the
+    cached tags of a device are dropped via invalidate when kiwi
+    changes them, e.g. by creating a filesystem
+
     :param str device:
         block device node name name. The device can
         also be specified as UUID=<uuid>
 
     """
+    uevent_seqnum_file = '/sys/kernel/uevent_seqnum'
+    cache_lock = threading.Lock()
+    cache_seqnum: Optional[str] = None
+    tags_cache: Dict[str, Dict[str, str]] = {}
+    partition_count_cache: Dict[str, int] = {}
+
     def __init__(self, device):
         uuid_format = re.match(r'^UUID=(.*)', device)
         if uuid_format:
@@ -89,13 +105,19 @@ class BlockID:
 
         :rtype: int
         """
-        partition_count = 0
-        lsblk_result = Command.run(
-            ['lsblk', '-r', '-o', 'NAME,TYPE', self.device]
-        )
-        for line in lsblk_result.output.strip().split(os.linesep):
-            if line.strip().endswith('part'):
-                partition_count += 1
+        with self.cache_lock:
+            self._validate_cache()
+            partition_count = self.partition_count_cache.get(self.device)
+        if partition_count is None:
+            partition_count = 0
+            lsblk_result = Command.run(
+                ['lsblk', '-r', '-o', 'NAME,TYPE', self.device]
+            )
+            for line in lsblk_result.output.strip().split(os.linesep):
+                if line.strip().endswith('part'):
+                    partition_count += 1
+            with self.cache_lock:
+                self.partition_count_cache[self.device] = partition_count
         return partition_count
 
     def get_blkid(self, id_type):
@@ -108,8 +130,57 @@ class BlockID:
 
         :rtype: str
         """
-        blkid_result = Command.run(
-            ['blkid', self.device, '-s', id_type, '-o', 'value'],
-            raise_on_error=False
-        )
-        return blkid_result.output.strip(os.linesep) if blkid_result else ''
+        return self.get_tags().get(id_type, '')
+
+    def get_tags(self) -> Dict[str, str]:
+        """
+        Retrieve all metadata IDs from block device
+
+        :return: dict of metadata ID names and values
+
+        :rtype: dict
+        """
+        with self.cache_lock:
+            self._validate_cache()
+            tags = self.tags_cache.get(self.device)
+        if tags is None:
+            tags = {}
+            blkid_result = Command.run(
+                ['blkid', '-o', 'export', self.device],
+                raise_on_error=False
+            )
+            if blkid_result:
+                for line in blkid_result.output.splitlines():
+                    name, separator, value = line.partition('=')
+                    if separator:
+                        tags[name] = re.sub(r'\\(.)', r'\1', value)
+            with self.cache_lock:
+                self.tags_cache[self.device] = tags
+        return dict(tags)
+
+    @classmethod
+    def invalidate(cls, device: str = '') -> None:
+        """
+        Drop cached information of the given or all block devices
+
+        :param str device: block device node name
+        """
+        with cls.cache_lock:
+            if device:
+                cls.tags_cache.pop(device, None)
+                cls.partition_count_cache.pop(device, None)
+            else:
+                cls.tags_cache.clear()
+                cls.partition_count_cache.clear()
+
+    @classmethod
+    def _validate_cache(cls) -> None:
+        try:
+            with open(cls.uevent_seqnum_file) as uevent_seqnum:
+                seqnum = uevent_seqnum.read().strip()
+        except OSError:
+            seqnum = ''
+        if seqnum != cls.cache_seqnum:
+            cls.cache_seqnum = seqnum
+            cls.tags_cache.clear()
+            cls.partition_count_cache.clear()
@@ -0,0 +1,180 @@
+# Copyright (c) 2026 SUSE LLC.  All rights reserved.
+#
+# This file is part of kiwi.
+#
+# kiwi is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# kiwi is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kiwi.  If not, see <http://www.gnu.org/licenses/>
+#
+import os
+import stat
+import errno
+import logging
+from typing import (
+    Iterator, Optional, Tuple
+)
+
+# project
+from kiwi.logger import Logger
+from kiwi.utils.block import BlockID
+
+from kiwi.exceptions import KiwiBlockCopyError
+
+log = logging.getLogger('kiwi')
+
+
+class BlockCopy:
+    """
+    **Copy data from a file or device to a file or device**
+
+    In-process replacement for dd. Holes in the source are found
+    via SEEK_DATA/SEEK_HOLE and skipped, data between two regular
+    files is transferred in the kernel via copy_file_range, all
+    other data is copied in large aligned blocks. For a sparse
+    copy blocks which only contain zeros are not written either.
+    This requires the target to read as zeros, which is the case
+    for a new file or a partition of a new disk image file
+
+    :param str source: source file or device
+    :param str target: target file or device
+    :param int block_size: number of bytes to transfer at once
+    """
+    def __init__(
+        self, source: str, target: str, block_size: int = 4194304
+    ) -> None:
+        self.source = source
+        self.target = target
+        self.block_size = block_size
+
+    def copy(
+        self, sparse: bool = True, progress_prefix: Optional[str] = None
+    ) -> int:
+        """
+        Copy source to target. A regular target file is truncated
+        to the size of the source like dd does. Cached BlockID
+        information of a target block device is dropped
+
+        :param bool sparse:
+            skip holes and zero blocks, only valid if target
+            reads as zeros
+        :param str progress_prefix:
+            show progress with the given prefix if set
+
+        :return: number of bytes written to target
+
+        :rtype: int
+
+        :raises KiwiBlockCopyError: if the copy failed
+        """
+        try:
+            source_fd = os.open(self.source, os.O_RDONLY)
+            try:
+                target_fd = os.open(self.target, os.O_WRONLY | os.O_CREAT)
+                try:
+                    written = self._copy(
+                        source_fd, target_fd, sparse, progress_prefix
+                    )
+                    if stat.S_ISBLK(os.fstat(target_fd).st_mode):
+                        BlockID.invalidate(self.target)
+                    return written
+                finally:
+                    os.close(target_fd)
+            finally:
+                os.close(source_fd)
+        except OSError as issue:
+            raise KiwiBlockCopyError(
+                f'Copy of {self.source} to {self.target} failed: {issue}'
+            )
+
+    def _copy(
+        self, source_fd: int, target_fd: int, sparse: bool,
+        progress_prefix: Optional[str]
+    ) -> int:
+        size = os.lseek(source_fd, 0, os.SEEK_END)
+        target_is_file = stat.S_ISREG(os.fstat(target_fd).st_mode)
+        kernel_copy = target_is_file and \
+            stat.S_ISREG(os.fstat(source_fd).st_mode)
+        if target_is_file:
+            os.ftruncate(target_fd, 0)
+        zero_block = bytes(self.block_size)
+        buffer = bytearray(self.block_size)
+        written = 0
+        done = 0
+        percent = -1
+        for offset, length in self._get_data_segments(source_fd, size, sparse):
+            while length:
+                count = min(self.block_size, length)
+                copied = 0
+                if kernel_copy:
+                    try:
+                        copied = os.copy_file_range(
+                            source_fd, target_fd, count, offset, offset
+                        )
+                    except OSError as issue:
+                        if issue.errno not in (
+                            errno.EXDEV, errno.EINVAL, errno.ENOSYS,
+                            errno.EOPNOTSUPP
+                        ):
+                            raise
+                        kernel_copy = False
+                    written += copied
+                if not copied:
+                    view = memoryview(buffer)[:count]
+                    copied = os.preadv(source_fd, [view], offset)
+                    if not copied:
+                        raise KiwiBlockCopyError(
+                            f'Unexpected end of {self.source} at {offset}'
+                        )
+                    view = view[:copied]
+                    if not sparse or view != zero_block[:copied]:
+                        written += os.pwritev(target_fd, [view], offset)
+                offset += copied
+                length -= copied
+                done += copied
+                if progress_prefix and int(done * 100 / size) != percent:
+                    percent = int(done * 100 / size)
+                    Logger.progress(percent, 100, progress_prefix)
+        if target_is_file:
+            os.ftruncate(target_fd, size)
+        if progress_prefix and percent != 100:
+            Logger.progress(100, 100, progress_prefix)
+        log.debug(
+            f'Copied {self.source} to {self.target}: '
+            f'{size} bytes, {written} bytes written'
+        )
+        return written
+
+    def _get_data_segments(
+        self, source_fd: int, size: int, sparse: bool
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Yield offset and length of the data segments in source.
+        Without sparse copy or if the source does not support
+        SEEK_DATA/SEEK_HOLE, e.g a block device, the whole source
+        is one data segment
+        """
+        if not sparse:
+            yield (0, size)
+            return
+        offset = 0
+        while offset < size:
+            try:
+                data_start = os.lseek(source_fd, offset, os.SEEK_DATA)
+            except OSError as issue:
+                if issue.errno == errno.ENXIO:
+                    # no more data until the end of the source
+                    return
+                yield (offset, size - offset)
+                return
+            data_end = min(os.lseek(source_fd, data_start, os.SEEK_HOLE), size)
+            yield (data_start, data_end - data_start)
+            offset = data_end
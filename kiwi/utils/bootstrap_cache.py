@@ -0,0 +1,407 @@
+# Copyright (c) 2026 SUSE LLC.  All rights reserved.
+#
+# This file is part of kiwi.
+#
+# kiwi is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# kiwi is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kiwi.  If not, see <http://www.gnu.org/licenses/>
+#
+import os
+import json
+import fcntl
+import shutil
+import hashlib
+import logging
+import threading
+from contextlib import contextmanager
+from typing import (
+    Iterator, List, NamedTuple, Optional, Set, Tuple
+)
+
+# project
+import kiwi.defaults as defaults
+
+from kiwi.defaults import Defaults
+from kiwi.archive.tar import ArchiveTar
+from kiwi.command import Command
+from kiwi.utils.sync_manifest import (
+    SyncManifest, FICLONE
+)
+from kiwi.version import __version__
+
+from kiwi.exceptions import KiwiDataSyncError
+
+log = logging.getLogger('kiwi')
+
+
+class RepositorySourceT(NamedTuple):
+    source: str
+    repo_type: str
+    distribution: str
+    remote: bool
+    alias: str
+    priority: Optional[int]
+    components: str
+    customization_script: str
+
+
+class BootstrapCache:
+    """
+    **On-disk cache of root trees after the bootstrap phase**
+
+    The cache key is a hash over the kiwi version, the package
+    manager, the architecture, the bootstrap requests, the
+    repositories with their alias, priority and components, the
+    checksums of their metadata index and of their customization
+    script, and the checksums of the signing keys. The package
+    manager resolves the same package set as long as none of them
+    has changed. Repositories of a type without a known metadata
+    index or with unreachable metadata disable the cache for the
+    build.
+
+    A root tree is stored as a copy made of reflinks if the cache
+    directory and the root tree share a filesystem that supports
+    them, otherwise as a zstd compressed tar archive. The least
+    recently used root trees are deleted to keep the allocated
+    size of the cache below max_size. The cache is inactive until
+    a cache directory is set
+    """
+    cache_dir: Optional[str] = None
+    max_size: int = 0
+    cache_lock = threading.Lock()
+
+    # metadata index files of a repository, the first one found is used
+    metadata_files = {
+        'rpm-md': ['repodata/repomd.xml'],
+        'apt-deb': ['InRelease', 'Release']
+    }
+
+    @classmethod
+    def set_cache_dir(cls, cache_dir: str, max_size: int) -> None:
+        """
+        Store bootstrap root trees in the given directory
+
+        :param str cache_dir: cache directory path
+        :param int max_size: maximum size of all root trees in bytes
+        """
+        with cls.cache_lock:
+            cls.cache_dir = cache_dir
+            cls.max_size = max_size
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Delete all cached root trees
+        """
+        with cls.cache_lock:
+            if cls.cache_dir and os.path.isdir(cls.cache_dir):
+                shutil.rmtree(cls.cache_dir, ignore_errors=True)
+
+    @classmethod
+    def get_key(
+        cls, package_manager: str, requests: List,
+        repositories: List[RepositorySourceT],
+        signing_keys: Optional[List[str]] = None
+    ) -> str:
+        """
+        Provides the cache key for a bootstrap phase
+
+        :param str package_manager: package manager name
+        :param list requests:
+            bootstrap requests and options which influence the
+            result of the package installation
+        :param list repositories: repositories in the order of use
+        :param list signing_keys: signing key files imported for the build
+
+        :return: cache key, empty if the cache is inactive or not usable
+
+        :rtype: str
+        """
+        if not cls.cache_dir:
+            return ''
+        metadata_digests = []
+        for repository in repositories:
+            metadata_digest = cls._get_metadata_digest(repository)
+            if not metadata_digest:
+                log.info(
+                    '--> No bootstrap cache: no metadata for {0}'.format(
+                        repository.source
+                    )
+                )
+                return ''
+            metadata_digests.append(metadata_digest)
+        file_digests = []
+        for filename in [
+            repository.customization_script for repository in repositories
+            if repository.customization_script
+        ] + (signing_keys or []):
+            file_digest = cls._get_file_digest(filename)
+            if not file_digest:
+                log.info(
+                    f'--> No bootstrap cache: failed to read {filename}'
+                )
+                return ''
+            file_digests.append(file_digest)
+        return hashlib.sha256(
+            json.dumps(
+                [
+                    __version__, package_manager, defaults.PLATFORM_MACHINE,
+                    requests, repositories, metadata_digests, file_digests
+                ]
+            ).encode()
+        ).hexdigest()
+
+    @classmethod
+    def restore(cls, key: str, root_dir: str, exclude: List[str]) -> bool:
+        """
+        Restore the root tree for the given key into root_dir.
+        Failures to read the cache are not fatal, everything
+        restored up to the failure is deleted again
+
+        :param str key: cache key from get_key
+        :param str root_dir: root directory path name
+        :param list exclude: list of exclude dirs/files
+
+        :return: True if restored, False if not cached
+
+        :rtype: bool
+        """
+        if not key or not cls.cache_dir:
+            return False
+        tree, archive = cls._get_entry_paths(key)
+        existing = cls._get_paths(root_dir, exclude)
+        try:
+            with cls._locked(exclusive=False):
+                if os.path.isdir(tree):
+                    SyncManifest(tree).sync(
+                        root_dir, cls._get_sync_flags(), exclude
+                    )
+                    os.utime(tree)
+                elif os.path.isfile(archive):
+                    Command.run(
+                        [
+                            'tar', '-C', root_dir, '--numeric-owner',
+                            '--xattrs', '--xattrs-include=*', '--acls',
+                            '-x', '-f', archive
+                        ] + cls._get_tar_exclude_options(exclude)
+                    )
+                    os.utime(archive)
+                else:
+                    return False
+        except Exception as issue:
+            log.warning(f'Failed to restore bootstrap root: {issue}')
+            # the bootstrap must not run on a partly restored root
+            cls._remove_new_paths(root_dir, exclude, existing)
+            return False
+        log.info(f'--> Restored bootstrap root from cache: {key}')
+        return True
+
+    @classmethod
+    def store(cls, key: str, root_dir: str, exclude: List[str]) -> None:
+        """
+        Store the root tree in root_dir under the given key and
+        evict the least recently used root trees above max_size.
+        Failures to write the cache are not fatal
+
+        :param str key: cache key from get_key
+        :param str root_dir: root directory path name
+        :param list exclude: list of exclude dirs/files
+        """
+        if not key or not cls.cache_dir:
+            return
+        tree, archive = cls._get_entry_paths(key)
+        temporary = f'{tree}.tmp{os.getpid()}'
+        try:
+            os.makedirs(cls.cache_dir, exist_ok=True)
+            if cls._has_reflink_support(root_dir, cls.cache_dir):
+                SyncManifest(root_dir, one_file_system=True).sync(
+                    temporary, cls._get_sync_flags(), exclude
+                )
+                entry, stored = tree, temporary
+            else:
+                stored = ArchiveTar(
+                    temporary, create_from_file_list=False
+                ).create_zstd_compressed(
+                    root_dir, exclude=exclude, options=[
+                        '--numeric-owner', '--acls', '--sparse',
+                        '--one-file-system'
+                    ]
+                )
+                entry = archive
+            with cls._locked(exclusive=True):
+                if not os.path.lexists(entry):
+                    os.rename(stored, entry)
+                cls._evict()
+            log.info(f'--> Stored bootstrap root in cache: {key}')
+        except Exception as issue:
+            log.warning(f'Failed to store bootstrap root: {issue}')
+        finally:
+            cls._remove(temporary)
+            cls._remove(f'{temporary}.zst')
+
+    @classmethod
+    def _evict(cls) -> None:
+        entries: List[Tuple[float, int, str]] = []
+        for name in os.listdir(cls.cache_dir or ''):
+            if name.startswith('.') or '.tmp' in name:
+                continue
+            path = os.sep.join([cls.cache_dir or '', name])
+            entries.append(
+                (os.lstat(path).st_mtime, cls._get_size(path), path)
+            )
+        total = sum(size for mtime, size, path in entries)
+        for mtime, size, path in sorted(entries):
+            if total <= cls.max_size:
+                break
+            log.info(f'--> Evicting bootstrap root from cache: {path}')
+            cls._remove(path)
+            total -= size
+
+    @classmethod
+    def _get_metadata_digest(
+        cls, repository: RepositorySourceT
+    ) -> Optional[str]:
+        prefix = ''
+        if repository.repo_type == 'apt-deb' and repository.distribution:
+            prefix = f'dists/{repository.distribution}/'
+        for name in cls.metadata_files.get(repository.repo_type, []):
+            location = '/'.join(
+                [repository.source.rstrip('/'), prefix + name]
+            )
+            metadata = cls._read_metadata(location, repository.remote)
+            if metadata is not None:
+                return hashlib.sha256(metadata).hexdigest()
+        return None
+
+    @staticmethod
+    def _get_file_digest(filename: str) -> Optional[str]:
+        try:
+            with open(filename, 'rb') as data:
+                return hashlib.sha256(data.read()).hexdigest()
+        except OSError as issue:
+            log.debug(f'Failed to read {filename}: {issue}')
+            return None
+
+    @staticmethod
+    def _read_metadata(location: str, remote: bool) -> Optional[bytes]:
+        try:
+            if remote:
+                # network access is only needed with an active cache
+                from urllib.request import urlopen
+                with urlopen(location, timeout=30) as response:
+                    return response.read()
+            with open(location, 'rb') as metadata:
+                return metadata.read()
+        except (OSError, ValueError) as issue:
+            log.debug(f'Failed to read repository metadata: {issue}')
+            return None
+
+    @classmethod
+    def _get_entry_paths(cls, key: str) -> Tuple[str, str]:
+        tree = os.sep.join([cls.cache_dir or '', key])
+        return tree, f'{tree}.tar.zst'
+
+    @staticmethod
+    def _get_sync_flags():
+        flags = SyncManifest.get_flags(Defaults.get_sync_options())
+        if not flags:
+            raise KiwiDataSyncError('Unsupported sync options for cache')
+        return flags
+
+    @staticmethod
+    def _get_tar_exclude_options(exclude: List[str]) -> List[str]:
+        exclude_options = []
+        for item in exclude:
+            exclude_options.append('--exclude')
+            exclude_options.append('./' + item)
+        return exclude_options
+
+    @staticmethod
+    def _has_reflink_support(source_dir: str, target_dir: str) -> bool:
+        probe = f'.kiwi_reflink.{os.getpid()}'
+        source_file = os.sep.join([source_dir, probe])
+        target_file = os.sep.join([target_dir, probe])
+        try:
+            with open(source_file, 'wb') as source:
+                source.write(b'\0')
+            with open(source_file, 'rb') as source:
+                with open(target_file, 'wb') as target:
+                    fcntl.ioctl(target.fileno(), FICLONE, source.fileno())
+            return True
+        except OSError:
+            return False
+        finally:
+            for probe_file in (source_file, target_file):
+                if os.path.lexists(probe_file):
+                    os.unlink(probe_file)
+
+    @staticmethod
+    def _get_paths(root_dir: str, exclude: List[str]) -> Set[str]:
+        paths = set()
+        for root, dirs, files in os.walk(root_dir):
+            relative_root = os.path.relpath(root, root_dir)
+            for name in dirs + files:
+                paths.add(os.path.normpath(os.sep.join([relative_root, name])))
+            # the contents of excluded directories, e.g. bind mounts,
+            # are not walked
+            dirs[:] = [
+                name for name in dirs if os.path.normpath(
+                    os.sep.join([relative_root, name])
+                ) not in exclude
+            ]
+        return paths
+
+    @classmethod
+    def _remove_new_paths(
+        cls, root_dir: str, exclude: List[str], existing: Set[str]
+    ) -> None:
+        for root, dirs, files in os.walk(root_dir):
+            relative_root = os.path.relpath(root, root_dir)
+            keep = []
+            for name in dirs + files:
+                path = os.path.normpath(os.sep.join([relative_root, name]))
+                if path in exclude:
+                    continue
+                if path in existing:
+                    keep.append(name)
+                else:
+                    cls._remove(os.sep.join([root, name]))
+            dirs[:] = [name for name in dirs if name in keep]
+
+    @staticmethod
+    def _get_size(path: str) -> int:
+        if not os.path.isdir(path) or os.path.islink(path):
+            return os.lstat(path).st_blocks * 512
+        size = 0
+        for root, dirs, files in os.walk(path):
+            for name in dirs + files:
+                size += os.lstat(os.sep.join([root, name])).st_blocks * 512
+        return size
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path, ignore_errors=True)
+        elif os.path.lexists(path):
+            os.unlink(path)
+
+    @classmethod
+    @contextmanager
+    def _locked(cls, exclusive: bool) -> Iterator[None]:
+        # serialize access of concurrent kiwi builds to the cache
+        os.makedirs(cls.cache_dir or '', exist_ok=True)
+        with open(os.sep.join([cls.cache_dir or '', '.lock']), 'w') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
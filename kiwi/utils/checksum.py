@@ -16,17 +16,32 @@
 # along with kiwi.  If not, see <http://www.gnu.org/licenses/>
 #
 import os
+import lzma
+import zlib
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
+from typing import (
+    Any, Callable, Dict, List, Optional
+)
 import hashlib
 import encodings.ascii as encoding
 
 # project
 from kiwi.api_helper import decommissioned
+from kiwi.command import Command
 from kiwi.utils.compress import Compress
 from kiwi.utils.primes import factors
 
 from kiwi.exceptions import (
-    KiwiFileNotFound
+    KiwiFileNotFound,
+    KiwiCommandError
+)
+
+digest_result_type = namedtuple(
+    'digest_result_type', [
+        'digests', 'size', 'uncompressed_digests', 'uncompressed_size'
+    ]
 )
 
 
@@ -45,6 +60,8 @@ class Checksum:
         self.source_filename = source_filename
         self.checksum_filename = None
         self.ascii = encoding.getregentry().name
+        # aligned read size, a multiple of the page and hash block size
+        self.read_size = 4194304
 
     def matches(self, checksum, filename):
         """
@@ -81,14 +98,7 @@ class Checksum:
 
         :param str filename: filename for checksum
         """
-        sha256_checksum = self._calculate_hash_hexdigest(
-            hashlib.sha256(), self.source_filename
-        )
-        if filename:
-            self._create_checksum_file(
-                sha256_checksum, filename, hashlib.sha256
-            )
-        return sha256_checksum
+        return self._create_checksum('sha256', filename)
 
     def sha512(self, filename=None):
         """
@@ -96,66 +106,140 @@ class Checksum:
 
         :param str filename: filename for checksum
         """
-        sha512_checksum = self._calculate_hash_hexdigest(
-            hashlib.sha512(), self.source_filename
+        return self._create_checksum('sha512', filename)
+
+    def digests(
+        self, hash_names: List[str], uncompressed: bool = False
+    ) -> digest_result_type:
+        """
+        Calculate the given digests of the source file in one read.
+        If uncompressed is set and the source file is compressed,
+        the digests of the uncompressed data are calculated from the
+        same read without creating a temporary file
+
+        :param list hash_names: hashlib algorithm names, e.g sha256
+        :param bool uncompressed: also digest the uncompressed data
+
+        :return:
+            digest_result_type with hexdigests per name and the size
+            of the source file. uncompressed_digests and
+            uncompressed_size are None if the source is not compressed
+
+        :rtype: digest_result_type
+        """
+        zipper = Compress(self.source_filename).get_format() \
+            if uncompressed else None
+        digests = [hashlib.new(name) for name in hash_names]
+        uncompressed_digests = [hashlib.new(name) for name in hash_names]
+        uncompressed_size = [0]
+
+        def update_uncompressed(data: bytes) -> None:
+            uncompressed_size[0] += len(data)
+            for digest in uncompressed_digests:
+                digest.update(data)
+
+        decoder = _StreamDecoder(
+            zipper, self.source_filename, update_uncompressed
+        ) if zipper else None
+        size = 0
+        buffer = bytearray(self.read_size)
+        view = memoryview(buffer)
+        with open(self.source_filename, 'rb', buffering=0) as source:
+            while True:
+                count = source.readinto(buffer)
+                if not count:
+                    break
+                size += count
+                for digest in digests:
+                    digest.update(view[:count])
+                if decoder:
+                    decoder.feed(view[:count])
+        if decoder:
+            decoder.close()
+        return digest_result_type(
+            digests={
+                name: digest.hexdigest()
+                for name, digest in zip(hash_names, digests)
+            },
+            size=size,
+            uncompressed_digests={
+                name: digest.hexdigest()
+                for name, digest in zip(hash_names, uncompressed_digests)
+            } if decoder else None,
+            uncompressed_size=uncompressed_size[0] if decoder else None
         )
-        if filename:
-            self._create_checksum_file(
-                sha512_checksum, filename, hashlib.sha512
+
+    @staticmethod
+    def digest_files(
+        filenames: List[str], hash_name: str = 'sha256',
+        max_workers: Optional[int] = None
+    ) -> Dict[str, str]:
+        """
+        Calculate the digest of the given files in parallel. hashlib
+        releases the GIL while hashing, which allows to use one
+        thread per file
+
+        :param list filenames: list of file paths
+        :param str hash_name: hashlib algorithm name
+        :param int max_workers: number of threads, defaults to cpu count
+
+        :return: dict of file paths and hexdigests
+
+        :rtype: dict
+        """
+        if not filenames:
+            return {}
+        with ThreadPoolExecutor(
+            max_workers=max_workers or min(len(filenames), os.cpu_count() or 1)
+        ) as executor:
+            results = executor.map(
+                lambda filename: Checksum(filename).digests(
+                    [hash_name]
+                ).digests[hash_name], filenames
             )
-        return sha512_checksum
+            return dict(zip(filenames, results))
+
+    def _create_checksum(self, hash_name, filename=None):
+        """
+        Create checksum and optionally the checksum file
 
-    def _create_checksum_file(self, checksum, filename, haslib_method):
+        :param str hash_name: hashlib algorithm name
+        :param str filename: filename for checksum
         """
-        Creates the text file that contains the checksum
+        result = self.digests([hash_name], uncompressed=bool(filename))
+        if filename:
+            self._create_checksum_file(result, hash_name, filename)
+        return result.digests[hash_name]
 
-        :param str checksum: checksum to include into the file
+    def _create_checksum_file(self, result, hash_name, filename):
+        """
+        Creates the text file that contains the checksum. For
+        compressed source files the checksum and block list of
+        the uncompressed data is written followed by the block
+        list of the compressed data
+
+        :param digest_result_type result: result from digests()
+        :param str hash_name: hashlib algorithm name
         :param str filename: filename of the output file
         """
-        compressed_blocks = None
-        compress = Compress(self.source_filename)
-        if compress.get_format():
-            compressed_blocks = self._block_list(
-                os.path.getsize(self.source_filename)
-            )
-            compress.uncompress(temporary=True)
-            blocks = self._block_list(
-                os.path.getsize(compress.uncompressed_filename)
-            )
-            checksum = self._calculate_hash_hexdigest(
-                haslib_method(), compress.uncompressed_filename
-            )
-        else:
-            blocks = self._block_list(
-                os.path.getsize(self.source_filename)
-            )
         with open(filename, encoding=self.ascii, mode='w') as checksum_file:
-            if compressed_blocks:
+            if result.uncompressed_digests:
+                blocks = self._block_list(result.uncompressed_size)
+                compressed_blocks = self._block_list(result.size)
                 checksum_file.write(
                     '%s %s %s %s %s\n' % (
-                        checksum, blocks.blocks, blocks.blocksize,
+                        result.uncompressed_digests[hash_name],
+                        blocks.blocks, blocks.blocksize,
                         compressed_blocks.blocks, compressed_blocks.blocksize
                     )
                 )
             else:
+                blocks = self._block_list(result.size)
                 checksum_file.write(
-                    f'{checksum} {blocks.blocks} {blocks.blocksize}\n'
+                    f'{result.digests[hash_name]} '
+                    f'{blocks.blocks} {blocks.blocksize}\n'
                 )
 
-    def _calculate_hash_hexdigest(self, digest, filename, digest_blocks=128):
-        """
-        Calculates the hash hexadecimal digest for a given file.
-
-        :param func digest: Digest function for hash calculation
-        :param str filename: File to compute
-        :param int digest_blocks: Number of blocks processed at a time
-        """
-        chunk_size = digest_blocks * digest.block_size
-        with open(filename, 'rb') as source:
-            for chunk in iter(lambda: source.read(chunk_size), b''):
-                digest.update(chunk)
-        return digest.hexdigest()
-
     def _block_list(self, file_size):
         """
         Calculates the number of blocks and the block size for a given file
@@ -180,3 +264,93 @@ class Checksum:
             blocksize=blocksize,
             blocks=blocks
         )
+
+
+class _StreamDecoder:
+    """
+    **Decode a compressed stream chunk by chunk**
+
+    xz and gzip data is decoded in process, zstd data is decoded
+    by the zstd tool reading the source file in a separate thread.
+    The decoded data is passed to sink in chunks of at most
+    chunk_size bytes
+
+    :param str zipper: compression format as returned by Compress
+    :param str source_filename: compressed source file
+    :param callable sink: called with each decoded chunk
+    :param int chunk_size: max size of a decoded chunk
+    """
+    def __init__(
+        self, zipper: str, source_filename: str,
+        sink: Callable[[bytes], None], chunk_size: int = 4194304
+    ) -> None:
+        self.zipper = zipper
+        self.sink = sink
+        self.chunk_size = chunk_size
+        self.decompressor: Any = None if zipper == 'zstd' \
+            else self._new_decompressor()
+        self.reader: Optional[Thread] = None
+        if zipper == 'zstd':
+            self.zstd_call = Command.call(
+                ['zstd', '-d', '-c', '-q', source_filename]
+            )
+            self.reader = Thread(target=self._read_zstd_output)
+            self.reader.start()
+
+    def feed(self, data) -> None:
+        """
+        Decode the given compressed data
+
+        :param bytes data: next chunk of the compressed stream
+        """
+        if self.reader:
+            return
+        while data:
+            if self.zipper == 'xz':
+                self.sink(self.decompressor.decompress(data, self.chunk_size))
+                while not self.decompressor.needs_input and \
+                        not self.decompressor.eof:
+                    self.sink(
+                        self.decompressor.decompress(b'', self.chunk_size)
+                    )
+            else:
+                self.sink(self.decompressor.decompress(data, self.chunk_size))
+                while self.decompressor.unconsumed_tail:
+                    self.sink(
+                        self.decompressor.decompress(
+                            self.decompressor.unconsumed_tail, self.chunk_size
+                        )
+                    )
+            data = b''
+            if self.decompressor.eof and self.decompressor.unused_data:
+                # concatenated streams
+                data = self.decompressor.unused_data
+                self.decompressor = self._new_decompressor()
+
+    def close(self) -> None:
+        """
+        Finish decoding
+
+        :raises KiwiCommandError: if the zstd tool failed
+        """
+        if self.reader:
+            self.reader.join()
+            if self.zstd_call.process.wait() != 0:
+                raise KiwiCommandError(
+                    'zstd: {0}'.format(
+                        self.zstd_call.error.read().decode(errors='replace')
+                    )
+                )
+        elif self.zipper == 'gzip':
+            self.sink(self.decompressor.flush())
+
+    def _new_decompressor(self):
+        if self.zipper == 'xz':
+            return lzma.LZMADecompressor()
+        return zlib.decompressobj(zlib.MAX_WBITS | 16)
+
+    def _read_zstd_output(self) -> None:
+        for chunk in iter(
+            lambda: self.zstd_call.output.read(self.chunk_size), b''
+        ):
+            self.sink(chunk)
@@ -17,8 +17,13 @@
 #
 import os
 import re
+import json
 import logging
-from typing import List
+import threading
+from collections import namedtuple
+from typing import (
+    Any, Dict, List, Optional
+)
 
 # project
 from kiwi.command import Command
@@ -27,6 +32,10 @@ from kiwi.exceptions import KiwiCommandCapabilitiesError
 
 log = logging.getLogger('kiwi')
 
+probe_type = namedtuple(
+    'probe_type', ['output', 'error']
+)
+
 
 class CommandCapabilities:
     """
@@ -35,7 +44,67 @@ class CommandCapabilities:
     Performs commands calls and parses the output
     so it can look specific flags on help message, check
     command version, etc.
+
+    The output of a probe is memoized for the lifetime of the
+    process. The cache key consists of the resolved tool path,
+    its modification time, the root directory and the probe
+    arguments, such that an updated tool is probed again. If a
+    cache file is set, probes are also stored on disk and shared
+    between kiwi invocations
     """
+    cache: Dict[str, Dict[str, str]] = {}
+    cache_file: Optional[str] = None
+    cache_lock = threading.Lock()
+
+    @classmethod
+    def set_cache_file(cls, filename: str) -> None:
+        """
+        Store probes in the given file and load the probes
+        stored there by a former kiwi invocation
+
+        :param str filename: cache file path
+        """
+        with cls.cache_lock:
+            cls.cache_file = filename
+            try:
+                with open(filename) as cache:
+                    cls.cache.update(json.load(cache))
+            except (OSError, ValueError):
+                pass
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """
+        Drop all memoized probes from memory and disk
+        """
+        with cls.cache_lock:
+            cls.cache = {}
+            if cls.cache_file and os.path.exists(cls.cache_file):
+                os.unlink(cls.cache_file)
+
+    @classmethod
+    def get_cached_probes(cls) -> List[Dict[str, str]]:
+        """
+        Provides the memoized probes
+
+        :return:
+            list of dicts with the keys tool, root and arguments
+
+        :rtype: list
+        """
+        with cls.cache_lock:
+            probes = []
+            for key in sorted(cls.cache):
+                tool, mtime, root, arguments = json.loads(key)
+                probes.append(
+                    {
+                        'tool': tool,
+                        'root': root,
+                        'arguments': ' '.join(arguments)
+                    }
+                )
+            return probes
+
     @staticmethod
     def has_option_in_help(
         call: str, flag: str, help_flags: List[str] = [],
@@ -64,13 +133,16 @@ class CommandCapabilities:
             arguments = ['chroot', root, call] + help_args
         else:
             arguments = [call] + help_args
-        if raise_on_error and not Path.which(
+        tool = Path.which(
             filename=call, access_mode=os.X_OK, root_dir=root or None
-        ):
+        )
+        if raise_on_error and not tool:
             raise KiwiCommandCapabilitiesError(
                 f'Attempting to call "{arguments}" but {call} was not found'
             )
-        command = Command.run(arguments, raise_on_error=False)
+        command = CommandCapabilities._probe(
+            tool, root, arguments, raise_on_error=False
+        )
         for line in command.output.splitlines():
             if flag in line:
                 return True
@@ -114,7 +186,11 @@ class CommandCapabilities:
             arguments = [call] + version_args
         version_info = None
         try:
-            command = Command.run(arguments)
+            command = CommandCapabilities._probe(
+                Path.which(
+                    filename=call, access_mode=os.X_OK, root_dir=root or None
+                ), root, arguments
+            )
             for line in command.output.splitlines():
                 matches = re.findall(r'([0-9]+(\.[0-9]+)*)', line)
                 if matches:
@@ -133,3 +209,48 @@ class CommandCapabilities:
                 log.warning(message)
             return False
         return version_info >= version_waterline
+
+    @classmethod
+    def _probe(
+        cls, tool: Optional[str], root: str, arguments: List[str],
+        **run_options: Any
+    ) -> Any:
+        """
+        Run the probe command or lookup its memoized output.
+        Probes of tools which can not be resolved as well as
+        probes which failed or exited with an error are not
+        memoized
+        """
+        key = None
+        try:
+            if tool:
+                key = json.dumps(
+                    [tool, os.stat(tool).st_mtime_ns, root, arguments]
+                )
+        except OSError:
+            pass
+        if key:
+            with cls.cache_lock:
+                result = cls.cache.get(key)
+            if result:
+                log.debug(f'Using memoized probe of {tool}: {arguments}')
+                return probe_type(**result)
+        command = Command.run(arguments, **run_options)
+        if key and command.returncode == 0:
+            with cls.cache_lock:
+                cls.cache[key] = {
+                    'output': command.output, 'error': command.error
+                }
+                cls._write_cache_file()
+        return command
+
+    @classmethod
+    def _write_cache_file(cls) -> None:
+        if cls.cache_file:
+            try:
+                os.makedirs(os.path.dirname(cls.cache_file), exist_ok=True)
+                with open(cls.cache_file + '.tmp', 'w') as cache:
+                    json.dump(cls.cache, cache)
+                os.replace(cls.cache_file + '.tmp', cls.cache_file)
+            except OSError as issue:
+                log.debug(f'Failed to write probe cache: {issue}')
@@ -16,8 +16,13 @@
 # along with kiwi.  If not, see <http://www.gnu.org/licenses/>
 #
 import os
+import gzip
+import lzma
+import shutil
 import logging
-from typing import List, Optional
+from typing import (
+    Dict, List, Optional
+)
 
 # project
 from kiwi.utils.temporary import Temporary
@@ -31,6 +36,13 @@ from kiwi.exceptions import (
 
 log = logging.getLogger('kiwi')
 
+# magic bytes at the start of a file per compression format
+COMPRESSION_MAGIC: Dict[str, bytes] = {
+    'xz': b'\xfd7zXZ\x00',
+    'gzip': b'\x1f\x8b',
+    'zstd': b'\x28\xb5\x2f\xfd'
+}
+
 
 class Compress:
     """
@@ -54,7 +66,7 @@ class Compress:
         self.keep_source = keep_source_on_compress
         self.source_filename = source_filename
         self.supported_zipper = [
-            'xz', 'gzip'
+            'xz', 'gzip', 'zstd'
         ]
         self.compressed_filename: Optional[str] = None
         self.uncompressed_filename: Optional[str] = None
@@ -76,6 +88,23 @@ class Compress:
         self.compressed_filename = self.source_filename + '.xz'
         return self.compressed_filename
 
+    def zstd(self, options: Optional[List[str]] = None) -> str:
+        """
+        Create zstd compressed file
+
+        :param list options: custom zstd compression options
+        """
+        if not options:
+            options = Defaults.get_zstd_compression_options()
+        assert options
+        if not self.keep_source:
+            options = options + ['--rm']
+        Command.run(
+            ['zstd', '-f', '-q'] + options + [self.source_filename]
+        )
+        self.compressed_filename = self.source_filename + '.zst'
+        return self.compressed_filename
+
     def gzip(self) -> str:
         """
         Create gzip(max compression) compressed file
@@ -107,30 +136,41 @@ class Compress:
                 f'could not detect compression format for {self.source_filename}'
             )
         if not temporary:
-            Command.run([zipper, '-d', self.source_filename])
+            Command.run(
+                [zipper, '-d'] + (
+                    ['-q', '--rm'] if zipper == 'zstd' else []
+                ) + [self.source_filename]
+            )
             self.uncompressed_filename = self.source_filename
         else:
             self.temp_file = Temporary().new_file()
-            bash_command = [
-                zipper, '-c', '-d', self.source_filename,
-                '>', self.temp_file.name
-            ]
-            Command.run(['bash', '-c', ' '.join(bash_command)])
+            if zipper == 'zstd':
+                Command.run(
+                    [
+                        'zstd', '-d', '-q', '-f', self.source_filename,
+                        '-o', self.temp_file.name
+                    ]
+                )
+            else:
+                zipper_open = lzma.open if zipper == 'xz' else gzip.open
+                with zipper_open(self.source_filename, 'rb') as source:
+                    with open(self.temp_file.name, 'wb') as target:
+                        shutil.copyfileobj(source, target, 1048576)
             self.uncompressed_filename = self.temp_file.name
         return self.uncompressed_filename
 
     def get_format(self) -> Optional[str]:
         """
-        Detect compression format
+        Detect compression format from the magic bytes at the
+        start of the source file
 
         :return: compression format name or None if it couldn't be inferred
 
         :rtype: Optional[str]
         """
+        with open(self.source_filename, 'rb') as source:
+            magic = source.read(6)
         for zipper in self.supported_zipper:
-            result = Command.run(
-                [zipper, '-l', self.source_filename], raise_on_error=False
-            )
-            if result.returncode == 0:
+            if magic.startswith(COMPRESSION_MAGIC[zipper]):
                 return zipper
         return None
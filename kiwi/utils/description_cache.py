@@ -0,0 +1,146 @@
+# Copyright (c) 2026 SUSE LLC.  All rights reserved.
+#
+# This file is part of kiwi.
+#
+# kiwi is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# kiwi is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kiwi.  If not, see <http://www.gnu.org/licenses/>
+#
+import os
+import shutil
+import logging
+import hashlib
+import threading
+from typing import (
+    List, Optional
+)
+
+# project
+from kiwi.defaults import Defaults
+from kiwi.version import __version__
+
+log = logging.getLogger('kiwi')
+
+
+class DescriptionCache:
+    """
+    **On-disk cache of validated image descriptions**
+
+    Stores the XSLT upgraded result of an image description once
+    it passed the schema validation. The cache key is a hash over
+    the description content, the content of the files it includes,
+    the kiwi version and the schema and stylesheet files, such
+    that a cached description is only used as long as none of
+    them has changed. The cache is inactive until a cache
+    directory is set
+    """
+    cache_dir: Optional[str] = None
+    cache_lock = threading.Lock()
+    tool_digest: Optional[str] = None
+
+    @classmethod
+    def set_cache_dir(cls, cache_dir: str) -> None:
+        """
+        Store validated descriptions in the given directory
+
+        :param str cache_dir: cache directory path
+        """
+        with cls.cache_lock:
+            cls.cache_dir = cache_dir
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Delete all cached descriptions
+        """
+        with cls.cache_lock:
+            if cls.cache_dir and os.path.isdir(cls.cache_dir):
+                shutil.rmtree(cls.cache_dir, ignore_errors=True)
+
+    @classmethod
+    def get_key(cls, filenames: List[str]) -> str:
+        """
+        Provides the cache key for the given description files
+
+        :param list filenames:
+            description file followed by the files it includes
+
+        :return: cache key, empty if the cache is inactive
+
+        :rtype: str
+        """
+        if not cls.cache_dir:
+            return ''
+        digest = hashlib.sha256(cls._get_tool_digest().encode())
+        for filename in filenames:
+            with open(filename, 'rb') as description:
+                for chunk in iter(lambda: description.read(65536), b''):
+                    digest.update(chunk)
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    @classmethod
+    def lookup(cls, key: str) -> Optional[str]:
+        """
+        Provides the cached description for the given key
+
+        :param str key: cache key from get_key
+
+        :return: file path or None if not cached
+
+        :rtype: str
+        """
+        if not key or not cls.cache_dir:
+            return None
+        cached = os.sep.join([cls.cache_dir, f'{key}.xml'])
+        if os.path.isfile(cached):
+            log.debug(f'Using validated description from cache: {cached}')
+            return cached
+        return None
+
+    @classmethod
+    def store(cls, key: str, description: str) -> None:
+        """
+        Store a validated description under the given key.
+        Failures to write the cache are not fatal
+
+        :param str key: cache key from get_key
+        :param str description: path to the validated description
+        """
+        if not key or not cls.cache_dir:
+            return
+        cached = os.sep.join([cls.cache_dir, f'{key}.xml'])
+        try:
+            os.makedirs(cls.cache_dir, exist_ok=True)
+            shutil.copyfile(description, f'{cached}.tmp{os.getpid()}')
+            os.replace(f'{cached}.tmp{os.getpid()}', cached)
+        except OSError as issue:
+            log.debug(f'Failed to write description cache: {issue}')
+
+    @classmethod
+    def _get_tool_digest(cls) -> str:
+        with cls.cache_lock:
+            if not cls.tool_digest:
+                tool_files = [Defaults.get_schema_file()]
+                xsl_dir = os.path.dirname(Defaults.get_xsl_stylesheet_file())
+                for entry in sorted(os.listdir(xsl_dir)):
+                    tool_files.append(os.sep.join([xsl_dir, entry]))
+                state = [__version__]
+                for tool_file in tool_files:
+                    tool_stat = os.stat(tool_file)
+                    state.append(
+                        f'{tool_file}:{tool_stat.st_size}:{tool_stat.st_mtime_ns}'
+                    )
+                cls.tool_digest = hashlib.sha256(
+                    '\n'.join(state).encode()
+                ).hexdigest()
+            return cls.tool_digest
@@ -0,0 +1,213 @@
+# Copyright (c) 2026 SUSE LLC.  All rights reserved.
+#
+# This file is part of kiwi.
+#
+# kiwi is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# kiwi is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kiwi.  If not, see <http://www.gnu.org/licenses/>
+#
+import os
+import json
+import shutil
+import hashlib
+import logging
+import tempfile
+import threading
+from typing import (
+    Dict, MutableMapping, Optional, Tuple
+)
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# project
+from kiwi.path import Path
+
+from kiwi.exceptions import KiwiUriOpenError
+
+log = logging.getLogger('kiwi')
+
+
+class Download:
+    """
+    **Download files from http(s) locations**
+
+    All instances share one pooled keep-alive HTTP session such that
+    connections to the same repository server are reused. Files are
+    streamed to the target in chunks of chunk_size bytes. An
+    interrupted transfer is resumed with a range request. If a
+    cache_dir is given, downloaded files are stored there and
+    revalidated via If-None-Match/If-Modified-Since on the next
+    request of the same url
+
+    :param str cache_dir: directory to store cached files or None
+    :param int chunk_size: number of bytes to read and write at once
+    :param int retries: number of attempts to resume a failed transfer
+    """
+    session: Optional[requests.Session] = None
+    session_lock = threading.Lock()
+
+    def __init__(
+        self, cache_dir: Optional[str] = None, chunk_size: int = 65536,
+        retries: int = 3
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.chunk_size = chunk_size
+        self.retries = retries
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """
+        Create or return the shared HTTP session
+
+        :return: instance of requests.Session
+
+        :rtype: requests.Session
+        """
+        with cls.session_lock:
+            if not cls.session:
+                pool_size = min(32, (os.cpu_count() or 1) + 4)
+                adapter = HTTPAdapter(
+                    pool_connections=pool_size, pool_maxsize=pool_size
+                )
+                cls.session = requests.Session()
+                cls.session.mount('http://', adapter)
+                cls.session.mount('https://', adapter)
+            return cls.session
+
+    def get(
+        self, url: str, target: str, auth: Optional[Tuple[str, str]] = None
+    ) -> None:
+        """
+        Download url to target file
+
+        :param str url: http(s) url
+        :param str target: file path
+        :param tuple auth: user and secret for basic authentication
+
+        :raises KiwiUriOpenError: if the download fails
+        """
+        if not self.cache_dir:
+            self._fetch(url, target, auth)
+            return
+        cache_file = os.sep.join(
+            [self.cache_dir, hashlib.sha256(url.encode()).hexdigest()]
+        )
+        cache_info = self._read_cache_info(cache_file)
+        headers = {}
+        if cache_info.get('etag'):
+            headers['If-None-Match'] = cache_info['etag']
+        if cache_info.get('last_modified'):
+            headers['If-Modified-Since'] = cache_info['last_modified']
+        Path.create(self.cache_dir)
+        response_headers = self._fetch(url, cache_file, auth, headers)
+        if response_headers is None:
+            log.debug(f'Using cached {url}')
+        else:
+            with open(cache_file + '.json', 'w') as info:
+                json.dump(
+                    {
+                        'etag': response_headers.get('ETag'),
+                        'last_modified': response_headers.get('Last-Modified')
+                    }, info
+                )
+        shutil.copyfile(cache_file, target)
+
+    def _fetch(
+        self, url: str, target: str, auth: Optional[Tuple[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Optional[MutableMapping[str, str]]:
+        """
+        Stream url to target, resume a failed transfer with a range
+        request. Data is written to a partial file first and moved to
+        target after the transfer is complete. The partial file has a
+        unique name, such that concurrent builds downloading the same
+        url to a shared cache do not write into the same file
+
+        :return:
+            case insensitive response headers or None if the server
+            reported the cached target as not modified
+
+        :rtype: requests.structures.CaseInsensitiveDict
+        """
+        session = self.get_session()
+        descriptor, partial_target = tempfile.mkstemp(
+            dir=os.path.dirname(target) or os.curdir,
+            prefix='.{0}.'.format(os.path.basename(target)), suffix='.part'
+        )
+        os.close(descriptor)
+        try:
+            return self._fetch_to(
+                session, url, target, partial_target, auth, headers
+            )
+        finally:
+            if os.path.exists(partial_target):
+                os.unlink(partial_target)
+
+    def _fetch_to(
+        self, session: requests.Session, url: str, target: str,
+        partial_target: str, auth: Optional[Tuple[str, str]],
+        headers: Optional[Dict[str, str]]
+    ) -> Optional[MutableMapping[str, str]]:
+        request_headers = dict(headers or {})
+        received = 0
+        attempt = 0
+        while True:
+            if received:
+                # resume the transfer, the data is no longer revalidated
+                request_headers = {'Range': f'bytes={received}-'}
+            try:
+                with session.get(
+                    url, auth=auth, headers=request_headers, stream=True,
+                    timeout=60
+                ) as response:
+                    if response.status_code == 304:
+                        return None
+                    response.raise_for_status()
+                    if response.status_code != 206:
+                        received = 0
+                    with open(
+                        partial_target, 'ab' if received else 'wb'
+                    ) as target_file:
+                        for chunk in response.iter_content(self.chunk_size):
+                            target_file.write(chunk)
+                            received += len(chunk)
+                    os.chmod(partial_target, 0o644)
+                    os.replace(partial_target, target)
+                    return response.headers
+            except (
+                requests.ConnectionError,
+                requests.Timeout,
+                requests.exceptions.ChunkedEncodingError
+            ) as issue:
+                attempt += 1
+                if attempt > self.retries:
+                    raise KiwiUriOpenError(
+                        f'{type(issue).__name__}: {issue} {url}'
+                    )
+                log.debug(
+                    f'Download of {url} interrupted after {received} bytes, '
+                    f'retry {attempt}/{self.retries}'
+                )
+            except Exception as issue:
+                raise KiwiUriOpenError(
+                    f'{type(issue).__name__}: {issue} {url}'
+                )
+
+    def _read_cache_info(self, cache_file: str) -> Dict[str, str]:
+        if os.path.exists(cache_file) and os.path.exists(cache_file + '.json'):
+            try:
+                with open(cache_file + '.json') as info:
+                    return json.load(info)
+            except ValueError:
+                pass
+        return {}
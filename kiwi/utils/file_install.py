@@ -0,0 +1,268 @@
+# Copyright (c) 2026 SUSE LLC.  All rights reserved.
+#
+# This file is part of kiwi.
+#
+# kiwi is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# kiwi is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kiwi.  If not, see <http://www.gnu.org/licenses/>
+#
+import os
+import re
+import stat
+import shutil
+import logging
+from typing import (
+    Dict, Optional, Tuple
+)
+
+log = logging.getLogger('kiwi')
+
+
+class FileInstall:
+    """
+    **Install files into an image root tree in-process**
+
+    Applies owner, permissions and the copy of a file to its
+    target location without spawning chown, chmod or rsync.
+    User and group names are resolved once against the passwd
+    and group files of the image root, such that the result
+    is the same as running chown inside of the image root.
+    Every method returns a false value for requests it can't
+    answer with the same semantics as the tools it replaces,
+    the caller is expected to fall back to the tools then
+
+    :param str root_dir: root directory path name
+    """
+    symbolic_mode = re.compile(r'^([ugoa]*)([-+=])([rwxXst]*)$')
+
+    def __init__(self, root_dir: str) -> None:
+        self.root_dir = root_dir
+        self.users: Optional[Dict[str, Tuple[int, int]]] = None
+        self.groups: Optional[Dict[str, int]] = None
+        self.umask: Optional[int] = None
+
+    def is_supported(self, filename: str) -> bool:
+        """
+        Check if the given file can be installed in-process
+
+        Only regular files are handled, symlinks could point
+        outside of the image root when resolved from the host
+
+        :param str filename: file path name
+
+        :return: True or False
+
+        :rtype: bool
+        """
+        return os.path.isfile(filename) and not os.path.islink(filename)
+
+    def get_owner_ids(self, owner: str) -> Optional[Tuple[int, int]]:
+        """
+        Resolve a chown owner specification of the form
+        user, user:group, user: or :group against the image
+        root. Numeric ids are accepted for unknown names
+
+        :param str owner: owner specification
+
+        :return: uid and gid, -1 for unchanged, None if unresolvable
+
+        :rtype: tuple
+        """
+        self._read_accounts()
+        user, separator, group = owner.partition(':')
+        uid = gid = -1
+        if user:
+            user_ids = self._get_user_ids(user)
+            if not user_ids:
+                return None
+            uid = user_ids[0]
+            if separator and not group:
+                # user: sets the login group of the user
+                gid = user_ids[1]
+                if gid == -1:
+                    return None
+        if group:
+            group_id = self._get_group_id(group)
+            if group_id is None:
+                return None
+            gid = group_id
+        if uid == -1 and gid == -1:
+            return None
+        return (uid, gid)
+
+    def set_owner(self, filename: str, owner: str) -> bool:
+        """
+        Change the owner of the given file
+
+        :param str filename: file path name
+        :param str owner: owner specification
+
+        :return: True if applied, False if not resolvable
+
+        :rtype: bool
+        """
+        owner_ids = self.get_owner_ids(owner)
+        if not owner_ids:
+            return False
+        os.chown(filename, *owner_ids)
+        return True
+
+    def get_mode(self, permissions: str, mode: int) -> Optional[int]:
+        """
+        Provides the mode of a regular file after applying the
+        given chmod permissions, either octal or a comma
+        separated list of symbolic [ugoa]*[-+=][rwxXst]* clauses
+
+        :param str permissions: chmod mode specification
+        :param int mode: current file mode
+
+        :return: new mode, None if not supported
+
+        :rtype: int
+        """
+        if re.match(r'^[0-7]{1,4}$', permissions):
+            return int(permissions, 8)
+        mode = stat.S_IMODE(mode)
+        for clause in permissions.split(','):
+            match = self.symbolic_mode.match(clause)
+            if not match:
+                return None
+            who, operator, perms = match.groups()
+            mask = 0
+            if not who or 'a' in who:
+                who = 'ugo'
+            for person in who:
+                mask |= {
+                    'u': stat.S_ISUID | stat.S_IRWXU,
+                    'g': stat.S_ISGID | stat.S_IRWXG,
+                    'o': stat.S_ISVTX | stat.S_IRWXO
+                }[person]
+            bits = 0
+            for perm in perms:
+                if perm == 'r':
+                    bits |= 0o444
+                elif perm == 'w':
+                    bits |= 0o222
+                elif perm == 'x' or (perm == 'X' and mode & 0o111):
+                    bits |= 0o111
+                elif perm == 's':
+                    bits |= stat.S_ISUID | stat.S_ISGID
+                elif perm == 't':
+                    bits |= stat.S_ISVTX
+            bits &= mask
+            if not match.group(1):
+                # without who, bits set in the umask are not affected
+                bits &= ~self._get_umask()
+            if operator == '+':
+                mode |= bits
+            elif operator == '-':
+                mode &= ~bits
+            else:
+                mode = (mode & ~mask) | bits
+        return mode
+
+    def set_mode(self, filename: str, permissions: str) -> bool:
+        """
+        Change the permissions of the given file
+
+        :param str filename: file path name
+        :param str permissions: chmod mode specification
+
+        :return: True if applied, False if not supported
+
+        :rtype: bool
+        """
+        mode = self.get_mode(permissions, os.stat(filename).st_mode)
+        if mode is None:
+            return False
+        os.chmod(filename, mode)
+        return True
+
+    def copy(self, source: str, target: str) -> bool:
+        """
+        Copy a regular file including owner, mode, extended
+        attributes, ACLs and modification time. The same target
+        as for rsync applies, if target is a directory the file
+        is copied into it. An existing target file is updated
+        in place
+
+        :param str source: source file path name
+        :param str target: target file or directory path name
+
+        :return: True if copied, False if not supported
+
+        :rtype: bool
+        """
+        if os.path.isdir(target) and not os.path.islink(target):
+            target = os.sep.join([target, os.path.basename(source)])
+        if os.path.lexists(target) and not self.is_supported(target):
+            return False
+        source_stat = os.stat(source)
+        shutil.copyfile(source, target)
+        os.chown(target, source_stat.st_uid, source_stat.st_gid)
+        os.chmod(target, stat.S_IMODE(source_stat.st_mode))
+        source_attributes = os.listxattr(source)
+        for attribute in os.listxattr(target):
+            if attribute not in source_attributes:
+                os.removexattr(target, attribute)
+        for attribute in source_attributes:
+            os.setxattr(target, attribute, os.getxattr(source, attribute))
+        os.utime(
+            target, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns)
+        )
+        return True
+
+    def _get_user_ids(self, user: str) -> Optional[Tuple[int, int]]:
+        if self.users and user in self.users:
+            return self.users[user]
+        if user.isdigit():
+            return (int(user), -1)
+        return None
+
+    def _get_group_id(self, group: str) -> Optional[int]:
+        if self.groups and group in self.groups:
+            return self.groups[group]
+        if group.isdigit():
+            return int(group)
+        return None
+
+    def _get_umask(self) -> int:
+        if self.umask is None:
+            self.umask = os.umask(0)
+            os.umask(self.umask)
+        return self.umask
+
+    def _read_accounts(self) -> None:
+        if self.users is not None and self.groups is not None:
+            return
+        self.users = {}
+        self.groups = {}
+        for entry in self._read_database('passwd'):
+            # name:password:uid:gid:gecos:home:shell
+            if len(entry) > 3 and entry[2].isdigit() and entry[3].isdigit():
+                self.users.setdefault(entry[0], (int(entry[2]), int(entry[3])))
+        for entry in self._read_database('group'):
+            # name:password:gid:members
+            if len(entry) > 2 and entry[2].isdigit():
+                self.groups.setdefault(entry[0], int(entry[2]))
+
+    def _read_database(self, name: str) -> list:
+        database = os.sep.join([self.root_dir, 'etc', name])
+        try:
+            with open(database) as handle:
+                return [
+                    line.rstrip('\n').split(':') for line in handle
+                    if line.strip() and not line.startswith('#')
+                ]
+        except OSError as issue:
+            log.debug(f'Failed to read {database}: {issue}')
+            return []
@@ -0,0 +1,142 @@
+# Copyright (c) 2026 SUSE LLC.  All rights reserved.
+#
+# This file is part of kiwi.
+#
+# kiwi is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# kiwi is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kiwi.  If not, see <http://www.gnu.org/licenses/>
+#
+import os
+import re
+import select
+import logging
+import threading
+from typing import (
+    List, Optional, Set
+)
+
+log = logging.getLogger('kiwi')
+
+
+class MountTable:
+    """
+    **Snapshot of the mount table of the kiwi process**
+
+    The mount table is read from /proc/self/mountinfo once and
+    kept open. The kernel signals every change of the mount
+    table as POLLPRI event on the open file, such that the
+    snapshot is only read again after a mount or umount took
+    place. Mount and umount calls done by kiwi additionally mark
+    the snapshot as outdated via invalidate
+    """
+    mountinfo = '/proc/self/mountinfo'
+    lock = threading.Lock()
+    mountinfo_fd: Optional[int] = None
+    poller: Optional[select.poll] = None
+    mountpoints: Optional[List[str]] = None
+    mountpoint_set: Set[str] = set()
+
+    @classmethod
+    def is_mountpoint(cls, path: str) -> Optional[bool]:
+        """
+        Check if the given path is a mountpoint
+
+        :param str path: path name
+
+        :return:
+            True or False, None if the mount table is not available
+
+        :rtype: bool
+        """
+        with cls.lock:
+            if not cls._refresh():
+                return None
+            return os.path.realpath(path) in cls.mountpoint_set
+
+    @classmethod
+    def get_mountpoints(cls, path: str = os.sep) -> Optional[List[str]]:
+        """
+        Provides the mountpoints at and below the given path in
+        umount order. Deeper mountpoints come first, a mountpoint
+        mounted more than once is listed once per mount, the
+        latest mount first
+
+        :param str path: path name
+
+        :return:
+            list of mountpoints, None if the mount table is not available
+
+        :rtype: list
+        """
+        path = os.path.realpath(path)
+        prefix = path.rstrip(os.sep) + os.sep
+        with cls.lock:
+            if not cls._refresh():
+                return None
+            mountpoints = [
+                mountpoint for mountpoint in reversed(cls.mountpoints or [])
+                if mountpoint == path or mountpoint.startswith(prefix)
+            ]
+        return sorted(
+            mountpoints, key=lambda mountpoint: mountpoint.count(os.sep),
+            reverse=True
+        )
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Mark the snapshot as outdated
+        """
+        with cls.lock:
+            cls.mountpoints = None
+
+    @classmethod
+    def _refresh(cls) -> bool:
+        if cls.mountinfo_fd is None:
+            try:
+                cls.mountinfo_fd = os.open(cls.mountinfo, os.O_RDONLY)
+            except OSError as issue:
+                log.debug(f'Mount table not available: {issue}')
+                return False
+            cls.poller = select.poll()
+            cls.poller.register(cls.mountinfo_fd, select.POLLPRI)
+            cls.mountpoints = None
+        elif cls.mountpoints is not None and cls.poller:
+            for fd, event in cls.poller.poll(0):
+                if event & (select.POLLPRI | select.POLLERR):
+                    cls.mountpoints = None
+        if cls.mountpoints is None:
+            cls.mountpoints = cls._read_mountpoints(cls.mountinfo_fd)
+            cls.mountpoint_set = set(cls.mountpoints)
+        return True
+
+    @staticmethod
+    def _read_mountpoints(fd: int) -> List[str]:
+        chunks = []
+        os.lseek(fd, 0, os.SEEK_SET)
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        mountpoints = []
+        for line in b''.join(chunks).decode(errors='replace').splitlines():
+            # mount ID, parent ID, major:minor, root, mountpoint, ...
+            fields = line.split(' ', 5)
+            if len(fields) > 4:
+                mountpoints.append(
+                    re.sub(
+                        r'\\([0-7]{3})',
+                        lambda match: chr(int(match.group(1), 8)), fields[4]
+                    )
+                )
+        return mountpoints
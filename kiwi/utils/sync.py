@@ -23,6 +23,8 @@ from typing import List
 
 # project
 from kiwi.command import Command
+from kiwi.utils.sync_manifest import SyncManifest
+from kiwi.exceptions import KiwiDataSyncError
 
 log = logging.getLogger('kiwi')
 
@@ -30,7 +32,14 @@ log = logging.getLogger('kiwi')
 class DataSync:
     """
     **Sync data from a source directory to a target directory**
+
+    The sync is done by rsync. With the manifest engine, directory
+    trees are synced in-process by SyncManifest as long as the
+    rsync options are supported by it
     """
+    engines = ('rsync', 'manifest')
+    engine = 'rsync'
+
     def __init__(self, source_dir: str, target_dir: str) -> None:
         """
         Create a new DataSync instance and initialize
@@ -42,6 +51,19 @@ class DataSync:
         self.source_dir = source_dir
         self.target_dir = target_dir
 
+    @classmethod
+    def set_engine(cls, engine: str) -> None:
+        """
+        Select the sync engine
+
+        :param str engine: one of rsync or manifest
+        """
+        if engine not in cls.engines:
+            raise KiwiDataSyncError(
+                f'Unknown sync engine: {engine}, use one of {cls.engines}'
+            )
+        cls.engine = engine
+
     def sync_data(
         self, options: List[str] = [], exclude: List[str] = [],
         force_trailing_slash: bool = False
@@ -109,11 +131,22 @@ class DataSync:
                 )
         if os.path.exists(self.target_dir):
             target_entry_permissions = os.stat(self.target_dir)[ST_MODE]
-        Command.run(
-            ['rsync'] + rsync_options + exclude_options + [
-                self.source_dir, self.target_dir
-            ]
-        )
+        manifest_flags = SyncManifest.get_flags(rsync_options) \
+            if self.engine == 'manifest' else None
+        if manifest_flags and os.path.isdir(self.source_dir) and \
+                not os.path.islink(self.source_dir.rstrip(os.sep)):
+            SyncManifest.get(
+                self.source_dir, manifest_flags.one_file_system
+            ).sync(
+                self.target_dir, manifest_flags, exclude,
+                copy_root_dir=not self.source_dir.endswith(os.sep)
+            )
+        else:
+            Command.run(
+                ['rsync'] + rsync_options + exclude_options + [
+                    self.source_dir, self.target_dir
+                ]
+            )
         if target_entry_permissions:
             # rsync applies the permissions of the source directory
             # also to the target directory which is unwanted because
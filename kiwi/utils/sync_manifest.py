@@ -0,0 +1,657 @@
+# Copyright (c) 2026 SUSE LLC.  All rights reserved.
+#
+# This file is part of kiwi.
+#
+# kiwi is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# kiwi is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kiwi.  If not, see <http://www.gnu.org/licenses/>
+#
+import os
+import re
+import stat
+import errno
+import fcntl
+import logging
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Callable, Dict, Iterator, List, NamedTuple, Optional, Pattern, Set, Tuple
+)
+
+# project
+from kiwi.exceptions import KiwiDataSyncError
+
+log = logging.getLogger('kiwi')
+
+# ioctl to share the data extents of a file, btrfs and xfs
+FICLONE = 0x40049409
+
+
+class ManifestEntryT(NamedTuple):
+    path: str
+    mode: int
+    uid: int
+    gid: int
+    size: int
+    atime_ns: int
+    mtime_ns: int
+    dev: int
+    ino: int
+    nlink: int
+    rdev: int
+    link: str
+    xattrs: Tuple[Tuple[str, bytes], ...]
+
+
+class SyncFlagsT(NamedTuple):
+    owner: bool
+    group: bool
+    devices: bool
+    specials: bool
+    hard_links: bool
+    xattrs: bool
+    acls: bool
+    one_file_system: bool
+    inplace: bool
+
+
+class SyncManifest:
+    """
+    **Manifest based sync of a directory tree**
+
+    The source tree is walked once into a manifest of all entries
+    with their type, owner, mode, size, times, inode and extended
+    attributes. The manifest is used to create the tree below a
+    target directory. Regular files are copied in a thread pool
+    via reflinks or copy_file_range, holes of sparse files are
+    kept. The result matches an rsync call with the supported
+    options, see get_flags. Inside of a share() context the
+    manifest of a source tree is kept and reused for further
+    syncs of the same tree or a sub directory of it
+
+    :param str source_dir: source directory path name
+    :param bool one_file_system: do not descend into other filesystems
+    """
+    max_workers = min(32, (os.cpu_count() or 1) + 4)
+    shared: Optional[Dict[Tuple[str, bool], 'SyncManifest']] = None
+    shared_lock = threading.Lock()
+
+    rsync_short_options = {
+        'a': ('recursive', 'links', 'perms', 'times', 'group', 'owner',
+              'devices', 'specials'),
+        'r': ('recursive',),
+        'l': ('links',),
+        'p': ('perms',),
+        't': ('times',),
+        'g': ('group',),
+        'o': ('owner',),
+        'D': ('devices', 'specials'),
+        'H': ('hard_links',),
+        'X': ('xattrs',),
+        'A': ('acls',),
+        'x': ('one_file_system',),
+        'S': ('sparse',)
+    }
+    rsync_long_options = {
+        '--archive': rsync_short_options['a'],
+        '--recursive': ('recursive',),
+        '--links': ('links',),
+        '--perms': ('perms',),
+        '--times': ('times',),
+        '--group': ('group',),
+        '--owner': ('owner',),
+        '--devices': ('devices',),
+        '--specials': ('specials',),
+        '--hard-links': ('hard_links',),
+        '--xattrs': ('xattrs',),
+        '--acls': ('acls',),
+        '--one-file-system': ('one_file_system',),
+        '--sparse': ('sparse',),
+        '--inplace': ('inplace',),
+        '--numeric-ids': ()
+    }
+
+    def __init__(self, source_dir: str, one_file_system: bool = False) -> None:
+        self.source_dir = os.path.normpath(source_dir)
+        self.one_file_system = one_file_system
+        self.entries = self._scan()
+
+    @classmethod
+    @contextmanager
+    def share(cls) -> Iterator[None]:
+        """
+        Keep and reuse the manifests of all syncs done in this
+        context. The source trees must not change meanwhile
+        """
+        with cls.shared_lock:
+            outer = cls.shared is not None
+            if not outer:
+                cls.shared = {}
+        try:
+            yield
+        finally:
+            if not outer:
+                with cls.shared_lock:
+                    cls.shared = None
+
+    @classmethod
+    def get(
+        cls, source_dir: str, one_file_system: bool = False
+    ) -> 'SyncManifest':
+        """
+        Provides the manifest of the given source directory,
+        taken from a shared manifest of the same or a parent
+        directory if available
+
+        :param str source_dir: source directory path name
+        :param bool one_file_system: do not descend into other filesystems
+
+        :return: SyncManifest instance
+
+        :rtype: SyncManifest
+        """
+        source_dir = os.path.normpath(source_dir)
+        with cls.shared_lock:
+            if cls.shared is None:
+                return cls(source_dir, one_file_system)
+            for (root, shared_one_file_system), manifest in \
+                    cls.shared.items():
+                if shared_one_file_system != one_file_system:
+                    continue
+                if root == source_dir:
+                    return manifest
+                if source_dir.startswith(root.rstrip(os.sep) + os.sep):
+                    subtree = manifest.get_subtree(
+                        os.path.relpath(source_dir, root)
+                    )
+                    if subtree:
+                        log.debug(f'Using sync manifest of {root}')
+                        return subtree
+            manifest = cls(source_dir, one_file_system)
+            cls.shared[(source_dir, one_file_system)] = manifest
+            return manifest
+
+    @classmethod
+    def get_flags(cls, options: List[str]) -> Optional[SyncFlagsT]:
+        """
+        Translate rsync options into sync flags
+
+        :param list options: rsync options
+
+        :return:
+            SyncFlagsT, None if the options are not supported
+            or do not include recursive, links, perms and times
+
+        :rtype: SyncFlagsT
+        """
+        names: Set[str] = set()
+        for option in options:
+            if option in cls.rsync_long_options:
+                names.update(cls.rsync_long_options[option])
+            elif re.match(r'^-[a-zA-Z]+$', option):
+                for letter in option[1:]:
+                    if letter not in cls.rsync_short_options:
+                        return None
+                    names.update(cls.rsync_short_options[letter])
+            else:
+                return None
+        if not {'recursive', 'links', 'perms', 'times'}.issubset(names):
+            return None
+        return SyncFlagsT(
+            **{name: name in names for name in SyncFlagsT._fields}
+        )
+
+    def get_subtree(self, path: str) -> Optional['SyncManifest']:
+        """
+        Provides the manifest of a sub directory
+
+        :param str path: directory path relative to the source directory
+
+        :return: SyncManifest instance, None if not contained
+
+        :rtype: SyncManifest
+        """
+        prefix = path + os.sep
+        entries = []
+        for entry in self.entries:
+            if entry.path == path:
+                if not stat.S_ISDIR(entry.mode) or (
+                    self.one_file_system and entry.dev != self.entries[0].dev
+                ):
+                    return None
+                entries.append(entry._replace(path=''))
+            elif entry.path.startswith(prefix):
+                entries.append(entry._replace(path=entry.path[len(prefix):]))
+        if not entries or entries[0].path:
+            return None
+        subtree = SyncManifest.__new__(SyncManifest)
+        subtree.source_dir = os.sep.join([self.source_dir, path])
+        subtree.one_file_system = self.one_file_system
+        subtree.entries = entries
+        return subtree
+
+    def sync(
+        self, target_dir: str, flags: SyncFlagsT,
+        exclude: Optional[List[str]] = None, copy_root_dir: bool = False
+    ) -> None:
+        """
+        Sync the tree into the target directory
+
+        :param str target_dir: target directory path name
+        :param SyncFlagsT flags: sync flags from get_flags
+        :param list exclude:
+            rsync patterns relative to the transfer root to exclude
+        :param bool copy_root_dir:
+            sync the source directory itself into the target directory
+            like rsync does for a source without a trailing slash
+        """
+        root_name = os.path.basename(self.source_dir) if copy_root_dir else ''
+        target_root = os.sep.join([target_dir, root_name]) \
+            if root_name else target_dir
+        try:
+            os.makedirs(target_dir, exist_ok=True)
+            self._sync(target_root, flags, exclude or [], root_name)
+        except OSError as issue:
+            raise KiwiDataSyncError(
+                f'Sync of {self.source_dir} to {target_dir} failed: {issue}'
+            )
+
+    def link(
+        self, target_dir: str, flags: SyncFlagsT,
+        exclude: Optional[List[str]] = None
+    ) -> None:
+        """
+        Create the tree in the empty target directory like sync
+        does, but hard link all regular files to the source tree
+        instead of copying them. The target directory must be on
+        the same filesystem as the source tree
+
+        :param str target_dir: target directory path name
+        :param SyncFlagsT flags: sync flags from get_flags
+        :param list exclude:
+            rsync patterns relative to the transfer root to exclude
+        """
+        try:
+            os.makedirs(target_dir, exist_ok=True)
+            self._sync(
+                target_dir, flags, exclude or [], '', link_files=True
+            )
+        except OSError as issue:
+            raise KiwiDataSyncError(
+                f'Link of {self.source_dir} to {target_dir} failed: {issue}'
+            )
+
+    def _sync(
+        self, target_root: str, flags: SyncFlagsT, exclude: List[str],
+        root_name: str, link_files: bool = False
+    ) -> None:
+        directories = []
+        files = []
+        hard_links = []
+        link_targets: Dict[Tuple[int, int], str] = {}
+        for entry in self._select(flags, exclude, root_name):
+            target = os.sep.join([target_root, entry.path]) \
+                if entry.path else target_root
+            if stat.S_ISDIR(entry.mode):
+                self._make_directory(target)
+                directories.append((entry, target))
+            elif stat.S_ISREG(entry.mode):
+                if flags.hard_links and entry.nlink > 1:
+                    inode = (entry.dev, entry.ino)
+                    if inode in link_targets:
+                        hard_links.append((link_targets[inode], target))
+                        continue
+                    link_targets[inode] = target
+                files.append((entry, target))
+            elif stat.S_ISLNK(entry.mode):
+                self._make_symlink(entry, target, flags)
+            else:
+                self._make_node(entry, target, flags)
+        if link_files:
+            for entry, target in files:
+                os.link(self._get_source_path(entry), target)
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # consume the results to raise a failed copy here
+                list(
+                    executor.map(
+                        lambda job: self._copy_file(job[0], job[1], flags),
+                        files
+                    )
+                )
+        for link_target, target in hard_links:
+            if os.path.lexists(target):
+                if os.path.samefile(link_target, target):
+                    continue
+                self._remove(target)
+            os.link(link_target, target)
+        # directories last, deepest first, creating their
+        # content would update the times again
+        for entry, target in reversed(directories):
+            self._apply_metadata(entry, target, flags)
+
+    def select(
+        self, flags: SyncFlagsT, exclude: Optional[List[str]] = None
+    ) -> Iterator[ManifestEntryT]:
+        """
+        Provides the entries a sync with the given flags and
+        exclude patterns transfers, parents before their children
+
+        :param SyncFlagsT flags: sync flags from get_flags
+        :param list exclude:
+            rsync patterns relative to the transfer root to exclude
+
+        :return: iterator of ManifestEntryT
+
+        :rtype: Iterator
+        """
+        return self._select(flags, exclude or [], '')
+
+    @classmethod
+    def get_exclude_filter(
+        cls, exclude: List[str]
+    ) -> Callable[[str, bool], bool]:
+        """
+        Provides a function which tells if a path matches one of
+        the exclude patterns. The function takes the path relative
+        to the transfer root and if it is a directory. Parent
+        directories are not taken into account
+
+        :param list exclude: rsync patterns to exclude
+
+        :return: filter function
+
+        :rtype: Callable
+        """
+        patterns = [cls._compile_pattern(pattern) for pattern in exclude]
+
+        def is_excluded(path: str, is_directory: bool) -> bool:
+            return any(
+                pattern.match(path) and (
+                    not directory_only or is_directory
+                ) for pattern, directory_only in patterns
+            )
+        return is_excluded
+
+    def _select(
+        self, flags: SyncFlagsT, exclude: List[str], root_name: str
+    ) -> Iterator[ManifestEntryT]:
+        is_excluded = self.get_exclude_filter(exclude)
+        excluded: Set[str] = set()
+        for entry in self.entries:
+            if entry.path:
+                parent = os.path.dirname(entry.path)
+                while parent:
+                    if parent in excluded:
+                        break
+                    parent = os.path.dirname(parent)
+                if parent:
+                    continue
+            kind = stat.S_IFMT(entry.mode)
+            if kind in (stat.S_IFCHR, stat.S_IFBLK) and not flags.devices:
+                continue
+            if kind in (stat.S_IFIFO, stat.S_IFSOCK) and not flags.specials:
+                continue
+            transfer_path = '/'.join(
+                [name for name in (root_name, entry.path) if name]
+            )
+            if transfer_path and is_excluded(
+                transfer_path, kind == stat.S_IFDIR
+            ):
+                excluded.add(entry.path)
+                continue
+            yield entry
+
+    def _copy_file(
+        self, entry: ManifestEntryT, target: str, flags: SyncFlagsT
+    ) -> None:
+        source = self._get_source_path(entry)
+        try:
+            target_stat: Optional[os.stat_result] = os.lstat(target)
+        except FileNotFoundError:
+            target_stat = None
+        is_file = bool(target_stat and stat.S_ISREG(target_stat.st_mode))
+        if target_stat and is_file and \
+                target_stat.st_size == entry.size and \
+                target_stat.st_mtime_ns == entry.mtime_ns:
+            # same size and time, the data is considered unchanged
+            pass
+        elif target_stat and is_file and flags.inplace:
+            with open(source, 'rb') as source_file:
+                with open(target, 'r+b') as target_file:
+                    self._copy_data(
+                        source_file.fileno(), target_file.fileno(), entry.size
+                    )
+        else:
+            temporary = os.sep.join(
+                [
+                    os.path.dirname(target),
+                    f'.{os.path.basename(target)}.{threading.get_ident()}'
+                ]
+            )
+            with open(source, 'rb') as source_file:
+                with open(temporary, 'wb') as target_file:
+                    self._copy_data(
+                        source_file.fileno(), target_file.fileno(), entry.size
+                    )
+            if target_stat and stat.S_ISDIR(target_stat.st_mode):
+                os.rmdir(target)
+            os.replace(temporary, target)
+        self._apply_metadata(entry, target, flags)
+
+    def _copy_data(self, source: int, target: int, size: int) -> None:
+        os.ftruncate(target, 0)
+        try:
+            fcntl.ioctl(target, FICLONE, source)
+            return
+        except OSError:
+            pass
+        offset = 0
+        while offset < size:
+            try:
+                data = os.lseek(source, offset, os.SEEK_DATA)
+            except OSError as issue:
+                if issue.errno == errno.ENXIO:
+                    # only a hole up to the end of the file
+                    break
+                data = offset
+            try:
+                hole = os.lseek(source, data, os.SEEK_HOLE)
+            except OSError:
+                hole = size
+            self._copy_range(source, target, data, min(hole, size) - data)
+            offset = hole
+        os.ftruncate(target, size)
+
+    @staticmethod
+    def _copy_range(source: int, target: int, offset: int, count: int) -> None:
+        end = offset + count
+        try:
+            while offset < end:
+                copied = os.copy_file_range(
+                    source, target, end - offset, offset, offset
+                )
+                if not copied:
+                    return
+                offset += copied
+        except OSError as issue:
+            if issue.errno not in (
+                errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP
+            ):
+                raise
+            while offset < end:
+                data = os.pread(source, min(1 << 20, end - offset), offset)
+                if not data:
+                    return
+                offset += os.pwrite(target, data, offset)
+
+    def _make_directory(self, target: str) -> None:
+        if os.path.isdir(target) and not os.path.islink(target):
+            return
+        if os.path.lexists(target):
+            self._remove(target)
+        os.mkdir(target, 0o700)
+
+    def _make_symlink(
+        self, entry: ManifestEntryT, target: str, flags: SyncFlagsT
+    ) -> None:
+        if not os.path.islink(target) or os.readlink(target) != entry.link:
+            if os.path.lexists(target):
+                self._remove(target)
+            os.symlink(entry.link, target)
+        self._apply_metadata(entry, target, flags)
+
+    def _make_node(
+        self, entry: ManifestEntryT, target: str, flags: SyncFlagsT
+    ) -> None:
+        try:
+            target_stat: Optional[os.stat_result] = os.lstat(target)
+        except FileNotFoundError:
+            target_stat = None
+        if not target_stat or \
+                stat.S_IFMT(target_stat.st_mode) != stat.S_IFMT(entry.mode) or \
+                target_stat.st_rdev != entry.rdev:
+            if target_stat:
+                self._remove(target)
+            if stat.S_ISFIFO(entry.mode):
+                os.mkfifo(target, 0o600)
+            else:
+                os.mknod(
+                    target, stat.S_IFMT(entry.mode) | 0o600, entry.rdev
+                )
+        self._apply_metadata(entry, target, flags)
+
+    def _apply_metadata(
+        self, entry: ManifestEntryT, target: str, flags: SyncFlagsT
+    ) -> None:
+        is_link = stat.S_ISLNK(entry.mode)
+        if flags.owner or flags.group:
+            os.chown(
+                target,
+                entry.uid if flags.owner else -1,
+                entry.gid if flags.group else -1,
+                follow_symlinks=False
+            )
+        if not is_link:
+            os.chmod(target, stat.S_IMODE(entry.mode))
+        if flags.xattrs or flags.acls:
+            try:
+                self._apply_xattrs(entry, target, flags)
+            except OSError:
+                if not is_link:
+                    raise
+        os.utime(
+            target, ns=(entry.atime_ns, entry.mtime_ns), follow_symlinks=False
+        )
+
+    @staticmethod
+    def _apply_xattrs(
+        entry: ManifestEntryT, target: str, flags: SyncFlagsT
+    ) -> None:
+        def synced(name: str) -> bool:
+            if name.startswith('system.posix_acl_'):
+                return flags.acls
+            return flags.xattrs and not name.startswith('system.')
+
+        source_xattrs = dict(
+            (name, value) for name, value in entry.xattrs if synced(name)
+        )
+        for name in os.listxattr(target, follow_symlinks=False):
+            if synced(name) and name not in source_xattrs:
+                os.removexattr(target, name, follow_symlinks=False)
+        for name, value in source_xattrs.items():
+            os.setxattr(target, name, value, follow_symlinks=False)
+
+    @staticmethod
+    def _remove(target: str) -> None:
+        if os.path.isdir(target) and not os.path.islink(target):
+            os.rmdir(target)
+        else:
+            os.unlink(target)
+
+    @staticmethod
+    def _compile_pattern(pattern: str) -> Tuple[Pattern, bool]:
+        # anchored rsync pattern, * and ? do not match a /
+        pattern = pattern.lstrip('/')
+        directory_only = pattern.endswith('/')
+        expression = ''
+        for token in re.findall(
+            r'\*\*|\*|\?|\[[^]]*\]|[^*?[]+|\[', pattern.rstrip('/')
+        ):
+            if token == '**':
+                expression += '.*'
+            elif token == '*':
+                expression += '[^/]*'
+            elif token == '?':
+                expression += '[^/]'
+            elif len(token) > 2 and token.startswith('['):
+                expression += '[^' + token[2:] \
+                    if token.startswith('[!') else token
+            else:
+                expression += re.escape(token)
+        return re.compile(f'^{expression}$'), directory_only
+
+    def _get_source_path(self, entry: ManifestEntryT) -> str:
+        return os.sep.join([self.source_dir, entry.path]) \
+            if entry.path else self.source_dir
+
+    def _scan(self) -> List[ManifestEntryT]:
+        root_stat = os.lstat(self.source_dir)
+        entries = [self._get_entry('', self.source_dir, root_stat)]
+        directories = ['']
+        while directories:
+            directory = directories.pop()
+            directory_path = os.sep.join([self.source_dir, directory]) \
+                if directory else self.source_dir
+            with os.scandir(directory_path) as iterator:
+                children = sorted(iterator, key=lambda child: child.name)
+            for child in children:
+                child_stat = child.stat(follow_symlinks=False)
+                path = os.sep.join([directory, child.name]) \
+                    if directory else child.name
+                entries.append(self._get_entry(path, child.path, child_stat))
+                same_file_system = child_stat.st_dev == root_stat.st_dev
+                if stat.S_ISDIR(child_stat.st_mode) and (
+                    same_file_system or not self.one_file_system
+                ):
+                    directories.append(path)
+        return entries
+
+    @staticmethod
+    def _get_entry(
+        path: str, filename: str, file_stat: os.stat_result
+    ) -> ManifestEntryT:
+        xattrs = []
+        try:
+            for name in os.listxattr(filename, follow_symlinks=False):
+                xattrs.append(
+                    (name, os.getxattr(filename, name, follow_symlinks=False))
+                )
+        except OSError:
+            pass
+        return ManifestEntryT(
+            path=path,
+            mode=file_stat.st_mode,
+            uid=file_stat.st_uid,
+            gid=file_stat.st_gid,
+            size=file_stat.st_size,
+            atime_ns=file_stat.st_atime_ns,
+            mtime_ns=file_stat.st_mtime_ns,
+            dev=file_stat.st_dev,
+            ino=file_stat.st_ino,
+            nlink=file_stat.st_nlink,
+            rdev=file_stat.st_rdev,
+            link=os.readlink(filename) if stat.S_ISLNK(file_stat.st_mode)
+            else '',
+            xattrs=tuple(xattrs)
+        )
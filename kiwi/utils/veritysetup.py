@@ -16,6 +16,7 @@
 # along with kiwi.  If not, see <http://www.gnu.org/licenses/>
 #
 import os
+import hashlib
 from typing import (
     Optional, Dict, IO
 )
@@ -35,6 +36,10 @@ class VeritySetup:
     """
     **Create block level verification data on file or device**
     """
+    # hash algorithm and superblock size used by veritysetup format
+    hash_algorithm = 'sha256'
+    superblock_size = 512
+
     def __init__(
         self, image_filepath: str, data_blocks: Optional[int] = None,
         hash_offset: int = 0
@@ -82,6 +87,7 @@ class VeritySetup:
                 ] if self.data_blocks else []
             )
         )
+        BlockID.invalidate(self.image_filepath)
         for line in verity_call.output.split(os.linesep):
             try:
                 # strip out any space, tabs, newlines
@@ -96,8 +102,39 @@ class VeritySetup:
 
     def get_hash_byte_size(self) -> int:
         """
-        Run veritysetup into a temporary file to estimate
-        the required bytesize
+        Calculate the bytesize of the hash device as written by
+        veritysetup format, the superblock followed by all levels
+        of the hash tree. Each hash block stores the digests of
+        the largest power of two of blocks from the level below
+        that fits into it. Levels are added until the top level
+        fits into a single hash block
+
+        :return: a byte value
+
+        :rtype: int
+        """
+        data_blocks = self.data_blocks or int(
+            self._get_data_byte_size() / defaults.VERITY_DATA_BLOCKSIZE
+        )
+        digest_size = hashlib.new(self.hash_algorithm).digest_size
+        # hash format version 1 pads digests to a power of two
+        digest_size_padded = 1 << (digest_size - 1).bit_length()
+        hash_per_block_bits = (
+            defaults.VERITY_HASH_BLOCKSIZE // digest_size_padded
+        ).bit_length() - 1
+        # the tree starts at the hash block following the superblock
+        hash_blocks = -(-self.superblock_size // defaults.VERITY_HASH_BLOCKSIZE)
+        level_blocks = data_blocks
+        while level_blocks > 1:
+            level_blocks = -(-level_blocks >> hash_per_block_bits)
+            hash_blocks += level_blocks
+        return hash_blocks * defaults.VERITY_HASH_BLOCKSIZE
+
+    def get_formatted_hash_byte_size(self) -> int:
+        """
+        Run veritysetup into a temporary file to measure the
+        required bytesize. This reads and hashes all data blocks
+        and serves to verify the result of get_hash_byte_size
 
         :return: a byte value
 
@@ -118,6 +155,11 @@ class VeritySetup:
         )
         return os.path.getsize(temp_file.name)
 
+    def _get_data_byte_size(self) -> int:
+        # works for block special devices as well as for files
+        with open(self.image_filepath, 'rb') as data:
+            return data.seek(0, os.SEEK_END)
+
     def get_block_storage_filesystem(self) -> str:
         """
         Retrieve filesystem type from image_filepath. The method
@@ -162,6 +204,7 @@ class VeritySetup:
                     # warned.
                     target.seek(-defaults.DM_METADATA_OFFSET, 2)
                     target.write(meta.read())
+            BlockID.invalidate(device_node)
 
     def create_verity_verification_metadata(self) -> None:
         """
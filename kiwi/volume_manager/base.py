@@ -371,12 +371,15 @@ class VolumeManagerBase(DeviceProvider):
         return '/'
 
     def sync_data(
-        self, exclude: Optional[List[str]] = None
+        self, exclude: Optional[List[str]] = None, offline: bool = False
     ) -> Optional[MountManager]:
         """
         Implements sync of root directory to mounted volumes
 
         :param list exclude: file patterns to exclude
+        :param bool offline:
+            ignored, volumes are created and mounted before the
+            sync such that the data is always copied into them
 
         :return: If a mount was created, then a context manager implementing the
             unmount is returned.
@@ -403,7 +403,7 @@ class VolumeManagerBtrfs(VolumeManagerBase):
             sync_target.extend(['.snapshots', '1', 'snapshot'])
         return os.path.join(*sync_target)
 
-    def sync_data(self, exclude=None):
+    def sync_data(self, exclude=None, offline=False):
         """
         Sync data into btrfs filesystem
 
@@ -411,6 +411,9 @@ class VolumeManagerBtrfs(VolumeManagerBase):
         into the first snapshot
 
         :param list exclude: files to exclude from sync
+        :param bool offline:
+            ignored, subvolumes are created and mounted before
+            the sync such that the data is always copied into them
         """
         if self.toplevel_mount:
             sync_target = self.get_mountpoint()
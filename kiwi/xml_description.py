@@ -16,16 +16,19 @@
 # along with kiwi.  If not, see <http://www.gnu.org/licenses/>
 #
 import importlib
+from collections import namedtuple
 from typing import (
-    Dict, Any
+    Dict, Any, Optional
 )
 import os
 import logging
+import threading
 from xml.dom import minidom
 from lxml import etree
 
 # project
 from kiwi.utils.temporary import Temporary
+from kiwi.utils.description_cache import DescriptionCache
 from kiwi.markup import Markup
 from kiwi.defaults import Defaults
 from kiwi import xml_parse
@@ -43,6 +46,10 @@ from kiwi.exceptions import (
 
 log = logging.getLogger('kiwi')
 
+validators_type = namedtuple(
+    'validators_type', ['relaxng', 'schematron']
+)
+
 
 class XMLDescription:
     """
@@ -56,11 +63,18 @@ class XMLDescription:
     * Schema Validation based on RelaxNG schema
     * Loading XML data into internal data structures
 
+    The schema validators are compiled once per process. If the
+    description was validated by a former kiwi call and is
+    unchanged, see DescriptionCache, validation is skipped
+
     Attributes
 
     :param str description: path to description file
     :param str derived_from: path to base description file
     """
+    schema_lock = threading.Lock()
+    schema_validators: Optional[validators_type] = None
+
     def __init__(
         self, description: str = '', derived_from: str = None
     ):
@@ -81,50 +95,18 @@ class XMLDescription:
 
         :rtype: object
         """
-        isoschematron = None
-        schematron = None
-        try:
-            isoschematron = importlib.import_module(
-                Defaults.get_schematron_module_name()
-            )
-        except Exception as error:
-            log.warning(f"schematron validation skipped: {error}")
-        try:
-            schema_doc = etree.parse(Defaults.get_schema_file())
-            relaxng = etree.RelaxNG(schema_doc)
-            if isoschematron:
-                schematron = isoschematron.Schematron(
-                    schema_doc, store_report=True
-                )
-        except Exception as issue:
-            raise KiwiSchemaImportError(issue)
-        try:
-            description = etree.parse(self.description)
-            validation_rng = relaxng.validate(description)
-            if schematron:
-                validation_schematron = schematron.validate(description)
-        except Exception as issue:
-            raise KiwiValidationError(issue)
-        if not validation_rng:
-            XMLDescription._get_relaxng_validation_details(
-                Defaults.get_schema_file(),
-                self.description,
-                relaxng.error_log
-            )
-        if schematron and not validation_schematron:
-            XMLDescription._get_schematron_validation_details(
-                schematron.validation_report
-            )
-        if not validation_rng or (schematron and not validation_schematron):
-            log.debug(open(self.description).read())
-            raise KiwiDescriptionInvalid(
-                'Failed to validate schema and/or schematron rules. '
-                'Use --debug for more details'
+        if self.markup.description_validated:
+            log.info('--> Description unchanged since last validation')
+        else:
+            self._validate()
+            DescriptionCache.store(
+                self.markup.description_cache_key, self.description
             )
 
         parse_result = self._parse()
 
         if parse_result.get_extension():
+            description = etree.parse(self.description)
             extension_namespace_map = \
                 description.getroot().xpath('extension')[0].nsmap
 
@@ -201,6 +183,64 @@ class XMLDescription:
         """
         return self.extension_data.get(namespace_name)
 
+    def _validate(self) -> None:
+        relaxng, schematron = XMLDescription._get_schema_validators()
+        try:
+            description = etree.parse(self.description)
+            with XMLDescription.schema_lock:
+                validation_rng = relaxng.validate(description)
+                relaxng_error_log = relaxng.error_log
+                if schematron:
+                    validation_schematron = schematron.validate(description)
+                    validation_report = schematron.validation_report
+        except Exception as issue:
+            raise KiwiValidationError(issue)
+        if not validation_rng:
+            XMLDescription._get_relaxng_validation_details(
+                Defaults.get_schema_file(),
+                self.description,
+                relaxng_error_log
+            )
+        if schematron and not validation_schematron:
+            XMLDescription._get_schematron_validation_details(
+                validation_report
+            )
+        if not validation_rng or (schematron and not validation_schematron):
+            log.debug(open(self.description).read())
+            raise KiwiDescriptionInvalid(
+                'Failed to validate schema and/or schematron rules. '
+                'Use --debug for more details'
+            )
+
+    @classmethod
+    def _get_schema_validators(cls) -> validators_type:
+        """
+        Compile the RelaxNG and schematron validators once per process
+        """
+        with cls.schema_lock:
+            if not cls.schema_validators:
+                isoschematron = None
+                schematron = None
+                try:
+                    isoschematron = importlib.import_module(
+                        Defaults.get_schematron_module_name()
+                    )
+                except Exception as error:
+                    log.warning(f"schematron validation skipped: {error}")
+                try:
+                    schema_doc = etree.parse(Defaults.get_schema_file())
+                    relaxng = etree.RelaxNG(schema_doc)
+                    if isoschematron:
+                        schematron = isoschematron.Schematron(
+                            schema_doc, store_report=True
+                        )
+                except Exception as issue:
+                    raise KiwiSchemaImportError(issue)
+                cls.schema_validators = validators_type(
+                    relaxng=relaxng, schematron=schematron
+                )
+            return cls.schema_validators
+
     @staticmethod
     def _get_relaxng_validation_details(
         schema_file, description_file, error_log
@@ -101,6 +101,16 @@ class ContainerT(NamedTuple):
     load_command: List[str]
 
 
+profiled_sections_type = NamedTuple(
+    'profiled_sections_type', [
+        ('sections', list),
+        ('section_count', int),
+        ('profiles', Optional[List[str]]),
+        ('profiled', list)
+    ]
+)
+
+
 class XMLState:
     """
     **Implements methods to get stateful information from the XML data**
@@ -108,6 +118,10 @@ class XMLState:
     :param object xml_data: parse result from XMLDescription.load()
     :param list profiles: list of used profiles
     :param object build_type: build <type> section reference
+
+    The sections matching the selected profiles are memoized per
+    section name. The methods changing the sections of the XML data
+    drop the memoized sections
     """
     def __init__(
         self, xml_data: Any, profiles: List = None,
@@ -117,6 +131,7 @@ class XMLState:
         self.root_filesystem_uuid: Optional[str] = None
         self.host_architecture = defaults.PLATFORM_MACHINE
         self.xml_data = xml_data
+        self.profiled_sections: Dict[str, profiled_sections_type] = {}
         self.profiles = self._used_profiles(profiles)
         self.build_type = self._build_type_section(
             build_type
@@ -133,7 +148,7 @@ class XMLState:
         :rtype: list
         """
         preferences_list = []
-        for preferences in self._profiled(self.xml_data.get_preferences()):
+        for preferences in self._get_profiled_sections('preferences'):
             if self.preferences_matches_host_architecture(preferences):
                 preferences_list.append(preferences)
         return preferences_list
@@ -164,7 +179,7 @@ class XMLState:
         :rtype: list
         """
         users = []
-        for users_section in self._profiled(self.xml_data.get_users()):
+        for users_section in self._get_profiled_sections('users'):
             if self.users_matches_host_architecture(users_section):
                 users.append(users_section)
         return users
@@ -374,9 +389,7 @@ class XMLState:
         :rtype: list
         """
         result = []
-        packages_sections = self._profiled(
-            self.xml_data.get_packages()
-        )
+        packages_sections = self._get_profiled_sections('packages')
         for packages in packages_sections:
             packages_type = packages.get_type()
             if packages_type in section_types:
@@ -2230,9 +2243,7 @@ class XMLState:
 
         :rtype: list
         """
-        drivers_sections = self._profiled(
-            self.xml_data.get_drivers()
-        )
+        drivers_sections = self._get_profiled_sections('drivers')
         result = []
         if drivers_sections:
             for driver in drivers_sections:
@@ -2251,9 +2262,7 @@ class XMLState:
 
         :rtype: list
         """
-        strip_sections = self._profiled(
-            self.xml_data.get_strip()
-        )
+        strip_sections = self._get_profiled_sections('strip')
         result = []
         if strip_sections:
             for strip in strip_sections:
@@ -2315,7 +2324,7 @@ class XMLState:
         :rtype: list
         """
         repository_list = []
-        for repository in self._profiled(self.xml_data.get_repository()):
+        for repository in self._get_profiled_sections('repository'):
             if self.repository_matches_host_architecture(repository):
                 repository_list.append(repository)
         return repository_list
@@ -2330,7 +2339,7 @@ class XMLState:
         :rtype: list
         """
         containers_list = []
-        for containers in self._profiled(self.xml_data.get_containers()):
+        for containers in self._get_profiled_sections('containers'):
             if self.containers_matches_host_architecture(containers):
                 containers_list.append(containers)
         return containers_list
@@ -2369,6 +2378,7 @@ class XMLState:
         Delete all repository sections matching configured profiles
         """
         self.xml_data.set_repository([])
+        self._invalidate_profiled_sections()
 
     def delete_repository_sections_used_for_build(self) -> None:
         """
@@ -2382,6 +2392,7 @@ class XMLState:
                 repo for repo in all_repos if repo not in used_for_build
             ]
         )
+        self._invalidate_profiled_sections()
 
     def get_repositories_signing_keys(self) -> List[str]:
         """
@@ -2503,6 +2514,7 @@ class XMLState:
                 sourcetype=repo_sourcetype
             )
         )
+        self._invalidate_profiled_sections()
 
     def add_certificate(self, cert_file: str, target_distribution: str) -> None:
         """
@@ -2510,9 +2522,7 @@ class XMLState:
         The main section will be created if it does not exist. Also
         setup the target_distribution in the resulting main section.
         """
-        certificates_section = self._profiled(
-            self.xml_data.get_certificates()
-        )
+        certificates_section = self._get_profiled_sections('certificates')
         if not certificates_section:
             self.xml_data.set_certificates(
                 [
@@ -2522,6 +2532,7 @@ class XMLState:
                     )
                 ]
             )
+            self._invalidate_profiled_sections()
         else:
             certificates_section[0].set_target_distribution(
                 target_distribution
@@ -2537,9 +2548,7 @@ class XMLState:
         Read list of certificates
         """
         cert_list = []
-        certificates_section = self._profiled(
-            self.xml_data.get_certificates()
-        )
+        certificates_section = self._get_profiled_sections('certificates')
         if certificates_section:
             for certificate in certificates_section[0].get_certificate():
                 cert_list.append(certificate.get_name())
@@ -2550,9 +2559,7 @@ class XMLState:
         Read CA target distribution
         """
         target_distribution = ''
-        certificates_section = self._profiled(
-            self.xml_data.get_certificates()
-        )
+        certificates_section = self._get_profiled_sections('certificates')
         if certificates_section:
             target_distribution = \
                 certificates_section[0].get_target_distribution()
@@ -2605,12 +2612,11 @@ class XMLState:
 
         :param object target_state: XMLState instance
         """
-        drivers_sections = self._profiled(
-            self.xml_data.get_drivers()
-        )
+        drivers_sections = self._get_profiled_sections('drivers')
         if drivers_sections:
             for drivers_section in drivers_sections:
                 target_state.xml_data.add_drivers(drivers_section)
+            target_state._invalidate_profiled_sections()
 
     def copy_systemdisk_section(self, target_state: Any) -> None:
         """
@@ -2630,12 +2636,11 @@ class XMLState:
 
         :param object target_state: XMLState instance
         """
-        strip_sections = self._profiled(
-            self.xml_data.get_strip()
-        )
+        strip_sections = self._get_profiled_sections('strip')
         if strip_sections:
             for strip_section in strip_sections:
                 target_state.xml_data.add_strip(strip_section)
+            target_state._invalidate_profiled_sections()
 
     def copy_machine_section(self, target_state: Any) -> None:
         """
@@ -2682,9 +2687,7 @@ class XMLState:
         :param object target_state: XMLState instance
         :param bool wipe: delete all repos in target prior to copy
         """
-        repository_sections = self._profiled(
-            self.xml_data.get_repository()
-        )
+        repository_sections = self._get_profiled_sections('repository')
         if repository_sections:
             if wipe:
                 target_state.xml_data.set_repository([])
@@ -2694,6 +2697,7 @@ class XMLState:
                 # in the target description
                 repository_copy.set_profiles(None)
                 target_state.xml_data.add_repository(repository_copy)
+            target_state._invalidate_profiled_sections()
 
     def copy_preferences_subsections(
         self, section_names: List, target_state: Any
@@ -2830,6 +2834,7 @@ class XMLState:
             target_state.xml_data.add_packages(
                 target_delete_packages_sections[0]
             )
+            target_state._invalidate_profiled_sections()
 
         target_delete_packages_section = \
             target_delete_packages_sections[0]
@@ -3329,6 +3334,30 @@ class XMLState:
             )
         )
 
+    def _get_profiled_sections(self, section_name: str) -> List:
+        """
+        Provides the sections of the given name matching the selected
+        profiles. The result is memoized and used as long as the
+        section list of the XML data and the selected profiles are
+        unchanged
+        """
+        sections = getattr(self.xml_data, f'get_{section_name}')()
+        memoized = self.profiled_sections.get(section_name)
+        if not memoized or memoized.sections is not sections or \
+                memoized.section_count != len(sections) or \
+                memoized.profiles != self.profiles:
+            memoized = profiled_sections_type(
+                sections=sections,
+                section_count=len(sections),
+                profiles=self.profiles,
+                profiled=self._profiled(sections)
+            )
+            self.profiled_sections[section_name] = memoized
+        return list(memoized.profiled)
+
+    def _invalidate_profiled_sections(self) -> None:
+        self.profiled_sections = {}
+
     def _profiled(self, xml_abstract):
         """
         return only those sections matching the instance stored
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 SUSE LLC.  All rights reserved.
+#
+# This file is part of kiwi.
+#
+# kiwi is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# kiwi is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kiwi.  If not, see <http://www.gnu.org/licenses/>
+#
+"""
+Replay a package manager install log through CommandProcess
+
+usage: command_process_benchmark.py [LOGFILE]
+
+If no LOGFILE is given a zypper like install log of 50MB
+is generated and replayed via cat. The wall and CPU time
+spent by the kiwi process to consume the output is printed
+"""
+import os
+import sys
+import time
+import resource
+from tempfile import NamedTemporaryFile
+
+from kiwi.command import Command
+from kiwi.command_process import CommandProcess
+
+LOG_SIZE = 50 * 1024 * 1024
+
+
+def create_install_log(target):
+    count = 0
+    written = 0
+    while written < LOG_SIZE:
+        line = (
+            'Retrieving: package-{0}-1.2.3-150500.1.1.x86_64 '
+            '(Main Repository) (1/3000), 512.3 KiB\n'
+            '({0}/3000) Installing: package-{0}-1.2.3-150500.1.1.x86_64 '
+            '[......done]\n'
+        ).format(count % 3000).encode()
+        target.write(line)
+        written += len(line)
+        count += 1
+    target.flush()
+
+
+def match_package_installed(package_name, package_manager_output):
+    return package_name in package_manager_output
+
+
+def replay(log_file):
+    usage_start = resource.getrusage(resource.RUSAGE_SELF)
+    time_start = time.monotonic()
+    process = CommandProcess(
+        command=Command.call(['cat', log_file]), log_topic='benchmark'
+    )
+    process.poll_show_progress(
+        items_to_complete=['package-{0}'.format(n) for n in range(3)],
+        match_method=process.create_match_method(match_package_installed)
+    )
+    time_stop = time.monotonic()
+    usage_stop = resource.getrusage(resource.RUSAGE_SELF)
+    cpu_time = (usage_stop.ru_utime - usage_start.ru_utime) + \
+        (usage_stop.ru_stime - usage_start.ru_stime)
+    print(
+        '\nreplayed {0} bytes: wall {1:.2f}s, cpu {2:.2f}s'.format(
+            os.path.getsize(log_file), time_stop - time_start, cpu_time
+        )
+    )
+
+
+def main():
+    if len(sys.argv) > 1:
+        replay(sys.argv[1])
+    else:
+        with NamedTemporaryFile(prefix='kiwi_install_log.') as log_file:
+            create_install_log(log_file)
+            replay(log_file.name)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 SUSE LLC.  All rights reserved.
+#
+# This file is part of kiwi.
+#
+# kiwi is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# kiwi is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kiwi.  If not, see <http://www.gnu.org/licenses/>
+#
+"""
+Compare the Compress formats on a raw disk image
+
+usage: compress_benchmark.py [IMAGE_FILE|SIZE_IN_MB]
+
+If no IMAGE_FILE is given a raw disk image of 4GB is generated.
+One quarter of the image is filled with compressible data, the
+rest stays sparse like the free space of a filesystem. For each
+format the wall time to compress and to uncompress into a
+temporary file as well as the compression ratio is printed
+"""
+import os
+import sys
+import time
+import logging
+import random
+import shutil
+from tempfile import TemporaryDirectory
+
+from kiwi.utils.compress import Compress
+
+IMAGE_SIZE_MB = 4096
+BLOCK_SIZE = 1048576
+
+
+def create_disk_image(target, size_mb):
+    generator = random.Random(42)
+    alphabet = bytes(range(32, 48))
+    with open(target, 'wb') as image:
+        image.truncate(size_mb * BLOCK_SIZE)
+        for block in range(0, size_mb, 4):
+            image.seek(block * BLOCK_SIZE)
+            image.write(bytes(generator.choices(alphabet, k=BLOCK_SIZE)))
+
+
+def measure(image_file, zipper, options):
+    with TemporaryDirectory(prefix='kiwi_compress_benchmark.') as work_dir:
+        source = os.sep.join([work_dir, 'image.raw'])
+        shutil.copyfile(image_file, source)
+        compress = Compress(source)
+        start = time.monotonic()
+        compressed = getattr(compress, zipper)(*options)
+        compress_time = time.monotonic() - start
+        ratio = os.path.getsize(image_file) / os.path.getsize(compressed)
+        start = time.monotonic()
+        Compress(compressed).uncompress(temporary=True)
+        uncompress_time = time.monotonic() - start
+    print(
+        '{0:<20} compress {1:8.2f}s  uncompress {2:8.2f}s  '
+        'ratio {3:8.2f}'.format(
+            ' '.join([zipper] + [' '.join(option) for option in options]),
+            compress_time, uncompress_time, ratio
+        )
+    )
+
+
+def benchmark(image_file):
+    for zipper, options in (
+        ('xz', [['--threads=0']]),
+        ('zstd', [['--threads=0', '-19']]),
+        ('zstd', [['--threads=0', '-3']]),
+        ('gzip', [])
+    ):
+        measure(image_file, zipper, options)
+
+
+def main():
+    logging.getLogger('kiwi').setLevel(logging.INFO)
+    if len(sys.argv) > 1 and os.path.isfile(sys.argv[1]):
+        benchmark(sys.argv[1])
+    else:
+        size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else IMAGE_SIZE_MB
+        with TemporaryDirectory(prefix='kiwi_disk_image.') as image_dir:
+            image_file = os.sep.join([image_dir, 'disk.raw'])
+            create_disk_image(image_file, size_mb)
+            benchmark(image_file)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 SUSE LLC.  All rights reserved.
+#
+# This file is part of kiwi.
+#
+# kiwi is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# kiwi is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kiwi.  If not, see <http://www.gnu.org/licenses/>
+#
+"""
+Compare the extraction of a set of Debian packages into a root tree
+
+usage: deb_extract_benchmark.py [DEB_DIR|PACKAGE_COUNT]
+
+DEB_DIR is a directory with the .deb files of a bootstrap, e.g. the
+apt archive cache after a Debian bookworm debootstrap --download-only.
+The packages are extracted in the order of their file names. If no
+DEB_DIR is given PACKAGE_COUNT synthetic xz compressed packages are
+built by dpkg-deb. The wall time of the former extraction one
+package after another by dpkg-deb and tar and of the parallel
+in-process extraction is printed. Both root trees are compared
+for equal content. The parallel extraction scales with the number
+of CPUs, the xz and gzip decompression runs outside of the GIL
+"""
+import os
+import sys
+import time
+import random
+import filecmp
+import subprocess
+from tempfile import TemporaryDirectory
+
+from kiwi.archive.deb import ArchiveDeb
+
+PACKAGE_COUNT = 150
+FILES_PER_PACKAGE = 120
+
+
+def create_packages(deb_dir, count):
+    generator = random.Random(42)
+    alphabet = bytes(range(32, 127))
+    packages = []
+    with TemporaryDirectory(prefix='kiwi_deb_source.') as source_dir:
+        for package in range(count):
+            name = f'package{package:03d}'
+            package_dir = os.sep.join([source_dir, name])
+            os.makedirs(os.sep.join([package_dir, 'DEBIAN']))
+            with open(
+                os.sep.join([package_dir, 'DEBIAN', 'control']), 'w'
+            ) as control:
+                control.write(
+                    f'Package: {name}\nVersion: 1.0\nArchitecture: all\n'
+                    'Maintainer: kiwi\nDescription: benchmark\n'
+                )
+            for number in range(generator.randint(1, FILES_PER_PACKAGE * 2)):
+                path = os.sep.join(
+                    [
+                        package_dir, 'usr', 'share', name,
+                        f'dir{number % 7}', f'file{number}'
+                    ]
+                )
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                size = int(generator.expovariate(1 / 16384))
+                block = bytes(generator.choices(alphabet, k=512))
+                with open(path, 'wb') as data:
+                    data.write((block * (size // 512 + 1))[:size])
+            deb = os.sep.join([deb_dir, f'{name}.deb'])
+            subprocess.run(
+                [
+                    'dpkg-deb', '--root-owner-group', '-Zxz', '-b',
+                    package_dir, deb
+                ], check=True, stdout=subprocess.DEVNULL
+            )
+            packages.append(deb)
+    return packages
+
+
+def extract_sequential(packages, root_dir):
+    for package in packages:
+        subprocess.run(
+            [
+                'bash', '-c', 'dpkg-deb --fsys-tarfile {0} | tar -C {1} -x'
+                .format(package, root_dir)
+            ], check=True
+        )
+
+
+def extract_parallel(packages, root_dir):
+    ArchiveDeb.extract_all(packages, root_dir)
+
+
+def measure(name, method, packages, root_dir):
+    start = time.monotonic()
+    method(packages, root_dir)
+    print('{0:<12} {1:8.2f}s'.format(name, time.monotonic() - start))
+
+
+def trees_equal(comparison):
+    if comparison.left_only or comparison.right_only or \
+            comparison.diff_files or comparison.funny_files:
+        return False
+    return all(
+        trees_equal(sub) for sub in comparison.subdirs.values()
+    )
+
+
+def benchmark(packages):
+    print(f'{len(packages)} packages')
+    with TemporaryDirectory(prefix='kiwi_deb_root.') as work_dir:
+        sequential_root = os.sep.join([work_dir, 'sequential'])
+        parallel_root = os.sep.join([work_dir, 'parallel'])
+        os.makedirs(sequential_root)
+        os.makedirs(parallel_root)
+        measure('dpkg-deb|tar', extract_sequential, packages, sequential_root)
+        measure('ArchiveDeb', extract_parallel, packages, parallel_root)
+        print(
+            'trees equal: {0}'.format(
+                trees_equal(filecmp.dircmp(sequential_root, parallel_root))
+            )
+        )
+
+
+def main():
+    if len(sys.argv) > 1 and os.path.isdir(sys.argv[1]):
+        benchmark(
+            sorted(
+                os.sep.join([sys.argv[1], name])
+                for name in os.listdir(sys.argv[1]) if name.endswith('.deb')
+            )
+        )
+    else:
+        count = int(sys.argv[1]) if len(sys.argv) > 1 else PACKAGE_COUNT
+        with TemporaryDirectory(prefix='kiwi_deb_set.') as deb_dir:
+            benchmark(create_packages(deb_dir, count))
+
+
+if __name__ == '__main__':
+    main()
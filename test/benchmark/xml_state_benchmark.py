@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 SUSE LLC.  All rights reserved.
+#
+# This file is part of kiwi.
+#
+# kiwi is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# kiwi is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kiwi.  If not, see <http://www.gnu.org/licenses/>
+#
+"""
+Measure the XMLState section getters on a large multi-profile description
+
+usage: xml_state_benchmark.py [PROFILE_COUNT] [CALL_COUNT]
+
+A description with PROFILE_COUNT profiles (default 100) is generated.
+Every profile owns its own packages, repository, users and drivers
+sections, each referencing a few other profiles as well. For each
+getter the wall time of the first call and of CALL_COUNT (default
+1000) repeated calls is printed
+"""
+import os
+import sys
+import time
+import logging
+from tempfile import TemporaryDirectory
+
+from kiwi.xml_description import XMLDescription
+from kiwi.xml_state import XMLState
+
+PROFILE_COUNT = 100
+CALL_COUNT = 1000
+
+
+def create_description(target, profile_count):
+    profiles = [f'profile{number}' for number in range(profile_count)]
+    sections = []
+    for number, profile in enumerate(profiles):
+        profile_list = ','.join(
+            [profile] + profiles[number + 1:number + 4]
+        )
+        packages = ''.join(
+            f'<package name="{profile}-package{package}"/>'
+            for package in range(20)
+        )
+        sections.append(
+            f'<packages type="image" profiles="{profile_list}">'
+            f'{packages}</packages>'
+        )
+        sections.append(
+            f'<repository profiles="{profile_list}">'
+            f'<source path="obs://{profile}/standard"/></repository>'
+        )
+        sections.append(
+            f'<users profiles="{profile_list}">'
+            f'<user password="x" home="/home/{profile}" name="{profile}"/>'
+            '</users>'
+        )
+        sections.append(
+            f'<drivers profiles="{profile_list}">'
+            f'<file name="drivers/{profile}/*"/></drivers>'
+        )
+    profile_sections = ''.join(
+        f'<profile name="{profile}" description="{profile}"/>'
+        for profile in profiles
+    )
+    with open(target, 'w') as description:
+        description.write(
+            '<image schemaversion="8.5" name="benchmark">'
+            '<description type="system"><author>kiwi</author>'
+            '<contact>kiwi@example.com</contact>'
+            '<specification>benchmark</specification></description>'
+            f'<profiles>{profile_sections}</profiles>'
+            '<preferences><version>1.1.1</version>'
+            '<packagemanager>zypper</packagemanager>'
+            '<type image="oem" filesystem="ext4"/></preferences>'
+            f'{"".join(sections)}'
+            '<packages type="bootstrap"><package name="filesystem"/>'
+            '</packages></image>'
+        )
+    return profiles
+
+
+def measure(name, getter, call_count):
+    start = time.monotonic()
+    getter()
+    first_call = time.monotonic() - start
+    start = time.monotonic()
+    for call in range(call_count):
+        getter()
+    repeated_calls = time.monotonic() - start
+    print(
+        '{0:<32} first call {1:8.3f}ms  {2} calls {3:8.3f}ms'.format(
+            name, first_call * 1e3, call_count, repeated_calls * 1e3
+        )
+    )
+
+
+def main():
+    logging.getLogger('kiwi').setLevel(logging.WARNING)
+    profile_count = int(sys.argv[1]) if len(sys.argv) > 1 else PROFILE_COUNT
+    call_count = int(sys.argv[2]) if len(sys.argv) > 2 else CALL_COUNT
+    with TemporaryDirectory(prefix='kiwi_xml_state_benchmark.') as work_dir:
+        description_file = os.sep.join([work_dir, 'config.xml'])
+        profiles = create_description(description_file, profile_count)
+        xml_data = XMLDescription(description_file).load()
+    state = XMLState(xml_data, profiles[::2])
+    for name, getter in (
+        ('get_packages_sections', lambda: state.get_packages_sections(
+            ['image', 'bootstrap']
+        )),
+        ('get_repository_sections', state.get_repository_sections),
+        ('get_users_sections', state.get_users_sections),
+        ('get_drivers_list', state.get_drivers_list)
+    ):
+        measure(name, getter, call_count)
+
+
+if __name__ == '__main__':
+    main()
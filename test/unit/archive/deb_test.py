@@ -0,0 +1,280 @@
+import io
+import os
+import stat
+import shutil
+import tarfile
+import subprocess
+from pytest import (
+    raises, fixture, mark
+)
+
+from kiwi.archive.deb import (
+    ArchiveDeb, PathClaims
+)
+
+from kiwi.exceptions import KiwiArchiveDebError
+
+
+def create_tar(members, compression):
+    archive = io.BytesIO()
+    with tarfile.open(
+        fileobj=archive, mode='w:' if compression == 'zst' else f'w:{compression}'
+    ) as tar:
+        for name, kind, content, mode in members:
+            info = tarfile.TarInfo(name)
+            info.mode = mode
+            info.mtime = 1700000000
+            if kind == 'dir':
+                info.type = tarfile.DIRTYPE
+                tar.addfile(info)
+            elif kind == 'symlink':
+                info.type = tarfile.SYMTYPE
+                info.linkname = content
+                tar.addfile(info)
+            elif kind == 'hardlink':
+                info.type = tarfile.LNKTYPE
+                info.linkname = content
+                tar.addfile(info)
+            else:
+                info.size = len(content)
+                tar.addfile(info, io.BytesIO(content))
+    data = archive.getvalue()
+    if compression == 'zst':
+        data = subprocess.run(
+            ['zstd', '-c'], input=data, stdout=subprocess.PIPE, check=True
+        ).stdout
+    return data
+
+
+def create_deb(filename, members, control=None, compression='xz'):
+    control = control or [('./control', 'file', b'Package: test\n', 0o644)]
+    ar_members = [
+        ('debian-binary', b'2.0\n'),
+        ('control.tar.gz', create_tar(control, 'gz')),
+        (f'data.tar.{compression}', create_tar(members, compression))
+    ]
+    with open(filename, 'wb') as deb:
+        deb.write(b'!<arch>\n')
+        for name, data in ar_members:
+            deb.write(
+                '{0:<16}{1:<12}{2:<6}{3:<6}{4:<8}{5:<10}`\n'.format(
+                    name, 0, 0, 0, 100644, len(data)
+                ).encode()
+            )
+            deb.write(data)
+            if len(data) % 2:
+                deb.write(b'\n')
+    return filename
+
+
+class TestArchiveDeb:
+    @fixture(autouse=True)
+    def inject_fixtures(self, tmpdir):
+        self._tmpdir = tmpdir
+        self.root_dir = tmpdir.mkdir('root')
+        self.deb = create_deb(
+            tmpdir.join('base.deb').strpath, [
+                ('./', 'dir', None, 0o755),
+                ('./usr/', 'dir', None, 0o755),
+                ('./usr/bin/', 'dir', None, 0o755),
+                ('./usr/bin/tool', 'file', b'tool', 0o4755),
+                ('./usr/bin/tool-link', 'hardlink', './usr/bin/tool', 0o755),
+                ('./usr/bin/alias', 'symlink', 'tool', 0o777),
+                ('./lib/', 'dir', None, 0o755),
+                ('./lib/library', 'file', b'library', 0o644)
+            ], control=[
+                ('./', 'dir', None, 0o755),
+                ('./control', 'file', b'Package: base\n', 0o644),
+                ('./postinst', 'file', b'#!/bin/sh\n', 0o755)
+            ]
+        )
+
+    def test_get_members(self):
+        members = ArchiveDeb(self.deb).get_members()
+        assert list(members) == [
+            'debian-binary', 'control.tar.gz', 'data.tar.xz'
+        ]
+        assert members['debian-binary'] == (68, 4)
+
+    def test_get_members_no_deb(self):
+        no_deb = self._tmpdir.join('no.deb')
+        no_deb.write('data')
+        with raises(KiwiArchiveDebError):
+            ArchiveDeb(no_deb.strpath).get_members()
+
+    def test_get_members_corrupt(self):
+        corrupt = self._tmpdir.join('corrupt.deb')
+        corrupt.write('!<arch>\n' + 'x' * 60)
+        with raises(KiwiArchiveDebError):
+            ArchiveDeb(corrupt.strpath).get_members()
+
+    def test_extract(self):
+        ArchiveDeb(self.deb).extract(self.root_dir.strpath)
+        tool = self.root_dir.join('usr', 'bin', 'tool')
+        assert tool.read() == 'tool'
+        assert stat.S_IMODE(os.stat(tool.strpath).st_mode) == 0o4755
+        assert os.stat(tool.strpath).st_mtime == 1700000000
+        assert os.stat(tool.strpath).st_nlink == 2
+        assert os.readlink(
+            self.root_dir.join('usr', 'bin', 'alias').strpath
+        ) == 'tool'
+        assert self.root_dir.join('lib', 'library').read() == 'library'
+        assert sorted(
+            os.path.basename(item) for item in self.root_dir.listdir()
+        ) == ['lib', 'usr']
+
+    def test_extract_follows_symlinks_inside_root(self):
+        self.root_dir.mkdir('usr').mkdir('lib')
+        os.symlink('usr/lib', self.root_dir.join('lib').strpath)
+        # an absolute symlink is resolved inside of the root as well
+        os.symlink('/usr', self.root_dir.join('opt').strpath)
+        deb = create_deb(
+            self._tmpdir.join('merged.deb').strpath, [
+                ('./lib/', 'dir', None, 0o755),
+                ('./lib/library', 'file', b'library', 0o644),
+                ('./opt/data', 'file', b'data', 0o644)
+            ]
+        )
+        ArchiveDeb(deb).extract(self.root_dir.strpath)
+        assert os.path.islink(self.root_dir.join('lib').strpath)
+        assert self.root_dir.join('usr', 'lib', 'library').read() == 'library'
+        assert self.root_dir.join('usr', 'data').read() == 'data'
+
+    def test_extract_replaces_file_by_directory(self):
+        self.root_dir.join('lib').write('file')
+        ArchiveDeb(self.deb).extract(self.root_dir.strpath)
+        assert self.root_dir.join('lib', 'library').read() == 'library'
+
+    def test_extract_no_data(self):
+        with open(self.deb, 'r+b') as deb:
+            deb.seek(self.deb_data_offset())
+            deb.write(b'data.tar.lz4')
+        with raises(KiwiArchiveDebError):
+            ArchiveDeb(self.deb).extract(self.root_dir.strpath)
+
+    def test_extract_failed(self):
+        target = self._tmpdir.join('file')
+        target.write('file')
+        with raises(KiwiArchiveDebError):
+            ArchiveDeb(self.deb).extract(target.strpath, PathClaims())
+
+    @mark.skipif(not shutil.which('zstd'), reason='zstd not installed')
+    def test_extract_zstd(self):
+        deb = create_deb(
+            self._tmpdir.join('zstd.deb').strpath, [
+                ('./data', 'file', b'data', 0o644)
+            ], compression='zst'
+        )
+        ArchiveDeb(deb).extract(self.root_dir.strpath)
+        assert self.root_dir.join('data').read() == 'data'
+
+    @mark.skipif(not shutil.which('zstd'), reason='zstd not installed')
+    def test_extract_zstd_failed(self):
+        offset, size = ArchiveDeb(self.deb).get_members()['data.tar.xz']
+        with open(self.deb, 'r+b') as deb:
+            deb.seek(self.deb_data_offset())
+            deb.write(b'data.tar.zst')
+            deb.seek(offset)
+            deb.write(b'x' * size)
+        with raises(KiwiArchiveDebError) as issue:
+            ArchiveDeb(self.deb).extract(self.root_dir.strpath)
+        assert 'Decompression of data.tar.zst failed' in str(issue.value)
+
+    def test_extract_control(self):
+        control_dir = self._tmpdir.join('control').strpath
+        ArchiveDeb(self.deb).extract_control(control_dir)
+        assert sorted(os.listdir(control_dir)) == ['control', 'postinst']
+        assert os.access(os.sep.join([control_dir, 'postinst']), os.X_OK)
+
+    def test_extract_control_failed(self):
+        target = self._tmpdir.join('file')
+        target.write('file')
+        with raises(KiwiArchiveDebError):
+            ArchiveDeb(self.deb).extract_control(target.strpath)
+
+    def test_extract_all(self):
+        other = create_deb(
+            self._tmpdir.join('other.deb').strpath, [
+                ('./usr/bin/', 'dir', None, 0o755),
+                ('./usr/bin/tool', 'file', b'other tool', 0o755),
+                ('./usr/bin/other', 'file', b'other', 0o755)
+            ]
+        )
+        control_dir = self._tmpdir.mkdir('control').strpath
+        ArchiveDeb.extract_all(
+            [self.deb, other], self.root_dir.strpath, control_dir
+        )
+        # the later package wins
+        assert self.root_dir.join('usr', 'bin', 'tool').read() == 'other tool'
+        assert self.root_dir.join('usr', 'bin', 'other').read() == 'other'
+        assert sorted(os.listdir(control_dir)) == ['base.deb', 'other.deb']
+
+    def test_extract_all_keeps_directory_replaced_by_symlink(self):
+        other = create_deb(
+            self._tmpdir.join('other.deb').strpath, [
+                ('./lib', 'symlink', 'usr/lib', 0o777)
+            ]
+        )
+        ArchiveDeb.extract_all([self.deb, other], self.root_dir.strpath)
+        # an existing directory is kept as dpkg does, independent
+        # of which package is extracted first
+        assert not os.path.islink(self.root_dir.join('lib').strpath)
+        assert self.root_dir.join('lib', 'library').read() == 'library'
+
+    def test_extract_all_symlink_of_earlier_package(self):
+        merged = create_deb(
+            self._tmpdir.join('merged.deb').strpath, [
+                ('./usr/', 'dir', None, 0o755),
+                ('./usr/lib/', 'dir', None, 0o755),
+                ('./lib', 'symlink', 'usr/lib', 0o777)
+            ]
+        )
+        ArchiveDeb.extract_all([merged, self.deb], self.root_dir.strpath)
+        # members below the symlink follow it
+        assert os.path.islink(self.root_dir.join('lib').strpath)
+        assert self.root_dir.join('usr', 'lib', 'library').read() == 'library'
+
+    def test_extract_all_replaces_parent_path_last(self):
+        merged = create_deb(
+            self._tmpdir.join('merged.deb').strpath, [
+                ('./usr/', 'dir', None, 0o755),
+                ('./usr/lib/', 'dir', None, 0o755),
+                ('./lib', 'symlink', 'usr/lib', 0o777)
+            ]
+        )
+        other = create_deb(
+            self._tmpdir.join('other.deb').strpath, [
+                ('./lib', 'file', b'file', 0o644)
+            ]
+        )
+        ArchiveDeb.extract_all(
+            [merged, self.deb, other], self.root_dir.strpath
+        )
+        assert self.root_dir.join('usr', 'lib', 'library').read() == 'library'
+        assert self.root_dir.join('lib').read() == 'file'
+
+    def test_extract_path_claims_order(self):
+        other = create_deb(
+            self._tmpdir.join('other.deb').strpath, [
+                ('./usr/bin/', 'dir', None, 0o755),
+                ('./usr/bin/tool', 'file', b'other tool', 0o755)
+            ]
+        )
+        claims = PathClaims()
+        # the later package in the order is extracted first
+        ArchiveDeb(other).extract(self.root_dir.strpath, claims, 1)
+        ArchiveDeb(self.deb).extract(self.root_dir.strpath, claims, 0)
+        assert self.root_dir.join('usr', 'bin', 'tool').read() == 'other tool'
+        # the hard link keeps the data of its own package
+        assert self.root_dir.join(
+            'usr', 'bin', 'tool-link'
+        ).read() == 'tool'
+        assert self.root_dir.join('lib', 'library').read() == 'library'
+        assert not [
+            name for name in os.listdir(self.root_dir.join('usr', 'bin'))
+            if 'kiwi-deb' in name
+        ]
+
+    def deb_data_offset(self):
+        offset, size = ArchiveDeb(self.deb).get_members()['data.tar.xz']
+        return offset - 60
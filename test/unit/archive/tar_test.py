@@ -5,6 +5,7 @@ from pytest import raises
 import unittest.mock as mock
 
 from kiwi.archive.tar import ArchiveTar
+from kiwi.utils.command_capabilities import CommandCapabilities
 
 from kiwi.exceptions import KiwiCommandCapabilitiesError
 
@@ -16,6 +17,8 @@ class TestArchiveTar:
         command.output = 'version 1.27.0'
         mock_command.return_value = command
         self.archive = ArchiveTar('foo.tar')
+        # each test probes the tar version again
+        CommandCapabilities.invalidate_cache()
 
     @patch('kiwi.archive.tar.Command.run')
     def setup_method(self, cls, mock_command):
@@ -157,6 +160,45 @@ class TestArchiveTar:
             ]
         )
 
+    @patch('kiwi.archive.tar.Command.run')
+    @patch('os.listdir')
+    def test_create_zstd_compressed(self, mock_os_dir, mock_command):
+        mock_os_dir.return_value = ['foo', 'bar']
+        assert self.archive.create_zstd_compressed('source-dir') == \
+            'foo.tar.zst'
+        mock_command.assert_called_once_with(
+            [
+                'bash', '-c',
+                ' '.join([
+                    'tar', '-C', 'source-dir', '--xattrs',
+                    '--xattrs-include=*', '-c', '--to-stdout',
+                    'bar', 'foo', '|', 'zstd', '-f', '-q', '--threads=0',
+                    '-19', '-o', 'foo.tar.zst'
+                ])
+            ]
+        )
+
+    @patch('kiwi.archive.tar.Command.run')
+    @patch('os.listdir')
+    def test_create_zstd_compressed_with_custom_options(
+        self, mock_os_dir, mock_command
+    ):
+        mock_os_dir.return_value = ['foo', 'bar']
+        assert self.archive.create_zstd_compressed(
+            'source-dir', options=['--numeric-owner'], zstd_options=['-3']
+        ) == 'foo.tar.zst'
+        mock_command.assert_called_once_with(
+            [
+                'bash', '-c',
+                ' '.join([
+                    'tar', '-C', 'source-dir', '--numeric-owner', '--xattrs',
+                    '--xattrs-include=*', '-c', '--to-stdout',
+                    'bar', 'foo', '|', 'zstd', '-f', '-q', '-3',
+                    '-o', 'foo.tar.zst'
+                ])
+            ]
+        )
+
     @patch('kiwi.archive.tar.Command.run')
     @patch('os.listdir')
     def test_create_gnu_gzip_compressed(self, mock_os_dir, mock_command):
@@ -212,6 +212,7 @@ class TestBootLoaderSystemdBoot:
             )
             file_handle.write.assert_called_once_with(self.bootloader.cmdline)
 
+    @patch('kiwi.bootloader.config.systemd_boot.BlockCopy')
     @patch('kiwi.bootloader.config.systemd_boot.Path.create')
     @patch('kiwi.bootloader.config.systemd_boot.Command.run')
     @patch('kiwi.bootloader.config.systemd_boot.LoopDevice')
@@ -221,7 +222,8 @@ class TestBootLoaderSystemdBoot:
     @patch.object(BootLoaderSystemdBoot, 'set_loader_entry')
     def test_create_embedded_fat_efi_image(
         self, mock_set_loader_entry, mock_run_bootctl, mock_MountManager,
-        mock_Disk, mock_LoopDevice, mock_Command_run, mock_Path_create
+        mock_Disk, mock_LoopDevice, mock_Command_run, mock_Path_create,
+        mock_BlockCopy
     ):
         target = Mock()
         self.bootloader.target = target
@@ -241,8 +243,9 @@ class TestBootLoaderSystemdBoot:
             call(
                 ['mkdosfs', '-n', 'BOOT', 'efi_device']
             ),
-            call(['dd', 'if=efi_device', 'of=ESP.img']),
             call(['mv', 'ESP.img', 'ESP'])
         ]
+        mock_BlockCopy.assert_called_once_with('efi_device', 'ESP.img')
+        mock_BlockCopy.return_value.copy.assert_called_once_with()
         mock_run_bootctl.assert_called_once_with('root_dir')
         mock_set_loader_entry.assert_called_once_with('root_dir', target.live)
@@ -180,6 +180,7 @@ class TestDiskBuilder:
         kiwi.builder.disk.Fstab = Mock(
             return_value=self.fstab
         )
+        kiwi.builder.disk.BlockCopy = Mock()
         self.xml_state = XMLState(description.load())
         self.disk_builder = DiskBuilder(
             self.xml_state, 'target_dir', 'root_dir',
@@ -402,7 +403,7 @@ class TestDiskBuilder:
                 'image', '.kconfig', 'run/*', 'tmp/*',
                 '.buildenv', 'var/cache/kiwi', 'boot/*', 'boot/.*',
                 'boot/efi/*', 'boot/efi/.*'
-            ])
+            ], offline=True)
         assert m_open.call_args_list[0:4] == [
             call('boot_dir/config.partids', 'w'),
             call('root_dir/boot/mbrid', 'w'),
@@ -778,7 +779,6 @@ class TestDiskBuilder:
             call(['cp', 'root_dir/recovery.partition.size', 'boot_dir']),
             call(['mv', 'initrd', 'root_dir/boot/initramfs-1.2.3.img']),
             call(['blockdev', '--getsize64', '/dev/root-device']),
-            call(['dd', 'if=tempfile', 'of=/dev/root-device']),
             call(['mv', 'initrd', 'root_dir/boot/initramfs-1.2.3.img']),
             call(
                 [
@@ -787,6 +787,12 @@ class TestDiskBuilder:
                 ]
             )
         ]
+        kiwi.builder.disk.BlockCopy.assert_called_once_with(
+            'tempfile', '/dev/root-device'
+        )
+        kiwi.builder.disk.BlockCopy.return_value.copy.assert_called_once_with(
+            sparse=False, progress_prefix='Dumping rootfs'
+        )
 
     @patch('kiwi.builder.disk.Disk')
     @patch('kiwi.builder.disk.create_boot_loader_config')
@@ -869,7 +875,6 @@ class TestDiskBuilder:
             call(['cp', 'root_dir/recovery.partition.size', 'boot_dir']),
             call(['mv', 'initrd', 'root_dir/boot/initramfs-1.2.3.img']),
             call(['blockdev', '--getsize64', '/dev/root-device']),
-            call(['dd', 'if=tempfile', 'of=/dev/root-device']),
             call(['mv', 'initrd', 'root_dir/boot/initramfs-1.2.3.img']),
             call(
                 [
@@ -1023,7 +1028,7 @@ class TestDiskBuilder:
                 'image', '.kconfig', 'run/*', 'tmp/*',
                 '.buildenv', 'var/cache/kiwi', 'boot/*', 'boot/.*',
                 'boot/efi/*', 'boot/efi/.*'
-            ])
+            ], offline=True)
         assert m_open.call_args_list == [
             call('boot_dir/config.partids', 'w'),
             call('root_dir/boot/mbrid', 'w'),
@@ -1044,7 +1049,6 @@ class TestDiskBuilder:
             call(['cp', 'root_dir/recovery.partition.size', 'boot_dir']),
             call(['mv', 'initrd', 'root_dir/boot/initramfs-1.2.3.img']),
             call(['blockdev', '--getsize64', '/dev/root-device']),
-            call(['dd', 'if=tempfile', 'of=/dev/root-device']),
             call(['mv', 'initrd', 'root_dir/boot/initramfs-1.2.3.img']),
             call(
                 [
@@ -1221,8 +1225,11 @@ class TestDiskBuilder:
         assert mock_command.call_args_list[2] == call(
             ['blockdev', '--getsize64', '/dev/integrityRoot']
         )
-        assert mock_command.call_args_list[3] == call(
-            ['dd', 'if=kiwi-tempname', 'of=/dev/integrityRoot']
+        kiwi.builder.disk.BlockCopy.assert_called_once_with(
+            'kiwi-tempname', '/dev/integrityRoot'
+        )
+        kiwi.builder.disk.BlockCopy.return_value.copy.assert_called_once_with(
+            sparse=False, progress_prefix='Dumping rootfs'
         )
         m_open.return_value.write.assert_has_calls(
             [
@@ -1435,6 +1442,12 @@ class TestDiskBuilder:
             randomize=True,
             root_dir='root_dir'
         )
+        kiwi.builder.disk.BlockCopy.assert_called_once_with(
+            ANY, self.luks_root.get_device.return_value.get_device.return_value
+        )
+        kiwi.builder.disk.BlockCopy.return_value.copy.assert_called_once_with(
+            sparse=False, progress_prefix='Dumping rootfs'
+        )
         self.luks_root.create_crypttab.assert_called_once_with(
             'root_dir/etc/crypttab'
         )
@@ -1715,7 +1728,7 @@ class TestDiskBuilder:
                 'image', '.kconfig', 'run/*', 'tmp/*',
                 '.buildenv', 'var/cache/kiwi',
                 'boot/*', 'boot/.*', 'boot/efi/*', 'boot/efi/.*'
-            ]
+            ], offline=True
         )
         self.setup.create_fstab.assert_called_once_with(
             self.disk_builder.fstab
@@ -1871,7 +1884,7 @@ class TestDiskBuilder:
                 'image', '.kconfig', 'run/*', 'tmp/*',
                 '.buildenv', 'var/cache/kiwi', 'var/*', 'var/.*',
                 'boot/*', 'boot/.*', 'boot/efi/*', 'boot/efi/.*'
-            ]
+            ], offline=True
         )
         assert [
             call('UUID=blkid_result / blkid_result_fs ro 0 0'),
@@ -348,7 +348,7 @@ class TestLiveImageBuilder:
     @patch('kiwi.builder.live.LoopDevice')
     @patch('kiwi.builder.live.DeviceProvider')
     @patch('kiwi.builder.live.LuksDevice')
-    @patch('kiwi.builder.live.Command.run')
+    @patch('kiwi.builder.live.BlockCopy')
     @patch('kiwi.builder.live.IsoToolsBase.setup_media_loader_directory')
     @patch('kiwi.builder.live.Temporary')
     @patch('kiwi.builder.live.shutil')
@@ -377,7 +377,7 @@ class TestLiveImageBuilder:
         mock_shutil,
         mock_Temporary,
         mock_setup_media_loader_directory,
-        mock_Command_run,
+        mock_BlockCopy,
         mock_LuksDevice,
         mock_DeviceProvider,
         mock_LoopDevice,
@@ -413,12 +413,12 @@ class TestLiveImageBuilder:
             randomize=self.xml_state.build_type.get_luks_randomize.return_value,
             root_dir='root_dir'
         )
-        mock_Command_run.assert_called_once_with(
-            [
-                'dd',
-                f'if={mock_Temporary.return_value.new_file.return_value.name}',
-                f'of={luks_device.get_device.return_value}'
-            ]
+        mock_BlockCopy.assert_called_once_with(
+            mock_Temporary.return_value.new_file.return_value.name,
+            luks_device.get_device.return_value
+        )
+        mock_BlockCopy.return_value.copy.assert_called_once_with(
+            sparse=False
         )
 
     @mark.parametrize('xml_filesystem', [None, 'squashfs'])
@@ -36,6 +36,7 @@ class TestCli:
             '--version': False,
             '--debug': False,
             '--debug-run-scripts-in-screen': False,
+            '--trace': False,
             'result': False,
             '--profile': [],
             '--setenv': [],
@@ -1,11 +1,11 @@
 import logging
+import os
 from unittest.mock import (
-    patch, Mock
+    patch, Mock, call
 )
 from pytest import (
     raises, fixture
 )
-from builtins import bytes
 
 from kiwi.command_process import (
     CommandProcess,
@@ -23,45 +23,29 @@ class TestCommandProcess:
     def fake_matcher(self, item, output):
         return True
 
-    def poll(self):
-        return self.data_flow.pop()
-
-    def outavailable(self):
-        return True
-
-    def erravailable(self):
-        return True
-
-    def outdata(self):
-        return self.data_out.pop()
-
-    def errdata(self):
-        return self.data_err.pop()
-
-    def create_flow_method(self, method):
-        def create_method(arg=None):
-            return method()
-        return create_method
+    def create_command(
+        self, stdout_data=b'data\n', stderr_data=b'error\n'
+    ):
+        command = Mock()
+        for name, data in (('output', stdout_data), ('error', stderr_data)):
+            read_fd, write_fd = os.pipe()
+            os.write(write_fd, data)
+            os.close(write_fd)
+            channel = open(read_fd, 'rb')
+            self.channels.append(channel)
+            setattr(command, name, channel)
+        return command
 
     def setup(self):
-        self.data_flow = [True, None, None, None, None, None, None, None]
-        self.data_out = [
-            bytes(b''), bytes(b''), bytes(b'\n'), bytes(b'a'),
-            bytes(b't'), bytes(b'a'), bytes(b'd')
-        ]
-        self.data_err = [
-            bytes(b''), bytes(b'\n'), bytes(b'r'), bytes(b'o'),
-            bytes(b'r'), bytes(b'r'), bytes(b'e')
-        ]
-        self.flow = self.create_flow_method(self.poll)
-        self.flow_out_available = self.create_flow_method(self.outavailable)
-        self.flow_err_available = self.create_flow_method(self.erravailable)
-        self.flow_out = self.create_flow_method(self.outdata)
-        self.flow_err = self.create_flow_method(self.errdata)
+        self.channels = []
 
     def setup_method(self, cls):
         self.setup()
 
+    def teardown_method(self, cls):
+        for channel in self.channels:
+            channel.close()
+
     @patch('kiwi.command.Command')
     def test_returncode(self, mock_command):
         command = Mock()
@@ -74,40 +58,42 @@ class TestCommandProcess:
         match_method = CommandProcess(mock_command).create_match_method(
             self.fake_matcher
         )
-        process = CommandProcess(mock_command)
-        process.command.command.process.poll = self.flow
-        process.command.command.output_available = self.flow_out_available
-        process.command.command.error_available = self.flow_err_available
-        process.command.command.output.read = self.flow_out
-        process.command.command.error.read = self.flow_err
+        process = CommandProcess(self.create_command())
         process.command.command.process.returncode = 0
         with self._caplog.at_level(logging.DEBUG):
             process.poll_show_progress(['a', 'b'], match_method, True)
             assert 'system: data' in self._caplog.text
 
+    @patch('kiwi.command_process.Logger.progress')
+    def test_poll_show_progress_extract_method(self, mock_progress):
+        match_method = Mock()
+        process = CommandProcess(
+            self.create_command(stdout_data=b'Installing: a\nInstalling: c\n')
+        )
+        process.command.command.process.returncode = 0
+        process.poll_show_progress(
+            ['a', 'b'], match_method,
+            extract_method=lambda line: line.split(': ')[1]
+        )
+        assert not match_method.called
+        assert process.items_processed == 1
+        assert mock_progress.call_args_list[1] == call(
+            1, 2, '[ INFO    ]: Processing'
+        )
+
     @patch('kiwi.command.Command')
     def test_poll_show_progress_raises(self, mock_command):
         match_method = CommandProcess(mock_command).create_match_method(
             self.fake_matcher
         )
-        process = CommandProcess(mock_command)
-        process.command.command.process.poll = self.flow
-        process.command.command.output_available = self.flow_out_available
-        process.command.command.error_available = self.flow_err_available
-        process.command.command.output.read = self.flow_out
-        process.command.command.error.read = self.flow_err
+        process = CommandProcess(self.create_command())
         process.command.command.process.returncode = 1
         with raises(KiwiCommandError):
             process.poll_show_progress(['a', 'b'], match_method)
 
     @patch('kiwi.command.Command')
     def test_poll(self, mock_command):
-        process = CommandProcess(mock_command)
-        process.command.command.process.poll = self.flow
-        process.command.command.output_available = self.flow_out_available
-        process.command.command.error_available = self.flow_err_available
-        process.command.command.output.read = self.flow_out
-        process.command.command.error.read = self.flow_err
+        process = CommandProcess(self.create_command())
         process.command.command.process.returncode = 0
         with self._caplog.at_level(logging.DEBUG):
             process.poll()
@@ -115,25 +101,14 @@ class TestCommandProcess:
 
     @patch('kiwi.command.Command')
     def test_poll_raises(self, mock_command):
-        process = CommandProcess(mock_command)
-        process.command.command.process.poll = self.flow
-        process.command.command.output_available = self.flow_out_available
-        process.command.command.error_available = self.flow_err_available
-        process.command.command.output.read = self.flow_out
-        process.command.command.error.read = self.flow_err
-        process.command.command.output.read.return_value = 'data'
+        process = CommandProcess(self.create_command())
         process.command.command.process.returncode = 1
         with raises(KiwiCommandError):
             process.poll()
 
     @patch('kiwi.command.Command')
     def test_poll_and_watch(self, mock_command):
-        process = CommandProcess(mock_command)
-        process.command.command.process.poll = self.flow
-        process.command.command.output_available = self.flow_out_available
-        process.command.command.error_available = self.flow_err_available
-        process.command.command.output.read = self.flow_out
-        process.command.command.error.read = self.flow_err
+        process = CommandProcess(self.create_command())
         process.command.command.process.returncode = 1
         with self._caplog.at_level(logging.DEBUG):
             result = process.poll_and_watch()
@@ -161,3 +136,41 @@ class TestCommandProcess:
     def test_get_pid(self):
         iterator = CommandIterator(Mock())
         assert iterator.get_pid() == iterator.command.process.pid
+
+    def test_command_iterator_lines(self):
+        command = self.create_command(
+            stdout_data=b'a\nb\n\nc', stderr_data=b'x\ny'
+        )
+        iterator = CommandIterator(command, chunk_size=1)
+        result = list(iterator)
+        assert [line.stdout_line for line in result] == [
+            'a', 'b', '', 'c'
+        ]
+        assert [line.stderr_line for line in result] == [
+            'x', 'y', '', ''
+        ]
+        assert iterator.get_error_output() == 'x\ny'
+        command.process.wait.assert_called_once_with()
+        with raises(StopIteration):
+            next(iterator)
+
+    def test_command_iterator_chunked(self):
+        stdout_data = b''.join(
+            'line {0}\n'.format(count).encode() for count in range(5000)
+        )
+        command = Mock()
+        read_fd, write_fd = os.pipe()
+        command.output = open(read_fd, 'rb')
+        command.error = self.create_command(stderr_data=b'').error
+        self.channels.append(command.output)
+        iterator = CommandIterator(command, chunk_size=4096)
+        writer = os.fdopen(write_fd, 'wb')
+        writer.write(stdout_data[:30000])
+        writer.flush()
+        lines = [next(iterator).stdout_line]
+        writer.write(stdout_data[30000:])
+        writer.close()
+        lines.extend(line.stdout_line for line in iterator)
+        assert lines == [
+            'line {0}'.format(count) for count in range(5000)
+        ]
@@ -0,0 +1,119 @@
+import os
+import json
+import logging
+import subprocess
+from unittest.mock import patch
+from pytest import (
+    raises, fixture
+)
+
+from kiwi.command import Command
+from kiwi.command_process import CommandProcess
+from kiwi.command_trace import (
+    CommandTrace, TracedPopen
+)
+
+from kiwi.exceptions import KiwiCommandError
+
+
+class TestCommandTrace:
+    @fixture(autouse=True)
+    def inject_fixtures(self, caplog, tmpdir):
+        self._caplog = caplog
+        self._tmpdir = tmpdir
+        CommandTrace.enable()
+        yield
+        CommandTrace.disable()
+
+    def _commands(self):
+        return [
+            event for event in CommandTrace.events
+            if event['cat'] == 'command'
+        ]
+
+    @CommandTrace.traced
+    def _traced_phase(self):
+        Command.run(['echo', 'traced'])
+        return 'done'
+
+    def test_disabled(self):
+        CommandTrace.disable()
+        Command.run(['true'])
+        with CommandTrace.phase('phase'):
+            pass
+        CommandTrace.write(self._tmpdir.join('kiwi.trace.json').strpath)
+        assert not CommandTrace.events
+        assert not os.path.exists(self._tmpdir.join('kiwi.trace.json'))
+
+    def test_run(self):
+        with CommandTrace.phase('SystemPrepare.install_system'):
+            Command.run(['echo', 'foo'])
+        Command.run(['false'], raise_on_error=False)
+        assert self._traced_phase() == 'done'
+        commands = self._commands()
+        assert [event['name'] for event in commands] == [
+            'echo', 'false', 'echo'
+        ]
+        assert commands[0]['args']['command'] == 'echo foo'
+        assert commands[0]['args']['phase'] == \
+            'SystemPrepare.install_system'
+        assert commands[0]['args']['returncode'] == 0
+        assert commands[0]['args']['output_bytes'] == 4
+        assert commands[0]['dur'] > 0
+        assert commands[0]['args']['cpu_time'] >= 0
+        assert commands[1]['args']['phase'] == ''
+        assert commands[1]['args']['returncode'] == 1
+        assert commands[2]['args']['phase'] == \
+            'TestCommandTrace._traced_phase'
+        assert [
+            event['name'] for event in CommandTrace.events
+            if event['cat'] == 'phase'
+        ] == ['SystemPrepare.install_system', 'TestCommandTrace._traced_phase']
+
+    def test_call(self):
+        process = CommandProcess(
+            command=Command.call(['echo', 'foo']), log_topic='trace'
+        )
+        process.poll()
+        commands = self._commands()
+        assert len(commands) == 1
+        assert commands[0]['args']['output_bytes'] == 4
+        assert commands[0]['args']['returncode'] == 0
+
+    @patch('subprocess.Popen.__init__')
+    def test_run_failure(self, mock_Popen_init):
+        mock_Popen_init.side_effect = OSError('Run failure')
+        with raises(KiwiCommandError):
+            Command.run(['true'])
+        with raises(KiwiCommandError):
+            Command.call(['true'])
+        commands = self._commands()
+        assert len(commands) == 2
+        assert commands[0]['args']['returncode'] is None
+
+    @patch('os.wait4')
+    def test_wait_child_reaped(self, mock_wait4):
+        mock_wait4.side_effect = ChildProcessError
+        process = TracedPopen(
+            CommandTrace.start_command(['true']), ['true']
+        )
+        process.wait()
+        assert len(self._commands()) == 1
+
+    def test_write(self):
+        Command.run(['echo', 'foo'])
+        with CommandTrace.phase('DiskBuilder._sync_system_to_image'):
+            Command.run(['true'])
+        trace_file = self._tmpdir.join('kiwi.trace.json').strpath
+        with self._caplog.at_level(logging.INFO):
+            CommandTrace.write(trace_file, count=1)
+        with open(trace_file) as trace:
+            events = json.load(trace)['traceEvents']
+        assert len(events) == 3
+        assert 'Command trace: 2 commands' in self._caplog.text
+        assert 'Top 1 commands by wall time' in self._caplog.text
+        assert '(no phase)' in self._caplog.text
+        assert 'DiskBuilder._sync_system_to_image' in self._caplog.text
+
+    def test_traced_popen_is_popen(self):
+        assert issubclass(TracedPopen, subprocess.Popen)
@@ -0,0 +1,35 @@
+import os
+from pytest import fixture
+
+from kiwi.markup.base import MarkupBase
+from kiwi.runtime_check_scheduler import RuntimeCheckScheduler
+from kiwi.utils.block import BlockID
+from kiwi.utils.bootstrap_cache import BootstrapCache
+from kiwi.utils.command_capabilities import CommandCapabilities
+from kiwi.utils.description_cache import DescriptionCache
+from kiwi.utils.mount_table import MountTable
+from kiwi.utils.sync import DataSync
+from kiwi.utils.sync_manifest import SyncManifest
+from kiwi.xml_description import XMLDescription
+
+
+@fixture(autouse=True)
+def reset_process_caches():
+    # probes are memoized process wide, tests must not share them
+    CommandCapabilities.cache = {}
+    CommandCapabilities.cache_file = None
+    BlockID.invalidate()
+    BootstrapCache.cache_dir = None
+    MarkupBase.xslt_transforms = {}
+    XMLDescription.schema_validators = None
+    DescriptionCache.cache_dir = None
+    RuntimeCheckScheduler.cache = {}
+    RuntimeCheckScheduler.cache_file = None
+    DataSync.engine = 'rsync'
+    SyncManifest.shared = None
+    if MountTable.mountinfo_fd is not None:
+        os.close(MountTable.mountinfo_fd)
+    MountTable.mountinfo_fd = None
+    MountTable.poller = None
+    MountTable.mountpoints = None
+    yield
@@ -1,3 +1,4 @@
+import os
 import logging
 from unittest.mock import (
     patch, call
@@ -63,6 +64,37 @@ class TestDefaults:
     def test_get_default_shared_cache_location(self):
         assert Defaults.get_shared_cache_location() == 'var/cache/kiwi'
 
+    def test_get_capabilities_cache_file(self):
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': '/cache'}):
+            assert Defaults.get_capabilities_cache_file() == \
+                '/cache/kiwi/capabilities.json'
+        with patch.dict('os.environ', {'HOME': '/home/user'}):
+            with patch.dict('os.environ'):
+                os.environ.pop('XDG_CACHE_HOME', None)
+                assert Defaults.get_capabilities_cache_file() == \
+                    '/home/user/.cache/kiwi/capabilities.json'
+
+    def test_get_sync_engine(self):
+        assert Defaults.get_sync_engine() == 'rsync'
+
+    def test_get_runtime_checks_cache_file(self):
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': '/cache'}):
+            assert Defaults.get_runtime_checks_cache_file() == \
+                '/cache/kiwi/runtime_checks.json'
+
+    def test_get_description_cache_location(self):
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': '/cache'}):
+            assert Defaults.get_description_cache_location() == \
+                '/cache/kiwi/descriptions'
+
+    def test_get_bootstrap_cache_location(self):
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': '/cache'}):
+            assert Defaults.get_bootstrap_cache_location() == \
+                '/cache/kiwi/bootstrap'
+
+    def test_get_bootstrap_cache_max_size(self):
+        assert Defaults.get_bootstrap_cache_max_size() == 21474836480
+
     @patch('kiwi.defaults.Path.which')
     def test_get_grub_boot_directory_name(self, mock_which):
         mock_which.return_value = 'grub2-install-was-found'
@@ -9,8 +9,12 @@ from pytest import (
 import kiwi.defaults as defaults
 
 from kiwi.filesystem.base import FileSystemBase
+from kiwi.utils.sync_manifest import SyncManifest
 
-from kiwi.exceptions import KiwiFileSystemSyncError
+from kiwi.exceptions import (
+    KiwiFileSystemSyncError,
+    KiwiDataSyncError
+)
 
 
 class TestFileSystemBase:
@@ -90,6 +94,85 @@ class TestFileSystemBase:
         filesystem_mount.mount.assert_called_once_with([])
         assert self.fsbase.get_mountpoint() == 'tmpdir'
 
+    @patch('kiwi.filesystem.base.MountManager')
+    @patch('kiwi.filesystem.base.DataSync')
+    @patch('kiwi.filesystem.base.SyncManifest.get')
+    @patch('kiwi.filesystem.base.Temporary.new_dir')
+    @patch('os.path.exists')
+    def test_sync_data_offline(
+        self, mock_exists, mock_Temporary_new_dir, mock_SyncManifest_get,
+        mock_sync, mock_mount
+    ):
+        mock_exists.return_value = True
+        mock_Temporary_new_dir.return_value.name = 'data_dir'
+        filesystem_mount = Mock()
+        mock_mount.return_value = filesystem_mount
+        fsbase = FileSystemBase(self.fsbase.device_provider, 'root_dir')
+        fsbase.device_create_args = {
+            'label': 'ROOT', 'size': 0, 'unit': 'k', 'uuid': 'uuid'
+        }
+        populate_args = []
+
+        def create_on_device(**create_args):
+            populate_args.extend(fsbase.populate_args)
+
+        fsbase.create_on_device = Mock(side_effect=create_on_device)
+        fsbase._get_populate_args = Mock(return_value=['-d', 'data_dir'])
+
+        assert fsbase.sync_data(['exclude_me'], offline=True) == \
+            filesystem_mount
+
+        mock_SyncManifest_get.assert_called_once_with('root_dir', True)
+        mock_SyncManifest_get.return_value.link.assert_called_once_with(
+            'data_dir', SyncManifest.get_flags(
+                defaults.Defaults.get_sync_options()
+            ), ['exclude_me']
+        )
+        fsbase.create_on_device.assert_called_once_with(
+            label='ROOT', size=0, unit='k', uuid='uuid'
+        )
+        assert populate_args == ['-d', 'data_dir']
+        assert fsbase.populate_args == []
+        assert not mock_sync.called
+        filesystem_mount.mount.assert_called_once_with([])
+
+    @patch('kiwi.filesystem.base.MountManager')
+    @patch('kiwi.filesystem.base.DataSync')
+    @patch('kiwi.filesystem.base.SyncManifest.get')
+    @patch('kiwi.filesystem.base.Temporary.new_dir')
+    @patch('os.path.exists')
+    def test_sync_data_offline_fallback(
+        self, mock_exists, mock_Temporary_new_dir, mock_SyncManifest_get,
+        mock_sync, mock_mount
+    ):
+        mock_exists.return_value = True
+        fsbase = FileSystemBase(self.fsbase.device_provider, 'root_dir')
+        fsbase.create_on_device = Mock()
+
+        # not created on a device before
+        fsbase.sync_data(offline=True)
+        assert mock_sync.call_count == 1
+
+        # mkfs can't populate from a directory
+        fsbase.device_create_args = {'label': 'ROOT', 'uuid': 'uuid'}
+        fsbase.sync_data(offline=True)
+        assert mock_sync.call_count == 2
+
+        # data tree can't be linked
+        fsbase._get_populate_args = Mock(return_value=['-d', 'data_dir'])
+        mock_SyncManifest_get.return_value.link.side_effect = \
+            KiwiDataSyncError('cross-device link')
+        fsbase.sync_data(offline=True)
+        assert mock_sync.call_count == 3
+
+        # attributes must be applied to the mounted filesystem
+        self.fsbase.device_create_args = fsbase.device_create_args
+        self.fsbase._get_populate_args = fsbase._get_populate_args
+        with patch('kiwi.filesystem.base.Command.run'):
+            self.fsbase.sync_data(offline=True)
+        assert mock_sync.call_count == 4
+        assert not fsbase.create_on_device.called
+
     @patch('kiwi.filesystem.base.VeritySetup')
     def test_create_verity_layer(self, mock_VeritySetup):
         self.fsbase.create_verity_layer()
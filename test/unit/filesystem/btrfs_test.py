@@ -51,3 +51,25 @@ class TestFileSystemBtrfs:
         mock_command.assert_called_once_with(
             ['btrfstune', '-f', '-u', '/dev/foo']
         )
+
+    @patch('kiwi.filesystem.btrfs.CommandCapabilities.has_option_in_help')
+    def test_get_populate_args(self, mock_has_option_in_help):
+        mock_has_option_in_help.return_value = True
+        assert self.btrfs._get_populate_args('data_dir') == \
+            ['--rootdir', 'data_dir']
+        mock_has_option_in_help.assert_called_once_with(
+            'mkfs.btrfs', '--rootdir', raise_on_error=False, silent=True
+        )
+        mock_has_option_in_help.return_value = False
+        assert self.btrfs._get_populate_args('data_dir') == []
+
+    @patch('kiwi.filesystem.btrfs.Command.run')
+    def test_create_on_device_populated(self, mock_command):
+        self.btrfs.create_on_device('label', uuid='uuid')
+        assert self.btrfs.device_create_args == {
+            'label': 'label', 'size': 0, 'unit': 'k', 'uuid': 'uuid'
+        }
+        self.btrfs.populate_args = ['--rootdir', 'data_dir']
+        self.btrfs.create_on_device(**self.btrfs.device_create_args)
+        command = mock_command.call_args_list[1][0][0]
+        assert command[-3:-1] == ['--rootdir', 'data_dir']
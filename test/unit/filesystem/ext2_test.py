@@ -50,3 +50,25 @@ class TestFileSystemExt2:
             call(['e2fsck', '-y', '-f', '/dev/foo'], raise_on_error=False),
             call(['tune2fs', '-f', '-U', 'random', '/dev/foo'])
         ]
+
+    @patch('kiwi.filesystem.ext2.CommandCapabilities.has_option_in_help')
+    def test_get_populate_args(self, mock_has_option_in_help):
+        mock_has_option_in_help.return_value = True
+        assert self.ext2._get_populate_args('data_dir') == \
+            ['-d', 'data_dir']
+        mock_has_option_in_help.assert_called_once_with(
+            'mkfs.ext2', '-d root-directory', raise_on_error=False, silent=True
+        )
+        mock_has_option_in_help.return_value = False
+        assert self.ext2._get_populate_args('data_dir') == []
+
+    @patch('kiwi.filesystem.ext2.Command.run')
+    def test_create_on_device_populated(self, mock_command):
+        self.ext2.create_on_device('label', uuid='uuid')
+        assert self.ext2.device_create_args == {
+            'label': 'label', 'size': 0, 'unit': 'k', 'uuid': 'uuid'
+        }
+        self.ext2.populate_args = ['-d', 'data_dir']
+        self.ext2.create_on_device(**self.ext2.device_create_args)
+        command = mock_command.call_args_list[1][0][0]
+        assert command[-3:-1] == ['-d', 'data_dir']
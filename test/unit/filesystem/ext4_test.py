@@ -1,6 +1,13 @@
+import os
+import re
+import shutil
+import subprocess
 from unittest.mock import (
     patch, call
 )
+from pytest import (
+    fixture, mark
+)
 
 import unittest.mock as mock
 
@@ -8,6 +15,10 @@ from kiwi.filesystem.ext4 import FileSystemExt4
 
 
 class TestFileSystemExt4:
+    @fixture(autouse=True)
+    def inject_fixtures(self, tmpdir):
+        self._tmpdir = tmpdir
+
     @patch('os.path.exists')
     def setup(self, mock_exists):
         mock_exists.return_value = True
@@ -50,3 +61,73 @@ class TestFileSystemExt4:
             call(['e2fsck', '-y', '-f', '/dev/foo'], raise_on_error=False),
             call(['tune2fs', '-f', '-U', 'random', '/dev/foo'])
         ]
+
+    @patch('kiwi.filesystem.ext4.CommandCapabilities.has_option_in_help')
+    def test_get_populate_args(self, mock_has_option_in_help):
+        mock_has_option_in_help.return_value = True
+        assert self.ext4._get_populate_args('data_dir') == \
+            ['-d', 'data_dir']
+        mock_has_option_in_help.assert_called_once_with(
+            'mkfs.ext4', '-d root-directory', raise_on_error=False, silent=True
+        )
+        mock_has_option_in_help.return_value = False
+        assert self.ext4._get_populate_args('data_dir') == []
+
+    @patch('kiwi.filesystem.ext4.Command.run')
+    def test_create_on_device_populated(self, mock_command):
+        self.ext4.create_on_device('label', uuid='uuid')
+        assert self.ext4.device_create_args == {
+            'label': 'label', 'size': 0, 'unit': 'k', 'uuid': 'uuid'
+        }
+        self.ext4.populate_args = ['-d', 'data_dir']
+        self.ext4.create_on_device(**self.ext4.device_create_args)
+        command = mock_command.call_args_list[1][0][0]
+        assert command[-3:-1] == ['-d', 'data_dir']
+
+    @mark.skipif(
+        not shutil.which('mkfs.ext4') or not shutil.which('debugfs'),
+        reason='requires e2fsprogs'
+    )
+    @patch('kiwi.filesystem.base.MountManager')
+    def test_sync_data_offline(self, mock_MountManager):
+        root_dir = self._tmpdir.mkdir('root')
+        root_dir.mkdir('image').join('config.xml').write('<image/>')
+        passwd = root_dir.mkdir('etc').join('passwd')
+        passwd.write('root:x:0:0::/root:/bin/bash')
+        os.chmod(passwd.strpath, 0o640)
+        os.link(passwd.strpath, root_dir.join('etc', 'passwd.link').strpath)
+        os.setxattr(passwd.strpath, 'user.kiwi', b'value')
+        image_file = self._tmpdir.join('image.raw').strpath
+        with open(image_file, 'wb') as image:
+            image.truncate(32 << 20)
+        provider = mock.Mock()
+        provider.get_device = mock.Mock(return_value=image_file)
+        ext4 = FileSystemExt4(provider, root_dir.strpath + '/')
+        ext4.create_on_device(label='ROOT')
+
+        ext4.sync_data(['image'], offline=True)
+
+        mock_MountManager.return_value.mount.assert_called_once_with([])
+
+        def debugfs(request):
+            return subprocess.run(
+                ['debugfs', '-R', request, image_file],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+            ).stdout
+
+        passwd_stat = debugfs('stat /etc/passwd')
+        assert re.search(
+            r'User:\s+{0}\s+Group:\s+{1}\s'.format(
+                os.getuid(), os.getgid()
+            ), passwd_stat
+        )
+        assert 'Mode:  0640' in passwd_stat
+        assert 'Links: 2' in passwd_stat
+        assert 'value' in debugfs('ea_get /etc/passwd user.kiwi')
+        assert 'image' not in debugfs('ls /')
+        superblock = subprocess.run(
+            ['dumpe2fs', '-h', image_file],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+        ).stdout
+        assert ext4.device_create_args['uuid'] in superblock
+        assert 'ROOT' in superblock
@@ -54,3 +54,25 @@ class TestFileSystemXfs:
             call(['xfs_repair', '-L', '/dev/foo']),
             call(['xfs_admin', '-U', 'generate', '/dev/foo'])
         ]
+
+    @patch('kiwi.filesystem.xfs.CommandCapabilities.has_option_in_help')
+    def test_get_populate_args(self, mock_has_option_in_help):
+        mock_has_option_in_help.return_value = True
+        assert self.xfs._get_populate_args('data_dir') == \
+            ['-p', 'file=data_dir,atime=1']
+        mock_has_option_in_help.assert_called_once_with(
+            'mkfs.xfs', 'atime=', raise_on_error=False, silent=True
+        )
+        mock_has_option_in_help.return_value = False
+        assert self.xfs._get_populate_args('data_dir') == []
+
+    @patch('kiwi.filesystem.xfs.Command.run')
+    def test_create_on_device_populated(self, mock_command):
+        self.xfs.create_on_device('label', uuid='uuid')
+        assert self.xfs.device_create_args == {
+            'label': 'label', 'size': 0, 'unit': 'k', 'uuid': 'uuid'
+        }
+        self.xfs.populate_args = ['-p', 'file=data_dir,atime=1']
+        self.xfs.create_on_device(**self.xfs.device_create_args)
+        command = mock_command.call_args_list[1][0][0]
+        assert command[-3:-1] == ['-p', 'file=data_dir,atime=1']
@@ -1,8 +1,11 @@
 from lxml import etree
 from unittest.mock import patch
-from pytest import raises
+from pytest import (
+    raises, fixture
+)
 
 from kiwi.markup.base import MarkupBase
+from kiwi.utils.description_cache import DescriptionCache
 from kiwi.xml_description import XMLDescription
 from kiwi.xml_state import XMLState
 
@@ -14,6 +17,10 @@ from kiwi.exceptions import (
 
 
 class TestMarkupBase:
+    @fixture(autouse=True)
+    def inject_fixtures(self, tmpdir):
+        self._tmpdir = tmpdir
+
     def setup(self):
         self.markup = MarkupBase('../data/example_config.xml')
 
@@ -76,3 +83,61 @@ class TestMarkupBase:
         state = XMLState(xml_data)
         assert state.xml_data.get_repository()[0].get_source().get_path() == \
             'http://example.com'
+
+    @patch('kiwi.markup.base.etree.XSLT')
+    def test_apply_xslt_stylesheets_compiled_once(self, mock_XSLT):
+        mock_XSLT.return_value.return_value = etree.ElementTree(
+            etree.Element('image')
+        )
+        self.markup.apply_xslt_stylesheets('../data/example_config.xml')
+        self.markup.apply_xslt_stylesheets('../data/example_config.xml')
+        assert mock_XSLT.call_count == 1
+        assert mock_XSLT.return_value.call_count == 2
+
+    def test_apply_xslt_stylesheets_from_description_cache(self):
+        DescriptionCache.set_cache_dir(self._tmpdir.strpath)
+        description = '../data/example_include_config_from_description_dir.xml'
+        markup = MarkupBase(description)
+        xml_description = markup.apply_xslt_stylesheets(description)
+        assert markup.description_cache_key
+        assert not markup.description_validated
+        DescriptionCache.store(markup.description_cache_key, xml_description)
+        with open(xml_description) as upgraded:
+            upgraded_description = upgraded.read()
+
+        markup = MarkupBase(description)
+        with patch.object(MarkupBase, '_transform') as mock_transform:
+            cached_description = markup.apply_xslt_stylesheets(description)
+            assert not mock_transform.called
+        assert markup.description_validated
+        with open(cached_description) as cached:
+            assert cached.read() == upgraded_description
+
+    def test_apply_xslt_stylesheets_include_changed(self):
+        include_file = self._tmpdir.join('include.xml')
+        include_file.write('<image><repository><source path="a"/>'
+                           '</repository></image>')
+        description = self._tmpdir.join('config.xml')
+        description.write(
+            '<image schemaversion="8.5" name="a">'
+            '<include from="this://include.xml"/></image>'
+        )
+        DescriptionCache.set_cache_dir(self._tmpdir.join('cache').strpath)
+        markup = MarkupBase(description.strpath)
+        markup.apply_xslt_stylesheets(description.strpath)
+        cache_key = markup.description_cache_key
+        include_file.write('<image><repository><source path="b"/>'
+                           '</repository></image>')
+        markup.apply_xslt_stylesheets(description.strpath)
+        assert markup.description_cache_key != cache_key
+
+    def test_apply_xslt_stylesheets_include_missing_no_cache_key(self):
+        DescriptionCache.set_cache_dir(self._tmpdir.strpath)
+        markup = MarkupBase(
+            '../data/example_include_config_missing_reference.xml'
+        )
+        with raises(KiwiIncludFileNotFoundError):
+            markup.apply_xslt_stylesheets(
+                '../data/example_include_config_missing_reference.xml'
+            )
+        assert markup.description_cache_key == ''
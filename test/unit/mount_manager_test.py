@@ -195,8 +195,22 @@ class TestMountManager:
             ['umount', '/some/mountpoint']
         )
 
+    @patch('kiwi.mount_manager.MountTable.is_mountpoint')
     @patch('kiwi.mount_manager.Command.run')
-    def test_is_mounted_true(self, mock_command):
+    def test_is_mounted_from_mount_table(
+        self, mock_command, mock_is_mountpoint
+    ):
+        mock_is_mountpoint.return_value = True
+        assert self.mount_manager.is_mounted() is True
+        mock_is_mountpoint.return_value = False
+        assert self.mount_manager.is_mounted() is False
+        mock_is_mountpoint.assert_called_with('/some/mountpoint')
+        assert not mock_command.called
+
+    @patch('kiwi.mount_manager.MountTable.is_mountpoint')
+    @patch('kiwi.mount_manager.Command.run')
+    def test_is_mounted_true(self, mock_command, mock_is_mountpoint):
+        mock_is_mountpoint.return_value = None
         command = Mock()
         command.returncode = 0
         mock_command.return_value = command
@@ -206,8 +220,10 @@ class TestMountManager:
             raise_on_error=False
         )
 
+    @patch('kiwi.mount_manager.MountTable.is_mountpoint')
     @patch('kiwi.mount_manager.Command.run')
-    def test_is_mounted_false(self, mock_command):
+    def test_is_mounted_false(self, mock_command, mock_is_mountpoint):
+        mock_is_mountpoint.return_value = None
         command = Mock()
         command.returncode = 1
         mock_command.return_value = command
@@ -216,3 +232,58 @@ class TestMountManager:
             command=['mountpoint', '-q', '/some/mountpoint'],
             raise_on_error=False
         )
+
+    @patch('kiwi.mount_manager.MountTable.invalidate')
+    @patch('kiwi.mount_manager.MountTable.get_mountpoints')
+    @patch('kiwi.mount_manager.Command.run')
+    def test_umount_tree(
+        self, mock_command, mock_get_mountpoints, mock_invalidate
+    ):
+        mock_get_mountpoints.return_value = [
+            '/some/mountpoint/proc', '/some/mountpoint'
+        ]
+        assert self.mount_manager.umount_tree() is True
+        mock_get_mountpoints.assert_called_once_with('/some/mountpoint')
+        assert mock_command.call_args_list == [
+            call(['umount', '/some/mountpoint/proc']),
+            call(['umount', '/some/mountpoint'])
+        ]
+        mock_invalidate.assert_called_once_with()
+
+    @patch('kiwi.mount_manager.MountTable.get_mountpoints')
+    @patch('kiwi.mount_manager.Command.run')
+    @patch('time.sleep')
+    def test_umount_tree_busy(
+        self, mock_sleep, mock_command, mock_get_mountpoints
+    ):
+        def command_call(args):
+            if args[-1] == '/some/mountpoint/proc':
+                raise KiwiCommandError('error')
+            if args == ['umount', '/some/mountpoint']:
+                raise KiwiCommandError('error')
+
+        mock_command.side_effect = command_call
+        mock_get_mountpoints.return_value = [
+            '/some/mountpoint/proc', '/some/mountpoint'
+        ]
+        with self._caplog.at_level(logging.WARNING):
+            assert self.mount_manager.umount_tree(
+                raise_on_busy=False
+            ) is False
+        assert mock_command.call_args_list == [
+            call(['umount', '/some/mountpoint/proc']),
+            call(['umount', '--lazy', '/some/mountpoint/proc']),
+            call(['umount', '/some/mountpoint']),
+            call(['umount', '--lazy', '/some/mountpoint'])
+        ]
+        assert not mock_sleep.called
+        assert '/some/mountpoint/proc still busy' in self._caplog.text
+
+    @patch('kiwi.mount_manager.MountTable.get_mountpoints')
+    @patch('kiwi.mount_manager.MountManager.umount')
+    def test_umount_tree_no_mount_table(
+        self, mock_umount, mock_get_mountpoints
+    ):
+        mock_get_mountpoints.return_value = None
+        assert self.mount_manager.umount_tree() == mock_umount.return_value
+        mock_umount.assert_called_once_with(True)
@@ -38,6 +38,16 @@ class TestOCI:
         OCI.new()
         mock_OCIBuildah.assert_called_once_with()
 
+    @patch('kiwi.oci_tools.native.OCINative')
+    @patch('kiwi.oci_tools.RuntimeConfig')
+    def test_oci_tool_native(
+        self, mock_RuntimeConfig, mock_OCINative
+    ):
+        self.runtime_config.get_oci_archive_tool.return_value = 'native'
+        mock_RuntimeConfig.return_value = self.runtime_config
+        OCI.new()
+        mock_OCINative.assert_called_once_with()
+
     @patch('kiwi.oci_tools.RuntimeConfig')
     def test_oci_tool_not_supported(self, mock_RuntimeConfig):
         self.runtime_config.get_oci_archive_tool.return_value = 'foo'
@@ -0,0 +1,292 @@
+import os
+import json
+import shutil
+import tarfile
+from unittest.mock import (
+    patch, call
+)
+from pytest import (
+    raises, fixture, mark
+)
+
+from kiwi.oci_tools.native import OCINative
+from kiwi.utils.sync_manifest import SyncManifest
+
+from kiwi.exceptions import KiwiOCIArchiveToolError
+
+
+class TestOCINative:
+    @fixture(autouse=True)
+    def inject_fixtures(self, tmpdir):
+        self._tmpdir = tmpdir
+        self.root_dir = tmpdir.mkdir('root')
+        self.root_dir.mkdir('etc').join('passwd').write('root:x:0:0')
+        self.root_dir.mkdir('usr').mkdir('bin').join('tool').write('tool')
+        os.link(
+            self.root_dir.join('usr', 'bin', 'tool').strpath,
+            self.root_dir.join('usr', 'bin', 'tool-link').strpath
+        )
+        os.symlink('tool', self.root_dir.join('usr', 'bin', 'alias').strpath)
+        self.root_dir.mkdir('opt').mkdir('data').join('file').write('data')
+        self.root_dir.mkdir('tmp').join('session').write('session')
+        self.oci_config = {
+            'container_name': 'foo',
+            'container_tag': 'latest',
+            'maintainer': 'tux',
+            'user': 'root',
+            'workingdir': '/root',
+            'entry_command': ['/bin/bash', '-x'],
+            'entry_subcommand': ['ls', '-l'],
+            'volumes': ['/var/log'],
+            'stopsignal': 'SIGINT',
+            'expose_ports': ['80'],
+            'environment': {'PATH': '/bin', 'LANG': 'C'},
+            'labels': {'name': 'value'},
+            'history': {'created_by': 'kiwi', 'comment': 'base'}
+        }
+        self.exclude_list = ['image', 'tmp/*']
+        with patch.dict('os.environ', {'SOURCE_DATE_EPOCH': '1700000000'}):
+            self.oci = self.new_oci('oci_base')
+
+    def new_oci(self, name, layer_compression='gzip'):
+        with patch('kiwi.oci_tools.native.Temporary') as mock_Temporary:
+            with patch('kiwi.oci_tools.native.RuntimeConfig') as mock_Config:
+                mock_Temporary.return_value.new_dir.return_value.name = \
+                    self._tmpdir.mkdir(name).strpath
+                mock_Config.return_value.get_oci_layer_compression.\
+                    return_value = layer_compression
+                return OCINative()
+
+    def create_base_image(self):
+        self.oci.init_container()
+        self.oci.unpack()
+        self.oci.sync_rootfs(self.root_dir.strpath, self.exclude_list)
+        self.oci.repack(self.oci_config)
+        self.oci.set_config(self.oci_config)
+        self.oci.post_process()
+        archive = self._tmpdir.join('base.tar').strpath
+        self.oci.export_container_image(archive, 'oci-archive', 'foo:latest')
+        return archive
+
+    def get_layer_members(self, oci):
+        with oci._open_layer(oci.manifest['layers'][-1]['digest']) as tar:
+            return {member.name: member for member in tar}
+
+    def test_create_base_image(self):
+        archive = self.create_base_image()
+        assert self.oci.creation_date == '2023-11-14T22:13:20+00:00'
+        members = self.get_layer_members(self.oci)
+        assert sorted(members) == [
+            'etc', 'etc/passwd', 'opt', 'opt/data', 'opt/data/file',
+            'tmp', 'usr', 'usr/bin', 'usr/bin/alias', 'usr/bin/tool',
+            'usr/bin/tool-link'
+        ]
+        assert members['usr/bin/alias'].linkname == 'tool'
+        links = [members['usr/bin/tool'], members['usr/bin/tool-link']]
+        assert sorted(member.type for member in links) == [
+            tarfile.REGTYPE, tarfile.LNKTYPE
+        ]
+        assert self.oci.manifest['layers'][0]['mediaType'] == \
+            'application/vnd.oci.image.layer.v1.tar+gzip'
+
+        with tarfile.open(archive) as image:
+            assert sorted(image.getnames())[-2:] == ['index.json', 'oci-layout']
+            index = json.load(image.extractfile('index.json'))
+            descriptor = index['manifests'][0]
+            assert descriptor['annotations'] == {
+                'org.opencontainers.image.ref.name': 'foo:latest'
+            }
+            manifest = json.load(
+                image.extractfile(
+                    'blobs/sha256/' + descriptor['digest'].split(':')[1]
+                )
+            )
+            assert len(manifest['layers']) == 1
+            config = json.load(
+                image.extractfile(
+                    'blobs/sha256/' + manifest['config']['digest'].split(':')[1]
+                )
+            )
+        assert config['author'] == 'tux'
+        assert config['config'] == {
+            'User': 'root',
+            'WorkingDir': '/root',
+            'Entrypoint': ['/bin/bash', '-x'],
+            'Cmd': ['ls', '-l'],
+            'Volumes': {'/var/log': {}},
+            'StopSignal': 'SIGINT',
+            'ExposedPorts': {'80': {}},
+            'Env': ['LANG=C', 'PATH=/bin'],
+            'Labels': {'name': 'value'}
+        }
+        assert config['history'] == [
+            {
+                'created': '2023-11-14T22:13:20+00:00',
+                'created_by': 'kiwi', 'comment': 'base'
+            }
+        ]
+        assert config['rootfs']['diff_ids'][0].startswith('sha256:')
+        # the layout only keeps blobs referenced by an image
+        assert len(os.listdir(self._tmpdir.join(
+            'oci_base', 'oci_layout', 'blobs', 'sha256'
+        ).strpath)) == 3
+
+    @mark.skipif(not shutil.which('zstd'), reason='zstd not installed')
+    def test_create_derived_image(self):
+        archive = self.create_base_image()
+        self.root_dir.join('etc', 'passwd').remove()
+        self.root_dir.join('opt', 'data').remove()
+        self.root_dir.join('opt', 'data').write('now a file')
+        self.root_dir.join('tmp', 'session').remove()
+        self.root_dir.join('etc', 'group').write('root:x:0:')
+        os.utime(self.root_dir.join('etc').strpath, (0, 0))
+        os.utime(self.root_dir.join('opt').strpath, (0, 0))
+
+        oci = self.new_oci('oci_derived', layer_compression='zstd')
+        oci.import_container_image(f'oci-archive:{archive}:foo:latest')
+        oci.config['config']['Labels'] = None
+        oci.unpack()
+        oci.sync_rootfs(self.root_dir.strpath, self.exclude_list)
+        oci_config = {
+            'container_name': 'foo',
+            'container_tag': 'derived',
+            'entry_command': [],
+            'environment': {'PATH': '/usr/bin'}
+        }
+        oci.repack(oci_config)
+        oci.set_config(oci_config)
+
+        members = self.get_layer_members(oci)
+        assert sorted(members) == [
+            'etc', 'etc/.wh.passwd', 'etc/group', 'opt', 'opt/.wh.data',
+            'opt/data'
+        ]
+        assert oci.manifest['layers'][1]['mediaType'] == \
+            'application/vnd.oci.image.layer.v1.tar+zstd'
+        assert len(oci.config['rootfs']['diff_ids']) == 2
+        assert 'Entrypoint' not in oci.config['config']
+        assert oci.config['config']['Env'] == ['LANG=C', 'PATH=/usr/bin']
+        assert 'Labels' not in oci.config['config']
+        assert oci._find_manifest('derived')['digest'] != \
+            oci._find_manifest('base_layer')['digest']
+
+        target_dir = self._tmpdir.mkdir('import')
+        target_dir.mkdir('etc').join('passwd').write('from somewhere')
+        oci.import_rootfs(target_dir.strpath)
+        assert not target_dir.join('etc', 'passwd').exists()
+        assert target_dir.join('etc', 'group').read() == 'root:x:0:'
+        assert target_dir.join('opt', 'data').read() == 'now a file'
+        assert target_dir.join('usr', 'bin', 'tool').read() == 'tool'
+        assert not target_dir.join('tmp', 'session').exists()
+        assert not [
+            name for name in os.listdir(target_dir.strpath)
+            if name.startswith('.wh.')
+        ]
+
+    def test_import_container_image_archive_no_tag(self):
+        archive = self.create_base_image()
+        oci = self.new_oci('oci_import')
+        oci.import_container_image(f'oci-archive:{archive}')
+        assert oci.manifest == self.oci.manifest
+        assert oci._find_manifest('base_layer')
+
+    def test_import_container_image_archive_unknown_tag(self):
+        archive = self.create_base_image()
+        oci = self.new_oci('oci_import')
+        with raises(KiwiOCIArchiveToolError):
+            oci.import_container_image(f'oci-archive:{archive}:foo:other')
+
+    def test_import_container_image_archive_broken(self):
+        broken = self._tmpdir.join('broken.tar')
+        broken.write('no tar archive')
+        oci = self.new_oci('oci_import')
+        with raises(KiwiOCIArchiveToolError):
+            oci.import_container_image(f'oci-archive:{broken.strpath}')
+
+    @patch.object(OCINative, '_skopeo_provides_tmpdir_option')
+    @patch('kiwi.oci_tools.native.Command.run')
+    def test_import_container_image_skopeo(
+        self, mock_Command_run, mock_skopeo_provides_tmpdir_option
+    ):
+        mock_skopeo_provides_tmpdir_option.return_value = True
+        layout = self._tmpdir.join('oci_base', 'oci_layout').strpath
+        self.create_base_image()
+        self.oci._set_tag(self.oci._find_manifest('latest'), 'base_layer')
+        self.oci.import_container_image('docker-archive:image.tar')
+        mock_Command_run.assert_called_once_with(
+            [
+                'skopeo', 'copy', 'docker-archive:image.tar',
+                f'oci:{layout}:base_layer', '--tmpdir', '/var/tmp'
+            ]
+        )
+        assert self.oci.container_tag == 'base_layer'
+
+    @patch.object(OCINative, '_skopeo_provides_tmpdir_option')
+    @patch('kiwi.oci_tools.native.Command.run')
+    def test_export_container_image_docker_archive(
+        self, mock_Command_run, mock_skopeo_provides_tmpdir_option
+    ):
+        mock_skopeo_provides_tmpdir_option.return_value = False
+        layout = self._tmpdir.join('oci_base', 'oci_layout').strpath
+        self.oci.export_container_image(
+            'image.tar', 'docker-archive', 'foo:latest', ['foo:1.0']
+        )
+        assert mock_Command_run.call_args_list == [
+            call(
+                [
+                    'skopeo', 'copy', f'oci:{layout}:base_layer',
+                    'docker-archive:image.tar:foo:latest',
+                    '--additional-tag', 'foo:1.0'
+                ]
+            )
+        ]
+
+    def test_find_manifest_platform(self):
+        self.oci.init_container()
+        manifest = self.oci._write_blob(b'{}', self.oci.media_type_manifest)
+        index = self.oci._write_blob(
+            json.dumps(
+                {
+                    'schemaVersion': 2,
+                    'manifests': [
+                        dict(manifest, platform={'architecture': 'amd64'}),
+                        dict(manifest, platform={'architecture': 'arm64'})
+                    ]
+                }
+            ).encode(), self.oci.media_type_index
+        )
+        self.oci._set_tag(index, 'multi')
+        with patch('kiwi.defaults.PLATFORM_MACHINE', 'aarch64'):
+            assert self.oci._find_manifest('multi')['platform'] == {
+                'architecture': 'arm64'
+            }
+        with patch('kiwi.defaults.PLATFORM_MACHINE', 's390x'):
+            with raises(KiwiOCIArchiveToolError):
+                self.oci._find_manifest('multi')
+
+    def test_repack_failed(self):
+        self.oci.init_container()
+        self.oci.sync_rootfs(self.root_dir.strpath)
+        with SyncManifest.share():
+            SyncManifest.get(self.root_dir.strpath, one_file_system=True)
+            # the file disappears after the root tree was scanned
+            self.root_dir.join('etc', 'passwd').remove()
+            with raises(KiwiOCIArchiveToolError):
+                self.oci.repack(self.oci_config)
+        assert os.listdir(self._tmpdir.join(
+            'oci_base', 'oci_layout', 'blobs', 'sha256'
+        ).strpath) == []
+
+    def test_apply_whiteout(self):
+        target_dir = self._tmpdir.mkdir('target')
+        target_dir.mkdir('etc').join('passwd').write('passwd')
+        target_dir.mkdir('var').mkdir('log').join('messages').write('log')
+        outside = self._tmpdir.mkdir('outside')
+        outside.join('file').write('file')
+        os.symlink(outside.strpath, target_dir.join('escape').strpath)
+        self.oci._apply_whiteout(target_dir.strpath, 'etc/.wh.passwd')
+        self.oci._apply_whiteout(target_dir.strpath, 'var/.wh..wh..opq')
+        self.oci._apply_whiteout(target_dir.strpath, 'escape/.wh.file')
+        assert target_dir.join('etc').listdir() == []
+        assert target_dir.join('var').listdir() == []
+        assert outside.join('file').exists()
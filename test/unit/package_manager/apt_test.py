@@ -120,11 +120,12 @@ class TestPackageManagerApt:
     @patch('kiwi.command.Command.call')
     @patch('kiwi.package_manager.apt.Temporary.new_file')
     @patch('kiwi.package_manager.apt.Temporary.new_dir')
+    @patch('kiwi.package_manager.apt.ArchiveDeb.extract_all')
     @patch('os.path.exists')
     def test_process_install_requests_bootstrap(
-        self, mock_os_path_exists, mock_Temporary_new_dir,
-        mock_Temporary_new_file, mock_Command_call, mock_Command_run,
-        mock_pathlib_Path
+        self, mock_os_path_exists, mock_ArchiveDeb_extract_all,
+        mock_Temporary_new_dir, mock_Temporary_new_file, mock_Command_call,
+        mock_Command_run, mock_pathlib_Path
     ):
         def command_run(command, env=None):
             # mock a postinst error for base-passwd to test the retry logic
@@ -167,24 +168,6 @@ class TestPackageManagerApt:
                     'apt'
                 ], self.env
             ),
-            call(
-                [
-                    'bash', '-c',
-                    'dpkg-deb --fsys-tarfile base-passwd | tar -C root-dir -x'
-                ], self.env
-            ),
-            call(
-                [
-                    'bash', '-c',
-                    'dpkg-deb --fsys-tarfile usrmerge | tar -C root-dir -x'
-                ], self.env
-            ),
-            call(
-                [
-                    'bash', '-c',
-                    'dpkg-deb --fsys-tarfile vim | tar -C root-dir -x'
-                ], self.env
-            ),
             call(
                 [
                     'dpkg', '-e', 'base-passwd', 'tempdir/base-passwd'
@@ -275,6 +258,24 @@ class TestPackageManagerApt:
                 ], new_env
             )
         ]
+        mock_ArchiveDeb_extract_all.assert_called_once_with(
+            ['base-passwd', 'usrmerge', 'vim'], 'root-dir', 'tempdir'
+        )
+
+    @patch('kiwi.command.Command.run')
+    @patch('os.path.isdir')
+    @patch('os.path.exists')
+    def test_run_bootstrap_scripts_extracted(
+        self, mock_os_path_exists, mock_os_path_isdir, mock_Command_run
+    ):
+        mock_os_path_exists.return_value = False
+        mock_os_path_isdir.return_value = True
+        self.manager._run_bootstrap_scripts(
+            ['/cache/vim.deb'], metadata_dir='tempdir'
+        )
+        # no dpkg -e call for already extracted control files
+        assert mock_Command_run.called is False
+        mock_os_path_isdir.assert_called_once_with('tempdir/vim.deb')
 
     @patch('kiwi.command.Command.call')
     @patch('kiwi.command.Command.run')
@@ -388,5 +389,11 @@ class TestPackageManagerApt:
     def test_match_package_installed(self):
         assert self.manager.match_package_installed('foo', 'Unpacking foo')
 
+    def test_get_installed_package_name(self):
+        assert self.manager.get_installed_package_name(
+            'Unpacking foo-bar:amd64 (1.2-3) ...'
+        ) == 'foo-bar'
+        assert self.manager.get_installed_package_name('foo') is None
+
     def test_match_package_deleted(self):
         assert self.manager.match_package_deleted('foo', 'Removing foo')
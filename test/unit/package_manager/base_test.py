@@ -71,6 +71,10 @@ class TestPackageManagerBase:
         with raises(NotImplementedError):
             self.manager.match_package_installed('package_name', 'log')
 
+    def test_get_installed_package_name(self):
+        with raises(NotImplementedError):
+            self.manager.get_installed_package_name('log')
+
     def test_match_package_deleted(self):
         with raises(NotImplementedError):
             self.manager.match_package_deleted('package_name', 'log')
@@ -210,6 +210,12 @@ class TestPackageManagerDnf4:
     def test_match_package_installed(self):
         assert self.manager.match_package_installed('foo', 'Installing  : foo')
 
+    def test_get_installed_package_name(self):
+        assert self.manager.get_installed_package_name(
+            '  Installing       : foo-bar-1:1.2-3.fc38.x86_64     1/3'
+        ) == 'foo-bar'
+        assert self.manager.get_installed_package_name('foo') is None
+
     def test_match_package_deleted(self):
         assert self.manager.match_package_deleted('foo', 'Removing: foo')
 
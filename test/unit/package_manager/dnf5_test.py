@@ -194,6 +194,12 @@ class TestPackageManagerDnf5:
     def test_match_package_installed(self):
         assert self.manager.match_package_installed('foo', 'Installing  : foo')
 
+    def test_get_installed_package_name(self):
+        assert self.manager.get_installed_package_name(
+            '[1/3] Installing foo-bar-0:1.2-3.fc40.x86_64 100% | 1 MiB/s'
+        ) == 'foo-bar'
+        assert self.manager.get_installed_package_name('foo') is None
+
     def test_match_package_deleted(self):
         assert self.manager.match_package_deleted('foo', 'Removing: foo')
 
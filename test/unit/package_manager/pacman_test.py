@@ -145,5 +145,11 @@ class TestPackageManagerPacman:
     def test_match_package_installed(self):
         assert self.manager.match_package_installed('foo', ' installing foo')
 
+    def test_get_installed_package_name(self):
+        assert self.manager.get_installed_package_name(
+            '(1/3) installing foo-bar  [####] 100%'
+        ) == 'foo-bar'
+        assert self.manager.get_installed_package_name('foo') is None
+
     def test_match_package_deleted(self):
         assert self.manager.match_package_deleted('foo', ' removing foo')
@@ -149,6 +149,12 @@ class TestPackageManagerZypper:
     def test_match_package_installed(self):
         assert self.manager.match_package_installed('foo', 'Installing: foo')
 
+    def test_get_installed_package_name(self):
+        assert self.manager.get_installed_package_name(
+            '(1/3) Installing: foo-bar-1.2.3-150500.1.1.x86_64 [...done]'
+        ) == 'foo-bar'
+        assert self.manager.get_installed_package_name('foo') is None
+
     def test_match_package_deleted(self):
         assert self.manager.match_package_deleted('foo', 'Removing: foo')
 
@@ -132,9 +132,11 @@ class TestPartitionerGpt:
             ['sgdisk', '--resize-table', '42', '/dev/loop0']
         )
 
+    @patch('kiwi.partitioner.gpt.BlockID.invalidate')
     @patch('kiwi.partitioner.gpt.Command.run')
-    def test_set_uuid(self, mock_Command_run):
+    def test_set_uuid(self, mock_Command_run, mock_BlockID_invalidate):
         self.partitioner.set_uuid(42, 'ID')
         mock_Command_run.assert_called_once_with(
             ['sgdisk', '--typecode', '42:ID', '/dev/loop0']
         )
+        mock_BlockID_invalidate.assert_called_once_with()
@@ -158,3 +158,37 @@ class TestPath:
         assert Path.first_exists('artificial') == '.'
         assert Path.first_exists('foo/bar') == '.'
         assert Path.first_exists('/x/y/z') == '/'
+
+    def test_clone(self, tmpdir):
+        source = tmpdir.join('source')
+        source.write('data')
+        os.chmod(source.strpath, 0o640)
+        target = tmpdir.join('target')
+        target.write('old')
+        assert Path.clone(source.strpath, target.strpath) in (
+            'reflink', 'copy'
+        )
+        assert target.read() == 'data'
+        assert os.stat(target.strpath).st_mode & 0o777 == 0o640
+        assert os.stat(target.strpath).st_ino != \
+            os.stat(source.strpath).st_ino
+
+    @patch('fcntl.ioctl')
+    def test_clone_fallbacks(self, mock_ioctl, tmpdir):
+        mock_ioctl.side_effect = OSError
+        source = tmpdir.join('source')
+        source.write('data')
+        target = tmpdir.join('target')
+        assert Path.clone(
+            source.strpath, target.strpath, allow_hardlink=True
+        ) == 'hardlink'
+        assert os.stat(target.strpath).st_ino == \
+            os.stat(source.strpath).st_ino
+        assert Path.clone(source.strpath, target.strpath) == 'copy'
+        assert target.read() == 'data'
+        assert os.stat(target.strpath).st_ino != \
+            os.stat(source.strpath).st_ino
+        with patch('os.link', side_effect=OSError):
+            assert Path.clone(
+                source.strpath, target.strpath, allow_hardlink=True
+            ) == 'copy'
@@ -0,0 +1,155 @@
+import os
+import json
+import logging
+import threading
+from unittest.mock import patch
+from pytest import (
+    raises, fixture
+)
+
+from kiwi.runtime_check_scheduler import RuntimeCheckScheduler
+
+from kiwi.exceptions import KiwiRuntimeError
+
+
+class FakeChecker:
+    host_checks = ('check_host',)
+
+    def __init__(self):
+        self.calls = []
+        self.threads = set()
+        self.barrier = threading.Barrier(2, timeout=5)
+
+    def check_host(self, target_dir):
+        self.calls.append(('check_host', target_dir))
+
+    def check_a(self):
+        self.threads.add(threading.get_ident())
+        self.barrier.wait()
+        self.calls.append(('check_a',))
+
+    def check_b(self):
+        self.threads.add(threading.get_ident())
+        self.barrier.wait()
+        self.calls.append(('check_b',))
+
+    def check_fail_first(self):
+        raise KiwiRuntimeError('first')
+
+    def check_fail_second(self):
+        raise KiwiRuntimeError('second')
+
+    def check_fail_host(self, target_dir):
+        raise KiwiRuntimeError(target_dir)
+
+
+class TestRuntimeCheckScheduler:
+    @fixture(autouse=True)
+    def inject_fixtures(self, caplog, tmpdir):
+        self._caplog = caplog
+        self._tmpdir = tmpdir
+
+    def setup(self):
+        self.checker = FakeChecker()
+        self.scheduler = RuntimeCheckScheduler(self.checker, 'digest')
+
+    def setup_method(self, cls):
+        self.setup()
+
+    def test_run_concurrently(self):
+        # both checks wait for each other, this only passes
+        # if they run at the same time
+        with self._caplog.at_level(logging.DEBUG):
+            durations = self.scheduler.run({'check_a': [], 'check_b': []})
+        assert sorted(self.checker.calls) == [('check_a',), ('check_b',)]
+        assert len(self.checker.threads) == 2
+        assert sorted(durations) == ['check_a', 'check_b']
+        assert self._caplog.text.index('Runtime check: check_a: passed') < \
+            self._caplog.text.index('Runtime check: check_b: passed')
+
+    def test_run_raises_first_error_in_order(self):
+        with raises(KiwiRuntimeError) as issue:
+            self.scheduler.run(
+                {
+                    'check_host': ['/target'],
+                    'check_fail_second': [],
+                    'check_fail_first': []
+                }
+            )
+        assert 'second' in str(issue.value)
+        assert self.checker.calls == [('check_host', '/target')]
+
+    def test_run_host_check_cached(self):
+        cache_file = os.sep.join([self._tmpdir.strpath, 'kiwi', 'checks.json'])
+        RuntimeCheckScheduler.set_cache_file(cache_file)
+        self.scheduler.run({'check_host': ['/target']})
+        with open(cache_file) as cache:
+            assert list(json.load(cache).values()) == ['check_host']
+
+        # a new invocation skips the host check for the same description
+        RuntimeCheckScheduler.cache = {}
+        RuntimeCheckScheduler.set_cache_file(cache_file)
+        checker = FakeChecker()
+        with self._caplog.at_level(logging.DEBUG):
+            RuntimeCheckScheduler(checker, 'digest').run(
+                {'check_host': ['/target']}
+            )
+        assert checker.calls == []
+        assert 'check_host: passed before, skipped' in self._caplog.text
+
+        # another description or other arguments run the check again
+        RuntimeCheckScheduler(checker, 'other').run(
+            {'check_host': ['/target']}
+        )
+        RuntimeCheckScheduler(checker, 'digest').run(
+            {'check_host': ['/other']}
+        )
+        assert checker.calls == [
+            ('check_host', '/target'), ('check_host', '/other')
+        ]
+
+        RuntimeCheckScheduler.invalidate_cache()
+        assert RuntimeCheckScheduler.cache == {}
+        assert not os.path.exists(cache_file)
+
+    def test_run_failed_host_check_not_cached(self):
+        self.checker.check_host = self.checker.check_fail_host
+        with raises(KiwiRuntimeError):
+            self.scheduler.run({'check_host': ['/target']})
+        assert RuntimeCheckScheduler.cache == {}
+
+    def test_run_without_digest_not_cached(self):
+        RuntimeCheckScheduler(self.checker).run({'check_host': ['/target']})
+        assert RuntimeCheckScheduler.cache == {}
+
+    def test_set_cache_file_invalid(self):
+        cache_file = self._tmpdir.join('checks.json')
+        cache_file.write('{invalid')
+        RuntimeCheckScheduler.set_cache_file(cache_file.strpath)
+        assert RuntimeCheckScheduler.cache == {}
+
+    @patch('os.makedirs')
+    def test_write_cache_failed(self, mock_makedirs):
+        mock_makedirs.side_effect = OSError('read-only')
+        RuntimeCheckScheduler.cache_file = '/not/writable/checks.json'
+        with self._caplog.at_level(logging.DEBUG):
+            self.scheduler.run({'check_host': ['/target']})
+        assert 'Failed to write runtime check cache' in self._caplog.text
+
+    @patch('kiwi.runtime_config.RUNTIME_CONFIG', {'runtime_checks': []})
+    def test_get_description_digest(self):
+        config_file = self._tmpdir.join('config.xml')
+        config_file.write('<image/>')
+        digest = RuntimeCheckScheduler.get_description_digest(
+            config_file.strpath, ['profile'], 'oem'
+        )
+        assert digest == RuntimeCheckScheduler.get_description_digest(
+            config_file.strpath, ['profile'], 'oem'
+        )
+        assert digest != RuntimeCheckScheduler.get_description_digest(
+            config_file.strpath, ['profile'], 'iso'
+        )
+        config_file.write('<image name="changed"/>')
+        assert digest != RuntimeCheckScheduler.get_description_digest(
+            config_file.strpath, ['profile'], 'oem'
+        )
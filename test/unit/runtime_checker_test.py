@@ -243,6 +243,28 @@ class TestRuntimeChecker:
         with raises(KiwiRuntimeError):
             runtime_checker.check_container_tool_chain_installed()
 
+    @patch('kiwi.runtime_checker.Path.which')
+    @patch('kiwi.runtime_checker.CommandCapabilities.has_option_in_help')
+    def test_check_container_tool_chain_installed_native(
+        self, mock_has_option_in_help, mock_which
+    ):
+        self.runtime_config.get_oci_archive_tool.return_value = 'native'
+        mock_which.return_value = False
+        mock_has_option_in_help.return_value = True
+        xml_state = XMLState(
+            self.description.load(), ['docker'], 'docker'
+        )
+        runtime_checker = RuntimeChecker(xml_state)
+        # skopeo writes the docker-archive
+        with raises(KiwiRuntimeError):
+            runtime_checker.check_container_tool_chain_installed()
+        xml_state = XMLState(
+            self.description.load(), ['docker'], 'docker'
+        )
+        xml_state.get_build_type_name = Mock(return_value='oci')
+        runtime_checker = RuntimeChecker(xml_state)
+        runtime_checker.check_container_tool_chain_installed()
+
     @patch('kiwi.runtime_checker.Path.which')
     @patch('kiwi.runtime_checker.CommandCapabilities.check_version')
     def test_check_container_tool_chain_installed_with_version(
@@ -152,8 +152,10 @@ class TestRuntimeConfig:
             runtime_config = RuntimeConfig(reread=True)
 
         assert runtime_config.get_xz_options() == ['-a', '-b', 'xxx']
+        assert runtime_config.get_zstd_options() == ['-c', '-d']
         assert runtime_config.is_obs_public() is True
         assert runtime_config.get_bundle_compression() is True
+        assert runtime_config.get_bundle_compression_format() == 'zstd'
         assert runtime_config.get_obs_download_server_url() == \
             'http://example.com'
         assert runtime_config.get_obs_api_server_url() == \
@@ -162,8 +164,15 @@ class TestRuntimeConfig:
         assert runtime_config.get_iso_tool_category() == 'xorriso'
         assert runtime_config.get_iso_media_tag_tool() == 'isomd5sum'
         assert runtime_config.get_oci_archive_tool() == 'umoci'
+        assert runtime_config.get_oci_layer_compression() == 'zstd'
         assert runtime_config.get_mapper_tool() == 'partx'
+        assert runtime_config.get_sync_engine() == 'manifest'
         assert runtime_config.get_package_changes() is True
+        assert runtime_config.get_capabilities_cache() is True
+        assert runtime_config.get_description_cache() is True
+        assert runtime_config.get_bootstrap_cache() is True
+        assert runtime_config.get_bootstrap_cache_max_size() == 10737418240
+        assert runtime_config.get_runtime_checks_cache() is True
         assert runtime_config.get_disabled_runtime_checks() == [
             'check_dracut_module_for_oem_install_in_package_list',
             'check_container_tool_chain_installed'
@@ -184,6 +193,8 @@ class TestRuntimeConfig:
 
         assert runtime_config.get_bundle_compression(default=True) is True
         assert runtime_config.get_bundle_compression(default=False) is False
+        assert runtime_config.get_bundle_compression_format() == 'xz'
+        assert runtime_config.get_zstd_options() is None
         assert runtime_config.is_obs_public() is True
         assert runtime_config.get_obs_download_server_url() == \
             Defaults.get_obs_download_server_url()
@@ -193,8 +204,16 @@ class TestRuntimeConfig:
         assert runtime_config.get_iso_tool_category() == 'xorriso'
         assert runtime_config.get_iso_media_tag_tool() == 'checkmedia'
         assert runtime_config.get_oci_archive_tool() == 'umoci'
+        assert runtime_config.get_oci_layer_compression() == 'gzip'
         assert runtime_config.get_mapper_tool() == 'kpartx'
+        assert runtime_config.get_sync_engine() == 'rsync'
         assert runtime_config.get_package_changes() is False
+        assert runtime_config.get_capabilities_cache() is False
+        assert runtime_config.get_description_cache() is False
+        assert runtime_config.get_bootstrap_cache() is False
+        assert runtime_config.get_bootstrap_cache_max_size() == \
+            Defaults.get_bootstrap_cache_max_size()
+        assert runtime_config.get_runtime_checks_cache() is False
         assert runtime_config.\
             get_credentials_verification_metadata_signing_key_file() == ''
 
@@ -219,11 +238,26 @@ class TestRuntimeConfig:
             assert 'Skipping invalid iso tool category: foo' in \
                 self._caplog.text
 
+        with self._caplog.at_level(logging.WARNING):
+            assert runtime_config.get_bundle_compression_format() == 'xz'
+            assert 'Skipping invalid bundle compression format: foo' in \
+                self._caplog.text
+
         with self._caplog.at_level(logging.WARNING):
             assert runtime_config.get_iso_media_tag_tool() == "checkmedia"
             assert 'Skipping invalid iso media tag tool: foo' in \
                 self._caplog.text
 
+        with self._caplog.at_level(logging.WARNING):
+            assert runtime_config.get_sync_engine() == 'rsync'
+            assert 'Skipping invalid sync engine: foo' in \
+                self._caplog.text
+
+        with self._caplog.at_level(logging.WARNING):
+            assert runtime_config.get_oci_layer_compression() == 'gzip'
+            assert 'Skipping invalid OCI layer compression: foo' in \
+                self._caplog.text
+
     def test_config_sections_other_settings(self):
         with patch.dict('os.environ', {'HOME': '../data/kiwi_config/other'}):
             runtime_config = RuntimeConfig(reread=True)
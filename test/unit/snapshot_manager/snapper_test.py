@@ -31,9 +31,14 @@ class TestSnapshotManagerSnapper:
         assert self.snapper.custom_args['some-arg'] == 'some-val'
         assert not self.snapper.custom_args['quota_groups']
 
+    @patch('kiwi.mount_manager.MountTable.is_mountpoint')
     @patch('kiwi.snapshot_manager.snapper.MountManager')
     @patch('kiwi.snapshot_manager.snapper.Command.run')
-    def test_create_first_snapshot_with_snapper_helper(self, mock_command, mock_mount):
+    def test_create_first_snapshot_with_snapper_helper(
+        self, mock_command, mock_mount, mock_is_mountpoint
+    ):
+        mock_is_mountpoint.return_value = False
+
         def return_snapper_version(command=None, raise_on_error=None, *args):
             mock = Mock()
             snapperCmd = ['chroot', 'snapper', '--version']
@@ -55,10 +60,6 @@ class TestSnapshotManagerSnapper:
         ]
         assert mock_command.call_args_list == [
             call(['chroot', 'root_dir', 'snapper', '--version']),
-            call(
-                command=['mountpoint', '-q', 'root_dir/tmp/mountpoint'],
-                raise_on_error=False
-            ),
             call([
                 'mount', '-n', '--bind', '/tmp/mountpoint',
                 'root_dir/tmp/mountpoint'
@@ -67,10 +68,6 @@ class TestSnapshotManagerSnapper:
                 'chroot', 'root_dir', '/usr/lib/snapper/installation-helper',
                 '--root-prefix', '/tmp/mountpoint/@', '--step', 'filesystem'
             ], None, True, False, True),
-            call(
-                command=['mountpoint', '-q', 'root_dir/tmp/mountpoint'],
-                raise_on_error=False
-            )
         ]
         assert len(extra_mounts) == 1
 
@@ -117,13 +114,17 @@ class TestSnapshotManagerSnapper:
         ]
         assert len(extra_mounts) == 1
 
+    @patch('kiwi.mount_manager.MountTable.is_mountpoint')
     @patch('os.path.exists')
     @patch('shutil.copyfile')
     @patch('kiwi.snapshot_manager.snapper.SysConfig')
     @patch('kiwi.snapshot_manager.snapper.Command.run')
     def test_setup_first_snapshot_with_snapper_helper(
-        self, mock_command, mock_sysconf, mock_copy, mock_os_exists
+        self, mock_command, mock_sysconf, mock_copy, mock_os_exists,
+        mock_is_mountpoint
     ):
+        mock_is_mountpoint.return_value = False
+
         def return_snapper_version(command=None, raise_on_error=None, *args):
             mock = Mock()
             snapperCmd = ['chroot', 'snapper', '--version']
@@ -173,23 +174,11 @@ class TestSnapshotManagerSnapper:
                 'chroot', '/tmp/mountpoint/@/.snapshots/1/snapshot',
                 'snapper', '--version'
             ]),
-            call(
-                command=[
-                    'mountpoint', '-q',
-                    'root_dir/tmp/mountpoint/@/.snapshots/1/snapshot'
-                ], raise_on_error=False
-            ),
             call([
                 'mount', '-n', '--bind',
                 '/tmp/mountpoint/@/.snapshots/1/snapshot',
                 'root_dir/tmp/mountpoint/@/.snapshots/1/snapshot'
             ]),
-            call(
-                command=[
-                    'mountpoint', '-q',
-                    'root_dir/tmp/mountpoint/@/.snapshots/1/snapshot/.snapshots'
-                ], raise_on_error=False
-            ),
             call([
                 'mount', '-n', '--bind',
                 '/tmp/mountpoint/@/.snapshots/1/snapshot/.snapshots',
@@ -200,18 +189,6 @@ class TestSnapshotManagerSnapper:
                 '--root-prefix', '/tmp/mountpoint/@/.snapshots/1/snapshot',
                 '--step', 'config', '--description', 'first root filesystem'
             ], None, True, False, True),
-            call(
-                command=[
-                    'mountpoint', '-q',
-                    'root_dir/tmp/mountpoint/@/.snapshots/1/snapshot/.snapshots'
-                ], raise_on_error=False
-            ),
-            call(
-                command=[
-                    'mountpoint', '-q',
-                    'root_dir/tmp/mountpoint/@/.snapshots/1/snapshot'
-                ], raise_on_error=False
-            ),
             call(['btrfs', 'qgroup', 'create', '1/0', '/tmp/mountpoint']),
             call([
                 'chroot', '/tmp/mountpoint/@/.snapshots/1/snapshot',
@@ -1,4 +1,5 @@
 import io
+import hashlib
 from unittest.mock import (
     patch, call, mock_open, MagicMock, Mock
 )
@@ -113,13 +114,13 @@ class TestSolverRepositoryBase:
             file_handle.read.return_value = 'data'
             assert self.solver._get_deb_packages() == 'data'
             mock_download.assert_called_once_with(
-                'Packages.gz', 'tmpfile'
+                'Packages.gz', 'tmpfile', use_cache=True
             )
         mock_download.reset_mock()
         assert self.solver._get_deb_packages('download_dir') == \
             'download_dir/Packages.gz'
         mock_download.assert_called_once_with(
-            'Packages.gz', 'download_dir/Packages.gz'
+            'Packages.gz', 'download_dir/Packages.gz', use_cache=True
         )
 
     @patch('kiwi.solver.repository.base.Temporary.new_file')
@@ -133,7 +134,7 @@ class TestSolverRepositoryBase:
         mock_tmpfile.return_value = tmpfile
         assert self.solver._get_repomd_xml() == xml_data
         mock_download.assert_called_once_with(
-            'repodata/repomd.xml', 'tmpfile'
+            'repodata/repomd.xml', 'tmpfile', use_cache=True
         )
         mock_parse.assert_called_once_with('tmpfile')
 
@@ -176,67 +177,34 @@ class TestSolverRepositoryBase:
     def test_timestamp(self):
         assert self.solver.timestamp() == 'static'
 
-    @patch('kiwi.solver.repository.base.urlopen')
-    @patch('kiwi.solver.repository.base.Request')
-    def test_download_from_repository_with_credentials(
-        self, mock_request, mock_urlopen
-    ):
-        request = mock.Mock()
-        mock_request.return_value = request
-        location = mock.Mock()
-        location.read.return_value = 'data-from-network'
-        mock_urlopen.return_value = location
+    def test_get_metadata_checksum(self):
+        assert self.solver.get_metadata_checksum() is None
+
+    @patch('kiwi.solver.repository.base.Download')
+    def test_download_from_repository_with_credentials(self, mock_Download):
         self.uri.is_remote.return_value = True
         self.uri.translate.return_value = 'http://myrepo/file'
         self.solver.user = 'user'
         self.solver.secret = 'secret'
-
-        m_open = mock_open()
-        with patch('builtins.open', m_open, create=True):
-            self.solver.download_from_repository(
-                'repodata/file', 'target-file'
-            )
-
-        mock_urlopen.assert_called_once_with(request)
-        mock_request.assert_called_once_with(
-            'http://myrepo/file/repodata/file'
-        )
-        request.add_header.assert_called_once_with(
-            'Authorization', b'Basic dXNlcjpzZWNyZXQ='
-        )
-        m_open.assert_called_once_with(
-            'target-file', 'wb'
-        )
-        m_open.return_value.write.assert_called_once_with(
-            'data-from-network'
+        self.solver.download_from_repository('repodata/file', 'target-file')
+        mock_Download.assert_called_once_with(None)
+        mock_Download.return_value.get.assert_called_once_with(
+            'http://myrepo/file/repodata/file', 'target-file',
+            ('user', 'secret')
         )
 
-    @patch('kiwi.solver.repository.base.urlopen')
-    @patch('kiwi.solver.repository.base.Request')
-    def test_download_from_repository_remote(
-        self, mock_request, mock_urlopen
-    ):
-        request = mock.Mock()
-        mock_request.return_value = request
-        location = mock.Mock()
-        location.read.return_value = 'data-from-network'
-        mock_urlopen.return_value = location
+    @patch('kiwi.solver.repository.base.Download')
+    def test_download_from_repository_remote(self, mock_Download):
         self.uri.is_remote.return_value = True
-        self.uri.translate.return_value = 'http://myrepo/file'
-
-        m_open = mock_open()
-        with patch('builtins.open', m_open, create=True):
-            self.solver.download_from_repository('repodata/file', 'target-file')
-
-        mock_urlopen.assert_called_once_with(request)
-        mock_request.assert_called_once_with(
-            'http://myrepo/file/repodata/file'
+        self.uri.translate.return_value = 'https://myrepo/file'
+        self.solver.download_from_repository(
+            'repodata/repomd.xml', 'target-file', use_cache=True
         )
-        m_open.assert_called_once_with(
-            'target-file', 'wb'
+        mock_Download.assert_called_once_with(
+            '/var/tmp/kiwi/download_cache'
         )
-        m_open.return_value.write.assert_called_once_with(
-            'data-from-network'
+        mock_Download.return_value.get.assert_called_once_with(
+            'https://myrepo/file/repodata/repomd.xml', 'target-file', None
         )
 
     @patch('kiwi.solver.repository.base.urlopen')
@@ -246,11 +214,11 @@ class TestSolverRepositoryBase:
     ):
         request = mock.Mock()
         mock_request.return_value = request
-        location = mock.Mock()
-        location.read.return_value = 'data'
-        mock_urlopen.return_value = location
+        mock_urlopen.return_value = io.BytesIO(b'data')
         self.uri.is_remote.return_value = False
         self.uri.translate.return_value = '/my_local_repo/file'
+        self.solver.user = 'user'
+        self.solver.secret = 'secret'
 
         m_open = mock_open()
         with patch('builtins.open', m_open, create=True):
@@ -260,13 +228,30 @@ class TestSolverRepositoryBase:
         mock_request.assert_called_once_with(
             'file:///my_local_repo/file/repodata/file'
         )
+        request.add_header.assert_called_once_with(
+            'Authorization', b'Basic dXNlcjpzZWNyZXQ='
+        )
         m_open.assert_called_once_with(
             'target-file', 'wb'
         )
         m_open.return_value.write.assert_called_once_with(
-            'data'
+            b'data'
         )
 
+    @patch.object(SolverRepositoryBase, 'download_from_repository')
+    def test_download_files_from_repository(self, mock_download):
+        self.solver.download_files_from_repository([])
+        assert not mock_download.called
+        self.solver.download_files_from_repository(
+            [('a', 'target/a'), ('b', 'target/b')]
+        )
+        assert sorted(mock_download.call_args_list) == [
+            call('a', 'target/a'), call('b', 'target/b')
+        ]
+        mock_download.side_effect = KiwiUriOpenError('error')
+        with raises(KiwiUriOpenError):
+            self.solver.download_files_from_repository([('a', 'target/a')])
+
     @patch('kiwi.solver.repository.base.urlopen')
     def test_download_from_repository_raises(self, mock_urlopen):
         self.uri.is_remote.return_value = False
@@ -305,7 +290,8 @@ class TestSolverRepositoryBase:
         mock_Temporary.return_value.new_dir.return_value.name = 'solv_dir.XX'
         self.solver._create_solvables('meta_dir.XX', 'rpmmd2solv')
         mock_glob.assert_called_once_with('meta_dir.XX/*')
-        assert mock_command.mock_calls == [
+        assert mock_command.call_count == 2
+        mock_command.assert_has_calls([
             call([
                 'bash',
                 '-c',
@@ -324,7 +310,7 @@ class TestSolverRepositoryBase:
                     'rpmmd2solv > solv_dir.XX/solvable-fefefefe'
                 ])
             ])
-        ]
+        ], any_order=True)
 
     @patch('kiwi.solver.repository.base.Temporary')
     @patch('kiwi.solver.repository.base.random.randrange')
@@ -351,14 +337,13 @@ class TestSolverRepositoryBase:
         )
 
     @patch('kiwi.solver.repository.base.Command.run')
-    @patch('kiwi.solver.repository.base.Path.wipe')
-    @patch('kiwi.solver.repository.base.Path.create')
     @patch('kiwi.solver.repository.base.SolverRepositoryBase.is_uptodate')
     @patch.object(SolverRepositoryBase, '_setup_repository_metadata')
     def test_create_repository_solvable(
         self, mock_setup_repository_metadata, mock_is_uptodate,
-        mock_path_create, mock_path_wipe, mock_command
+        mock_command, tmpdir
     ):
+        target_dir = tmpdir.strpath
         mock_is_uptodate.return_value = False
         tempdir = Mock()
         tempdir.name = 'solvable_dir.XX'
@@ -366,24 +351,121 @@ class TestSolverRepositoryBase:
         self.uri.alias.return_value = 'repo-alias'
         self.uri.uri = 'repo-uri'
 
-        m_open = mock_open()
-        with patch('builtins.open', m_open, create=True):
-            assert self.solver.create_repository_solvable('target_dir') == \
-                'target_dir/repo-alias'
+        def merge(command):
+            merged_solvable = command[2].split('> ')[1]
+            # the solvable is merged into a hidden file next to it
+            assert os.path.dirname(merged_solvable) == target_dir
+            assert os.path.basename(merged_solvable).startswith(
+                '.repo-alias.'
+            )
+            with open(merged_solvable, 'w') as solvable:
+                solvable.write('solv')
+
+        mock_command.side_effect = merge
 
-        mock_is_uptodate.assert_called_once_with('target_dir')
+        assert self.solver.create_repository_solvable(target_dir) == \
+            target_dir + '/repo-alias'
+
+        mock_is_uptodate.assert_called_once_with(target_dir)
         mock_setup_repository_metadata.assert_called_once_with()
-        mock_command.assert_called_once_with(
-            [
-                'bash', '-c',
-                'mergesolv solvable_dir.XX/* > target_dir/repo-alias'
-            ]
+        assert mock_command.call_args[0][0][:2] == ['bash', '-c']
+        assert mock_command.call_args[0][0][2].startswith(
+            'mergesolv solvable_dir.XX/* > '
+        )
+        assert sorted(os.listdir(target_dir)) == [
+            'repo-alias', 'repo-alias.info', 'repo-alias.timestamp'
+        ]
+        assert tmpdir.join('repo-alias').read() == 'solv'
+        assert tmpdir.join('repo-alias.info').read() == \
+            ''.join(['repo-uri', os.linesep])
+        assert tmpdir.join('repo-alias.timestamp').read() == 'static'
+
+    @patch('kiwi.solver.repository.base.Command.run')
+    def test_merge_solvables_failed(self, mock_command, tmpdir):
+        tempdir = Mock()
+        tempdir.name = 'solvable_dir.XX'
+        self.solver.repository_solvable_dir = tempdir
+        mock_command.side_effect = Exception('mergesolv failed')
+        with raises(Exception):
+            self.solver._merge_solvables(tmpdir.strpath, 'checksum')
+        # no incomplete solvable is left behind
+        assert os.listdir(tmpdir.strpath) == []
+
+    @patch('os.utime')
+    @patch('os.path.exists')
+    @patch('kiwi.solver.repository.base.Path.create')
+    @patch.object(SolverRepositoryBase, 'get_metadata_checksum')
+    @patch.object(SolverRepositoryBase, '_setup_repository_metadata')
+    def test_create_repository_solvable_cached(
+        self, mock_setup_repository_metadata, mock_get_metadata_checksum,
+        mock_path_create, mock_exists, mock_utime
+    ):
+        mock_get_metadata_checksum.return_value = 'checksum'
+        mock_exists.return_value = True
+        assert self.solver.create_repository_solvable('target_dir') == \
+            'target_dir/cache/checksum'
+        mock_utime.assert_called_once_with('target_dir/cache/checksum')
+        assert not mock_setup_repository_metadata.called
+
+    @patch('kiwi.solver.repository.base.Command.run')
+    @patch.object(SolverRepositoryBase, 'get_metadata_checksum')
+    @patch.object(SolverRepositoryBase, '_setup_repository_metadata')
+    @patch.object(SolverRepositoryBase, '_cleanup_solvable_cache')
+    def test_create_repository_solvable_not_cached(
+        self, mock_cleanup_solvable_cache, mock_setup_repository_metadata,
+        mock_get_metadata_checksum, mock_command, tmpdir
+    ):
+        target_dir = tmpdir.strpath
+        cache_dir = tmpdir.mkdir('cache')
+        # an entry without info files is incomplete
+        cache_dir.join('checksum').write('broken')
+        mock_get_metadata_checksum.return_value = 'checksum'
+        tempdir = Mock()
+        tempdir.name = 'solvable_dir.XX'
+        self.solver.repository_solvable_dir = tempdir
+
+        def merge(command):
+            with open(command[2].split('> ')[1], 'w') as solvable:
+                solvable.write('solv')
+
+        mock_command.side_effect = merge
+
+        assert self.solver.create_repository_solvable(target_dir) == \
+            cache_dir.join('checksum').strpath
+
+        mock_setup_repository_metadata.assert_called_once_with()
+        assert mock_command.call_args[0][0][2].startswith(
+            'mergesolv solvable_dir.XX/* > {0}/.checksum.'.format(
+                cache_dir.strpath
+            )
         )
-        assert m_open.call_args_list == [
-            call('target_dir/repo-alias.info', 'w'),
-            call('target_dir/repo-alias.timestamp', 'w')
+        assert cache_dir.join('checksum').read() == 'solv'
+        assert sorted(os.listdir(cache_dir.strpath)) == [
+            'checksum', 'checksum.info', 'checksum.timestamp'
         ]
-        assert m_open.return_value.write.call_args_list == [
-            call(''.join(['repo-uri', os.linesep])),
-            call('static')
+        mock_cleanup_solvable_cache.assert_called_once_with(cache_dir.strpath)
+
+    @patch('kiwi.solver.repository.base.Defaults.get_solvable_cache_size')
+    def test_cleanup_solvable_cache(self, mock_get_solvable_cache_size, tmpdir):
+        for age, name in enumerate(['newest', 'middle', 'oldest']):
+            solvable = tmpdir.join(name)
+            solvable.write('x' * 100)
+            tmpdir.join(name + '.info').write('uri')
+            os.utime(solvable.strpath, (1000 - age, 1000 - age))
+        mock_get_solvable_cache_size.return_value = 300
+        self.solver._cleanup_solvable_cache(tmpdir.strpath)
+        assert len(os.listdir(tmpdir.strpath)) == 6
+        mock_get_solvable_cache_size.return_value = 150
+        self.solver._cleanup_solvable_cache(tmpdir.strpath)
+        assert sorted(os.listdir(tmpdir.strpath)) == [
+            'newest', 'newest.info'
         ]
+        mock_get_solvable_cache_size.return_value = 0
+        self.solver._cleanup_solvable_cache(tmpdir.strpath)
+        assert sorted(os.listdir(tmpdir.strpath)) == [
+            'newest', 'newest.info'
+        ]
+
+    def test_get_metadata_checksum_from(self):
+        assert self.solver._get_metadata_checksum_from(['a', 'b']) == \
+            hashlib.sha256(os.linesep.join(['a', 'b']).encode()).hexdigest()
@@ -1,11 +1,19 @@
+import hashlib
 from unittest.mock import (
     patch, Mock
 )
+from pytest import fixture
+
+from kiwi.exceptions import KiwiUriOpenError
 from kiwi.solver.repository.deb import SolverRepositoryDeb
 from kiwi.solver.repository.base import SolverRepositoryBase
 
 
 class TestSolverRepositoryDeb:
+    @fixture(autouse=True)
+    def inject_fixtures(self, tmpdir):
+        self._tmpdir = tmpdir
+
     def setup(self):
         self.uri = Mock()
         self.uri.uri = 'http://example.org/some/path'
@@ -28,3 +36,67 @@ class TestSolverRepositoryDeb:
         mock_create_solvables.assert_called_once_with(
             'metadata_dir.XX', 'deb2solv'
         )
+
+    def _create_release_file(self):
+        release_file = self._tmpdir.join('Release')
+        release_file.write(
+            'Origin: Debian\n'
+            'MD5Sum:\n'
+            ' d41d8cd98f00b204e9800998ecf8427e 1024 '
+            'main/binary-amd64/Packages.gz\n'
+            'SHA256:\n'
+            ' 0815 1024 main/binary-amd64/Packages\n'
+            ' abcd 2048 main/binary-amd64/Packages.gz\n'
+            ' ef01 512 Packages.gz\n'
+        )
+        return release_file.strpath
+
+    @patch('kiwi.solver.repository.deb.Temporary')
+    @patch.object(SolverRepositoryBase, 'download_from_repository')
+    def test_get_metadata_checksum_dists(
+        self, mock_download_from_repository, mock_Temporary
+    ):
+        mock_Temporary.return_value.new_file.return_value.name = \
+            self._create_release_file()
+        self.uri.uri = 'http://example.org/debian/dists/bookworm/main/' \
+            'binary-amd64/'
+        assert self.solver.get_metadata_checksum() == hashlib.sha256(
+            b'Packages:abcd'
+        ).hexdigest()
+        mock_download_from_repository.assert_called_once_with(
+            '../../Release', self._tmpdir.join('Release').strpath,
+            use_cache=True
+        )
+
+    @patch('kiwi.solver.repository.deb.Temporary')
+    @patch.object(SolverRepositoryBase, 'download_from_repository')
+    def test_get_metadata_checksum_flat(
+        self, mock_download_from_repository, mock_Temporary
+    ):
+        mock_Temporary.return_value.new_file.return_value.name = \
+            self._create_release_file()
+        assert self.solver.get_metadata_checksum() == hashlib.sha256(
+            b'Packages:ef01'
+        ).hexdigest()
+        mock_download_from_repository.assert_called_once_with(
+            'Release', self._tmpdir.join('Release').strpath, use_cache=True
+        )
+
+    @patch('kiwi.solver.repository.deb.Temporary')
+    @patch.object(SolverRepositoryBase, 'download_from_repository')
+    def test_get_metadata_checksum_no_entry(
+        self, mock_download_from_repository, mock_Temporary
+    ):
+        mock_Temporary.return_value.new_file.return_value.name = \
+            self._create_release_file()
+        self.uri.uri = 'http://example.org/debian/dists/bookworm/contrib/' \
+            'binary-amd64'
+        assert self.solver.get_metadata_checksum() is None
+
+    @patch('kiwi.solver.repository.deb.Temporary')
+    @patch.object(SolverRepositoryBase, 'download_from_repository')
+    def test_get_metadata_checksum_no_release_file(
+        self, mock_download_from_repository, mock_Temporary
+    ):
+        mock_download_from_repository.side_effect = KiwiUriOpenError('error')
+        assert self.solver.get_metadata_checksum() is None
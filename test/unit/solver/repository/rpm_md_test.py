@@ -1,3 +1,5 @@
+import hashlib
+import os
 from unittest.mock import patch, call
 
 import unittest.mock as mock
@@ -30,14 +32,14 @@ class TestSolverRepositoryRpmMd:
         mock_xml.return_value = self.xml_data
         self.solver._setup_repository_metadata()
 
-        assert mock_download_from_repository.call_args_list == [
-            call(
-                'repodata/55f95a93-primary.xml.gz',
-                'metadata_dir.XX/55f95a93-primary.xml.gz'
-            ),
+        assert sorted(mock_download_from_repository.call_args_list) == [
             call(
                 'repodata/0815-other.xml.gz',
                 'metadata_dir.XX/0815-other.xml.gz'
+            ),
+            call(
+                'repodata/55f95a93-primary.xml.gz',
+                'metadata_dir.XX/55f95a93-primary.xml.gz'
             )
         ]
         assert mock_create_solvables.call_args_list == [
@@ -49,3 +51,23 @@ class TestSolverRepositoryRpmMd:
     def test_timestamp(self, mock_xml):
         mock_xml.return_value = self.xml_data
         assert self.solver.timestamp() == '1478352191'
+
+    @patch.object(SolverRepositoryBase, '_get_repomd_xml')
+    def test_get_metadata_checksum(self, mock_xml):
+        mock_xml.return_value = self.xml_data
+        assert self.solver.get_metadata_checksum() == hashlib.sha256(
+            os.linesep.join(
+                [
+                    'primary:55f95a93',
+                    'group_gz:d62ed932df26f29968f17d3ed780a617'
+                    'ce116e651d4b0042495bbec4182671ac'
+                ]
+            ).encode()
+        ).hexdigest()
+
+    @patch.object(SolverRepositoryBase, '_get_repomd_xml')
+    def test_get_metadata_checksum_no_checksums(self, mock_xml):
+        mock_xml.return_value = etree.ElementTree(etree.fromstring(
+            '<repomd xmlns="http://linux.duke.edu/metadata/repo"/>'
+        ))
+        assert self.solver.get_metadata_checksum() is None
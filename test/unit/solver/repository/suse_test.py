@@ -1,3 +1,4 @@
+import hashlib
 from unittest.mock import patch
 
 import unittest.mock as mock
@@ -54,3 +55,16 @@ class TestSolverRepositorySUSE:
         mock_create_solvables.assert_called_once_with(
             'metadata_dir.XX', 'susetags2solv'
         )
+
+    @patch.object(SolverRepositoryBase, '_get_repomd_xml')
+    def test_get_metadata_checksum(self, mock_xml):
+        mock_xml.return_value = self.xml_data
+        assert self.solver.get_metadata_checksum() == hashlib.sha256(
+            b'primary:55f95a93'
+        ).hexdigest()
+        mock_xml.assert_called_once_with('suse/repodata')
+
+    @patch.object(SolverRepositoryBase, '_get_repomd_xml')
+    def test_get_metadata_checksum_media(self, mock_xml):
+        mock_xml.side_effect = Exception
+        assert self.solver.get_metadata_checksum() is None
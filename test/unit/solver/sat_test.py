@@ -1,7 +1,7 @@
 import logging
 import importlib
 from unittest.mock import (
-    patch, Mock, MagicMock
+    patch, Mock, MagicMock, call
 )
 from pytest import (
     raises, fixture
@@ -85,8 +85,66 @@ class TestSat:
         solver_repository.create_repository_solvable.assert_called_once_with()
         self.sat.pool.add_repo.assert_called_once_with('some-uri')
         pool_repository.add_solv.assert_called_once_with(solvable)
+        assert self.sat.whatprovides_outdated is True
+        assert not self.sat.pool.createwhatprovides.called
+
+    @patch.object(Sat, 'add_repository')
+    def test_add_repositories(self, mock_add_repository):
+        solver_repositories = [Mock(), Mock()]
+        self.sat.add_repositories(solver_repositories)
+        assert mock_add_repository.call_args_list == [
+            call(solver_repositories[0]), call(solver_repositories[1])
+        ]
+
+    def test_solve_creates_whatprovides_once(self):
+        self.sat.add_repositories([Mock(), Mock()])
+        self.solver.solve = Mock(
+            return_value=None
+        )
+        self.selection.isempty = Mock(
+            return_value=False
+        )
+        self.selection.jobs = Mock(
+            return_value=['vim']
+        )
+        self.sat.solve(['vim'])
+        self.sat.solve(['vim'])
         self.sat.pool.addfileprovides.assert_called_once_with()
         self.sat.pool.createwhatprovides.assert_called_once_with()
+        assert self.sat.whatprovides_outdated is False
+
+    @patch('kiwi.solver.sat.time.monotonic')
+    def test_get_phase_timing(self, mock_monotonic):
+        mock_monotonic.side_effect = [
+            # load
+            0, 1,
+            # index
+            10, 12,
+            # solve
+            20, 23,
+            # transaction
+            30, 34
+        ]
+        self.sat.add_repository(Mock())
+        self.solver.solve = Mock(
+            return_value=None
+        )
+        self.selection.isempty = Mock(
+            return_value=False
+        )
+        self.selection.jobs = Mock(
+            return_value=['vim']
+        )
+        with self._caplog.at_level(logging.DEBUG):
+            self.sat.solve(['vim'])
+            assert 'Solver phase timing: load: 1.000s, index: 2.000s, ' \
+                'solve: 3.000s, transaction: 4.000s' in self._caplog.text
+        assert self.sat.get_phase_timing() == {
+            'load': 1.0,
+            'index': 2.0,
+            'solve': 3.0,
+            'transaction': 4.0
+        }
 
     @patch.object(Sat, '_setup_jobs')
     def test_solve_has_problems(self, mock_setup_jobs):
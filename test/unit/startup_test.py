@@ -0,0 +1,69 @@
+import sys
+import subprocess
+
+# The import time of commands which do not load an image description
+# must stay below this share of the import time of the description
+# parser, measured on the same host under the same load
+STARTUP_BUDGET = 0.5
+
+# maximum number of kiwi modules imported by these commands
+KIWI_MODULE_BUDGET = 40
+
+HEAVY_MODULES = [
+    'lxml',
+    'kiwi.xml_parse',
+    'kiwi.xml_state',
+    'kiwi.xml_description',
+    'kiwi.runtime_checker',
+    'kiwi.builder'
+]
+
+
+class TestStartup:
+    def setup(self):
+        modules, self.parser_import_time = self._get_import_profile(
+            'import kiwi.xml_state'
+        )
+
+    def setup_method(self, cls):
+        self.setup()
+
+    def _get_import_profile(self, code, arguments=[]):
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code] + arguments,
+            capture_output=True, text=True
+        )
+        modules = set()
+        import_time = 0
+        for line in process.stderr.splitlines():
+            if not line.startswith('import time:'):
+                continue
+            self_time, cumulative_time, name = line[12:].split('|')
+            if not cumulative_time.strip().isdigit():
+                continue
+            modules.add(name.strip())
+            if not name.startswith('  '):
+                import_time += int(cumulative_time)
+        return modules, import_time
+
+    def _check_startup(self, arguments):
+        modules, import_time = self._get_import_profile(
+            'import sys; from kiwi.kiwi import main; '
+            'sys.argv[0] = "kiwi-ng"; main()', arguments
+        )
+        assert 'kiwi.cli' in modules
+        for module in HEAVY_MODULES:
+            assert module not in modules
+        assert len(
+            [module for module in modules if module.startswith('kiwi')]
+        ) <= KIWI_MODULE_BUDGET
+        assert import_time < self.parser_import_time * STARTUP_BUDGET
+
+    def test_version(self):
+        self._check_startup(['--version'])
+
+    def test_help(self):
+        self._check_startup(['--help'])
+
+    def test_result_list(self):
+        self._check_startup(['result', 'list', '--target-dir', '/not/there'])
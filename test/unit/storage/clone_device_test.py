@@ -1,8 +1,11 @@
 import io
+import os
 from unittest.mock import (
     patch, call, MagicMock, Mock
 )
-from pytest import raises
+from pytest import (
+    raises, fixture
+)
 
 from kiwi.storage.clone_device import CloneDevice
 
@@ -10,6 +13,10 @@ from kiwi.exceptions import KiwiRaidSetupError
 
 
 class TestCloneDevice:
+    @fixture(autouse=True)
+    def inject_fixtures(self, tmpdir):
+        self._tmpdir = tmpdir
+
     def setup(self):
         self.storage_device = Mock()
         self.storage_device.get_device = Mock(
@@ -27,50 +34,133 @@ class TestCloneDevice:
     def setup_method(self, cls):
         self.setup()
 
+    @patch('kiwi.storage.clone_device.BlockCopy')
     @patch('kiwi.storage.clone_device.Command.run')
     @patch('kiwi.storage.clone_device.BlockID')
     @patch('kiwi.storage.clone_device.FileSystem.new')
+    @patch.object(CloneDevice, '_reads_zeros')
     def test_clone_filesystem(
-        self, mock_FileSystem_new, mock_BlockID, mock_Command_run
+        self, mock_reads_zeros, mock_FileSystem_new, mock_BlockID,
+        mock_Command_run, mock_BlockCopy
     ):
+        mock_reads_zeros.return_value = True
         self.clone_id.get_filesystem.return_value = 'ext3'
         mock_BlockID.return_value = self.clone_id
 
         self.clone_device.clone([self.target_device])
 
-        mock_Command_run.assert_called_once_with(
-            ['dd', 'if=/dev/source-device', 'of=/dev/target-device', 'bs=1M']
+        mock_reads_zeros.assert_called_once_with('/dev/target-device')
+        mock_BlockCopy.assert_called_once_with(
+            '/dev/source-device', '/dev/target-device'
+        )
+        mock_BlockCopy.return_value.copy.assert_called_once_with(
+            sparse=True,
+            progress_prefix='Cloning /dev/target-device'
         )
+        assert not mock_Command_run.called
         mock_FileSystem_new.assert_called_once_with(
             'ext3', self.target_device
         )
         mock_FileSystem_new.return_value.__enter__ \
             .return_value.set_uuid.assert_called_once_with()
 
+    @patch('kiwi.storage.clone_device.BlockCopy')
     @patch('kiwi.storage.clone_device.Command.run')
     @patch('kiwi.storage.clone_device.BlockID')
-    def test_clone_lvm(self, mock_BlockID, mock_Command_run):
+    def test_clone_lvm(
+        self, mock_BlockID, mock_Command_run, mock_BlockCopy
+    ):
         self.clone_id.get_filesystem.return_value = 'LVM2_member'
         mock_BlockID.return_value = self.clone_id
 
         self.clone_device.clone([self.target_device])
 
         assert mock_Command_run.call_args_list == [
-            call(
-                [
-                    'dd', 'if=/dev/source-device', 'of=/dev/target-device',
-                    'bs=1M'
-                ]
-            ),
             call(
                 ['vgimportclone', '/dev/target-device']
             )
         ]
+        mock_BlockID.invalidate.assert_called_once_with('/dev/target-device')
+
+    @patch('kiwi.storage.clone_device.BlockCopy')
+    @patch('kiwi.storage.clone_device.BlockID')
+    @patch('kiwi.storage.clone_device.FileSystem.new')
+    @patch.object(CloneDevice, '_reads_zeros')
+    def test_clone_to_mapped_device(
+        self, mock_reads_zeros, mock_FileSystem_new, mock_BlockID,
+        mock_BlockCopy
+    ):
+        mock_reads_zeros.return_value = False
+        self.clone_id.get_filesystem.return_value = 'ext3'
+        mock_BlockID.return_value = self.clone_id
+
+        self.clone_device.clone([self.target_device])
+
+        mock_BlockCopy.return_value.copy.assert_called_once_with(
+            sparse=False,
+            progress_prefix='Cloning /dev/target-device'
+        )
+
+    @patch('kiwi.storage.clone_device.Command.run')
+    def test_reads_zeros(self, mock_Command_run):
+        sys_block = self._tmpdir.mkdir('sys_block')
+        devices = self._tmpdir.mkdir('devices')
+        # loop0 with partition loop0p1, dm-0 maps loop0 linear,
+        # dm-1 is a crypt device on top of dm-0, md0 is a raid
+        devices.mkdir('loop0').mkdir('loop0p1').join('partition').write('1')
+        for name in ('dm-0', 'dm-1', 'md0'):
+            devices.mkdir(name).mkdir('slaves')
+        devices.join('dm-0').mkdir('dm')
+        devices.join('dm-1').mkdir('dm')
+        devices.join('md0').mkdir('md')
+        devices.join('md0').mkdir('md0p1').join('partition').write('1')
+        os.symlink(
+            devices.join('loop0').strpath,
+            devices.join('dm-0', 'slaves', 'loop0').strpath
+        )
+        os.symlink(
+            devices.join('dm-0').strpath,
+            devices.join('dm-1', 'slaves', 'dm-0').strpath
+        )
+        for name in ('loop0', 'dm-0', 'dm-1', 'md0'):
+            os.symlink(
+                devices.join(name).strpath, sys_block.join(name).strpath
+            )
+        for name in ('loop0p1', 'md0p1'):
+            parent = name[:-2]
+            os.symlink(
+                devices.join(parent, name).strpath,
+                sys_block.join(name).strpath
+            )
+        image_file = self._tmpdir.join('image.raw')
+        image_file.write('')
 
+        def dmsetup(command):
+            table = {
+                '/dev/dm-0': '0 2048 linear 7:0 2048',
+                '/dev/dm-1': '0 2048 crypt aes-xts-plain64 :64:logon:k 0 253:0 0'
+            }
+            return Mock(output=table[command[-1]] + os.linesep)
+
+        mock_Command_run.side_effect = dmsetup
+
+        def reads_zeros(device):
+            return self.clone_device._reads_zeros(device, sys_block.strpath)
+
+        assert reads_zeros(image_file.strpath) is True
+        assert reads_zeros('/dev/loop0p1') is True
+        assert reads_zeros('/dev/dm-0') is True
+        assert reads_zeros('/dev/dm-1') is False
+        assert reads_zeros('/dev/md0p1') is False
+        assert reads_zeros('/dev/unknown') is False
+
+    @patch('kiwi.storage.clone_device.BlockCopy')
     @patch('kiwi.storage.clone_device.Command.run')
     @patch('kiwi.storage.clone_device.BlockID')
     @patch('uuid.uuid4')
-    def test_clone_luks(self, mock_uuid4, mock_BlockID, mock_Command_run):
+    def test_clone_luks(
+        self, mock_uuid4, mock_BlockID, mock_Command_run, mock_BlockCopy
+    ):
         self.clone_id.get_filesystem.return_value = 'crypto_LUKS'
         mock_BlockID.return_value = self.clone_id
         mock_uuid4.return_value = 'some-UUID'
@@ -78,12 +168,6 @@ class TestCloneDevice:
         self.clone_device.clone([self.target_device])
 
         assert mock_Command_run.call_args_list == [
-            call(
-                [
-                    'dd', 'if=/dev/source-device', 'of=/dev/target-device',
-                    'bs=1M'
-                ]
-            ),
             call(
                 [
                     'cryptsetup', '-q', 'luksUUID',
@@ -91,14 +175,16 @@ class TestCloneDevice:
                 ]
             )
         ]
+        mock_BlockID.invalidate.assert_called_once_with('/dev/target-device')
 
+    @patch('kiwi.storage.clone_device.BlockCopy')
     @patch('kiwi.storage.clone_device.Command.run')
     @patch('kiwi.storage.clone_device.BlockID')
     @patch('kiwi.storage.clone_device.FileSystem.new')
     @patch('kiwi.storage.clone_device.MappedDevice')
     def test_clone_raid(
         self, mock_MappedDevice, mock_FileSystem_new,
-        mock_BlockID, mock_Command_run
+        mock_BlockID, mock_Command_run, mock_BlockCopy
     ):
         self.clone_id.get_filesystem.return_value = 'linux_raid_member'
         mock_BlockID.return_value = self.clone_id
@@ -119,12 +205,6 @@ class TestCloneDevice:
         mock_FileSystem_new.return_value.__enter__ \
             .return_value.set_uuid.assert_called_once_with()
         assert mock_Command_run.call_args_list == [
-            call(
-                [
-                    'dd', 'if=/dev/source-device', 'of=/dev/target-device',
-                    'bs=1M'
-                ]
-            ),
             call(
                 ['mdadm', '--stop', '/dev/md0']
             ),
@@ -142,9 +222,12 @@ class TestCloneDevice:
             )
         ]
 
+    @patch('kiwi.storage.clone_device.BlockCopy')
     @patch('kiwi.storage.clone_device.Command.run')
     @patch('kiwi.storage.clone_device.BlockID')
-    def test_clone_raid_raises(self, mock_BlockID, mock_Command_run):
+    def test_clone_raid_raises(
+        self, mock_BlockID, mock_Command_run, mock_BlockCopy
+    ):
         self.clone_id.get_filesystem.return_value = 'linux_raid_member'
         mock_BlockID.return_value = self.clone_id
         with patch('builtins.open', create=True) as mock_open:
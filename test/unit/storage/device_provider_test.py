@@ -19,15 +19,11 @@ class TestDeviceProvider:
         with raises(KiwiDeviceProviderError):
             self.provider.get_device()
 
-    @patch('kiwi.storage.device_provider.Command.run')
-    def test_get_uuid(self, mock_command):
-        uuid_call = Mock()
-        uuid_call.output = '0815\n'
-        mock_command.return_value = uuid_call
+    @patch('kiwi.storage.device_provider.BlockID')
+    def test_get_uuid(self, mock_BlockID):
+        mock_BlockID.return_value.get_uuid.return_value = '0815'
         assert self.provider.get_uuid('/dev/some-device') == '0815'
-        mock_command.assert_called_once_with(
-            ['blkid', '/dev/some-device', '-s', 'UUID', '-o', 'value']
-        )
+        mock_BlockID.assert_called_once_with('/dev/some-device')
 
     @patch('kiwi.storage.device_provider.Command.run')
     def test_get_byte_size(self, mock_command):
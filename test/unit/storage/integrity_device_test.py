@@ -65,9 +65,13 @@ class TestIntegrityDevice:
     def test_is_loop(self):
         assert self.integrity.is_loop() is True
 
+    @patch('kiwi.storage.integrity_device.BlockID.invalidate')
     @patch('kiwi.storage.integrity_device.Command.run')
-    def test_create_dm_integrity(self, mock_Command_run):
+    def test_create_dm_integrity(
+        self, mock_Command_run, mock_BlockID_invalidate
+    ):
         self.integrity.create_dm_integrity()
+        mock_BlockID_invalidate.assert_called_once_with('/dev/some-device')
         assert mock_Command_run.call_args_list == [
             call(
                 [
@@ -154,7 +154,7 @@ class TestImageSystem:
         some_mount.is_mounted.return_value = True
         self.image_system.mount_list.append(some_mount)
         self.image_system.umount()
-        some_mount.umount.assert_called_once_with()
+        some_mount.umount_tree.assert_called_once_with()
 
     @patch('os.path.exists')
     @patch('kiwi.system.mount.MountManager')
@@ -168,4 +168,4 @@ class TestImageSystem:
         }
         with ImageSystem(device_map, 'root_dir') as system:
             system.mount()
-        mount.umount.assert_called()
+        mount.umount_tree.assert_called()
@@ -18,6 +18,7 @@ from kiwi.exceptions import (
 
 from kiwi.defaults import Defaults
 from kiwi.system.prepare import SystemPrepare
+from kiwi.utils.bootstrap_cache import RepositorySourceT
 from kiwi.xml_description import XMLDescription
 from kiwi.xml_state import XMLState
 
@@ -303,6 +304,21 @@ class TestSystemPrepare:
         repo.import_trusted_keys.assert_called_once_with(
             ['key-file-a.asc', 'key-file-b.asc']
         )
+        assert self.system.repository_sources == [
+            RepositorySourceT(
+                'uri', None, '', False, 'uri-alias', 42, '', ''
+            ),
+            RepositorySourceT(
+                'uri', 'rpm-md', '', False, 'uri-alias', None, '',
+                '../data/script'
+            )
+        ]
+        assert self.system.signing_keys == ['key-file-a.asc', 'key-file-b.asc']
+        assert self.system.repository_options == [
+            'check_signatures', 'exclude_docs',
+            '_install_langs%POSIX:C:C.UTF-8:en_US:de_DE',
+            '_target_arch%x86_64'
+        ]
 
     @patch('kiwi.system.prepare.Repository.new')
     @patch('kiwi.system.prepare.Uri')
@@ -372,6 +388,76 @@ class TestSystemPrepare:
             self.system.root_bind, None
         )
 
+    @patch('kiwi.system.prepare.BootstrapCache')
+    @patch('kiwi.system.prepare.CommandProcess.poll_show_progress')
+    @patch('kiwi.system.prepare.ArchiveTar')
+    @patch('os.path.exists')
+    def test_install_bootstrap_cache_store(
+        self, mock_exists, mock_tar, mock_poll, mock_BootstrapCache
+    ):
+        mock_exists.return_value = True
+        mount = Mock()
+        mount.mountpoint = 'root_dir/proc'
+        root_mount = Mock()
+        root_mount.mountpoint = 'root_dir'
+        self.system.root_bind.mount_stack = [root_mount, mount]
+        self.system.root_bind.config_files = ['/etc/hosts']
+        self.system.repository_sources = [
+            RepositorySourceT('uri', 'rpm-md', '', True, 'alias', None, '', '')
+        ]
+        self.system.signing_keys = ['key.asc']
+        self.manager.exclude_requests = ['some']
+        mock_BootstrapCache.get_key.return_value = 'key'
+        mock_BootstrapCache.restore.return_value = False
+        self.system.install_bootstrap(self.manager)
+        mock_BootstrapCache.get_key.assert_called_once_with(
+            'zypper', [
+                'onlyRequired', None, '15.3',
+                {'disable': ['mod_c'], 'enable': ['mod_a:stream', 'mod_b']},
+                [], 'foo', 'foo', 'foo', 'some'
+            ], [
+                RepositorySourceT(
+                    'uri', 'rpm-md', '', True, 'alias', None, '', ''
+                )
+            ], ['key.asc']
+        )
+        exclude = ['proc', 'etc/hosts', 'etc/hosts.kiwi', 'etc/hosts.sha']
+        mock_BootstrapCache.restore.assert_called_once_with(
+            'key', 'root_dir', exclude
+        )
+        self.manager.process_install_requests_bootstrap.assert_called_once_with(
+            self.system.root_bind, None
+        )
+        mock_BootstrapCache.store.assert_called_once_with(
+            'key', 'root_dir', exclude
+        )
+
+    @patch('kiwi.system.prepare.BootstrapCache')
+    @patch('kiwi.system.prepare.CommandProcess.poll_show_progress')
+    @patch('kiwi.system.prepare.ArchiveTar')
+    @patch('os.path.exists')
+    def test_install_bootstrap_cache_restored(
+        self, mock_exists, mock_tar, mock_poll, mock_BootstrapCache
+    ):
+        mock_exists.return_value = True
+        tar = Mock()
+        mock_tar.return_value = tar
+        mock_BootstrapCache.get_key.return_value = 'key'
+        mock_BootstrapCache.restore.return_value = True
+        self.system.install_bootstrap(self.manager)
+        self.manager.cleanup_requests.assert_called_once_with()
+        assert not self.manager.process_install_requests_bootstrap.called
+        assert not self.manager.post_process_install_requests_bootstrap.called
+        assert not mock_BootstrapCache.store.called
+        # archives are not part of the cache
+        tar.extract.assert_called_once_with('root_dir')
+
+    @patch('kiwi.system.prepare.BootstrapCache')
+    def test_get_bootstrap_cache_key_delta_root(self, mock_BootstrapCache):
+        self.system.delta_root = True
+        assert self.system._get_bootstrap_cache_key('zypper', 'x', []) == ''
+        assert not mock_BootstrapCache.get_key.called
+
     @patch('kiwi.system.prepare.RootInit')
     @patch('kiwi.system.prepare.RootBind')
     @patch('kiwi.system.prepare.CommandProcess.poll_show_progress')
@@ -29,8 +29,9 @@ from kiwi.command import CommandT
 
 class TestSystemSetup:
     @fixture(autouse=True)
-    def inject_fixtures(self, caplog):
+    def inject_fixtures(self, caplog, tmpdir):
         self._caplog = caplog
+        self._tmpdir = tmpdir
 
     @patch('kiwi.system.setup.RuntimeConfig')
     def setup(self, mock_RuntimeConfig):
@@ -439,6 +440,64 @@ class TestSystemSetup:
         mock_Path_create.assert_called_once_with('root_dir/some')
         assert data.sync_data.called
 
+    @patch('kiwi.command.Command.run')
+    @patch('kiwi.system.setup.DataSync')
+    @patch('os.chown')
+    def test_import_files_in_process(
+        self, mock_chown, mock_DataSync, mock_Command_run
+    ):
+        root_dir = self._tmpdir.strpath
+        os.makedirs(os.sep.join([root_dir, 'etc']))
+        os.makedirs(os.sep.join([root_dir, 'image', 'files']))
+        with open(os.sep.join([root_dir, 'etc', 'passwd']), 'w') as passwd:
+            passwd.write('bob:x:1000:100::/home/bob:/bin/bash\n')
+        with open(os.sep.join([root_dir, 'etc', 'group']), 'w') as group:
+            group.write('users:x:100:\n')
+        for name in ('a', 'b', 'c'):
+            with open(os.sep.join([root_dir, 'image', 'files', name]), 'w') as file:
+                file.write(name)
+            os.chmod(os.sep.join([root_dir, 'image', 'files', name]), 0o644)
+        os.symlink('/etc/passwd', os.sep.join([root_dir, 'image', 'files', 'd']))
+        file_type = namedtuple('FileT', ['target', 'owner', 'permissions'])
+        self.xml_state.get_system_files.return_value = {
+            'files/a': file_type(
+                target='/usr/bin/a', owner='bob:users', permissions='u+x'
+            ),
+            'files/b': file_type(target='', owner='', permissions='0600'),
+            'files/c': file_type(
+                target='/etc/c', owner='alice', permissions='u=g'
+            ),
+            'files/d': file_type(target='', owner='bob', permissions='')
+        }
+        self.xml_state.get_bootstrap_files.return_value = {}
+        setup = SystemSetup(self.xml_state, root_dir)
+
+        setup.import_files()
+
+        with open(os.sep.join([root_dir, 'usr', 'bin', 'a'])) as file:
+            assert file.read() == 'a'
+        assert oct(os.stat(
+            os.sep.join([root_dir, 'usr', 'bin', 'a'])
+        ).st_mode & 0o7777) == '0o744'
+        assert oct(os.stat(
+            os.sep.join([root_dir, 'b'])
+        ).st_mode & 0o7777) == '0o600'
+        assert call(
+            os.sep.join([root_dir, 'image', 'files', 'a']), 1000, 100
+        ) in mock_chown.call_args_list
+        # owner and mode not resolvable in-process, file c is
+        # still copied in-process, the symlink d is synced
+        assert mock_Command_run.call_args_list == [
+            call(['chroot', root_dir, 'chown', 'alice', '/image/files/c']),
+            call(['chroot', root_dir, 'chmod', 'u=g', '/image/files/c']),
+            call(['chroot', root_dir, 'chown', 'bob', '/image/files/d'])
+        ]
+        with open(os.sep.join([root_dir, 'etc', 'c'])) as file:
+            assert file.read() == 'c'
+        mock_DataSync.assert_called_once_with(
+            os.sep.join([root_dir, 'image', 'files', 'd']), root_dir
+        )
+
     @patch('kiwi.command.Command.run')
     @patch('kiwi.system.setup.DataSync')
     @patch('os.path.exists')
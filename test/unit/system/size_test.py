@@ -1,17 +1,55 @@
+import os
 from unittest.mock import patch
 
 import unittest.mock as mock
 
-from kiwi.system.size import SystemSize
+from kiwi.system.size import (
+    SystemSize, SystemSizeIndex
+)
 
 
 class TestSystemSize:
     def setup(self):
+        SystemSize.invalidate_index()
         self.size = SystemSize('directory')
 
     def setup_method(self, cls):
         self.setup()
 
+    def teardown_method(self, cls):
+        SystemSize.invalidate_index()
+
+    def _create_tree(self, root):
+        # root/
+        # root/proc/cpuinfo 4096
+        # root/usr/bin/tool 3145728, hardlinked as root/usr/sbin/tool
+        # root/usr/lib/lib.so 1048576
+        # root/usr/lib-doc/README 1048576
+        # root/var/link -> ../usr/lib
+        for directory in (
+            'proc', 'usr/bin', 'usr/sbin', 'usr/lib', 'usr/lib-doc', 'var'
+        ):
+            os.makedirs(os.sep.join([root, directory]))
+        for filename, size in (
+            ('proc/cpuinfo', 4096),
+            ('usr/bin/tool', 3145728),
+            ('usr/lib/lib.so', 1048576),
+            ('usr/lib-doc/README', 1048576)
+        ):
+            with open(os.sep.join([root, filename]), 'wb') as data:
+                data.truncate(size)
+        os.link(
+            os.sep.join([root, 'usr/bin/tool']),
+            os.sep.join([root, 'usr/sbin/tool'])
+        )
+        os.symlink('../usr/lib', os.sep.join([root, 'var/link']))
+
+    def _directory_bytes(self, root, directories):
+        return sum(
+            os.lstat(os.sep.join([root, directory])).st_size
+            for directory in directories
+        )
+
     def test_customize_ext(self):
         self.size.accumulate_files = mock.Mock(
             return_value=10000
@@ -24,22 +62,71 @@ class TestSystemSize:
     def test_customize_xfs(self):
         assert self.size.customize(42, 'xfs') == 63
 
-    @patch('kiwi.system.size.Command.run')
-    def test_accumulate_mbyte_file_sizes(self, mock_command):
-        assert isinstance(self.size.accumulate_mbyte_file_sizes(['/foo']), int)
-        mock_command.assert_called_once_with(
-            [
-                'du', '-s', '--apparent-size', '--block-size', '1',
-                '--exclude', 'directory/proc',
-                '--exclude', 'directory/sys',
-                '--exclude', 'directory/dev',
-                '--exclude', '/foo', 'directory'
+    @patch('kiwi.system.size.SystemSizeIndex')
+    def test_accumulate_mbyte_file_sizes(self, mock_SystemSizeIndex):
+        size_index = mock_SystemSizeIndex.return_value
+        size_index.get_byte_size.return_value = 3145728
+        assert self.size.accumulate_mbyte_file_sizes(['/foo']) == 3
+        size_index.get_byte_size.assert_called_once_with(
+            'directory', [
+                'directory/proc',
+                'directory/sys',
+                'directory/dev',
+                '/foo'
             ]
         )
 
-    @patch('kiwi.system.size.Command.run')
-    def test_accumulate_files(self, mock_command):
-        assert isinstance(self.size.accumulate_files(), int)
-        mock_command.assert_called_once_with(
-            ['bash', '-c', 'find directory | wc -l']
+    @patch('kiwi.system.size.SystemSizeIndex')
+    def test_accumulate_files(self, mock_SystemSizeIndex):
+        size_index = mock_SystemSizeIndex.return_value
+        size_index.get_file_count.return_value = 42
+        assert self.size.accumulate_files() == 42
+        size_index.get_file_count.assert_called_once_with('directory')
+
+    @patch('kiwi.system.size.SystemSizeIndex')
+    def test_get_index_shared_and_invalidated(self, mock_SystemSizeIndex):
+        size_index = mock_SystemSizeIndex.return_value
+        size_index.contains.return_value = True
+        assert self.size.get_index() == size_index
+        assert SystemSize('directory/usr').get_index() == size_index
+        mock_SystemSizeIndex.assert_called_once_with('directory')
+        SystemSize.invalidate_index('directory/')
+        assert not SystemSize.size_index
+        self.size.get_index()
+        SystemSize.invalidate_index()
+        assert not SystemSize.size_index
+
+    def test_accumulate_from_tree(self, tmpdir):
+        root = tmpdir.strpath
+        self._create_tree(root)
+        usr_dirs = ['usr', 'usr/bin', 'usr/sbin', 'usr/lib', 'usr/lib-doc']
+        size = SystemSize(root + '/')
+        assert size.accumulate_files() == 14
+        directory_bytes = self._directory_bytes(
+            root, ['.', 'proc', 'var'] + usr_dirs
+        )
+        assert size.get_index().get_byte_size(root) == \
+            5246976 + len('../usr/lib') + directory_bytes
+        assert SystemSize(root + '/usr').accumulate_files() == 9
+        assert size.get_index().get_byte_size(
+            root + '/usr', [root + '/usr/lib']
+        ) == 4194304 + self._directory_bytes(
+            root, ['usr', 'usr/bin', 'usr/sbin', 'usr/lib-doc']
         )
+        assert size.get_index().get_byte_size(root + '/usr/bin') == \
+            3145728 + self._directory_bytes(root, ['usr/bin'])
+        assert size.get_index().get_byte_size(root + '/none') == 0
+        assert len(SystemSize.size_index) == 1
+
+
+class TestSystemSizeIndex:
+    @patch('os.scandir')
+    def test_vanished_entries(self, mock_scandir, tmpdir):
+        entry = mock.Mock()
+        entry.stat.side_effect = FileNotFoundError
+        mock_scandir.return_value.__enter__.return_value = [entry]
+        size_index = SystemSizeIndex(tmpdir.strpath)
+        assert size_index.get_file_count(tmpdir.strpath) == 1
+        mock_scandir.side_effect = FileNotFoundError
+        size_index = SystemSizeIndex(tmpdir.strpath)
+        assert not size_index.contains(tmpdir.strpath)
@@ -1,6 +1,6 @@
 import sys
 from unittest.mock import (
-    patch, call
+    patch, call, Mock
 )
 from pytest import (
     raises, fixture
@@ -21,6 +21,7 @@ class TestCliTask:
     def inject_fixtures(self, caplog):
         self._caplog = caplog
 
+    @patch('kiwi.tasks.base.CommandTrace.enable')
     @patch('kiwi.logger.Logger.setLogLevel')
     @patch('kiwi.logger.Logger.setLogFlag')
     @patch('kiwi.logger.Logger.set_logfile')
@@ -34,12 +35,14 @@ class TestCliTask:
     def setup(
         self, mock_runtime_config, mock_global_args, mock_command_args,
         mock_load_command, mock_help_check, mock_color,
-        mock_set_log_socket, mock_setlog, mock_setLogFlag, mock_setLogLevel
+        mock_set_log_socket, mock_setlog, mock_setLogFlag, mock_setLogLevel,
+        mock_CommandTrace_enable
     ):
         Defaults.set_platform_name('x86_64')
         mock_global_args.return_value = {
             '--debug': True,
             '--debug-run-scripts-in-screen': True,
+            '--trace': True,
             '--logfile': 'stdout',
             '--logsocket': 'log_socket',
             '--loglevel': None,
@@ -66,6 +69,7 @@ class TestCliTask:
             call(logging.CRITICAL, except_for=['file', 'socket'])
         ]
         mock_setLogFlag.assert_called_once_with('run-scripts-in-screen')
+        mock_CommandTrace_enable.assert_called_once_with()
         mock_setlog.assert_called_once_with('stdout')
         mock_color.assert_called_once_with()
         mock_runtime_config.assert_called_once_with()
@@ -74,6 +78,7 @@ class TestCliTask:
         mock_global_args.return_value = {
             '--debug': True,
             '--debug-run-scripts-in-screen': True,
+            '--trace': False,
             '--logfile': 'some',
             '--logsocket': 'log_socket',
             '--loglevel': None,
@@ -82,11 +87,13 @@ class TestCliTask:
             '--setenv': [],
             '--type': None
         }
+        mock_CommandTrace_enable.reset_mock()
         self.task = CliTask()
         assert mock_setLogLevel.call_args_list == [
             call(logging.DEBUG),
             call(logging.DEBUG, only_for=['file', 'socket'])
         ]
+        assert not mock_CommandTrace_enable.called
 
     @patch('kiwi.logger.Logger.setLogLevel')
     @patch('kiwi.logger.Logger.setLogFlag')
@@ -120,6 +127,7 @@ class TestCliTask:
             '--logfile': None,
             '--logsocket': None,
             '--debug-run-scripts-in-screen': None,
+            '--trace': None,
             '--color-output': None,
             '--loglevel': '10',
             '--setenv': []
@@ -142,6 +150,7 @@ class TestCliTask:
             '--logfile': None,
             '--logsocket': None,
             '--debug-run-scripts-in-screen': None,
+            '--trace': None,
             '--color-output': None,
             '--loglevel': 'bogus',
             '--setenv': []
@@ -164,13 +173,32 @@ class TestCliTask:
     def test_attr_token(self):
         assert self.task.attr_token('a=b') == ['a', 'b']
 
-    @patch('kiwi.tasks.base.RuntimeChecker')
+    @patch('kiwi.runtime_checker.RuntimeChecker')
     def test_load_xml_description(self, mock_runtime_checker):
         self.task.load_xml_description('../data/description')
         mock_runtime_checker.assert_called_once_with(self.task.xml_state)
         assert self.task.config_file == '../data/description/config.xml'
         assert isinstance(self.task.xml_data, kiwi.xml_parse.image)
         assert self.task.xml_state.profiles == ['vmxFlavour']
+        assert self.task.description_digest
+
+    @patch('kiwi.tasks.base.RuntimeCheckScheduler')
+    def test_run_checks(self, mock_RuntimeCheckScheduler):
+        self.task.runtime_checker = Mock()
+        self.task.description_digest = 'digest'
+        self.task.runtime_config = Mock()
+        self.task.runtime_config.get_disabled_runtime_checks.return_value = [
+            'check_disabled'
+        ]
+        self.task.run_checks(
+            {'check_a': [], 'check_disabled': [], 'check_b': ['arg']}
+        )
+        mock_RuntimeCheckScheduler.assert_called_once_with(
+            self.task.runtime_checker, 'digest'
+        )
+        mock_RuntimeCheckScheduler.return_value.run.assert_called_once_with(
+            {'check_a': [], 'check_b': ['arg']}
+        )
 
     def test_load_xml_description_buildservice(self):
         self.task.load_xml_description('../data/description.buildservice')
@@ -43,9 +43,11 @@ class TestImageInfoTask:
             }
         }
         self.runtime_checker = Mock()
-        kiwi.tasks.base.RuntimeChecker = Mock(
+        self.runtime_checker_patch = patch(
+            'kiwi.runtime_checker.RuntimeChecker',
             return_value=self.runtime_checker
         )
+        self.runtime_checker_patch.start()
         self.runtime_config = Mock()
         kiwi.tasks.base.RuntimeConfig = Mock(
             return_value=self.runtime_config
@@ -82,6 +84,7 @@ class TestImageInfoTask:
 
     def teardown(self):
         sys.argv = argv_kiwi_tests
+        self.runtime_checker_patch.stop()
 
     def teardown_method(self, cls):
         self.teardown()
@@ -215,7 +218,9 @@ class TestImageInfoTask:
         self.task.command_args['--resolve-package-list'] = True
         self.task.process()
 
-        assert self.solver.add_repository.called
+        self.solver.add_repositories.assert_called_once_with(
+            [mock_solver_repo_new.return_value] * 5
+        )
         assert mock_uri.call_args_list == [
             call(uri='http://us.archive.ubuntu.com/ubuntu/', source_type=''),
             call(
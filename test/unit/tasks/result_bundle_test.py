@@ -75,6 +75,7 @@ class TestResultBundleTask:
         self.task.command_args['--package-as-rpm'] = None
         self.task.command_args['--bundle-format'] = None
         self.task.command_args['--no-compress'] = None
+        self.task.command_args['--jobs'] = None
 
     def test_process_invalid_bundle_directory(self):
         self._init_command_args()
@@ -90,13 +91,11 @@ class TestResultBundleTask:
     @patch('kiwi.tasks.result_bundle.Path.which')
     @patch('kiwi.tasks.result_bundle.Compress')
     @patch('os.path.exists')
-    @patch('os.path.islink')
-    @patch('os.unlink')
-    @patch('os.symlink')
-    @patch('os.readlink')
+    @patch('kiwi.tasks.result_bundle.Path.clone')
+    @patch('kiwi.tasks.result_bundle.ResultBundleTask._rewrite_file_references')
     def test_process_result_bundle(
-        self, mock_os_readlink, mock_os_symlink, mock_os_unlink,
-        mock_os_path_islink, mock_exists, mock_compress,
+        self, mock_rewrite_file_references, mock_path_clone,
+        mock_exists, mock_compress,
         mock_path_which, mock_path_create, mock_command, mock_load
     ):
         # This file won't be copied with build id
@@ -115,12 +114,6 @@ class TestResultBundleTask:
         self.task.command_args['bundle'] = True
         self.task.command_args['--zsync-source'] = 'http://example.com/zsync'
 
-        command_result = Mock()
-        command_result.output = "some mime is text"
-        mock_command.return_value = command_result
-
-        mock_os_readlink.return_value = 'readlinked'
-
         m_open = mock_open()
         with patch('builtins.open', m_open, create=True):
             self.task.process()
@@ -129,31 +122,30 @@ class TestResultBundleTask:
             os.sep.join([self.abs_target_dir, 'kiwi.result'])
         )
         mock_path_create.assert_called_once_with(self.abs_bundle_dir)
+        assert mock_path_clone.call_args_list == [
+            call(
+                'test-image-1.2.3',
+                os.sep.join([self.abs_bundle_dir, 'test-image-1.2.3-Build_42']),
+                allow_hardlink=True
+            ),
+            call(
+                'test-image-noversion',
+                os.sep.join([self.abs_bundle_dir, 'test-image-noversion']),
+                allow_hardlink=False
+            )
+        ]
+        renames = [('test-image-1.2.3', 'test-image-1.2.3-Build_42')]
+        assert mock_rewrite_file_references.call_args_list == [
+            call(
+                os.sep.join([self.abs_bundle_dir, 'test-image-1.2.3-Build_42']),
+                renames
+            ),
+            call(
+                os.sep.join([self.abs_bundle_dir, 'test-image-noversion']),
+                renames
+            )
+        ]
         assert mock_command.call_args_list == [
-            call([
-                'cp', 'test-image-1.2.3',
-                os.sep.join([self.abs_bundle_dir, 'test-image-1.2.3-Build_42'])
-            ]),
-            call([
-                'cp', 'test-image-noversion',
-                os.sep.join([self.abs_bundle_dir, 'test-image-noversion'])
-            ]),
-            call([
-                'file',
-                os.sep.join([self.abs_bundle_dir, 'test-image-1.2.3-Build_42'])
-            ]),
-            call([
-                'sed', '-ie', 's/test-image-1.2.3/readlinked/g',
-                os.sep.join([self.abs_bundle_dir, 'test-image-1.2.3-Build_42'])
-            ]),
-            call([
-                'file',
-                os.sep.join([self.abs_bundle_dir, 'test-image-noversion'])
-            ]),
-            call([
-                'sed', '-ie', 's/test-image-1.2.3/readlinked/g',
-                os.sep.join([self.abs_bundle_dir, 'test-image-noversion'])
-            ]),
             call([
                 'zsyncmake', '-e',
                 '-u', 'http://example.com/zsync/compressed_filename',
@@ -170,6 +162,48 @@ class TestResultBundleTask:
             )
         )
 
+    @patch('kiwi.tasks.result_bundle.Result.load')
+    @patch('kiwi.tasks.result_bundle.Command.run')
+    @patch('kiwi.tasks.result_bundle.Path.create')
+    @patch('kiwi.tasks.result_bundle.Compress')
+    @patch('os.path.exists')
+    @patch('kiwi.tasks.result_bundle.Path.clone')
+    @patch('kiwi.tasks.result_bundle.ResultBundleTask._rewrite_file_references')
+    def test_process_result_bundle_zstd(
+        self, mock_rewrite_file_references, mock_path_clone,
+        mock_exists, mock_compress,
+        mock_path_create, mock_command, mock_load
+    ):
+        compress = Mock()
+
+        def zstd(options):
+            # only one file is compressed at a time
+            assert self.task.compress_lock.locked()
+            return 'compressed_filename'
+
+        compress.zstd.side_effect = zstd
+        mock_compress.return_value = compress
+        mock_exists.return_value = False
+        mock_load.return_value = self.result
+        self.task.runtime_config.get_bundle_compression_format.return_value = \
+            'zstd'
+        self._init_command_args()
+        self.task.command_args['bundle'] = True
+
+        m_open = mock_open()
+        with patch('builtins.open', m_open, create=True):
+            self.task.process()
+
+        compress.zstd.assert_called_once_with(
+            self.task.runtime_config.get_zstd_options.return_value
+        )
+        assert not compress.xz.called
+        m_open.return_value.write.assert_called_once_with(
+            '{0}  compressed_filename{1}'.format(
+                self.task.runtime_config.get_checksum_handler.return_value.digest.return_value, os.linesep
+            )
+        )
+
     @patch('kiwi.tasks.result_bundle.Privileges.check_for_root_permissions')
     @patch('kiwi.tasks.result_bundle.Result.load')
     @patch('kiwi.tasks.result_bundle.Command.run')
@@ -181,14 +215,13 @@ class TestResultBundleTask:
     @patch('os.chdir')
     @patch('os.unlink')
     @patch('glob.iglob')
-    @patch('os.path.islink')
-    @patch('os.symlink')
-    @patch('os.readlink')
+    @patch('kiwi.tasks.result_bundle.Path.clone')
+    @patch('kiwi.tasks.result_bundle.ResultBundleTask._rewrite_file_references')
     @patch('os.path.realpath')
     @patch('os.path.abspath')
     def test_process_result_bundle_as_rpm(
-        self, mock_os_path_abspath, mock_os_path_realpath, mock_os_readlink,
-        mock_os_symlink, mock_os_path_islink, mock_iglob, mock_unlink,
+        self, mock_os_path_abspath, mock_os_path_realpath, mock_rewrite_file_references,
+        mock_path_clone, mock_iglob, mock_unlink,
         mock_chdir, mock_exists, mock_compress,
         mock_path_wipe, mock_path_which, mock_path_create, mock_command,
         mock_load, mock_Privileges_check_for_root_permissions
@@ -200,7 +233,6 @@ class TestResultBundleTask:
                 return 'bundle-dir'
 
         compress = Mock()
-        mock_os_readlink.return_value = 'readlink'
         mock_os_path_abspath.side_effect = abspath
         mock_path_which.return_value = 'zsyncmake'
         compress.xz.return_value = 'compressed_filename'
@@ -221,22 +253,6 @@ class TestResultBundleTask:
         mock_path_wipe.assert_called_once_with('bundle-dir')
         mock_Privileges_check_for_root_permissions.assert_called_once_with()
         assert mock_command.call_args_list == [
-            call(
-                [
-                    'cp', 'test-image-1.2.3',
-                    os.sep.join(
-                        ['bundle-dir', 'test-image-1.2.3-Build_42']
-                    )
-                ]
-            ),
-            call(
-                [
-                    'file',
-                    os.sep.join(
-                        ['bundle-dir', 'test-image-1.2.3-Build_42']
-                    )
-                ]
-            ),
             call(
                 [
                     'rpmbuild', '--nodeps', '--nocheck', '--rmspec', '-bb',
@@ -254,13 +270,11 @@ class TestResultBundleTask:
     @patch('kiwi.tasks.result_bundle.Command.run')
     @patch('kiwi.tasks.result_bundle.Path.create')
     @patch('os.path.exists')
-    @patch('os.path.islink')
-    @patch('os.unlink')
-    @patch('os.symlink')
-    @patch('os.readlink')
+    @patch('kiwi.tasks.result_bundle.Path.clone')
+    @patch('kiwi.tasks.result_bundle.ResultBundleTask._rewrite_file_references')
     def test_process_result_bundle_with_bundle_format(
-        self, mock_os_readlink, mock_os_symlink, mock_os_unlink,
-        mock_os_path_islink, mock_exists, mock_path_create, mock_command,
+        self, mock_rewrite_file_references, mock_path_clone,
+        mock_exists, mock_path_create, mock_command,
         mock_load
     ):
         self.xml_state.profiles = None
@@ -286,37 +300,28 @@ class TestResultBundleTask:
 
         self.task.process()
 
-        assert mock_command.call_args_list == [
-            call(
-                [
-                    'cp',
-                    '/tmp/mytest/Leap-15.2.x86_64-1.15.2.raw',
-                    os.sep.join(
-                        [self.abs_bundle_dir, 'Leap-15.2-oem:1.raw']
-                    )
-                ]
-            ),
-            call(
-                [
-                    'file',
-                    os.sep.join(
-                        [self.abs_bundle_dir, 'Leap-15.2-oem:1.raw']
-                    )
-                ]
-            )
-        ]
+        assert not mock_command.called
+        mock_path_clone.assert_called_once_with(
+            '/tmp/mytest/Leap-15.2.x86_64-1.15.2.raw',
+            os.sep.join(
+                [self.abs_bundle_dir, 'Leap-15.2-oem:1.raw']
+            ), allow_hardlink=False
+        )
+        mock_rewrite_file_references.assert_called_once_with(
+            os.sep.join(
+                [self.abs_bundle_dir, 'Leap-15.2-oem:1.raw']
+            ), [('Leap-15.2.x86_64-1.15.2.raw', 'Leap-15.2-oem:1.raw')]
+        )
 
     @patch('kiwi.tasks.result_bundle.Result.load')
     @patch('kiwi.tasks.result_bundle.Command.run')
     @patch('kiwi.tasks.result_bundle.Path.create')
     @patch('os.path.exists')
-    @patch('os.path.islink')
-    @patch('os.unlink')
-    @patch('os.symlink')
-    @patch('os.readlink')
+    @patch('kiwi.tasks.result_bundle.Path.clone')
+    @patch('kiwi.tasks.result_bundle.ResultBundleTask._rewrite_file_references')
     def test_process_result_bundle_with_bundle_format_for_vagrant_types(
-        self, mock_os_readlink, mock_os_symlink, mock_os_unlink,
-        mock_os_path_islink, mock_exists, mock_path_create, mock_command,
+        self, mock_rewrite_file_references, mock_path_clone,
+        mock_exists, mock_path_create, mock_command,
         mock_load
     ):
         self.xml_state.profiles = None
@@ -342,37 +347,28 @@ class TestResultBundleTask:
 
         self.task.process()
 
-        assert mock_command.call_args_list == [
-            call(
-                [
-                    'cp',
-                    '/tmp/mytest/Leap-15.2.x86_64-1.15.2.vagrant.virtualbox.box',
-                    os.sep.join(
-                        [self.abs_bundle_dir, 'Leap-15.2-oem:1.vagrant.virtualbox.box']
-                    )
-                ]
-            ),
-            call(
-                [
-                    'file',
-                    os.sep.join(
-                        [self.abs_bundle_dir, 'Leap-15.2-oem:1.vagrant.virtualbox.box']
-                    )
-                ]
-            )
-        ]
+        assert not mock_command.called
+        mock_path_clone.assert_called_once_with(
+            '/tmp/mytest/Leap-15.2.x86_64-1.15.2.vagrant.virtualbox.box',
+            os.sep.join(
+                [self.abs_bundle_dir, 'Leap-15.2-oem:1.vagrant.virtualbox.box']
+            ), allow_hardlink=False
+        )
+        mock_rewrite_file_references.assert_called_once_with(
+            os.sep.join(
+                [self.abs_bundle_dir, 'Leap-15.2-oem:1.vagrant.virtualbox.box']
+            ), [('Leap-15.2.x86_64-1.15.2.vagrant.virtualbox.box', 'Leap-15.2-oem:1.vagrant.virtualbox.box')]
+        )
 
     @patch('kiwi.tasks.result_bundle.Result.load')
     @patch('kiwi.tasks.result_bundle.Command.run')
     @patch('kiwi.tasks.result_bundle.Path.create')
     @patch('os.path.exists')
-    @patch('os.path.islink')
-    @patch('os.unlink')
-    @patch('os.symlink')
-    @patch('os.readlink')
+    @patch('kiwi.tasks.result_bundle.Path.clone')
+    @patch('kiwi.tasks.result_bundle.ResultBundleTask._rewrite_file_references')
     def test_process_result_bundle_with_bundle_format_for_archive_types(
-        self, mock_os_readlink, mock_os_symlink, mock_os_unlink,
-        mock_os_path_islink, mock_exists, mock_path_create, mock_command,
+        self, mock_rewrite_file_references, mock_path_clone,
+        mock_exists, mock_path_create, mock_command,
         mock_load
     ):
         self.xml_state.profiles = None
@@ -398,37 +394,28 @@ class TestResultBundleTask:
 
         self.task.process()
 
-        assert mock_command.call_args_list == [
-            call(
-                [
-                    'cp',
-                    '/tmp/mytest/Leap-15.2.x86_64-1.15.2.tar.xz',
-                    os.sep.join(
-                        [self.abs_bundle_dir, 'Leap-15.2-oem:1.tar.xz']
-                    )
-                ]
-            ),
-            call(
-                [
-                    'file',
-                    os.sep.join(
-                        [self.abs_bundle_dir, 'Leap-15.2-oem:1.tar.xz']
-                    )
-                ]
-            )
-        ]
+        assert not mock_command.called
+        mock_path_clone.assert_called_once_with(
+            '/tmp/mytest/Leap-15.2.x86_64-1.15.2.tar.xz',
+            os.sep.join(
+                [self.abs_bundle_dir, 'Leap-15.2-oem:1.tar.xz']
+            ), allow_hardlink=False
+        )
+        mock_rewrite_file_references.assert_called_once_with(
+            os.sep.join(
+                [self.abs_bundle_dir, 'Leap-15.2-oem:1.tar.xz']
+            ), [('Leap-15.2.x86_64-1.15.2.tar.xz', 'Leap-15.2-oem:1.tar.xz')]
+        )
 
     @patch('kiwi.tasks.result_bundle.Result.load')
     @patch('kiwi.tasks.result_bundle.Command.run')
     @patch('kiwi.tasks.result_bundle.Path.create')
     @patch('os.path.exists')
-    @patch('os.path.islink')
-    @patch('os.unlink')
-    @patch('os.symlink')
-    @patch('os.readlink')
+    @patch('kiwi.tasks.result_bundle.Path.clone')
+    @patch('kiwi.tasks.result_bundle.ResultBundleTask._rewrite_file_references')
     def test_process_result_bundle_with_bundle_format_for_oci_types(
-        self, mock_os_readlink, mock_os_symlink, mock_os_unlink,
-        mock_os_path_islink, mock_exists, mock_path_create, mock_command,
+        self, mock_rewrite_file_references, mock_path_clone,
+        mock_exists, mock_path_create, mock_command,
         mock_load
     ):
         self.xml_state.profiles = None
@@ -454,37 +441,28 @@ class TestResultBundleTask:
 
         self.task.process()
 
-        assert mock_command.call_args_list == [
-            call(
-                [
-                    'cp',
-                    '/tmp/mytest/Leap-15.2.x86_64-1.15.2.oci.tar.xz',
-                    os.sep.join(
-                        [self.abs_bundle_dir, 'Leap-15.2-oci:1.oci.tar.xz']
-                    )
-                ]
-            ),
-            call(
-                [
-                    'file',
-                    os.sep.join(
-                        [self.abs_bundle_dir, 'Leap-15.2-oci:1.oci.tar.xz']
-                    )
-                ]
-            )
-        ]
+        assert not mock_command.called
+        mock_path_clone.assert_called_once_with(
+            '/tmp/mytest/Leap-15.2.x86_64-1.15.2.oci.tar.xz',
+            os.sep.join(
+                [self.abs_bundle_dir, 'Leap-15.2-oci:1.oci.tar.xz']
+            ), allow_hardlink=False
+        )
+        mock_rewrite_file_references.assert_called_once_with(
+            os.sep.join(
+                [self.abs_bundle_dir, 'Leap-15.2-oci:1.oci.tar.xz']
+            ), [('Leap-15.2.x86_64-1.15.2.oci.tar.xz', 'Leap-15.2-oci:1.oci.tar.xz')]
+        )
 
     @patch('kiwi.tasks.result_bundle.Result.load')
     @patch('kiwi.tasks.result_bundle.Command.run')
     @patch('kiwi.tasks.result_bundle.Path.create')
     @patch('os.path.exists')
-    @patch('os.path.islink')
-    @patch('os.unlink')
-    @patch('os.symlink')
-    @patch('os.readlink')
+    @patch('kiwi.tasks.result_bundle.Path.clone')
+    @patch('kiwi.tasks.result_bundle.ResultBundleTask._rewrite_file_references')
     def test_process_result_bundle_with_bundle_format_for_docker_type(
-        self, mock_os_readlink, mock_os_symlink, mock_os_unlink,
-        mock_os_path_islink, mock_exists, mock_path_create, mock_command,
+        self, mock_rewrite_file_references, mock_path_clone,
+        mock_exists, mock_path_create, mock_command,
         mock_load
     ):
         self.xml_state.profiles = None
@@ -510,37 +488,28 @@ class TestResultBundleTask:
 
         self.task.process()
 
-        assert mock_command.call_args_list == [
-            call(
-                [
-                    'cp',
-                    '/tmp/mytest/Leap-15.2.x86_64-1.15.2.docker.tar',
-                    os.sep.join(
-                        [self.abs_bundle_dir, 'Leap-15.2-docker:1.docker.tar']
-                    )
-                ]
-            ),
-            call(
-                [
-                    'file',
-                    os.sep.join(
-                        [self.abs_bundle_dir, 'Leap-15.2-docker:1.docker.tar']
-                    )
-                ]
-            )
-        ]
+        assert not mock_command.called
+        mock_path_clone.assert_called_once_with(
+            '/tmp/mytest/Leap-15.2.x86_64-1.15.2.docker.tar',
+            os.sep.join(
+                [self.abs_bundle_dir, 'Leap-15.2-docker:1.docker.tar']
+            ), allow_hardlink=False
+        )
+        mock_rewrite_file_references.assert_called_once_with(
+            os.sep.join(
+                [self.abs_bundle_dir, 'Leap-15.2-docker:1.docker.tar']
+            ), [('Leap-15.2.x86_64-1.15.2.docker.tar', 'Leap-15.2-docker:1.docker.tar')]
+        )
 
     @patch('kiwi.tasks.result_bundle.Result.load')
     @patch('kiwi.tasks.result_bundle.Command.run')
     @patch('kiwi.tasks.result_bundle.Path.create')
     @patch('os.path.exists')
-    @patch('os.path.islink')
-    @patch('os.unlink')
-    @patch('os.symlink')
-    @patch('os.readlink')
+    @patch('kiwi.tasks.result_bundle.Path.clone')
+    @patch('kiwi.tasks.result_bundle.ResultBundleTask._rewrite_file_references')
     def test_process_result_bundle_with_bundle_format_for_compressed_docker_type(
-        self, mock_os_readlink, mock_os_symlink, mock_os_unlink,
-        mock_os_path_islink, mock_exists, mock_path_create, mock_command,
+        self, mock_rewrite_file_references, mock_path_clone,
+        mock_exists, mock_path_create, mock_command,
         mock_load
     ):
         self.xml_state.profiles = None
@@ -566,37 +535,28 @@ class TestResultBundleTask:
 
         self.task.process()
 
-        assert mock_command.call_args_list == [
-            call(
-                [
-                    'cp',
-                    '/tmp/mytest/Leap-15.2.x86_64-1.15.2.docker.tar.xz',
-                    os.sep.join(
-                        [self.abs_bundle_dir, 'Leap-15.2-docker:1.docker.tar.xz']
-                    )
-                ]
-            ),
-            call(
-                [
-                    'file',
-                    os.sep.join(
-                        [self.abs_bundle_dir, 'Leap-15.2-docker:1.docker.tar.xz']
-                    )
-                ]
-            )
-        ]
+        assert not mock_command.called
+        mock_path_clone.assert_called_once_with(
+            '/tmp/mytest/Leap-15.2.x86_64-1.15.2.docker.tar.xz',
+            os.sep.join(
+                [self.abs_bundle_dir, 'Leap-15.2-docker:1.docker.tar.xz']
+            ), allow_hardlink=False
+        )
+        mock_rewrite_file_references.assert_called_once_with(
+            os.sep.join(
+                [self.abs_bundle_dir, 'Leap-15.2-docker:1.docker.tar.xz']
+            ), [('Leap-15.2.x86_64-1.15.2.docker.tar.xz', 'Leap-15.2-docker:1.docker.tar.xz')]
+        )
 
     @patch('kiwi.tasks.result_bundle.Result.load')
     @patch('kiwi.tasks.result_bundle.Command.run')
     @patch('kiwi.tasks.result_bundle.Path.create')
     @patch('os.path.exists')
-    @patch('os.path.islink')
-    @patch('os.unlink')
-    @patch('os.symlink')
-    @patch('os.readlink')
+    @patch('kiwi.tasks.result_bundle.Path.clone')
+    @patch('kiwi.tasks.result_bundle.ResultBundleTask._rewrite_file_references')
     def test_process_result_bundle_with_bundle_format_from_commandline(
-        self, mock_os_readlink, mock_os_symlink, mock_os_unlink,
-        mock_os_path_islink, mock_exists, mock_path_create, mock_command,
+        self, mock_rewrite_file_references, mock_path_clone,
+        mock_exists, mock_path_create, mock_command,
         mock_load
     ):
         self.xml_state.profiles = None
@@ -623,37 +583,28 @@ class TestResultBundleTask:
 
         self.task.process()
 
-        assert mock_command.call_args_list == [
-            call(
-                [
-                    'cp',
-                    '/tmp/mytest/Leap-15.2.x86_64-1.15.2.raw',
-                    os.sep.join(
-                        [self.abs_bundle_dir, 'Leap-15.2-oem:1.raw']
-                    )
-                ]
-            ),
-            call(
-                [
-                    'file',
-                    os.sep.join(
-                        [self.abs_bundle_dir, 'Leap-15.2-oem:1.raw']
-                    )
-                ]
-            )
-        ]
+        assert not mock_command.called
+        mock_path_clone.assert_called_once_with(
+            '/tmp/mytest/Leap-15.2.x86_64-1.15.2.raw',
+            os.sep.join(
+                [self.abs_bundle_dir, 'Leap-15.2-oem:1.raw']
+            ), allow_hardlink=False
+        )
+        mock_rewrite_file_references.assert_called_once_with(
+            os.sep.join(
+                [self.abs_bundle_dir, 'Leap-15.2-oem:1.raw']
+            ), [('Leap-15.2.x86_64-1.15.2.raw', 'Leap-15.2-oem:1.raw')]
+        )
 
     @patch('kiwi.tasks.result_bundle.Result.load')
     @patch('kiwi.tasks.result_bundle.Command.run')
     @patch('kiwi.tasks.result_bundle.Path.create')
     @patch('os.path.exists')
-    @patch('os.path.islink')
-    @patch('os.unlink')
-    @patch('os.symlink')
-    @patch('os.readlink')
+    @patch('kiwi.tasks.result_bundle.Path.clone')
+    @patch('kiwi.tasks.result_bundle.ResultBundleTask._rewrite_file_references')
     def test_process_result_bundle_name_includes_version(
-        self, mock_os_readlink, mock_os_symlink, mock_os_unlink,
-        mock_os_path_islink, mock_exists, mock_path_create, mock_command,
+        self, mock_rewrite_file_references, mock_path_clone,
+        mock_exists, mock_path_create, mock_command,
         mock_load
     ):
         result = Result(self.xml_state)
@@ -676,24 +627,18 @@ class TestResultBundleTask:
             os.sep.join([self.abs_target_dir, 'kiwi.result'])
         )
         mock_path_create.assert_called_once_with(self.abs_bundle_dir)
-        assert mock_command.call_args_list == [
-            call(
-                [
-                    'cp', 'test-1.2.3-image-1.2.3',
-                    os.sep.join(
-                        [self.abs_bundle_dir, 'test-1.2.3-image-1.2.3-Build_42']
-                    )
-                ]
-            ),
-            call(
-                [
-                    'file',
-                    os.sep.join(
-                        [self.abs_bundle_dir, 'test-1.2.3-image-1.2.3-Build_42']
-                    )
-                ]
-            )
-        ]
+        assert not mock_command.called
+        mock_path_clone.assert_called_once_with(
+            'test-1.2.3-image-1.2.3',
+            os.sep.join(
+                [self.abs_bundle_dir, 'test-1.2.3-image-1.2.3-Build_42']
+            ), allow_hardlink=False
+        )
+        mock_rewrite_file_references.assert_called_once_with(
+            os.sep.join(
+                [self.abs_bundle_dir, 'test-1.2.3-image-1.2.3-Build_42']
+            ), [('test-1.2.3-image-1.2.3', 'test-1.2.3-image-1.2.3-Build_42')]
+        )
 
     @patch('kiwi.tasks.result_bundle.Result.load')
     @patch('kiwi.tasks.result_bundle.Command.run')
@@ -701,13 +646,11 @@ class TestResultBundleTask:
     @patch('kiwi.tasks.result_bundle.Path.which')
     @patch('kiwi.tasks.result_bundle.Compress')
     @patch('os.path.exists')
-    @patch('os.path.islink')
-    @patch('os.unlink')
-    @patch('os.symlink')
-    @patch('os.readlink')
+    @patch('kiwi.tasks.result_bundle.Path.clone')
+    @patch('kiwi.tasks.result_bundle.ResultBundleTask._rewrite_file_references')
     def test_process_result_bundle_zsyncmake_missing(
-        self, mock_os_readlink, mock_os_symlink, mock_os_unlink,
-        mock_os_path_islink, mock_exists, mock_compress,
+        self, mock_rewrite_file_references, mock_path_clone,
+        mock_exists, mock_compress,
         mock_path_which, mock_path_create, mock_command, mock_load
     ):
         compress = Mock()
@@ -726,6 +669,35 @@ class TestResultBundleTask:
                 assert '--> zsyncmake missing, zsync setup skipped' in \
                     self._caplog.text
 
+    def test_rewrite_file_references(self, tmpdir):
+        renames = [
+            ('test-image-1.2.3', 'test-image-1.2.3-Build_42'),
+            ('test-image.raw', 'test-image-Build_42.raw')
+        ]
+        packages = tmpdir.join('test-image-1.2.3-Build_42.packages')
+        packages.write('test-image-1.2.3.raw\ntest-image.raw\n')
+        os.chmod(packages.strpath, 0o640)
+        origin = tmpdir.join('origin.packages')
+        os.link(packages.strpath, origin.strpath)
+        image = tmpdir.join('test-image-1.2.3-Build_42.raw')
+        image.write_binary(b'\0test-image-1.2.3')
+        unchanged = tmpdir.join('test-image-1.2.3-Build_42.changes')
+        unchanged.write('no references')
+        inode = os.stat(unchanged.strpath).st_ino
+
+        for bundle_file in (packages, image, unchanged):
+            ResultBundleTask._rewrite_file_references(
+                bundle_file.strpath, renames
+            )
+
+        assert packages.read() == \
+            'test-image-1.2.3-Build_42.raw\ntest-image-Build_42.raw\n'
+        assert os.stat(packages.strpath).st_mode & 0o777 == 0o640
+        # hard linked origin is not modified
+        assert origin.read() == 'test-image-1.2.3.raw\ntest-image.raw\n'
+        assert image.read_binary() == b'\0test-image-1.2.3'
+        assert os.stat(unchanged.strpath).st_ino == inode
+
     def test_process_result_bundle_help(self):
         self._init_command_args()
         self.task.command_args['help'] = True
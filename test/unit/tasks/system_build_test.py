@@ -39,9 +39,11 @@ class TestSystemBuildTask:
         )
 
         self.runtime_checker = Mock()
-        kiwi.tasks.base.RuntimeChecker = Mock(
+        self.runtime_checker_patch = patch(
+            'kiwi.runtime_checker.RuntimeChecker',
             return_value=self.runtime_checker
         )
+        self.runtime_checker_patch.start()
 
         self.setup = Mock()
         kiwi.tasks.system_build.SystemSetup = Mock(
@@ -71,6 +73,7 @@ class TestSystemBuildTask:
 
     def teardown(self):
         sys.argv = argv_kiwi_tests
+        self.runtime_checker_patch.stop()
 
     def teardown_method(self, cls):
         self.teardown()
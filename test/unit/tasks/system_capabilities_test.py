@@ -0,0 +1,91 @@
+import sys
+from unittest.mock import (
+    patch, Mock
+)
+
+import kiwi
+
+from ..test_helper import argv_kiwi_tests
+from kiwi.tasks.system_capabilities import SystemCapabilitiesTask
+
+
+class TestSystemCapabilitiesTask:
+    def setup(self):
+        sys.argv = [
+            sys.argv[0], 'system', 'capabilities'
+        ]
+        kiwi.tasks.system_capabilities.Help = Mock(
+            return_value=Mock()
+        )
+        self.task = SystemCapabilitiesTask()
+
+    def setup_method(self, cls):
+        self.setup()
+
+    def teardown(self):
+        sys.argv = argv_kiwi_tests
+
+    def teardown_method(self, cls):
+        self.teardown()
+
+    def _init_command_args(self):
+        self.task.command_args = {}
+        self.task.command_args['help'] = False
+        self.task.command_args['capabilities'] = False
+        self.task.command_args['--clear-cache'] = False
+
+    @patch('kiwi.tasks.system_capabilities.DataOutput')
+    @patch('kiwi.tasks.system_capabilities.Path.which')
+    @patch('kiwi.tasks.system_capabilities.CommandCapabilities')
+    def test_process_system_capabilities(
+        self, mock_CommandCapabilities, mock_Path_which, mock_DataOutput
+    ):
+        def which(filename, access_mode):
+            return None if filename == 'checkmedia' else filename
+
+        mock_Path_which.side_effect = which
+        mock_CommandCapabilities.check_version.return_value = True
+        mock_CommandCapabilities.has_option_in_help.return_value = False
+        mock_CommandCapabilities.cache_file = 'capabilities.json'
+        mock_CommandCapabilities.get_cached_probes.return_value = []
+        self._init_command_args()
+        self.task.command_args['capabilities'] = True
+        self.task.command_args['--clear-cache'] = True
+        self.task.global_args['--color-output'] = False
+        self.task.process()
+        mock_CommandCapabilities.invalidate_cache.assert_called_once_with()
+        mock_CommandCapabilities.check_version.assert_any_call(
+            'tar', (1, 27), raise_on_error=False, silent=True
+        )
+        mock_CommandCapabilities.has_option_in_help.assert_any_call(
+            'losetup', '--sector-size', raise_on_error=False, silent=True
+        )
+        mock_DataOutput.assert_called_once_with(
+            {
+                'capabilities': {
+                    'tar version >= 1.27': True,
+                    'losetup --sector-size': False,
+                    'umoci config --no-history': False,
+                    'skopeo version >= 0.2.0': True,
+                    'skopeo copy --additional-tag': False,
+                    'checkmedia version >= 6.6': 'not installed'
+                },
+                'cache_file': 'capabilities.json',
+                'probes': []
+            }
+        )
+        mock_DataOutput.return_value.display.assert_called_once_with()
+
+        mock_DataOutput.reset_mock()
+        self.task.global_args['--color-output'] = True
+        self.task.process()
+        assert mock_DataOutput.call_args[1] == {'style': 'color'}
+
+    def test_process_system_capabilities_help(self):
+        self._init_command_args()
+        self.task.command_args['help'] = True
+        self.task.command_args['capabilities'] = True
+        self.task.process()
+        self.task.manual.show.assert_called_once_with(
+            'kiwi::system::capabilities'
+        )
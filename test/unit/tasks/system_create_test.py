@@ -1,6 +1,6 @@
 import sys
 from unittest.mock import (
-    Mock, MagicMock
+    patch, Mock, MagicMock
 )
 import os
 
@@ -31,9 +31,11 @@ class TestSystemCreateTask:
         )
 
         self.runtime_checker = Mock()
-        kiwi.tasks.base.RuntimeChecker = Mock(
+        self.runtime_checker_patch = patch(
+            'kiwi.runtime_checker.RuntimeChecker',
             return_value=self.runtime_checker
         )
+        self.runtime_checker_patch.start()
 
         self.runtime_config = Mock()
         self.runtime_config.get_disabled_runtime_checks.return_value = []
@@ -62,6 +64,7 @@ class TestSystemCreateTask:
 
     def teardown(self):
         sys.argv = argv_kiwi_tests
+        self.runtime_checker_patch.stop()
 
     def teardown_method(self, cls):
         self.teardown()
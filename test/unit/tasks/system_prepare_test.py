@@ -38,9 +38,11 @@ class TestSystemPrepareTask:
         kiwi.tasks.system_prepare.Privileges = Mock()
 
         self.runtime_checker = Mock()
-        kiwi.tasks.base.RuntimeChecker = Mock(
+        self.runtime_checker_patch = patch(
+            'kiwi.runtime_checker.RuntimeChecker',
             return_value=self.runtime_checker
         )
+        self.runtime_checker_patch.start()
 
         self.setup = Mock()
         kiwi.tasks.system_prepare.SystemSetup = Mock(
@@ -64,6 +66,7 @@ class TestSystemPrepareTask:
 
     def teardown(self):
         sys.argv = argv_kiwi_tests
+        self.runtime_checker_patch.stop()
 
     def teardown_method(self, cls):
         self.teardown()
@@ -0,0 +1,109 @@
+import os
+import errno
+from unittest.mock import patch
+from pytest import (
+    raises, fixture
+)
+
+from kiwi.utils.block_copy import BlockCopy
+
+from kiwi.exceptions import KiwiBlockCopyError
+
+MB = 1048576
+
+
+class TestBlockCopy:
+    @fixture(autouse=True)
+    def inject_fixtures(self, tmpdir):
+        self.source = tmpdir.join('source').strpath
+        self.target = tmpdir.join('target').strpath
+        # 16MB sparse source with data at 1MB, an explicitly
+        # written zero block at 5MB and data at the end
+        with open(self.source, 'wb') as source:
+            source.truncate(16 * MB)
+            source.seek(MB)
+            source.write(b'a' * MB)
+            source.seek(5 * MB)
+            source.write(bytes(MB))
+            source.seek(16 * MB - 4096)
+            source.write(b'z' * 4096)
+        with open(self.source, 'rb') as source:
+            self.data = source.read()
+
+    def _read_target(self):
+        with open(self.target, 'rb') as target:
+            return target.read()
+
+    def test_copy(self):
+        with open(self.target, 'wb') as target:
+            target.write(b'x' * 32 * MB)
+        written = BlockCopy(self.source, self.target, MB).copy()
+        assert self._read_target() == self.data
+        assert written < 16 * MB
+
+    @patch('os.copy_file_range')
+    @patch('kiwi.utils.block_copy.Logger.progress')
+    def test_copy_buffered(self, mock_progress, mock_copy_file_range):
+        mock_copy_file_range.side_effect = OSError(errno.EXDEV, 'cross dev')
+        written = BlockCopy(self.source, self.target, MB).copy(
+            progress_prefix='Dumping'
+        )
+        assert self._read_target() == self.data
+        # zero blocks inside of data segments are not written
+        assert written <= MB + MB + 4096
+        mock_progress.assert_called_with(100, 100, 'Dumping')
+
+    @patch('kiwi.utils.block_copy.BlockID.invalidate')
+    def test_copy_to_block_device(self, mock_BlockID_invalidate):
+        with patch('stat.S_ISBLK', return_value=True):
+            BlockCopy(self.source, self.target, MB).copy()
+        mock_BlockID_invalidate.assert_called_once_with(self.target)
+
+    @patch('kiwi.utils.block_copy.BlockID.invalidate')
+    def test_copy_to_file(self, mock_BlockID_invalidate):
+        BlockCopy(self.source, self.target, MB).copy()
+        assert not mock_BlockID_invalidate.called
+
+    def test_copy_not_sparse(self):
+        with patch('os.copy_file_range') as mock_copy_file_range:
+            mock_copy_file_range.side_effect = OSError(errno.EINVAL, 'einval')
+            assert BlockCopy(self.source, self.target, MB).copy(
+                sparse=False
+            ) == 16 * MB
+        assert self._read_target() == self.data
+
+    def test_copy_without_seek_data_support(self):
+        lseek = os.lseek
+
+        def no_seek_data(fd, offset, whence):
+            if whence == os.SEEK_DATA:
+                raise OSError(errno.EINVAL, 'einval')
+            return lseek(fd, offset, whence)
+
+        with patch('os.lseek', side_effect=no_seek_data):
+            BlockCopy(self.source, self.target, MB).copy()
+        assert self._read_target() == self.data
+
+    def test_copy_sparse_source(self):
+        with open(self.source, 'wb') as source:
+            source.truncate(4 * MB)
+        assert BlockCopy(self.source, self.target).copy() == 0
+        assert self._read_target() == bytes(4 * MB)
+
+    def test_copy_source_missing(self):
+        with raises(KiwiBlockCopyError):
+            BlockCopy(self.source + '.missing', self.target).copy()
+
+    @patch('os.copy_file_range')
+    def test_copy_kernel_copy_failed(self, mock_copy_file_range):
+        mock_copy_file_range.side_effect = OSError(errno.EIO, 'eio')
+        with raises(KiwiBlockCopyError):
+            BlockCopy(self.source, self.target).copy()
+
+    @patch('os.copy_file_range')
+    @patch('os.preadv')
+    def test_copy_source_truncated(self, mock_preadv, mock_copy_file_range):
+        mock_copy_file_range.return_value = 0
+        mock_preadv.return_value = 0
+        with raises(KiwiBlockCopyError):
+            BlockCopy(self.source, self.target).copy()
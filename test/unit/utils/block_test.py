@@ -1,11 +1,21 @@
 from unittest.mock import (
     Mock, patch
 )
+from pytest import fixture
 
 from kiwi.utils.block import BlockID
 
 
 class TestBlockID:
+    @fixture(autouse=True)
+    def inject_fixtures(self, tmpdir):
+        self.uevent_seqnum = tmpdir.join('uevent_seqnum').strpath
+        with open(self.uevent_seqnum, 'w') as uevent_seqnum:
+            uevent_seqnum.write('42\n')
+        BlockID.uevent_seqnum_file = self.uevent_seqnum
+        yield
+        BlockID.uevent_seqnum_file = '/sys/kernel/uevent_seqnum'
+
     def setup(self):
         self.blkid = BlockID('device')
 
@@ -21,12 +31,45 @@ class TestBlockID:
 
     @patch('kiwi.utils.block.Command.run')
     def test_get_blkid(self, mock_command):
-        self.blkid.get_blkid('LABEL')
+        mock_command.return_value.output = \
+            'DEVNAME=device\nLABEL=my\\ label\nUUID=uuid\nTYPE=ext4\n'
+        assert self.blkid.get_blkid('LABEL') == 'my label'
+        assert self.blkid.get_blkid('UUID') == 'uuid'
+        assert self.blkid.get_blkid('PTUUID') == ''
         mock_command.assert_called_once_with(
-            ['blkid', 'device', '-s', 'LABEL', '-o', 'value'],
+            ['blkid', '-o', 'export', 'device'],
             raise_on_error=False
         )
 
+    @patch('kiwi.utils.block.Command.run')
+    def test_get_tags_no_result(self, mock_command):
+        mock_command.return_value = None
+        assert self.blkid.get_tags() == {}
+
+    @patch('kiwi.utils.block.Command.run')
+    def test_get_tags_cache_invalidation(self, mock_command):
+        mock_command.return_value.output = 'TYPE=ext4\n'
+        assert self.blkid.get_filesystem() == 'ext4'
+        mock_command.return_value.output = 'TYPE=xfs\n'
+        assert self.blkid.get_filesystem() == 'ext4'
+        BlockID.invalidate('other-device')
+        assert self.blkid.get_filesystem() == 'ext4'
+        BlockID.invalidate('device')
+        assert self.blkid.get_filesystem() == 'xfs'
+        mock_command.return_value.output = 'TYPE=btrfs\n'
+        with open(self.uevent_seqnum, 'w') as uevent_seqnum:
+            uevent_seqnum.write('43\n')
+        assert self.blkid.get_filesystem() == 'btrfs'
+        assert mock_command.call_count == 3
+
+    @patch('kiwi.utils.block.Command.run')
+    def test_get_tags_without_uevent_seqnum(self, mock_command):
+        BlockID.uevent_seqnum_file = self.uevent_seqnum + '.missing'
+        mock_command.return_value.output = 'TYPE=ext4\n'
+        assert self.blkid.get_filesystem() == 'ext4'
+        assert self.blkid.get_filesystem() == 'ext4'
+        assert mock_command.call_count == 1
+
     @patch('kiwi.utils.block.BlockID.get_blkid')
     def test_get_filesystem(self, mock_get_blkid):
         self.blkid.get_filesystem()
@@ -53,3 +96,10 @@ class TestBlockID:
         lsblk_call.output = "NAME TYPE\nsda disk\nsda4 part \nsda3 part"
         mock_Command_run.return_value = lsblk_call
         assert self.blkid.get_partition_count() == 2
+        assert self.blkid.get_partition_count() == 2
+        mock_Command_run.assert_called_once_with(
+            ['lsblk', '-r', '-o', 'NAME,TYPE', 'device']
+        )
+        BlockID.invalidate()
+        assert self.blkid.get_partition_count() == 2
+        assert mock_Command_run.call_count == 2
@@ -0,0 +1,255 @@
+import os
+import io
+import logging
+from unittest.mock import patch
+from pytest import fixture
+
+from kiwi.utils.bootstrap_cache import (
+    BootstrapCache, RepositorySourceT
+)
+
+
+class TestBootstrapCache:
+    @fixture(autouse=True)
+    def inject_fixtures(self, caplog, tmpdir):
+        self._caplog = caplog
+        self._tmpdir = tmpdir
+        self.cache_dir = tmpdir.join('cache').strpath
+        self.repo_dir = tmpdir.mkdir('repo')
+        self.repo_dir.mkdir('repodata').join('repomd.xml').write('<repomd/>')
+        self.root_dir = tmpdir.mkdir('root')
+        self.root_dir.mkdir('etc').join('os-release').write('ID=test')
+        self.root_dir.join('etc').join('hosts').write('localhost')
+        self.root_dir.mkdir('proc').join('cpuinfo').write('cpu')
+        self.repositories = [
+            RepositorySourceT(
+                self.repo_dir.strpath, 'rpm-md', '', False, 'repo', None, '', ''
+            )
+        ]
+        BootstrapCache.set_cache_dir(self.cache_dir, 1024 * 1024)
+
+    def test_get_key(self):
+        key = BootstrapCache.get_key('zypper', ['vim'], self.repositories)
+        assert len(key) == 64
+        assert key == BootstrapCache.get_key(
+            'zypper', ['vim'], self.repositories
+        )
+        assert key != BootstrapCache.get_key(
+            'zypper', ['vim', 'zsh'], self.repositories
+        )
+        assert key != BootstrapCache.get_key(
+            'dnf4', ['vim'], self.repositories
+        )
+        assert key != BootstrapCache.get_key(
+            'zypper', ['vim'], [self.repositories[0]._replace(priority=42)]
+        )
+        assert key != BootstrapCache.get_key(
+            'zypper', ['vim'], [self.repositories[0]._replace(alias='other')]
+        )
+        self.repo_dir.join('repodata').join('repomd.xml').write('<new/>')
+        assert key != BootstrapCache.get_key(
+            'zypper', ['vim'], self.repositories
+        )
+
+    def test_get_key_files(self):
+        script = self._tmpdir.join('customize.sh')
+        script.write('#!/bin/sh')
+        signing_key = self._tmpdir.join('key.asc')
+        signing_key.write('key')
+        repositories = [
+            self.repositories[0]._replace(customization_script=script.strpath)
+        ]
+        key = BootstrapCache.get_key(
+            'zypper', ['vim'], repositories, [signing_key.strpath]
+        )
+        assert key
+        script.write('#!/bin/bash')
+        assert key != BootstrapCache.get_key(
+            'zypper', ['vim'], repositories, [signing_key.strpath]
+        )
+        key = BootstrapCache.get_key(
+            'zypper', ['vim'], repositories, [signing_key.strpath]
+        )
+        signing_key.write('new key')
+        assert key != BootstrapCache.get_key(
+            'zypper', ['vim'], repositories, [signing_key.strpath]
+        )
+        with self._caplog.at_level(logging.INFO):
+            assert BootstrapCache.get_key(
+                'zypper', ['vim'], repositories, ['missing.asc']
+            ) == ''
+        assert 'No bootstrap cache: failed to read missing.asc' in \
+            self._caplog.text
+
+    def test_get_key_apt(self):
+        self.repo_dir.mkdir('dists').mkdir('stable').join('Release').write(
+            'Suite: stable'
+        )
+        repositories = [
+            RepositorySourceT(
+                self.repo_dir.strpath, 'apt-deb', 'stable', False, 'repo',
+                None, 'main', ''
+            )
+        ]
+        key = BootstrapCache.get_key('apt', ['vim'], repositories)
+        assert key
+        self.repo_dir.join('dists').join('stable').join('InRelease').write(
+            'Suite: stable signed'
+        )
+        assert key != BootstrapCache.get_key('apt', ['vim'], repositories)
+
+    @patch('urllib.request.urlopen')
+    def test_get_key_remote(self, mock_urlopen):
+        mock_urlopen.return_value = io.BytesIO(b'<repomd/>')
+        repositories = [
+            RepositorySourceT(
+                'https://example.org/repo/', 'rpm-md', '', True, 'repo',
+                None, '', ''
+            )
+        ]
+        assert BootstrapCache.get_key('zypper', ['vim'], repositories)
+        mock_urlopen.assert_called_once_with(
+            'https://example.org/repo/repodata/repomd.xml', timeout=30
+        )
+        mock_urlopen.side_effect = OSError('unreachable')
+        with self._caplog.at_level(logging.INFO):
+            assert BootstrapCache.get_key(
+                'zypper', ['vim'], repositories
+            ) == ''
+        assert 'No bootstrap cache: no metadata' in self._caplog.text
+
+    def test_get_key_unknown_repo_type(self):
+        repositories = [
+            self.repositories[0]._replace(repo_type='pacman')
+        ]
+        assert BootstrapCache.get_key('pacman', ['vim'], repositories) == ''
+
+    def test_inactive(self):
+        BootstrapCache.cache_dir = None
+        assert BootstrapCache.get_key(
+            'zypper', ['vim'], self.repositories
+        ) == ''
+        assert BootstrapCache.restore(
+            'key', self.root_dir.strpath, []
+        ) is False
+        BootstrapCache.store('key', self.root_dir.strpath, [])
+        assert not os.path.exists(self.cache_dir)
+
+    @patch.object(BootstrapCache, '_has_reflink_support')
+    def test_store_restore_tree(self, mock_has_reflink_support):
+        mock_has_reflink_support.return_value = True
+        assert BootstrapCache.restore(
+            'key', self.root_dir.strpath, []
+        ) is False
+        BootstrapCache.store(
+            'key', self.root_dir.strpath, ['proc', 'etc/hosts']
+        )
+        tree = os.sep.join([self.cache_dir, 'key'])
+        assert sorted(os.listdir(tree)) == ['etc']
+        assert os.listdir(os.sep.join([tree, 'etc'])) == ['os-release']
+
+        new_root = self._tmpdir.mkdir('new_root')
+        new_root.mkdir('proc')
+        assert BootstrapCache.restore('key', new_root.strpath, []) is True
+        assert new_root.join('etc').join('os-release').read() == 'ID=test'
+        assert new_root.join('proc').listdir() == []
+
+        BootstrapCache.invalidate()
+        assert not os.path.exists(self.cache_dir)
+
+    @patch('kiwi.utils.bootstrap_cache.Command.run')
+    @patch('kiwi.utils.bootstrap_cache.ArchiveTar')
+    @patch.object(BootstrapCache, '_has_reflink_support')
+    def test_store_restore_archive(
+        self, mock_has_reflink_support, mock_ArchiveTar, mock_Command_run
+    ):
+        mock_has_reflink_support.return_value = False
+
+        def create_zstd_compressed(source_dir, exclude, options):
+            with open(f'{temporary}.zst', 'w') as archive:
+                archive.write('data')
+            return f'{temporary}.zst'
+
+        temporary = os.sep.join([self.cache_dir, f'key.tmp{os.getpid()}'])
+        mock_ArchiveTar.return_value.create_zstd_compressed.side_effect = \
+            create_zstd_compressed
+        BootstrapCache.store('key', self.root_dir.strpath, ['proc'])
+        mock_ArchiveTar.assert_called_once_with(
+            temporary, create_from_file_list=False
+        )
+        mock_ArchiveTar.return_value.create_zstd_compressed.assert_called_once_with(
+            self.root_dir.strpath, exclude=['proc'], options=[
+                '--numeric-owner', '--acls', '--sparse', '--one-file-system'
+            ]
+        )
+        archive = os.sep.join([self.cache_dir, 'key.tar.zst'])
+        assert os.path.isfile(archive)
+        assert not os.path.exists(f'{temporary}.zst')
+
+        assert BootstrapCache.restore('key', 'new_root', ['proc']) is True
+        mock_Command_run.assert_called_once_with(
+            [
+                'tar', '-C', 'new_root', '--numeric-owner', '--xattrs',
+                '--xattrs-include=*', '--acls', '-x', '-f', archive,
+                '--exclude', './proc'
+            ]
+        )
+
+    @patch.object(BootstrapCache, '_has_reflink_support')
+    def test_store_evicts_least_recently_used(self, mock_has_reflink_support):
+        mock_has_reflink_support.return_value = True
+        self.root_dir.join('etc').join('data').write('x' * 65536)
+        BootstrapCache.max_size = 100 * 1024
+        BootstrapCache.store('old', self.root_dir.strpath, [])
+        os.utime(os.sep.join([self.cache_dir, 'old']), (0, 0))
+        BootstrapCache.store('new', self.root_dir.strpath, [])
+        assert sorted(os.listdir(self.cache_dir)) == ['.lock', 'new']
+
+    @patch('kiwi.utils.bootstrap_cache.SyncManifest')
+    @patch.object(BootstrapCache, '_has_reflink_support')
+    def test_store_failed(self, mock_has_reflink_support, mock_SyncManifest):
+        mock_has_reflink_support.return_value = True
+        mock_SyncManifest.return_value.sync.side_effect = OSError('full')
+        with self._caplog.at_level(logging.WARNING):
+            BootstrapCache.store('key', self.root_dir.strpath, [])
+        assert 'Failed to store bootstrap root: full' in self._caplog.text
+        assert os.listdir(self.cache_dir) == []
+
+    @patch('kiwi.utils.bootstrap_cache.SyncManifest')
+    def test_restore_failed(self, mock_SyncManifest):
+        os.makedirs(os.sep.join([self.cache_dir, 'key']))
+
+        def partial_sync(root_dir, flags, exclude):
+            self.root_dir.mkdir('usr').join('partial').write('data')
+            self.root_dir.join('etc').join('partial').write('data')
+            raise OSError('full')
+
+        mock_SyncManifest.return_value.sync.side_effect = partial_sync
+        with self._caplog.at_level(logging.WARNING):
+            assert BootstrapCache.restore(
+                'key', self.root_dir.strpath, ['proc']
+            ) is False
+        assert 'Failed to restore bootstrap root: full' in self._caplog.text
+        # everything restored up to the failure is deleted
+        assert sorted(
+            os.path.basename(item) for item in self.root_dir.listdir()
+        ) == ['etc', 'proc']
+        assert sorted(os.listdir(self.root_dir.join('etc'))) == [
+            'hosts', 'os-release'
+        ]
+        assert self.root_dir.join('proc').join('cpuinfo').read() == 'cpu'
+
+    @patch('fcntl.ioctl')
+    def test_has_reflink_support(self, mock_ioctl):
+        target_dir = self._tmpdir.mkdir('target')
+        assert BootstrapCache._has_reflink_support(
+            self.root_dir.strpath, target_dir.strpath
+        ) is True
+        mock_ioctl.side_effect = OSError('not supported')
+        assert BootstrapCache._has_reflink_support(
+            self.root_dir.strpath, target_dir.strpath
+        ) is False
+        assert target_dir.listdir() == []
+        assert sorted(
+            os.path.basename(item) for item in self.root_dir.listdir()
+        ) == ['etc', 'proc']
@@ -1,13 +1,23 @@
+import io
+import os
+import gzip
+import lzma
+import hashlib
 from builtins import bytes
 import encodings.ascii as encoding
 from unittest.mock import (
-    patch, call, Mock, mock_open
+    patch, mock_open
 )
 from pytest import raises
 
-from kiwi.utils.checksum import Checksum
+from kiwi.utils.checksum import (
+    Checksum, _StreamDecoder
+)
 
-from kiwi.exceptions import KiwiFileNotFound
+from kiwi.exceptions import (
+    KiwiFileNotFound,
+    KiwiCommandError
+)
 
 
 class TestChecksum:
@@ -54,150 +64,108 @@ class TestChecksum:
         with patch('builtins.open', self.m_open, create=True):
             assert self.checksum.matches('foo', 'some-file') is False
 
-    @patch('kiwi.path.Path.which')
-    @patch('kiwi.utils.checksum.Compress')
-    @patch('hashlib.sha256')
-    @patch('os.path.getsize')
-    def test_sha256_xz(self, mock_size, mock_sha256, mock_compress, mock_which):
-        checksum = Mock
-        checksum.uncompressed_filename = 'some-file-uncompressed'
-        mock_which.return_value = 'factor'
-        compress = Mock()
-        digest = Mock()
-        digest.block_size = 1024
-        digest._calculate_hash_hexdigest = Mock(
-            return_value=checksum
-        )
-        digest.hexdigest = Mock(
-            return_value='sum'
-        )
-        compress.get_format = Mock(
-            return_value='xz'
-        )
-        mock_size.return_value = 1343225856
-        mock_sha256.return_value = digest
-        mock_compress.return_value = compress
-
-        with patch('builtins.open', self.m_open, create=True):
-            self.checksum.sha256('outfile')
-
-        assert self.m_open.call_args_list == [
-            call('some-file', 'rb'),
-            call('some-file-uncompressed', 'rb'),
-            call('outfile', encoding=self.ascii, mode='w')
-        ]
-        self.m_open.return_value.write.assert_called_once_with(
-            'sum 163968 8192 163968 8192\n'
-        )
-
-    @patch('kiwi.path.Path.which')
-    @patch('kiwi.utils.checksum.Compress')
-    @patch('hashlib.sha512')
-    @patch('os.path.getsize')
-    def test_sha512_xz(self, mock_size, mock_sha512, mock_compress, mock_which):
-        checksum = Mock
-        checksum.uncompressed_filename = 'some-file-uncompressed'
-        mock_which.return_value = 'factor'
-        compress = Mock()
-        digest = Mock()
-        digest.block_size = 1024
-        digest._calculate_hash_hexdigest = Mock(
-            return_value=checksum
-        )
-        digest.hexdigest = Mock(
-            return_value='sum'
-        )
-        compress.get_format = Mock(
-            return_value='xz'
-        )
-        mock_size.return_value = 1343225856
-        mock_sha512.return_value = digest
-        mock_compress.return_value = compress
-
-        with patch('builtins.open', self.m_open, create=True):
-            self.checksum.sha512('outfile')
-
-        assert self.m_open.call_args_list == [
-            call('some-file', 'rb'),
-            call('some-file-uncompressed', 'rb'),
-            call('outfile', encoding=self.ascii, mode='w')
-        ]
-        self.m_open.return_value.write.assert_called_once_with(
-            'sum 163968 8192 163968 8192\n'
-        )
-
-    @patch('kiwi.path.Path.which')
+    def _create_data(self, tmpdir, zipper_open=None, members=1):
+        data = b'0123456789abcdef' * 4096 * 3
+        filename = tmpdir.join('data').strpath
+        if zipper_open:
+            with open(filename, 'wb') as target:
+                for member in range(members):
+                    with zipper_open(target, 'wb') as compressed:
+                        compressed.write(data)
+        else:
+            with open(filename, 'wb') as target:
+                target.write(data)
+        return filename, data * members
+
+    def test_sha256_file(self, tmpdir):
+        filename, data = self._create_data(tmpdir)
+        outfile = tmpdir.join('outfile').strpath
+        assert Checksum(filename).sha256(outfile) == \
+            hashlib.sha256(data).hexdigest()
+        with open(outfile) as checksum_file:
+            assert checksum_file.read() == '{0} 24 8192\n'.format(
+                hashlib.sha256(data).hexdigest()
+            )
+
+    def test_sha512_xz(self, tmpdir):
+        filename, data = self._create_data(tmpdir, lzma.open)
+        outfile = tmpdir.join('outfile').strpath
+        with open(filename, 'rb') as compressed:
+            compressed_data = compressed.read()
+        assert Checksum(filename).sha512(outfile) == \
+            hashlib.sha512(compressed_data).hexdigest()
+        blocks = Checksum(filename)._block_list(len(compressed_data))
+        with open(outfile) as checksum_file:
+            assert checksum_file.read() == '{0} 24 8192 {1} {2}\n'.format(
+                hashlib.sha512(data).hexdigest(),
+                blocks.blocks, blocks.blocksize
+            )
+
+    def test_sha256_plain(self, tmpdir):
+        filename, data = self._create_data(tmpdir, gzip.open)
+        with open(filename, 'rb') as compressed:
+            compressed_data = compressed.read()
+        assert Checksum(filename).sha256() == \
+            hashlib.sha256(compressed_data).hexdigest()
+
+    def test_digests(self, tmpdir):
+        for zipper_open in (lzma.open, gzip.open):
+            filename, data = self._create_data(tmpdir, zipper_open, 2)
+            checksum = Checksum(filename)
+            checksum.read_size = 4096
+            result = checksum.digests(['sha256', 'sha512'], uncompressed=True)
+            assert result.size == os.path.getsize(filename)
+            assert result.uncompressed_size == len(data)
+            assert result.uncompressed_digests == {
+                'sha256': hashlib.sha256(data).hexdigest(),
+                'sha512': hashlib.sha512(data).hexdigest()
+            }
+
+    def test_digests_not_compressed(self, tmpdir):
+        filename, data = self._create_data(tmpdir)
+        result = Checksum(filename).digests(['sha256'], uncompressed=True)
+        assert result.digests == {'sha256': hashlib.sha256(data).hexdigest()}
+        assert result.size == len(data)
+        assert result.uncompressed_digests is None
+        assert result.uncompressed_size is None
+
+    @patch('kiwi.utils.checksum.Command.call')
     @patch('kiwi.utils.checksum.Compress')
-    @patch('hashlib.sha256')
-    @patch('os.path.getsize')
-    def test_sha256_file(
-        self, mock_size, mock_sha256, mock_compress, mock_which
-    ):
-        mock_which.return_value = 'factor'
-        compress = Mock()
-        digest = Mock()
-        digest.block_size = 1024
-        digest.hexdigest = Mock(
-            return_value='sum'
-        )
-        compress.get_format = Mock(
-            return_value=None
-        )
-        mock_size.return_value = 1343225856
-        mock_sha256.return_value = digest
-        mock_compress.return_value = compress
-
-        with patch('builtins.open', self.m_open, create=True):
-            self.checksum.sha256('outfile')
-
-        assert self.m_open.call_args_list == [
-            call('some-file', 'rb'),
-            call('outfile', encoding=self.ascii, mode='w')
-        ]
-        self.m_open.return_value.write.assert_called_once_with(
-            'sum 163968 8192\n'
-        )
-
-    @patch('kiwi.path.Path.which')
-    @patch('kiwi.utils.checksum.Compress')
-    @patch('hashlib.sha256')
-    @patch('os.path.getsize')
-    def test_sha256(
-        self, mock_size, mock_sha256, mock_compress, mock_which
-    ):
-        mock_which.return_value = 'factor'
-        compress = Mock()
-        digest = Mock()
-        digest.block_size = 1024
-        digest.hexdigest = Mock(
-            return_value='sum'
-        )
-        compress.get_format = Mock(
-            return_value=None
-        )
-        mock_size.return_value = 1343225856
-        mock_sha256.return_value = digest
-        mock_compress.return_value = compress
-
-        with patch('builtins.open', self.m_open, create=True):
-            self.checksum.sha256('outfile')
-
-        assert self.m_open.call_args_list == [
-            call('some-file', 'rb'),
-            call('outfile', encoding=self.ascii, mode='w')
-        ]
-        self.m_open.return_value.write.assert_called_once_with(
-            'sum 163968 8192\n'
-        )
-
-    @patch('hashlib.sha256')
-    def test_sha256_plain(self, mock_sha256):
-        digest = Mock()
-        digest.block_size = 1024
-        digest.hexdigest = Mock(
-            return_value='sum'
-        )
-        mock_sha256.return_value = digest
-
-        with patch('builtins.open', self.m_open, create=True):
-            assert self.checksum.sha256() == digest.hexdigest.return_value
+    def test_digests_zstd(self, mock_Compress, mock_Command_call, tmpdir):
+        filename, data = self._create_data(tmpdir)
+        mock_Compress.return_value.get_format.return_value = 'zstd'
+        mock_Command_call.return_value.output = io.BytesIO(b'uncompressed')
+        mock_Command_call.return_value.process.wait.return_value = 0
+        result = Checksum(filename).digests(['sha256'], uncompressed=True)
+        mock_Command_call.assert_called_once_with(
+            ['zstd', '-d', '-c', '-q', filename]
+        )
+        assert result.digests == {'sha256': hashlib.sha256(data).hexdigest()}
+        assert result.uncompressed_digests == {
+            'sha256': hashlib.sha256(b'uncompressed').hexdigest()
+        }
+        mock_Command_call.return_value.output = io.BytesIO(b'')
+        mock_Command_call.return_value.error = io.BytesIO(b'broken')
+        mock_Command_call.return_value.process.wait.return_value = 1
+        with raises(KiwiCommandError):
+            Checksum(filename).digests(['sha256'], uncompressed=True)
+
+    def test_stream_decoder_chunks(self):
+        data = b'0123456789abcdef' * 64
+        for zipper, compressed in (
+            ('xz', lzma.compress(data)), ('gzip', gzip.compress(data))
+        ):
+            chunks = []
+            decoder = _StreamDecoder(zipper, 'some-file', chunks.append, 16)
+            decoder.feed(compressed)
+            decoder.close()
+            assert b''.join(chunks) == data
+            assert max(len(chunk) for chunk in chunks) <= 16
+
+    def test_digest_files(self, tmpdir):
+        assert Checksum.digest_files([]) == {}
+        filename, data = self._create_data(tmpdir)
+        assert Checksum.digest_files([filename, '../data/gz_data.gz']) == {
+            filename: hashlib.sha256(data).hexdigest(),
+            '../data/gz_data.gz': Checksum('../data/gz_data.gz').sha256()
+        }
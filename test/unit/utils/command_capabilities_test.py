@@ -1,3 +1,5 @@
+import os
+import json
 import logging
 from unittest.mock import (
     patch, call
@@ -14,12 +16,19 @@ from kiwi.exceptions import KiwiCommandCapabilitiesError
 
 class TestCommandCapabilities:
     @fixture(autouse=True)
-    def inject_fixtures(self, caplog):
+    def inject_fixtures(self, caplog, tmpdir):
         self._caplog = caplog
+        self._tmpdir = tmpdir
+        self.tool = tmpdir.join('command').strpath
+        with open(self.tool, 'w'):
+            pass
+        # tools which can not be stat'ed are probed without memoization
+        self.unknown_tool = tmpdir.join('unknown').strpath
 
     @patch('kiwi.command.Command.run')
     @patch('kiwi.utils.command_capabilities.Path.which')
     def test_has_option_in_help(self, mock_Path_which, mock_run):
+        mock_Path_which.return_value = self.unknown_tool
         command_type = namedtuple('command', ['output', 'error'])
         mock_run.return_value = command_type(
             output="Dummy line\n\t--some-flag\n\t--some-other-flag",
@@ -59,6 +68,7 @@ class TestCommandCapabilities:
     def test_has_option_in_help_command_failure_warning(
         self, mock_Path_which, mock_run
     ):
+        mock_Path_which.return_value = self.unknown_tool
         mock_run.return_value.output = ''
         mock_run.return_value.error = ''
         with self._caplog.at_level(logging.WARNING):
@@ -72,6 +82,7 @@ class TestCommandCapabilities:
     def test_has_option_in_help_command_failure_exception(
         self, mock_Path_which, mock_run
     ):
+        mock_Path_which.return_value = self.unknown_tool
         mock_run.return_value.output = ''
         mock_run.return_value.error = ''
         with raises(KiwiCommandCapabilitiesError):
@@ -152,3 +163,86 @@ class TestCommandCapabilities:
             CommandCapabilities.check_version(
                 'command_that_fails', '--non-existing-flag'
             )
+
+    @patch('kiwi.command.Command.run')
+    @patch('kiwi.utils.command_capabilities.Path.which')
+    def test_probes_are_memoized(self, mock_Path_which, mock_run):
+        mock_Path_which.return_value = self.tool
+        command_type = namedtuple('command', ['output', 'error', 'returncode'])
+        mock_run.return_value = command_type(
+            output='command v1.2.3\n\t--some-flag', error='', returncode=0
+        )
+        cache_file = self._tmpdir.join('cache', 'capabilities.json').strpath
+        CommandCapabilities.set_cache_file(cache_file)
+        assert CommandCapabilities.has_option_in_help('command', '--some-flag')
+        assert CommandCapabilities.has_option_in_help('command', '--some-flag')
+        assert CommandCapabilities.check_version('command', (1, 2))
+        assert CommandCapabilities.check_version('command', (1, 2))
+        assert mock_run.call_args_list == [
+            call(['command', '--help'], raise_on_error=False),
+            call(['command', '--version'])
+        ]
+        assert CommandCapabilities.get_cached_probes() == [
+            {'tool': self.tool, 'root': '', 'arguments': 'command --help'},
+            {'tool': self.tool, 'root': '', 'arguments': 'command --version'}
+        ]
+        with open(cache_file) as cache:
+            assert len(json.load(cache)) == 2
+
+        # probes are shared with the next invocation
+        CommandCapabilities.cache = {}
+        CommandCapabilities.set_cache_file(cache_file)
+        assert CommandCapabilities.check_version('command', (1, 2))
+        assert mock_run.call_count == 2
+
+        # an updated tool is probed again
+        os.utime(self.tool, ns=(0, 0))
+        assert CommandCapabilities.check_version('command', (1, 2))
+        assert mock_run.call_count == 3
+
+        CommandCapabilities.invalidate_cache()
+        assert CommandCapabilities.get_cached_probes() == []
+        assert not os.path.exists(cache_file)
+        assert CommandCapabilities.check_version('command', (1, 2))
+        assert mock_run.call_count == 4
+
+    @patch('kiwi.command.Command.run')
+    @patch('kiwi.utils.command_capabilities.Path.which')
+    def test_failed_probes_are_not_memoized(self, mock_Path_which, mock_run):
+        mock_Path_which.return_value = self.tool
+        mock_run.side_effect = Exception
+        assert not CommandCapabilities.check_version(
+            'command', (1, 2), raise_on_error=False
+        )
+        assert CommandCapabilities.get_cached_probes() == []
+
+    @patch('kiwi.command.Command.run')
+    @patch('kiwi.utils.command_capabilities.Path.which')
+    def test_probes_with_exit_error_are_not_memoized(
+        self, mock_Path_which, mock_run
+    ):
+        mock_Path_which.return_value = self.tool
+        mock_run.return_value.output = '--some-flag'
+        mock_run.return_value.error = ''
+        mock_run.return_value.returncode = 1
+        assert CommandCapabilities.has_option_in_help('command', '--some-flag')
+        assert CommandCapabilities.has_option_in_help('command', '--some-flag')
+        assert mock_run.call_count == 2
+        assert CommandCapabilities.get_cached_probes() == []
+
+    @patch('kiwi.command.Command.run')
+    @patch('kiwi.utils.command_capabilities.Path.which')
+    @patch('os.replace')
+    def test_write_cache_file_failure(
+        self, mock_os_replace, mock_Path_which, mock_run
+    ):
+        mock_os_replace.side_effect = OSError
+        mock_Path_which.return_value = self.tool
+        mock_run.return_value.output = 'command v1.2.3'
+        mock_run.return_value.error = ''
+        mock_run.return_value.returncode = 0
+        CommandCapabilities.set_cache_file(
+            self._tmpdir.join('capabilities.json').strpath
+        )
+        assert CommandCapabilities.check_version('command', (1, 2))
+        assert len(CommandCapabilities.get_cached_probes()) == 1
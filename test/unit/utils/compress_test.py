@@ -1,10 +1,9 @@
-import logging
+import gzip
+import lzma
 from unittest.mock import (
     patch, Mock
 )
-from pytest import (
-    raises, fixture
-)
+from pytest import raises
 
 from kiwi.utils.compress import Compress
 
@@ -15,10 +14,6 @@ from kiwi.exceptions import (
 
 
 class TestCompress:
-    @fixture(autouse=True)
-    def inject_fixtures(self, caplog):
-        self._caplog = caplog
-
     @patch('os.path.exists')
     def setup(self, mock_exists):
         mock_exists.return_value = True
@@ -73,17 +68,61 @@ class TestCompress:
         )
         assert self.compress.uncompressed_filename == 'some-file'
 
+    @patch('kiwi.command.Command.run')
+    def test_zstd(self, mock_command):
+        assert self.compress.zstd() == 'some-file.zst'
+        mock_command.assert_called_once_with(
+            ['zstd', '-f', '-q', '--threads=0', '-19', 'some-file']
+        )
+        assert self.compress.compressed_filename == 'some-file.zst'
+
+    @patch('kiwi.command.Command.run')
+    @patch('os.path.exists')
+    def test_zstd_remove_source(self, mock_exists, mock_command):
+        mock_exists.return_value = True
+        compress = Compress('some-file')
+        assert compress.zstd(options=['-3']) == 'some-file.zst'
+        mock_command.assert_called_once_with(
+            ['zstd', '-f', '-q', '-3', '--rm', 'some-file']
+        )
+
+    @patch('kiwi.command.Command.run')
+    @patch('kiwi.utils.compress.Compress.get_format')
+    def test_uncompress_zstd(self, mock_format, mock_command):
+        mock_format.return_value = 'zstd'
+        self.compress.uncompress()
+        mock_command.assert_called_once_with(
+            ['zstd', '-d', '-q', '--rm', 'some-file']
+        )
+
+    @patch('kiwi.utils.compress.Temporary.new_file')
+    def test_uncompress_temporary(self, mock_temp, tmpdir):
+        uncompressed = tmpdir.join('uncompressed').strpath
+        tempfile = Mock()
+        tempfile.name = uncompressed
+        mock_temp.return_value = tempfile
+        for zipper_open, suffix in [(lzma.open, 'xz'), (gzip.open, 'gz')]:
+            compressed = tmpdir.join(f'data.{suffix}').strpath
+            with zipper_open(compressed, 'wb') as data:
+                data.write(b'data\n')
+            compress = Compress(compressed)
+            assert compress.uncompress(temporary=True) == uncompressed
+            with open(uncompressed) as data:
+                assert data.read() == 'data\n'
+
     @patch('kiwi.command.Command.run')
     @patch('kiwi.utils.compress.Temporary.new_file')
     @patch('kiwi.utils.compress.Compress.get_format')
-    def test_uncompress_temporary(self, mock_format, mock_temp, mock_command):
+    def test_uncompress_temporary_zstd(
+        self, mock_format, mock_temp, mock_command
+    ):
         tempfile = Mock()
         tempfile.name = 'tempfile'
         mock_temp.return_value = tempfile
-        mock_format.return_value = 'xz'
+        mock_format.return_value = 'zstd'
         self.compress.uncompress(temporary=True)
         mock_command.assert_called_once_with(
-            ['bash', '-c', 'xz -c -d some-file > tempfile']
+            ['zstd', '-d', '-q', '-f', 'some-file', '-o', 'tempfile']
         )
         assert self.compress.uncompressed_filename == 'tempfile'
 
@@ -93,26 +132,16 @@ class TestCompress:
         with raises(KiwiCompressionFormatUnknown):
             self.compress.uncompress()
 
-    @patch('kiwi.path.Path.which')
-    def test_get_format(self, mock_which):
-        mock_which.side_effect = ['xz']
-        xz = Compress('../data/xz_data.xz')
-        assert xz.get_format() == 'xz'
-
-        mock_which.side_effect = ['xz', 'gzip']
-        gzip = Compress('../data/gz_data.gz')
-        assert gzip.get_format() == 'gzip'
-
     @patch('kiwi.command.Command.run')
-    def test_get_format_invalid_format(self, mock_run):
-        result = Mock()
-        result.returncode = 1
-        mock_run.return_value = result
-        invalid = Compress("../data/gz_data.gz")
-        invalid.supported_zipper = ["mock_zip"]
-
-        with self._caplog.at_level(logging.DEBUG):
-            assert invalid.get_format() is None
-            mock_run.assert_called_once_with(
-                ['mock_zip', '-l', '../data/gz_data.gz'], raise_on_error=False
-            )
+    def test_get_format(self, mock_run, tmpdir):
+        assert Compress('../data/xz_data.xz').get_format() == 'xz'
+        assert Compress('../data/gz_data.gz').get_format() == 'gzip'
+        zstd_data = tmpdir.join('zstd_data.zst')
+        zstd_data.write_binary(b'\x28\xb5\x2f\xfd\x00\x00')
+        assert Compress(zstd_data.strpath).get_format() == 'zstd'
+        assert not mock_run.called
+
+    def test_get_format_invalid_format(self, tmpdir):
+        invalid = tmpdir.join('data')
+        invalid.write('data')
+        assert Compress(invalid.strpath).get_format() is None
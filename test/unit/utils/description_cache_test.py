@@ -0,0 +1,63 @@
+import os
+import logging
+from unittest.mock import patch
+from pytest import fixture
+
+from kiwi.utils.description_cache import DescriptionCache
+
+
+class TestDescriptionCache:
+    @fixture(autouse=True)
+    def inject_fixtures(self, caplog, tmpdir):
+        self._caplog = caplog
+        self._tmpdir = tmpdir
+        self.cache_dir = tmpdir.join('cache').strpath
+        self.description = tmpdir.join('config.xml')
+        self.description.write('<image/>')
+        self.include = tmpdir.join('include.xml')
+        self.include.write('<image><repository/></image>')
+        DescriptionCache.tool_digest = None
+        DescriptionCache.set_cache_dir(self.cache_dir)
+
+    def test_get_key(self):
+        key = DescriptionCache.get_key([self.description.strpath])
+        assert key == DescriptionCache.get_key([self.description.strpath])
+        assert key != DescriptionCache.get_key(
+            [self.description.strpath, self.include.strpath]
+        )
+        self.description.write('<image name="a"/>')
+        assert key != DescriptionCache.get_key([self.description.strpath])
+
+    def test_get_key_tool_version(self):
+        key = DescriptionCache.get_key([self.description.strpath])
+        DescriptionCache.tool_digest = None
+        with patch('kiwi.utils.description_cache.__version__', '0.0.1'):
+            assert key != DescriptionCache.get_key(
+                [self.description.strpath]
+            )
+
+    def test_get_key_inactive(self):
+        DescriptionCache.cache_dir = None
+        assert DescriptionCache.get_key([self.description.strpath]) == ''
+        assert DescriptionCache.lookup('key') is None
+        DescriptionCache.store('key', self.description.strpath)
+        assert not os.path.exists(self.cache_dir)
+
+    def test_store_lookup(self):
+        assert DescriptionCache.lookup('key') is None
+        DescriptionCache.store('key', self.description.strpath)
+        cached = DescriptionCache.lookup('key')
+        assert cached == os.sep.join([self.cache_dir, 'key.xml'])
+        with open(cached) as description:
+            assert description.read() == '<image/>'
+        DescriptionCache.invalidate()
+        assert DescriptionCache.lookup('key') is None
+
+    @patch('shutil.copyfile')
+    def test_store_failed(self, mock_copyfile):
+        mock_copyfile.side_effect = OSError('read-only')
+        with self._caplog.at_level(logging.DEBUG):
+            DescriptionCache.store('key', self.description.strpath)
+        assert 'Failed to write description cache: read-only' in \
+            self._caplog.text
+        assert DescriptionCache.lookup('key') is None
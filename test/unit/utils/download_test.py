@@ -0,0 +1,173 @@
+import os
+import threading
+from http.server import (
+    BaseHTTPRequestHandler, ThreadingHTTPServer
+)
+from pytest import (
+    raises, fixture
+)
+
+from kiwi.utils.download import Download
+
+from kiwi.exceptions import KiwiUriOpenError
+
+DATA = bytes(range(256)) * 1024
+ETAG = '"0815"'
+LAST_MODIFIED = 'Thu, 01 Jan 2026 00:00:00 GMT'
+
+
+class RepositoryHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    requests = []
+    drops = 0
+    validator_headers = ('ETag', 'Last-Modified')
+
+    def do_GET(self):
+        self.requests.append(
+            (self.path, dict(self.headers), self.client_address[1])
+        )
+        if self.path != '/repodata/primary.xml.gz':
+            self.send_error(404)
+            return
+        if self.headers.get('If-None-Match') == ETAG:
+            self.send_response(304)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        start = 0
+        range_header = self.headers.get('Range')
+        if range_header:
+            start = int(range_header.split('=')[1].rstrip('-'))
+            self.send_response(206)
+            self.send_header(
+                'Content-Range', f'bytes {start}-{len(DATA) - 1}/{len(DATA)}'
+            )
+        else:
+            self.send_response(200)
+        self.send_header('Content-Length', str(len(DATA) - start))
+        self.send_header(self.validator_headers[0], ETAG)
+        self.send_header(self.validator_headers[1], LAST_MODIFIED)
+        self.end_headers()
+        if RepositoryHandler.drops:
+            # send partial data and drop the connection
+            self.wfile.write(DATA[start:start + 1000])
+            RepositoryHandler.drops -= 1
+            self.close_connection = True
+            return
+        self.wfile.write(DATA[start:])
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestDownload:
+    @fixture(autouse=True)
+    def inject_fixtures(self, tmpdir):
+        RepositoryHandler.requests = []
+        RepositoryHandler.drops = 0
+        RepositoryHandler.validator_headers = ('ETag', 'Last-Modified')
+        server = ThreadingHTTPServer(('127.0.0.1', 0), RepositoryHandler)
+        server_thread = threading.Thread(
+            target=server.serve_forever, daemon=True
+        )
+        server_thread.start()
+        self.url = 'http://127.0.0.1:{0}/repodata/primary.xml.gz'.format(
+            server.server_address[1]
+        )
+        self._tmpdir = tmpdir
+        self.target = tmpdir.join('primary.xml.gz').strpath
+        yield
+        server.shutdown()
+        server.server_close()
+        server_thread.join()
+
+    def test_get(self):
+        download = Download(chunk_size=4096)
+        download.get(self.url, self.target, ('user', 'secret'))
+        download.get(self.url, self.target)
+        with open(self.target, 'rb') as target:
+            assert target.read() == DATA
+        # the partial file is gone
+        assert os.listdir(self._tmpdir.strpath) == ['primary.xml.gz']
+        assert RepositoryHandler.requests[0][1]['Authorization'] == \
+            'Basic dXNlcjpzZWNyZXQ='
+        # connection is kept alive and reused by the pooled session
+        assert RepositoryHandler.requests[0][2] == \
+            RepositoryHandler.requests[1][2]
+
+    def test_get_resumes_interrupted_transfer(self):
+        RepositoryHandler.drops = 1
+        Download(chunk_size=100).get(self.url, self.target)
+        with open(self.target, 'rb') as target:
+            assert target.read() == DATA
+        assert len(RepositoryHandler.requests) == 2
+        assert 'Range' not in RepositoryHandler.requests[0][1]
+        assert RepositoryHandler.requests[1][1]['Range'] == 'bytes=1000-'
+
+    def test_get_raises_after_retries(self):
+        RepositoryHandler.drops = 2
+        with raises(KiwiUriOpenError):
+            Download(retries=1).get(self.url, self.target)
+        assert len(RepositoryHandler.requests) == 2
+        assert os.listdir(self._tmpdir.strpath) == []
+
+    def test_get_not_found(self):
+        with raises(KiwiUriOpenError):
+            Download().get(self.url.replace('primary', 'other'), self.target)
+
+    def test_get_cached(self):
+        cache_dir = self._tmpdir.join('cache').strpath
+        download = Download(cache_dir)
+        download.get(self.url, self.target)
+        os.unlink(self.target)
+        download.get(self.url, self.target)
+        with open(self.target, 'rb') as target:
+            assert target.read() == DATA
+        assert 'If-None-Match' not in RepositoryHandler.requests[0][1]
+        assert RepositoryHandler.requests[1][1]['If-None-Match'] == ETAG
+        assert RepositoryHandler.requests[1][1]['If-Modified-Since'] == \
+            LAST_MODIFIED
+
+    def test_get_cached_validator_header_case(self):
+        # e.g. Go's net/http sends Etag
+        RepositoryHandler.validator_headers = ('Etag', 'last-modified')
+        cache_dir = self._tmpdir.join('cache').strpath
+        download = Download(cache_dir)
+        download.get(self.url, self.target)
+        download.get(self.url, self.target)
+        assert RepositoryHandler.requests[1][1]['If-None-Match'] == ETAG
+        assert RepositoryHandler.requests[1][1]['If-Modified-Since'] == \
+            LAST_MODIFIED
+
+    def test_get_partial_file_is_unique(self):
+        cache_dir = self._tmpdir.mkdir('cache').strpath
+        cache_file = os.sep.join([cache_dir, 'primary'])
+        partial_files = []
+        # a partial file of a concurrent build is left untouched
+        with open(cache_file + '.part', 'wb') as other:
+            other.write(b'other')
+        download = Download()
+        fetch_to = download._fetch_to
+
+        def record_fetch_to(session, url, target, partial_target, *args):
+            partial_files.append(partial_target)
+            return fetch_to(session, url, target, partial_target, *args)
+
+        download._fetch_to = record_fetch_to
+        download._fetch(self.url, cache_file)
+        assert partial_files[0] != cache_file + '.part'
+        assert os.path.dirname(partial_files[0]) == cache_dir
+        with open(cache_file + '.part', 'rb') as other:
+            assert other.read() == b'other'
+        assert sorted(os.listdir(cache_dir)) == ['primary', 'primary.part']
+
+    def test_get_cache_info_invalid(self):
+        cache_dir = self._tmpdir.join('cache').strpath
+        download = Download(cache_dir)
+        download.get(self.url, self.target)
+        for cache_info in os.listdir(cache_dir):
+            if cache_info.endswith('.json'):
+                with open(os.sep.join([cache_dir, cache_info]), 'w') as info:
+                    info.write('{')
+        download.get(self.url, self.target)
+        assert 'If-None-Match' not in RepositoryHandler.requests[1][1]
@@ -0,0 +1,144 @@
+import os
+import stat
+from pytest import fixture
+from unittest.mock import patch
+
+from kiwi.utils.file_install import FileInstall
+
+
+class TestFileInstall:
+    @fixture(autouse=True)
+    def inject_fixtures(self, tmpdir):
+        self._tmpdir = tmpdir
+        self.root_dir = tmpdir.mkdir('root').strpath
+        os.makedirs(os.sep.join([self.root_dir, 'etc']))
+        os.makedirs(os.sep.join([self.root_dir, 'image']))
+        with open(os.sep.join([self.root_dir, 'etc', 'passwd']), 'w') as passwd:
+            passwd.write(
+                'root:x:0:0:root:/root:/bin/bash\n'
+                'bob:x:1000:100:Bob:/home/bob:/bin/bash\n'
+                'broken:x:nouid\n'
+            )
+        with open(os.sep.join([self.root_dir, 'etc', 'group']), 'w') as group:
+            group.write(
+                'root:x:0:\n'
+                'users:x:100:\n'
+                'wheel:x:10:bob\n'
+            )
+        self.source = os.sep.join([self.root_dir, 'image', 'some'])
+        with open(self.source, 'w') as source:
+            source.write('data')
+        os.chmod(self.source, 0o644)
+        self.file_install = FileInstall(self.root_dir)
+
+    def test_is_supported(self):
+        os.symlink('some', os.sep.join([self.root_dir, 'image', 'link']))
+        assert self.file_install.is_supported(self.source) is True
+        assert self.file_install.is_supported(
+            os.sep.join([self.root_dir, 'image', 'link'])
+        ) is False
+        assert self.file_install.is_supported(self.root_dir) is False
+        assert self.file_install.is_supported('/not/there') is False
+
+    def test_get_owner_ids(self):
+        assert self.file_install.get_owner_ids('bob') == (1000, -1)
+        assert self.file_install.get_owner_ids('bob:wheel') == (1000, 10)
+        assert self.file_install.get_owner_ids('bob:') == (1000, 100)
+        assert self.file_install.get_owner_ids(':users') == (-1, 100)
+        assert self.file_install.get_owner_ids('42:43') == (42, 43)
+        assert self.file_install.get_owner_ids('alice') is None
+        assert self.file_install.get_owner_ids('bob:nogroup') is None
+        assert self.file_install.get_owner_ids('42:') is None
+        assert self.file_install.get_owner_ids(':') is None
+
+    def test_get_owner_ids_no_accounts(self):
+        file_install = FileInstall('/not/there')
+        assert file_install.get_owner_ids('root') is None
+        assert file_install.get_owner_ids('0:0') == (0, 0)
+
+    @patch('os.chown')
+    def test_set_owner(self, mock_chown):
+        assert self.file_install.set_owner(self.source, 'bob:users') is True
+        mock_chown.assert_called_once_with(self.source, 1000, 100)
+        mock_chown.reset_mock()
+        assert self.file_install.set_owner(self.source, 'alice') is False
+        assert not mock_chown.called
+
+    @patch('os.umask')
+    def test_get_mode(self, mock_umask):
+        mock_umask.return_value = 0o022
+        get_mode = self.file_install.get_mode
+        assert get_mode('0755', 0o100644) == 0o755
+        assert get_mode('4755', 0o100644) == 0o4755
+        assert get_mode('600', 0o104755) == 0o600
+        assert get_mode('u+x', 0o100644) == 0o744
+        assert get_mode('+x', 0o100644) == 0o755
+        assert get_mode('+w', 0o100444) == 0o644
+        assert get_mode('a+w', 0o100444) == 0o666
+        assert get_mode('go-rwx', 0o100644) == 0o600
+        assert get_mode('u=rw,go=r', 0o100777) == 0o644
+        assert get_mode('u+s,o+t', 0o100755) == 0o5755
+        assert get_mode('g+X', 0o100744) == 0o754
+        assert get_mode('g+X', 0o100644) == 0o644
+        assert get_mode('=r', 0o100666) == 0o444
+        assert get_mode('u=g', 0o100644) is None
+        assert get_mode('0o755', 0o100644) is None
+
+    def test_set_mode(self):
+        assert self.file_install.set_mode(self.source, 'u+x') is True
+        assert stat.S_IMODE(os.stat(self.source).st_mode) == 0o744
+        assert self.file_install.set_mode(self.source, 'u=g') is False
+        assert stat.S_IMODE(os.stat(self.source).st_mode) == 0o744
+
+    def test_copy(self):
+        os.chmod(self.source, 0o4751)
+        os.utime(self.source, ns=(1000000000, 2000000000))
+        target = os.sep.join([self.root_dir, 'etc', 'some_file'])
+        assert self.file_install.copy(self.source, target) is True
+        target_stat = os.stat(target)
+        source_stat = os.stat(self.source)
+        assert stat.S_IMODE(target_stat.st_mode) == 0o4751
+        assert target_stat.st_mtime_ns == 2000000000
+        assert target_stat.st_uid == source_stat.st_uid
+        with open(target) as copy:
+            assert copy.read() == 'data'
+
+    def test_copy_into_directory_in_place(self):
+        target = os.sep.join([self.root_dir, 'etc', 'some'])
+        with open(target, 'w') as existing:
+            existing.write('old data which is longer')
+        inode = os.stat(target).st_ino
+        assert self.file_install.copy(
+            self.source, os.sep.join([self.root_dir, 'etc'])
+        ) is True
+        assert os.stat(target).st_ino == inode
+        with open(target) as copy:
+            assert copy.read() == 'data'
+
+    @patch('os.setxattr')
+    @patch('os.removexattr')
+    @patch('os.listxattr')
+    @patch('os.getxattr')
+    def test_copy_extended_attributes(
+        self, mock_getxattr, mock_listxattr, mock_removexattr, mock_setxattr
+    ):
+        target = os.sep.join([self.root_dir, 'etc', 'some'])
+        mock_listxattr.side_effect = [
+            ['system.posix_acl_access'], ['user.stale']
+        ]
+        mock_getxattr.return_value = b'acl'
+        assert self.file_install.copy(self.source, target) is True
+        mock_removexattr.assert_called_once_with(target, 'user.stale')
+        mock_setxattr.assert_called_once_with(
+            target, 'system.posix_acl_access', b'acl'
+        )
+
+    def test_copy_not_supported(self):
+        target = os.sep.join([self.root_dir, 'etc', 'link'])
+        os.symlink('/etc/passwd', target)
+        assert self.file_install.copy(self.source, target) is False
+        assert os.path.islink(target)
+        os.makedirs(os.sep.join([self.root_dir, 'etc', 'some']))
+        assert self.file_install.copy(
+            self.source, os.sep.join([self.root_dir, 'etc'])
+        ) is False
@@ -0,0 +1,92 @@
+import os
+import select
+from unittest.mock import (
+    patch, Mock
+)
+from pytest import fixture
+
+from kiwi.utils.mount_table import MountTable
+
+
+class TestMountTable:
+    @fixture(autouse=True)
+    def inject_fixtures(self, tmpdir):
+        self.mountinfo = tmpdir.join('mountinfo').strpath
+        self._write_mountinfo(
+            [
+                '/', '/proc', '/image/root', '/image/root/boot',
+                '/image/root/proc', '/image/root/boot/efi',
+                '/image/root_cow', '/image/root/my\\040dir',
+                '/image/root/proc'
+            ]
+        )
+        MountTable.mountinfo = self.mountinfo
+        yield
+        if MountTable.mountinfo_fd is not None:
+            os.close(MountTable.mountinfo_fd)
+        MountTable.mountinfo = '/proc/self/mountinfo'
+        MountTable.mountinfo_fd = None
+        MountTable.poller = None
+        MountTable.mountpoints = None
+
+    def _write_mountinfo(self, mountpoints):
+        with open(self.mountinfo, 'w') as mountinfo:
+            for mount_id, mountpoint in enumerate(mountpoints):
+                mountinfo.write(
+                    f'{mount_id + 20} 1 8:1 / {mountpoint} rw - ext4 '
+                    '/dev/sda1 rw\n'
+                )
+            mountinfo.write('broken line\n')
+
+    def test_is_mountpoint(self):
+        assert MountTable.is_mountpoint('/image/root/boot') is True
+        assert MountTable.is_mountpoint('/image/root/boot/') is True
+        assert MountTable.is_mountpoint('/image/root/my dir') is True
+        assert MountTable.is_mountpoint('/image/root/var') is False
+
+    def test_get_mountpoints(self):
+        assert MountTable.get_mountpoints('/image/root') == [
+            '/image/root/boot/efi',
+            '/image/root/proc',
+            '/image/root/my dir',
+            '/image/root/proc',
+            '/image/root/boot',
+            '/image/root'
+        ]
+        assert MountTable.get_mountpoints('/image/root/var') == []
+        assert len(MountTable.get_mountpoints()) == 9
+
+    def test_invalidate(self):
+        assert MountTable.is_mountpoint('/mnt') is False
+        self._write_mountinfo(['/', '/mnt'])
+        assert MountTable.is_mountpoint('/mnt') is False
+        MountTable.invalidate()
+        assert MountTable.is_mountpoint('/mnt') is True
+
+    @patch('kiwi.utils.mount_table.select.poll')
+    def test_refresh_on_mount_table_change(self, mock_poll):
+        poller = Mock()
+        poller.poll.return_value = []
+        mock_poll.return_value = poller
+        assert MountTable.is_mountpoint('/mnt') is False
+        self._write_mountinfo(['/', '/mnt'])
+        assert MountTable.is_mountpoint('/mnt') is False
+        poller.poll.return_value = [
+            (MountTable.mountinfo_fd, select.POLLERR | select.POLLPRI)
+        ]
+        assert MountTable.is_mountpoint('/mnt') is True
+        poller.register.assert_called_once_with(
+            MountTable.mountinfo_fd, select.POLLPRI
+        )
+        poller.poll.assert_called_with(0)
+
+    def test_mount_table_not_available(self):
+        MountTable.mountinfo = self.mountinfo + '.missing'
+        assert MountTable.is_mountpoint('/') is None
+        assert MountTable.get_mountpoints('/') is None
+
+    def test_proc_self_mountinfo(self):
+        MountTable.mountinfo = '/proc/self/mountinfo'
+        if os.path.exists(MountTable.mountinfo):
+            assert MountTable.is_mountpoint('/') is True
+            assert MountTable.is_mountpoint('/proc') is True
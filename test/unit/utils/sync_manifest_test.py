@@ -0,0 +1,383 @@
+import os
+import errno
+import stat
+import shutil
+import struct
+import subprocess
+from unittest.mock import patch
+from pytest import (
+    raises, fixture, mark
+)
+
+from kiwi.defaults import Defaults
+from kiwi.utils.sync_manifest import (
+    SyncManifest, SyncFlagsT
+)
+
+from kiwi.exceptions import KiwiDataSyncError
+
+ACL_EA_ACCESS = 'system.posix_acl_access'
+
+
+def acl_xattr(user_id):
+    # version 2 header followed by tag, permission and id entries
+    entries = [
+        (0x01, 6, 0xffffffff), (0x02, 4, user_id), (0x04, 4, 0xffffffff),
+        (0x10, 4, 0xffffffff), (0x20, 0, 0xffffffff)
+    ]
+    return struct.pack('<I', 2) + b''.join(
+        struct.pack('<HHI', *entry) for entry in entries
+    )
+
+
+def tree_state(root):
+    state = {}
+    inodes = {}
+    for path, directories, files in os.walk(root):
+        for name in sorted(directories + files):
+            filename = os.path.join(path, name)
+            file_stat = os.lstat(filename)
+            relative = os.path.relpath(filename, root)
+            content = None
+            if stat.S_ISREG(file_stat.st_mode):
+                with open(filename, 'rb') as data:
+                    content = data.read()
+                if file_stat.st_nlink > 1:
+                    inodes.setdefault(file_stat.st_ino, []).append(relative)
+            has_mtime = not stat.S_ISDIR(file_stat.st_mode) and \
+                not stat.S_ISLNK(file_stat.st_mode)
+            state[relative] = (
+                file_stat.st_mode, file_stat.st_uid, file_stat.st_gid,
+                file_stat.st_rdev, content,
+                os.readlink(filename) if os.path.islink(filename) else None,
+                file_stat.st_mtime_ns if has_mtime else None,
+                sorted(
+                    (name, os.getxattr(filename, name, follow_symlinks=False))
+                    for name in os.listxattr(filename, follow_symlinks=False)
+                )
+            )
+    return state, sorted(inodes.values())
+
+
+class TestSyncManifest:
+    @fixture(autouse=True)
+    def inject_fixtures(self, tmpdir):
+        self._tmpdir = tmpdir
+        self.source = tmpdir.mkdir('source').strpath
+        os.makedirs(os.sep.join([self.source, 'etc', 'ssh']))
+        os.makedirs(os.sep.join([self.source, 'image']))
+        os.makedirs(os.sep.join([self.source, 'var', 'cache']))
+        for name, content in (
+            ('etc/passwd', b'root:x:0:0::/root:/bin/bash\n'),
+            ('etc/ssh/sshd_config', b'PermitRootLogin no\n'),
+            ('image/config.xml', b'<image/>'),
+            ('var/cache/data', b'cached'),
+            ('var/cache/data.keep', b'kept')
+        ):
+            with open(os.sep.join([self.source, name]), 'wb') as data:
+                data.write(content)
+        passwd = os.sep.join([self.source, 'etc', 'passwd'])
+        os.chmod(passwd, 0o4640)
+        os.utime(passwd, ns=(1000000000, 1500000000123))
+        os.link(passwd, os.sep.join([self.source, 'etc', 'passwd.link']))
+        os.symlink('passwd', os.sep.join([self.source, 'etc', 'symlink']))
+        os.setxattr(passwd, 'user.kiwi', b'value')
+        os.setxattr(passwd, ACL_EA_ACCESS, acl_xattr(1000))
+        with open(os.sep.join([self.source, 'sparse']), 'wb') as sparse:
+            sparse.truncate(4 << 20)
+            sparse.seek(1 << 20)
+            sparse.write(b'data')
+        os.mkfifo(os.sep.join([self.source, 'fifo']))
+        self.target = os.sep.join([tmpdir.strpath, 'target'])
+        self.flags = SyncManifest.get_flags(Defaults.get_sync_options())
+
+    def test_get_flags(self):
+        assert self.flags == SyncFlagsT(
+            owner=True, group=True, devices=True, specials=True,
+            hard_links=True, xattrs=True, acls=True, one_file_system=True,
+            inplace=True
+        )
+        assert SyncManifest.get_flags(['-a']) == SyncFlagsT(
+            owner=True, group=True, devices=True, specials=True,
+            hard_links=False, xattrs=False, acls=False, one_file_system=False,
+            inplace=False
+        )
+        assert SyncManifest.get_flags(['-aHXS', '--numeric-ids']).hard_links
+        assert SyncManifest.get_flags(['-rlpt']).owner is False
+        assert SyncManifest.get_flags(['-a', '--delete']) is None
+        assert SyncManifest.get_flags(['-av']) is None
+        assert SyncManifest.get_flags(['-r']) is None
+        assert SyncManifest.get_flags(['--filter', '-a']) is None
+
+    def test_sync(self):
+        SyncManifest(self.source, True).sync(
+            self.target, self.flags, ['image', 'var/cache/*', 'etc/ssh/']
+        )
+        passwd = os.sep.join([self.target, 'etc', 'passwd'])
+        passwd_stat = os.lstat(passwd)
+        assert stat.S_IMODE(passwd_stat.st_mode) == 0o4640
+        assert (passwd_stat.st_uid, passwd_stat.st_gid) == (
+            os.getuid(), os.getgid()
+        )
+        assert passwd_stat.st_mtime_ns == 1500000000123
+        assert passwd_stat.st_nlink == 2
+        assert os.path.samefile(
+            passwd, os.sep.join([self.target, 'etc', 'passwd.link'])
+        )
+        assert os.getxattr(passwd, 'user.kiwi') == b'value'
+        assert os.getxattr(passwd, ACL_EA_ACCESS) == acl_xattr(1000)
+        assert os.readlink(
+            os.sep.join([self.target, 'etc', 'symlink'])
+        ) == 'passwd'
+        assert stat.S_ISFIFO(
+            os.lstat(os.sep.join([self.target, 'fifo'])).st_mode
+        )
+        assert not os.path.exists(os.sep.join([self.target, 'image']))
+        assert not os.path.exists(os.sep.join([self.target, 'etc', 'ssh']))
+        assert os.listdir(os.sep.join([self.target, 'var', 'cache'])) == []
+        sparse = os.sep.join([self.target, 'sparse'])
+        with open(sparse, 'rb') as data:
+            assert data.read() == b'\0' * (1 << 20) + b'data' + \
+                b'\0' * ((3 << 20) - 4)
+        assert os.stat(sparse).st_blocks * 512 < 4 << 20
+
+    def test_link(self):
+        source_etc = os.sep.join([self.source, 'etc'])
+        os.chmod(source_etc, 0o750)
+        os.utime(source_etc, ns=(1000000000, 1200000000000))
+        SyncManifest(self.source, True).link(
+            self.target, self.flags, ['image']
+        )
+        for name in ('etc/passwd', 'etc/passwd.link', 'sparse'):
+            assert os.path.samefile(
+                os.sep.join([self.source, name]),
+                os.sep.join([self.target, name])
+            )
+        assert os.lstat(
+            os.sep.join([self.target, 'etc', 'passwd'])
+        ).st_nlink == 4
+        target_etc = os.lstat(os.sep.join([self.target, 'etc']))
+        assert stat.S_IMODE(target_etc.st_mode) == 0o750
+        assert target_etc.st_mtime_ns == 1200000000000
+        assert os.readlink(
+            os.sep.join([self.target, 'etc', 'symlink'])
+        ) == 'passwd'
+        assert not os.path.exists(os.sep.join([self.target, 'image']))
+
+    @patch('os.link')
+    def test_link_failed(self, mock_link):
+        mock_link.side_effect = OSError(errno.EXDEV, 'cross-device link')
+        with raises(KiwiDataSyncError):
+            SyncManifest(self.source).link(self.target, self.flags)
+
+    def test_sync_root_dir_and_patterns(self):
+        SyncManifest(self.source).sync(
+            self.target, SyncManifest.get_flags(['-a']),
+            ['source/var/cache/data.[!k]*', 'source/etc/*/', 'source/?parse'],
+            copy_root_dir=True
+        )
+        target = os.sep.join([self.target, 'source'])
+        assert os.path.exists(os.sep.join([target, 'var/cache/data']))
+        assert os.path.exists(os.sep.join([target, 'var/cache/data.keep']))
+        assert os.path.exists(os.sep.join([target, 'etc/passwd']))
+        assert not os.path.exists(os.sep.join([target, 'etc/ssh']))
+        assert not os.path.exists(os.sep.join([target, 'sparse']))
+        # hard links are not kept without -H, xattrs not without -X
+        passwd = os.sep.join([target, 'etc', 'passwd'])
+        assert os.lstat(passwd).st_nlink == 1
+        assert os.listxattr(passwd) == []
+
+    def test_select(self):
+        paths = [
+            entry.path for entry in SyncManifest(self.source).select(
+                self.flags, ['image', 'var/cache/*', 'etc/ssh/']
+            )
+        ]
+        assert paths[0] == ''
+        assert 'etc/passwd' in paths
+        assert 'var/cache' in paths
+        assert not [
+            path for path in paths
+            if path.startswith(('image', 'var/cache/', 'etc/ssh'))
+        ]
+
+    def test_get_exclude_filter(self):
+        is_excluded = SyncManifest.get_exclude_filter(
+            ['var/cache/*', 'etc/*/']
+        )
+        assert is_excluded('var/cache/data', False) is True
+        assert is_excluded('var/cache', True) is False
+        assert is_excluded('etc/ssh', True) is True
+        assert is_excluded('etc/passwd', False) is False
+
+    def test_sync_existing_target(self):
+        os.makedirs(os.sep.join([self.target, 'etc']))
+        os.makedirs(os.sep.join([self.target, 'sparse']))
+        os.symlink('/etc/passwd', os.sep.join([self.target, 'fifo']))
+        passwd = os.sep.join([self.target, 'etc', 'passwd'])
+        with open(passwd, 'wb') as data:
+            data.write(b'longer outdated content')
+        os.setxattr(passwd, 'user.stale', b'stale')
+        inode = os.lstat(passwd).st_ino
+        SyncManifest(self.source).sync(self.target, self.flags)
+        assert os.lstat(passwd).st_ino == inode
+        with open(passwd, 'rb') as data:
+            assert data.read() == b'root:x:0:0::/root:/bin/bash\n'
+        assert 'user.stale' not in os.listxattr(passwd)
+        assert os.path.isfile(os.sep.join([self.target, 'sparse']))
+        assert stat.S_ISFIFO(
+            os.lstat(os.sep.join([self.target, 'fifo'])).st_mode
+        )
+        # a second sync finds all data unchanged
+        with patch.object(SyncManifest, '_copy_data') as mock_copy_data:
+            SyncManifest(self.source).sync(self.target, self.flags)
+            assert not mock_copy_data.called
+
+    def test_sync_replace_without_inplace(self):
+        os.makedirs(os.sep.join([self.target, 'etc']))
+        passwd = os.sep.join([self.target, 'etc', 'passwd'])
+        with open(passwd, 'wb') as data:
+            data.write(b'outdated')
+        inode = os.lstat(passwd).st_ino
+        SyncManifest(self.source).sync(
+            self.target, SyncManifest.get_flags(['-a'])
+        )
+        assert os.lstat(passwd).st_ino != inode
+        assert sorted(os.listdir(os.sep.join([self.target, 'etc']))) == [
+            'passwd', 'passwd.link', 'ssh', 'symlink'
+        ]
+
+    @mark.skipif(os.geteuid() != 0, reason='chown requires root')
+    def test_sync_ownership(self):
+        passwd = os.sep.join([self.source, 'etc', 'passwd'])
+        os.chown(passwd, 1000, 100)
+        os.chmod(passwd, 0o4640)
+        os.lchown(os.sep.join([self.source, 'etc', 'symlink']), 1001, 101)
+        SyncManifest(self.source).sync(self.target, self.flags)
+        passwd_stat = os.lstat(os.sep.join([self.target, 'etc', 'passwd']))
+        assert (passwd_stat.st_uid, passwd_stat.st_gid) == (1000, 100)
+        # the setuid bit is set again after the change of the owner
+        assert stat.S_IMODE(passwd_stat.st_mode) == 0o4640
+        symlink_stat = os.lstat(os.sep.join([self.target, 'etc', 'symlink']))
+        assert (symlink_stat.st_uid, symlink_stat.st_gid) == (1001, 101)
+        shutil.rmtree(self.target)
+        SyncManifest(self.source).sync(
+            self.target, SyncManifest.get_flags(['-rlpt'])
+        )
+        passwd_stat = os.lstat(os.sep.join([self.target, 'etc', 'passwd']))
+        assert (passwd_stat.st_uid, passwd_stat.st_gid) == (0, 0)
+
+    @mark.skipif(os.geteuid() != 0, reason='device nodes require root')
+    def test_sync_device_node(self):
+        os.mknod(
+            os.sep.join([self.source, 'null']),
+            stat.S_IFCHR | 0o666, os.makedev(1, 3)
+        )
+        SyncManifest(self.source).sync(self.target, self.flags)
+        null_stat = os.lstat(os.sep.join([self.target, 'null']))
+        assert stat.S_ISCHR(null_stat.st_mode)
+        assert null_stat.st_rdev == os.makedev(1, 3)
+        shutil.rmtree(self.target)
+        SyncManifest(self.source).sync(
+            self.target, SyncManifest.get_flags(['-rlpt'])
+        )
+        assert not os.path.exists(os.sep.join([self.target, 'null']))
+        assert not os.path.exists(os.sep.join([self.target, 'fifo']))
+
+    @patch('os.copy_file_range')
+    @patch('fcntl.ioctl')
+    def test_sync_copy_fallback(self, mock_ioctl, mock_copy_file_range):
+        mock_ioctl.side_effect = OSError(95, 'Operation not supported')
+        mock_copy_file_range.side_effect = OSError(18, 'Cross-device link')
+        SyncManifest(self.source).sync(self.target, self.flags)
+        assert tree_state(self.source) == tree_state(self.target)
+
+    @patch('os.copy_file_range')
+    def test_sync_failed(self, mock_copy_file_range):
+        mock_copy_file_range.side_effect = OSError(5, 'I/O error')
+        with patch('fcntl.ioctl', side_effect=OSError(95, 'unsupported')):
+            with raises(KiwiDataSyncError):
+                SyncManifest(self.source).sync(self.target, self.flags)
+
+    def test_share(self):
+        with patch.object(
+            SyncManifest, '_scan', side_effect=SyncManifest._scan,
+            autospec=True
+        ) as mock_scan:
+            with SyncManifest.share():
+                with SyncManifest.share():
+                    manifest = SyncManifest.get(self.source + os.sep)
+                    assert SyncManifest.get(self.source) is manifest
+                    etc = SyncManifest.get(
+                        os.sep.join([self.source, 'etc'])
+                    )
+                assert SyncManifest.shared is not None
+                assert mock_scan.call_count == 1
+                assert etc.source_dir == os.sep.join([self.source, 'etc'])
+                assert [entry.path for entry in etc.entries][0] == ''
+                assert 'ssh/sshd_config' in [
+                    entry.path for entry in etc.entries
+                ]
+                etc.sync(self.target, self.flags)
+                assert os.path.isfile(
+                    os.sep.join([self.target, 'ssh', 'sshd_config'])
+                )
+                # a different one file system setting is not shared
+                SyncManifest.get(self.source, one_file_system=True)
+                assert mock_scan.call_count == 2
+            assert SyncManifest.shared is None
+            SyncManifest.get(self.source)
+            assert mock_scan.call_count == 3
+
+    def test_get_subtree_other_file_system(self):
+        manifest = SyncManifest(self.source, one_file_system=True)
+        manifest.entries = [
+            entry._replace(dev=42) if entry.path == 'etc' else entry
+            for entry in manifest.entries
+        ]
+        assert manifest.get_subtree('etc') is None
+        assert manifest.get_subtree('not/there') is None
+        assert manifest.get_subtree('var').entries[0].path == ''
+
+    @mark.skipif(not shutil.which('rsync'), reason='rsync not installed')
+    @mark.parametrize('options', [
+        Defaults.get_sync_options(), ['-a'], ['-a', '-H', '-X', '-A']
+    ])
+    def test_sync_equals_rsync(self, options):
+        self._assert_sync_equals_rsync(options)
+
+    @mark.skipif(not shutil.which('rsync'), reason='rsync not installed')
+    @mark.skipif(os.geteuid() != 0, reason='device nodes require root')
+    @mark.parametrize('options', [
+        Defaults.get_sync_options(), ['-a'], ['-rlpt']
+    ])
+    def test_sync_equals_rsync_as_root(self, options):
+        os.makedirs(os.sep.join([self.source, 'dev']))
+        os.mknod(
+            os.sep.join([self.source, 'dev', 'null']),
+            stat.S_IFCHR | 0o666, os.makedev(1, 3)
+        )
+        os.mknod(
+            os.sep.join([self.source, 'dev', 'loop0']),
+            stat.S_IFBLK | 0o660, os.makedev(7, 0)
+        )
+        os.chown(os.sep.join([self.source, 'dev', 'loop0']), 0, 6)
+        os.chown(os.sep.join([self.source, 'etc', 'passwd']), 1000, 100)
+        os.chmod(os.sep.join([self.source, 'etc', 'passwd']), 0o4640)
+        self._assert_sync_equals_rsync(options)
+
+    def _assert_sync_equals_rsync(self, options):
+        rsync_target = os.sep.join([self._tmpdir.strpath, 'rsync'])
+        exclude = ['image', 'var/cache/*']
+        subprocess.run(
+            ['rsync'] + options + [
+                '--exclude=/' + pattern for pattern in exclude
+            ] + [self.source + os.sep, rsync_target], check=True
+        )
+        SyncManifest(self.source).sync(
+            self.target, SyncManifest.get_flags(options), exclude
+        )
+        assert tree_state(self.target) == tree_state(rsync_target)
+        # holes of sparse files are kept
+        sparse = os.sep.join([self.target, 'sparse'])
+        assert os.stat(sparse).st_blocks * 512 < os.stat(sparse).st_size
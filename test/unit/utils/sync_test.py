@@ -1,11 +1,16 @@
 import os
 import errno
 import logging
-from pytest import fixture
+from pytest import (
+    raises, fixture
+)
 from stat import ST_MODE
 from unittest.mock import patch
 
 from kiwi.utils.sync import DataSync
+from kiwi.utils.sync_manifest import SyncFlagsT
+
+from kiwi.exceptions import KiwiDataSyncError
 
 
 class TestDataSync:
@@ -58,6 +63,43 @@ class TestDataSync:
             ['rsync', 'source_dir/', 'target_dir']
         )
 
+    @patch('kiwi.utils.sync.Command.run')
+    @patch('kiwi.utils.sync.SyncManifest.get')
+    @patch('os.path.isdir')
+    @patch('os.chmod')
+    @patch('os.stat')
+    def test_sync_data_manifest(
+        self, mock_stat, mock_chmod, mock_isdir, mock_SyncManifest_get,
+        mock_command
+    ):
+        mock_stat.return_value = os.stat('.')
+        mock_isdir.return_value = True
+        DataSync.set_engine('manifest')
+        self.sync.sync_data(
+            options=['-a', '--one-file-system'], exclude=['exclude_me']
+        )
+        mock_SyncManifest_get.assert_called_once_with('source_dir', True)
+        mock_SyncManifest_get.return_value.sync.assert_called_once_with(
+            'target_dir', SyncFlagsT(
+                owner=True, group=True, devices=True, specials=True,
+                hard_links=False, xattrs=False, acls=False,
+                one_file_system=True, inplace=False
+            ), ['exclude_me'], copy_root_dir=True
+        )
+        assert not mock_command.called
+
+        # options not supported by the manifest engine use rsync
+        mock_SyncManifest_get.reset_mock()
+        self.sync.sync_data(options=['-a', '--delete'])
+        assert not mock_SyncManifest_get.called
+        mock_command.assert_called_once_with(
+            ['rsync', '-a', '--delete', 'source_dir', 'target_dir']
+        )
+
+    def test_set_engine_unknown(self):
+        with raises(KiwiDataSyncError):
+            DataSync.set_engine('cp')
+
     @patch('os.getxattr')
     def test_target_supports_extended_attributes(self, mock_getxattr):
         assert self.sync.target_supports_extended_attributes() is True
@@ -1,6 +1,9 @@
 import io
+import shutil
 from textwrap import dedent
-from pytest import raises
+from pytest import (
+    raises, fixture, mark
+)
 from unittest.mock import (
     patch, Mock, MagicMock, call
 )
@@ -12,6 +15,10 @@ import kiwi.defaults as defaults
 
 
 class TestVeritySetup:
+    @fixture(autouse=True)
+    def inject_fixtures(self, tmpdir):
+        self._tmpdir = tmpdir
+
     @patch('os.path.getsize')
     def setup(self, mock_os_path_getsize):
         mock_os_path_getsize.return_value = 4096
@@ -32,9 +39,11 @@ class TestVeritySetup:
     def setup_method(self, cls, mock_os_path_getsize):
         self.setup()
 
+    @patch('kiwi.utils.veritysetup.BlockID.invalidate')
     @patch('kiwi.utils.veritysetup.Command.run')
-    def test_format(self, mock_Command_run):
+    def test_format(self, mock_Command_run, mock_BlockID_invalidate):
         self.veritysetup.format()
+        mock_BlockID_invalidate.assert_called_once_with('image_file')
         mock_Command_run.assert_called_once_with(
             [
                 'veritysetup', 'format', 'image_file', 'image_file',
@@ -44,16 +53,49 @@ class TestVeritySetup:
             ]
         )
 
+    def test_get_hash_byte_size(self):
+        # superblock and one block of 128 sha256 digests
+        assert self.veritysetup.get_hash_byte_size() == 8192
+        for data_blocks, hash_blocks in [
+            (1, 1), (128, 2), (129, 4), (16384, 130),
+            (16385, 133), (2097152, 16514), (2097153, 16518)
+        ]:
+            self.veritysetup.data_blocks = data_blocks
+            assert self.veritysetup.get_hash_byte_size() == hash_blocks * 4096
+
+    def test_get_hash_byte_size_full(self):
+        image_file = self._tmpdir.join('image_file').strpath
+        with open(image_file, 'wb') as image:
+            image.truncate(129 * 4096 + 100)
+        assert VeritySetup(image_file).get_hash_byte_size() == 4 * 4096
+
+    @mark.skipif(
+        not shutil.which('veritysetup'), reason='requires veritysetup'
+    )
+    @mark.parametrize(
+        'data_blocks', [2, 10, 127, 128, 129, 1000, 16384, 16385]
+    )
+    def test_get_hash_byte_size_equals_formatted(self, data_blocks):
+        image_file = self._tmpdir.join('image_file').strpath
+        with open(image_file, 'wb') as image:
+            image.truncate(data_blocks * 4096)
+        full = VeritySetup(image_file)
+        assert full.get_hash_byte_size() == \
+            full.get_formatted_hash_byte_size()
+        partial = VeritySetup(image_file, data_blocks=data_blocks - 1)
+        assert partial.get_hash_byte_size() == \
+            partial.get_formatted_hash_byte_size()
+
     @patch('kiwi.utils.veritysetup.Command.run')
     @patch('kiwi.utils.veritysetup.Temporary.new_file')
     @patch('os.path.getsize')
-    def test_get_hash_byte_size(
+    def test_get_formatted_hash_byte_size(
         self, mock_os_path_getsize, mock_Temporary_new_file, mock_Command_run
     ):
         tempfile = Mock()
         tempfile.name = 'tempfile'
         mock_Temporary_new_file.return_value = tempfile
-        assert self.veritysetup.get_hash_byte_size() == \
+        assert self.veritysetup.get_formatted_hash_byte_size() == \
             mock_os_path_getsize.return_value
         mock_Command_run.assert_called_once_with(
             [
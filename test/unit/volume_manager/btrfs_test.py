@@ -330,7 +330,7 @@ class TestVolumeManagerBtrfs:
     @patch('kiwi.volume_manager.btrfs.Command.run')
     def test_get_fstab(self, mock_command):
         blkid_result = Mock()
-        blkid_result.output = 'id'
+        blkid_result.output = 'LABEL=id\nUUID=id\n'
         mock_command.return_value = blkid_result
         volume_mount = Mock()
         volume_mount.mountpoint = \
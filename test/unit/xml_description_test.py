@@ -9,6 +9,7 @@ from kiwi.utils.temporary import Temporary
 from pytest import fixture
 
 from kiwi.xml_description import XMLDescription
+from kiwi.utils.description_cache import DescriptionCache
 
 from kiwi.exceptions import (
     KiwiCommandError,
@@ -23,8 +24,9 @@ from kiwi.exceptions import (
 
 class TestSchema:
     @fixture(autouse=True)
-    def inject_fixtures(self, caplog):
+    def inject_fixtures(self, caplog, tmpdir):
         self._caplog = caplog
+        self._tmpdir = tmpdir
 
     def setup(self):
         test_xml = bytes(
@@ -164,6 +166,27 @@ class TestSchema:
         parsed = self.description_from_data.load()
         assert parsed.get_schemaversion() == schemaversion
 
+    def test_load_schema_compiled_once(self):
+        with patch(
+            'kiwi.xml_description.etree.RelaxNG', wraps=etree.RelaxNG
+        ) as mock_RelaxNG:
+            self.description_from_data.load()
+            self.description_from_file.load()
+        assert mock_RelaxNG.call_count == 1
+
+    def test_load_from_description_cache(self):
+        DescriptionCache.set_cache_dir(self._tmpdir.strpath)
+        description = XMLDescription('../data/example_config.xml')
+        assert not description.markup.description_validated
+        description.load()
+        assert len(self._tmpdir.listdir()) == 1
+
+        description = XMLDescription('../data/example_config.xml')
+        assert description.markup.description_validated
+        with patch.object(XMLDescription, '_validate') as mock_validate:
+            assert description.load().get_name() == 'LimeJeOS'
+            assert not mock_validate.called
+
     @patch('lxml.etree.RelaxNG')
     def test_load_schema_import_error(self, mock_relax):
         mock_relax.side_effect = KiwiSchemaImportError(
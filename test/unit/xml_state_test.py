@@ -307,6 +307,32 @@ class TestXMLState:
         assert self.state.xml_data.get_repository()[3] \
             .get_sourcetype() == 'metalink'
 
+    def test_profiled_sections_memoized(self):
+        repositories = self.state.get_repository_sections()
+        with patch.object(XMLState, '_profiled') as mock_profiled:
+            assert self.state.get_repository_sections() == repositories
+            assert not mock_profiled.called
+
+    def test_profiled_sections_invalidated(self):
+        repository_count = len(self.state.get_repository_sections())
+        self.state.add_repository('repo', 'type')
+        assert len(self.state.get_repository_sections()) == \
+            repository_count + 1
+        self.state.delete_repository_sections()
+        assert self.state.get_repository_sections() == []
+        # sections changed via the XML data are picked up as well
+        self.state.xml_data.add_repository(
+            self.boot_state.get_repository_sections()[0]
+        )
+        assert len(self.state.get_repository_sections()) == 1
+
+    def test_profiled_sections_profiles_changed(self):
+        state = XMLState(self.description.load(), ['vmxFlavour'], 'oem')
+        packages_sections = state.get_packages_sections(['image'])
+        state.profiles = []
+        assert len(state.get_packages_sections(['image'])) < \
+            len(packages_sections)
+
     def test_add_repository_with_empty_values(self):
         self.state.add_repository('repo', 'type', '', '', True)
         assert self.state.xml_data.get_repository()[3].get_source().get_path() \